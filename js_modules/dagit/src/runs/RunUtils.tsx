@@ -45,7 +45,8 @@ export type IRunStatus =
   | "NOT_STARTED"
   | "FAILURE"
   | "STARTED"
-  | "MANAGED";
+  | "MANAGED"
+  | "QUEUED";
 
 export function titleForRun(run: { runId: string }) {
   return run.runId.split("-").shift();
@@ -54,6 +55,7 @@ export function titleForRun(run: { runId: string }) {
 export const RUN_STATUS_COLORS = {
   NOT_STARTED: Colors.GRAY1,
   MANAGED: Colors.GRAY3,
+  QUEUED: Colors.GRAY2,
   STARTED: Colors.GRAY3,
   SUCCESS: Colors.GREEN2,
   FAILURE: Colors.RED3
@@ -61,6 +63,7 @@ export const RUN_STATUS_COLORS = {
 export const RUN_STATUS_HOVER_COLORS = {
   NOT_STARTED: Colors.GRAY3,
   MANAGED: Colors.GRAY3,
+  QUEUED: Colors.GRAY4,
   STARTED: Colors.GRAY5,
   SUCCESS: Colors.GREEN4,
   FAILURE: Colors.RED5
@@ -46,7 +46,7 @@ function searchSuggestionsForRuns(
     },
     {
       token: "status",
-      values: () => ["NOT_STARTED", "STARTED", "SUCCESS", "FAILURE", "MANAGED"]
+      values: () => ["NOT_STARTED", "STARTED", "SUCCESS", "FAILURE", "MANAGED", "QUEUED"]
     },
     {
       token: "pipeline",
@@ -14,11 +14,12 @@ from dagster_graphql.implementation.context import (
 from dagster_graphql.implementation.reloader import Reloader
 from dagster_graphql.schema import create_schema
 from dagster_graphql.version import __version__ as dagster_graphql_version
-from flask import Flask, jsonify, request, send_file
+from flask import Flask, Response, jsonify, request, send_file
 from flask_cors import CORS
 from flask_graphql import GraphQLView
 from flask_sockets import Sockets
 from graphql.execution.executors.gevent import GeventExecutor as Executor
+from graphql_server import HttpQueryError, get_graphql_params
 from nbconvert import HTMLExporter
 
 from dagster import __version__ as dagster_version
@@ -26,10 +27,12 @@ from dagster import check, seven
 from dagster.core.definitions.reconstructable import ReconstructableRepository
 from dagster.core.execution.compute_logs import warn_if_compute_logs_disabled
 from dagster.core.instance import DagsterInstance
+from dagster.core.launcher import CliApiRunLauncher
 from dagster.core.scheduler import reconcile_scheduler_state
 from dagster.core.storage.compute_log_manager import ComputeIOType
 
 from .format_error import format_error_with_stack_trace
+from .query_cache import QueryCache
 from .subscription_server import DagsterSubscriptionServer
 from .templates.playground import TEMPLATE as PLAYGROUND_TEMPLATE
 from .version import __version__
@@ -40,16 +43,79 @@ MISSING_SCHEDULER_WARNING = (
 )
 
 
+# Responses to queries that only read pipeline snapshots never change
+SNAPSHOT_QUERY_CACHE_CONTROL = 'max-age=31536000, immutable'
+
+
 class DagsterGraphQLView(GraphQLView):
-    def __init__(self, context, **kwargs):
+    def __init__(self, context, query_cache=None, **kwargs):
         super(DagsterGraphQLView, self).__init__(**kwargs)
         self.context = check.inst_param(context, 'context', DagsterGraphQLContext)
+        self.query_cache = check.opt_inst_param(query_cache, 'query_cache', QueryCache)
 
     def get_context(self):
         return self.context
 
     format_error = staticmethod(format_error_with_stack_trace)
 
+    def parse_body(self):
+        data = super(DagsterGraphQLView, self).parse_body()
+        if not self.query_cache or isinstance(data, list):
+            return data
+
+        return self.query_cache.resolve_persisted_query(data, request.args)
+
+    def dispatch_request(self):
+        if not self.query_cache or (
+            request.method.lower() == 'get' and self.should_display_graphiql()
+        ):
+            return super(DagsterGraphQLView, self).dispatch_request()
+
+        try:
+            data = self.parse_body()
+        except HttpQueryError:
+            # Reported by the superclass, which parses the body again
+            return super(DagsterGraphQLView, self).dispatch_request()
+
+        if isinstance(data, list):
+            return super(DagsterGraphQLView, self).dispatch_request()
+
+        params = get_graphql_params(data, request.args)
+        etag = self.query_cache.etag_for_query(
+            params.query, params.variables, params.operation_name
+        )
+        if etag is None:
+            return super(DagsterGraphQLView, self).dispatch_request()
+
+        if request.if_none_match.contains(etag):
+            return self._snapshot_query_response(etag, status=304)
+
+        response_data = self.query_cache.get_response(etag)
+        if response_data is not None:
+            return self._snapshot_query_response(etag, response=response_data)
+
+        if not self.query_cache.snapshots_exist(
+            params.query, params.variables, params.operation_name
+        ):
+            return super(DagsterGraphQLView, self).dispatch_request()
+
+        response = super(DagsterGraphQLView, self).dispatch_request()
+        if response.status_code != 200:
+            return response
+
+        response_data = response.get_data()
+        if 'errors' in seven.json.loads(response_data.decode('utf-8')):
+            return response
+
+        self.query_cache.set_response(etag, response_data)
+        return self._snapshot_query_response(etag, response=response_data)
+
+    def _snapshot_query_response(self, etag, response=None, status=200):
+        response = Response(response, status=status, content_type='application/json')
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = SNAPSHOT_QUERY_CACHE_CONTROL
+        return response
+
 
 def dagster_graphql_subscription_view(subscription_server, context):
     context = check.inst_param(context, 'context', DagsterGraphQLContext)
@@ -155,6 +221,7 @@ def instantiate_app_with_views(context):
             graphiql_template=PLAYGROUND_TEMPLATE,
             executor=Executor(),
             context=context,
+            query_cache=QueryCache(context.instance, __version__),
         ),
     )
     sockets.add_url_rule(
@@ -193,6 +260,10 @@ def create_app_with_reconstructable_repo(recon_repo, instance, reloader=None):
         version=__version__,
     )
 
+    # Start the runs that were queued for launch before Dagit was last stopped
+    if isinstance(instance.run_launcher, CliApiRunLauncher):
+        instance.run_launcher.resume_queued_runs(instance)
+
     # Automatically initialize scheduler everytime Dagit loads
     scheduler = instance.scheduler
     repository = context.legacy_get_repository_definition()
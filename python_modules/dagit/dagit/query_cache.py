@@ -0,0 +1,224 @@
+'''Persisted queries, and a response cache for the GraphQL queries whose results are a function of
+pipeline snapshots alone.
+
+Persisted queries follow the automatic persisted query protocol of Apollo: a client sends the
+sha256 hash of a query in ``extensions.persistedQuery.sha256Hash``, and sends the query itself only
+when dagit replies that it does not know the hash. Requests for persisted queries can then be small
+enough to be sent with GET, which browsers cache.
+
+A pipeline snapshot never changes once it is stored, so the response to a query that only reads
+pipeline snapshots by id can be reused for as long as dagit runs, and cached by browsers for good.
+'''
+import hashlib
+
+import six
+from graphql.error import GraphQLSyntaxError
+from graphql.language import ast
+from graphql.language.parser import parse
+from graphql_server import HttpQueryError
+
+from dagster import check, seven
+from dagster.core.instance import DagsterInstance
+from dagster.utils import LRUCache
+
+PERSISTED_QUERY_CACHE_SIZE = 1000
+
+RESPONSE_CACHE_SIZE = 200
+
+PERSISTED_QUERY_NOT_FOUND = 'PersistedQueryNotFound'
+
+# The fields of a pipeline snapshot that are read from the instance rather than from the snapshot
+INSTANCE_FIELD_NAMES = frozenset(['runs', 'schedules'])
+
+
+def _sha256(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class QueryCache(object):
+    '''The persisted queries and the cached snapshot query responses of a dagit process.'''
+
+    def __init__(
+        self,
+        instance,
+        version,
+        persisted_query_cache_size=PERSISTED_QUERY_CACHE_SIZE,
+        response_cache_size=RESPONSE_CACHE_SIZE,
+    ):
+        self._instance = check.inst_param(instance, 'instance', DagsterInstance)
+        # Responses depend on the schema, so their ETags change with the version of dagit
+        self._version = check.str_param(version, 'version')
+        self._persisted_queries = LRUCache(persisted_query_cache_size)
+        self._responses = LRUCache(response_cache_size)
+
+    def resolve_persisted_query(self, data, query_data):
+        '''Fill in the query of a request for a persisted query.
+
+        Args:
+            data (Dict[str, Any]): The parameters in the body of the request.
+            query_data (Dict[str, str]): The parameters in the query string of the request.
+
+        Returns:
+            Dict[str, Any]: The body parameters, with the query if it was persisted.
+        '''
+        extensions = data.get('extensions') or query_data.get('extensions')
+        if isinstance(extensions, six.string_types):
+            try:
+                extensions = seven.json.loads(extensions)
+            except ValueError:
+                raise HttpQueryError(400, 'Extensions are invalid JSON.')
+
+        persisted_query = extensions.get('persistedQuery') if isinstance(extensions, dict) else None
+        if not isinstance(persisted_query, dict) or 'sha256Hash' not in persisted_query:
+            return data
+
+        query_hash = persisted_query['sha256Hash']
+        query = data.get('query') or query_data.get('query')
+        if query:
+            if _sha256(query) != query_hash:
+                raise HttpQueryError(400, 'The sha256Hash of the persisted query does not match.')
+
+            self._persisted_queries.set(query_hash, query)
+            return data
+
+        query = self._persisted_queries.get(query_hash)
+        if query is None:
+            # Clients send the query again when they get this error
+            raise HttpQueryError(200, PERSISTED_QUERY_NOT_FOUND)
+
+        resolved_data = dict(data.items())
+        resolved_data['query'] = query
+        return resolved_data
+
+    def etag_for_query(self, query, variables, operation_name):
+        '''The ETag of the response to a query that only reads pipeline snapshots, or None for any
+        other query.'''
+        if not query or snapshot_ids_for_query(query, variables, operation_name) is None:
+            return None
+
+        return _sha256(
+            seven.json.dumps(
+                [self._version, query, variables or {}, operation_name], sort_keys=True
+            )
+        )
+
+    def snapshots_exist(self, query, variables, operation_name):
+        '''Whether the pipeline snapshots a query reads are all stored, so that its response will not
+        change. A snapshot that is not found yet may be stored later.'''
+        return all(
+            self._instance.has_pipeline_snapshot(snapshot_id)
+            for snapshot_id in snapshot_ids_for_query(query, variables, operation_name)
+        )
+
+    def get_response(self, etag):
+        return self._responses.get(etag)
+
+    def set_response(self, etag, response_data):
+        check.str_param(etag, 'etag')
+        check.inst_param(response_data, 'response_data', bytes)
+        self._responses.set(etag, response_data)
+
+
+def snapshot_ids_for_query(query, variables=None, operation_name=None):
+    '''The ids of the pipeline snapshots that the result of a GraphQL query is a function of.
+
+    That is the case for a query whose root fields are all ``pipelineSnapshotOrError`` by
+    ``snapshotId``, and that selects none of the fields of the snapshots that are read from the
+    instance.
+
+    Returns:
+        Optional[List[str]]: The snapshot ids, or None if the result of the query may depend on
+            anything else.
+    '''
+    check.str_param(query, 'query')
+    variables = check.opt_dict_param(variables, 'variables')
+    check.opt_str_param(operation_name, 'operation_name')
+
+    try:
+        document = parse(query)
+    except GraphQLSyntaxError:
+        return None
+
+    operations = [
+        definition
+        for definition in document.definitions
+        if isinstance(definition, ast.OperationDefinition)
+        and (
+            operation_name is None or (definition.name and definition.name.value == operation_name)
+        )
+    ]
+    if len(operations) != 1 or operations[0].operation != 'query':
+        return None
+
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, ast.FragmentDefinition)
+    }
+
+    snapshot_ids = []
+    for field in _fields_of_selection_set(operations[0].selection_set, fragments):
+        if field.name.value == '__typename':
+            continue
+
+        if field.name.value != 'pipelineSnapshotOrError':
+            return None
+
+        arguments = {argument.name.value: argument.value for argument in field.arguments}
+        if list(arguments.keys()) != ['snapshotId']:
+            return None
+
+        snapshot_id = _argument_value(arguments['snapshotId'], variables)
+        if not isinstance(snapshot_id, six.string_types):
+            return None
+
+        if _selects_instance_field(field.selection_set, fragments, set()):
+            return None
+
+        snapshot_ids.append(snapshot_id)
+
+    return snapshot_ids if snapshot_ids else None
+
+
+def _argument_value(value, variables):
+    if isinstance(value, ast.Variable):
+        return variables.get(value.name.value)
+    if isinstance(value, ast.StringValue):
+        return value.value
+    return None
+
+
+def _fields_of_selection_set(selection_set, fragments, visited_fragments=None):
+    '''The fields selected by a selection set, including those of the fragments it spreads.'''
+    visited_fragments = visited_fragments if visited_fragments is not None else set()
+    if selection_set is None:
+        return
+
+    for selection in selection_set.selections:
+        if isinstance(selection, ast.Field):
+            yield selection
+        elif isinstance(selection, ast.InlineFragment):
+            for field in _fields_of_selection_set(
+                selection.selection_set, fragments, visited_fragments
+            ):
+                yield field
+        elif isinstance(selection, ast.FragmentSpread):
+            fragment_name = selection.name.value
+            # Unknown and cyclic fragments fail validation when the query is executed
+            if fragment_name in fragments and fragment_name not in visited_fragments:
+                visited_fragments.add(fragment_name)
+                for field in _fields_of_selection_set(
+                    fragments[fragment_name].selection_set, fragments, visited_fragments
+                ):
+                    yield field
+
+
+def _selects_instance_field(selection_set, fragments, visited_fragments):
+    # A fragment is walked in full the first time it is spread, so it is only walked once
+    for field in _fields_of_selection_set(selection_set, fragments, visited_fragments):
+        if field.name.value in INSTANCE_FIELD_NAMES or _selects_instance_field(
+            field.selection_set, fragments, visited_fragments
+        ):
+            return True
+
+    return False
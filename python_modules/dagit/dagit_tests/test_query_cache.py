@@ -0,0 +1,176 @@
+import hashlib
+import json
+
+from dagit.app import create_app_with_reconstructable_repo
+from dagit.query_cache import PERSISTED_QUERY_NOT_FOUND, snapshot_ids_for_query
+
+from dagster.core.definitions.reconstructable import ReconstructableRepository
+from dagster.core.instance import DagsterInstance
+from dagster.seven import mock
+from dagster.utils import file_relative_path
+
+from .pipeline import math
+
+SNAPSHOT_QUERY = '''
+query PipelineSnapshotQuery($snapshotId: String!) {
+    pipelineSnapshotOrError(snapshotId: $snapshotId) {
+        __typename
+        ... on PipelineSnapshot {
+            name
+            solidHandles { handleID }
+        }
+    }
+}
+'''
+
+
+def test_snapshot_ids_for_query():
+    assert snapshot_ids_for_query(SNAPSHOT_QUERY, {'snapshotId': 'abc'}) == ['abc']
+    assert (
+        snapshot_ids_for_query(
+            '''
+        query {
+            first: pipelineSnapshotOrError(snapshotId: "abc") { ...SnapshotFragment }
+            second: pipelineSnapshotOrError(snapshotId: "def") { ...SnapshotFragment }
+        }
+        fragment SnapshotFragment on PipelineSnapshot { name modes { name } }
+        '''
+        )
+        == ['abc', 'def']
+    )
+
+    # the snapshot id is not given
+    assert snapshot_ids_for_query(SNAPSHOT_QUERY) is None
+    assert (
+        snapshot_ids_for_query(
+            'query { pipelineSnapshotOrError(activePipelineName: "math") { __typename } }'
+        )
+        is None
+    )
+    # other root fields
+    assert (
+        snapshot_ids_for_query(
+            'query { pipelineSnapshotOrError(snapshotId: "abc") { __typename } version }'
+        )
+        is None
+    )
+    # fields read from the instance
+    assert (
+        snapshot_ids_for_query(
+            '''
+            query {
+                pipelineSnapshotOrError(snapshotId: "abc") { ...SnapshotFragment }
+            }
+            fragment SnapshotFragment on PipelineSnapshot { name runs { runId } }
+            '''
+        )
+        is None
+    )
+    assert (
+        snapshot_ids_for_query(
+            'mutation { pipelineSnapshotOrError(snapshotId: "abc") { __typename } }'
+        )
+        is None
+    )
+    assert snapshot_ids_for_query('query {') is None
+
+
+def test_snapshot_ids_for_query_cyclic_fragments():
+    assert (
+        snapshot_ids_for_query(
+            '''
+            query {
+                pipelineSnapshotOrError(snapshotId: "abc") { ...A }
+            }
+            fragment A on PipelineSnapshot { name solidHandles { ...B } }
+            fragment B on SolidHandle { handleID solid { ...A } }
+            '''
+        )
+        == ['abc']
+    )
+
+
+def define_client(instance):
+    return create_app_with_reconstructable_repo(
+        ReconstructableRepository.from_yaml(file_relative_path(__file__, './repository.yaml')),
+        instance,
+    ).test_client()
+
+
+def post_query(client, query, variables=None, extensions=None, headers=None):
+    return client.post(
+        '/graphql',
+        data=json.dumps({'query': query, 'variables': variables, 'extensions': extensions}),
+        content_type='application/json',
+        headers=headers,
+    )
+
+
+def test_snapshot_query_response_cache():
+    instance = DagsterInstance.ephemeral()
+    instance.create_run_for_pipeline(
+        math, environment_dict={'solids': {'add_one': {'inputs': {'num': {'value': 1}}}}}
+    )
+    snapshot_id = math.get_pipeline_snapshot_id()
+    client = define_client(instance)
+
+    response = post_query(client, SNAPSHOT_QUERY, {'snapshotId': snapshot_id})
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'max-age=31536000, immutable'
+    etag = response.headers['ETag']
+    data = json.loads(response.data.decode('utf-8'))
+    assert data['data']['pipelineSnapshotOrError']['name'] == 'math'
+
+    # served from the cache, without running the resolvers
+    with mock.patch(
+        'dagster_graphql.schema.roots.get_pipeline_snapshot_or_error_from_snapshot_id'
+    ) as get_snapshot:
+        cached_response = post_query(client, SNAPSHOT_QUERY, {'snapshotId': snapshot_id})
+        assert not get_snapshot.called
+
+    assert cached_response.status_code == 200
+    assert cached_response.headers['ETag'] == etag
+    assert cached_response.data == response.data
+
+    not_modified_response = post_query(
+        client, SNAPSHOT_QUERY, {'snapshotId': snapshot_id}, headers={'If-None-Match': etag}
+    )
+    assert not_modified_response.status_code == 304
+    assert not not_modified_response.data
+
+
+def test_snapshot_query_not_found_not_cached():
+    client = define_client(DagsterInstance.ephemeral())
+
+    response = post_query(client, SNAPSHOT_QUERY, {'snapshotId': 'nope'})
+    assert response.status_code == 200
+    assert 'ETag' not in response.headers
+    data = json.loads(response.data.decode('utf-8'))
+    assert data['data']['pipelineSnapshotOrError']['__typename'] == 'PipelineSnapshotNotFoundError'
+
+
+def test_persisted_query():
+    client = define_client(DagsterInstance.ephemeral())
+    query = 'query { version }'
+    extensions = {
+        'persistedQuery': {
+            'version': 1,
+            'sha256Hash': hashlib.sha256(query.encode('utf-8')).hexdigest(),
+        }
+    }
+
+    response = client.get('/graphql', query_string={'extensions': json.dumps(extensions)})
+    assert response.status_code == 200
+    data = json.loads(response.data.decode('utf-8'))
+    assert data['errors'][0]['message'] == PERSISTED_QUERY_NOT_FOUND
+
+    response = post_query(client, query, extensions=extensions)
+    assert response.status_code == 200
+    assert json.loads(response.data.decode('utf-8'))['data']['version']
+
+    response = client.get('/graphql', query_string={'extensions': json.dumps(extensions)})
+    assert response.status_code == 200
+    assert json.loads(response.data.decode('utf-8'))['data']['version']
+
+    response = post_query(client, 'query { __typename }', extensions=extensions)
+    assert response.status_code == 400
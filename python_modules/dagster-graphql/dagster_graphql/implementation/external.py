@@ -3,9 +3,14 @@ import sys
 from graphql.execution.base import ResolveInfo
 
 from dagster import check
-from dagster.config.validate import validate_config_from_snap
+from dagster.config.validate import (
+    create_config_validation_handle,
+    get_changed_config_path,
+    revalidate_config_from_snap,
+)
 from dagster.core.errors import DagsterInvalidDefinitionError
 from dagster.core.host_representation import ExternalExecutionPlan, ExternalPipeline
+from dagster.utils import LRUCache
 from dagster.utils.error import serializable_error_info_from_exc_info
 
 from .utils import PipelineSelector, UserFacingGraphQLError, capture_dauphin_error
@@ -70,27 +75,67 @@ def get_external_pipeline_or_raise(graphene_info, selector):
         )
 
 
+CONFIG_VALIDATION_CACHE_SIZE = 32
+
+# The last config validated for each mode of each pipeline snapshot, with its validation. The config
+# editor of dagit has its config validated after every edit, so most configs differ from the last
+# one only in a small subtree, and only that subtree needs to be validated again.
+_config_validation_cache = LRUCache(CONFIG_VALIDATION_CACHE_SIZE)
+
+
+def _validate_config(external_pipeline, mode, environment_dict):
+    config_type_key = external_pipeline.root_config_key_for_mode(mode)
+    cache_key = (external_pipeline.computed_pipeline_snapshot_id, config_type_key)
+
+    cached_validation = _config_validation_cache.get(cache_key)
+
+    if cached_validation is None:
+        handle = create_config_validation_handle(
+            config_schema_snapshot=external_pipeline.config_schema_snapshot,
+            config_type_key=config_type_key,
+            config_value=environment_dict,
+        )
+    else:
+        previous_environment_dict, previous_handle = cached_validation
+        changed_path = get_changed_config_path(previous_environment_dict, environment_dict)
+        handle = (
+            previous_handle
+            if changed_path is None
+            else revalidate_config_from_snap(previous_handle, environment_dict, changed_path)
+        )
+
+    # Copied, since the caller may go on to change its config in place
+    _config_validation_cache.set(cache_key, (_copy_config_value(environment_dict), handle))
+
+    return handle
+
+
+def _copy_config_value(config_value):
+    # Much faster than copy.deepcopy for config values, which are made of dicts, lists and scalars
+    if isinstance(config_value, dict):
+        return {key: _copy_config_value(value) for key, value in config_value.items()}
+    if isinstance(config_value, list):
+        return [_copy_config_value(item) for item in config_value]
+    return config_value
+
+
 def ensure_valid_config(external_pipeline, mode, environment_dict):
     check.inst_param(external_pipeline, 'external_pipeline', ExternalPipeline)
     check.str_param(mode, 'mode')
-    # do not type check environment_dict so that validate_config_from_snap throws
+    # do not type check environment_dict so that its validation reports the error
 
-    validated_config = validate_config_from_snap(
-        config_schema_snapshot=external_pipeline.config_schema_snapshot,
-        config_type_key=external_pipeline.root_config_key_for_mode(mode),
-        config_value=environment_dict,
-    )
+    validation = _validate_config(external_pipeline, mode, environment_dict)
 
-    if not validated_config.success:
+    if not validation.success:
         from dagster_graphql.schema.errors import DauphinPipelineConfigValidationInvalid
 
         raise UserFacingGraphQLError(
             DauphinPipelineConfigValidationInvalid.for_validation_errors(
-                external_pipeline, validated_config.errors
+                external_pipeline, validation.errors
             )
         )
 
-    return validated_config
+    return validation
 
 
 def ensure_valid_step_keys(full_external_execution_plan, step_keys):
@@ -7,7 +7,7 @@ from dagster_graphql.schema.pipelines import DauphinPipeline, DauphinPipelineSna
 from graphql.execution.base import ResolveInfo
 
 from dagster import check
-from dagster.core.storage.pipeline_run import PipelineRun
+from dagster.core.storage.pipeline_run import PipelineRun, RunRecord
 
 from .utils import UserFacingGraphQLError, capture_dauphin_error
 
@@ -60,8 +60,8 @@ def get_pipeline_or_raise(graphene_info, selector):
 def get_pipeline_reference_or_raise(graphene_info, pipeline_run):
     '''Returns a DauphinPipelineReference or raises a UserFacingGraphQLError if a pipeline
     reference cannot be retrieved based on the run, e.g, a UserFacingGraphQLError that wraps an
-    InvalidSubsetError.'''
-    check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+    InvalidSubsetError. The run may be a RunRecord if it has a pipeline snapshot.'''
+    check.inst_param(pipeline_run, 'pipeline_run', (PipelineRun, RunRecord))
 
     if pipeline_run.pipeline_snapshot_id is None:
         return graphene_info.schema.type_named('UnknownPipeline')(
@@ -83,9 +83,9 @@ def get_runs(graphene_info, filters, cursor=None, limit=None):
         if run:
             runs = [run]
     elif filters and (filters.pipeline_name or filters.tags or filters.status):
-        runs = instance.get_runs(filters, cursor, limit)
+        runs = instance.get_run_records(filters, cursor, limit)
     else:
-        runs = instance.get_runs(cursor=cursor, limit=limit)
+        runs = instance.get_run_records(cursor=cursor, limit=limit)
 
     return [graphene_info.schema.type_named('PipelineRun')(run) for run in runs]
 
@@ -1,11 +1,7 @@
 from collections import OrderedDict, defaultdict
 
-from dagster_graphql.schema.pipelines import DauphinPipeline
-from dagster_graphql.schema.solids import (
-    DauphinSolidInvocationSite,
-    DauphinUsedSolid,
-    build_dauphin_solid_handles,
-)
+from dagster_graphql.schema.pipelines import DauphinPipeline, get_pipeline_snapshot_view
+from dagster_graphql.schema.solids import DauphinSolidInvocationSite, DauphinUsedSolid
 
 
 def get_solid(graphene_info, name):
@@ -21,9 +17,7 @@ def get_used_solid_map(graphene_info):
     definitions = []
 
     for external_pipeline in graphene_info.context.legacy_get_all_external_pipelines():
-        for handle in build_dauphin_solid_handles(
-            external_pipeline, external_pipeline.dep_structure_index
-        ):
+        for handle in get_pipeline_snapshot_view(external_pipeline).solid_handles.values():
             definition = handle.solid.get_dauphin_solid_definition()
             if definition.name not in inv_by_def_name:
                 definitions.append(definition)
@@ -49,7 +49,7 @@ class DauphinAsset(dauphin.ObjectType):
 
         return [
             graphene_info.schema.type_named('PipelineRun')(r)
-            for r in graphene_info.context.instance.get_runs(
+            for r in graphene_info.context.instance.get_run_records(
                 filters=PipelineRunsFilter(run_ids=run_ids)
             )
         ]
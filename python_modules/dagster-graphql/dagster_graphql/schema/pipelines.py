@@ -1,5 +1,7 @@
 from __future__ import absolute_import
 
+from collections import OrderedDict
+
 import yaml
 from dagster_graphql import dauphin
 from dagster_graphql.implementation.context import ExternalPipeline
@@ -11,7 +13,7 @@ from dagster import check
 from dagster.core.host_representation import ExternalPresetData, RepresentedPipeline
 from dagster.core.snap import ConfigSchemaSnapshot, LoggerDefSnap, ModeDefSnap, ResourceDefSnap
 from dagster.core.storage.pipeline_run import PipelineRunsFilter
-from dagster.seven import lru_cache
+from dagster.utils import LRUCache
 
 from .config_types import DauphinConfigTypeField
 from .dagster_types import to_dauphin_dagster_type
@@ -84,18 +86,7 @@ class DauphinIPipelineSnapshotMixin(object):
         return self.get_represented_pipeline().description
 
     def resolve_dagster_types(self, _graphene_info):
-        represented_pipeline = self.get_represented_pipeline()
-        return sorted(
-            list(
-                map(
-                    lambda dt: to_dauphin_dagster_type(
-                        represented_pipeline.pipeline_snapshot, dt.key
-                    ),
-                    [t for t in represented_pipeline.dagster_type_snaps if t.name],
-                )
-            ),
-            key=lambda dagster_type: dagster_type.name,
-        )
+        return get_pipeline_snapshot_view(self.get_represented_pipeline()).dagster_types
 
     @capture_dauphin_error
     def resolve_dagster_type_or_error(self, _, **kwargs):
@@ -116,35 +107,25 @@ class DauphinIPipelineSnapshotMixin(object):
         )
 
     def resolve_solids(self, _graphene_info):
-        represented_pipeline = self.get_represented_pipeline()
-        return build_dauphin_solids(represented_pipeline, represented_pipeline.dep_structure_index,)
+        return get_pipeline_snapshot_view(self.get_represented_pipeline()).solids
 
     def resolve_modes(self, _):
-        represented_pipeline = self.get_represented_pipeline()
-        return [
-            DauphinMode(represented_pipeline.config_schema_snapshot, mode_def_snap)
-            for mode_def_snap in sorted(
-                represented_pipeline.mode_def_snaps, key=lambda item: item.name
-            )
-        ]
+        return get_pipeline_snapshot_view(self.get_represented_pipeline()).modes
 
     def resolve_solid_handle(self, _graphene_info, handleID):
-        return _get_solid_handles(self.get_represented_pipeline()).get(handleID)
+        return get_pipeline_snapshot_view(self.get_represented_pipeline()).solid_handles.get(
+            handleID
+        )
 
     def resolve_solid_handles(self, _graphene_info, **kwargs):
-        handles = _get_solid_handles(self.get_represented_pipeline())
+        view = get_pipeline_snapshot_view(self.get_represented_pipeline())
         parentHandleID = kwargs.get('parentHandleID')
 
-        if parentHandleID == "":
-            handles = {key: handle for key, handle in handles.items() if not handle.parent}
-        elif parentHandleID is not None:
-            handles = {
-                key: handle
-                for key, handle in handles.items()
-                if handle.parent and handle.parent.handleID.to_string() == parentHandleID
-            }
+        if parentHandleID is None:
+            return view.sorted_solid_handles
 
-        return [handles[key] for key in sorted(handles)]
+        # The top level handles are the children of ""
+        return view.sorted_solid_handles_by_parent.get(parentHandleID, [])
 
     def resolve_tags(self, graphene_info):
         represented_pipeline = self.get_represented_pipeline()
@@ -217,15 +198,107 @@ class DauphinPipeline(DauphinIPipelineSnapshotMixin, dauphin.ObjectType):
         ]
 
 
-@lru_cache(maxsize=32)
-def _get_solid_handles(represented_pipeline):
+PIPELINE_SNAPSHOT_VIEW_CACHE_SIZE = 32
+
+_pipeline_snapshot_view_cache = LRUCache(PIPELINE_SNAPSHOT_VIEW_CACHE_SIZE)
+
+
+def get_pipeline_snapshot_view(represented_pipeline):
+    '''The dauphin objects derived from a pipeline snapshot, shared by every request for a pipeline
+    with the same snapshot, however the pipeline is represented.
+    '''
     check.inst_param(represented_pipeline, 'represented_pipeline', RepresentedPipeline)
-    return {
-        str(item.handleID): item
-        for item in build_dauphin_solid_handles(
-            represented_pipeline, represented_pipeline.dep_structure_index
+
+    snapshot_id = represented_pipeline.computed_pipeline_snapshot_id
+    view = _pipeline_snapshot_view_cache.get(snapshot_id)
+    if view is None:
+        view = PipelineSnapshotView(represented_pipeline)
+        _pipeline_snapshot_view_cache.set(snapshot_id, view)
+
+    return view
+
+
+class PipelineSnapshotView(object):
+    '''The solid handles, solids, dagster types and modes of a pipeline snapshot, each built on
+    first use.
+    '''
+
+    def __init__(self, represented_pipeline):
+        self._represented_pipeline = check.inst_param(
+            represented_pipeline, 'represented_pipeline', RepresentedPipeline
         )
-    }
+        self._solid_handles = None
+        self._sorted_solid_handles = None
+        self._sorted_solid_handles_by_parent = None
+        self._solids = None
+        self._dagster_types = None
+        self._modes = None
+
+    @property
+    def solid_handles(self):
+        '''OrderedDict[str, DauphinSolidHandle]: All the solid handles of the pipeline, including
+        those inside composites, keyed by handle id.'''
+        if self._solid_handles is None:
+            self._solid_handles = OrderedDict(
+                (str(handle.handleID), handle)
+                for handle in build_dauphin_solid_handles(
+                    self._represented_pipeline, self._represented_pipeline.dep_structure_index
+                )
+            )
+        return self._solid_handles
+
+    @property
+    def sorted_solid_handles(self):
+        if self._sorted_solid_handles is None:
+            self._sorted_solid_handles = [
+                self.solid_handles[key] for key in sorted(self.solid_handles)
+            ]
+        return self._sorted_solid_handles
+
+    @property
+    def sorted_solid_handles_by_parent(self):
+        '''Dict[str, List[DauphinSolidHandle]]: The solid handles of the pipeline, sorted by handle
+        id and keyed by the handle id of their parent, or "" for the top level handles.'''
+        if self._sorted_solid_handles_by_parent is None:
+            by_parent = {}
+            for handle in self.sorted_solid_handles:
+                parent_id = handle.parent.handleID.to_string() if handle.parent else ''
+                by_parent.setdefault(parent_id, []).append(handle)
+            self._sorted_solid_handles_by_parent = by_parent
+        return self._sorted_solid_handles_by_parent
+
+    @property
+    def solids(self):
+        if self._solids is None:
+            self._solids = build_dauphin_solids(
+                self._represented_pipeline, self._represented_pipeline.dep_structure_index
+            )
+        return self._solids
+
+    @property
+    def dagster_types(self):
+        if self._dagster_types is None:
+            pipeline_snapshot = self._represented_pipeline.pipeline_snapshot
+            self._dagster_types = sorted(
+                [
+                    to_dauphin_dagster_type(pipeline_snapshot, dagster_type_snap.key)
+                    for dagster_type_snap in self._represented_pipeline.dagster_type_snaps
+                    if dagster_type_snap.name
+                ],
+                key=lambda dagster_type: dagster_type.name,
+            )
+        return self._dagster_types
+
+    @property
+    def modes(self):
+        if self._modes is None:
+            self._modes = [
+                DauphinMode(self._represented_pipeline.config_schema_snapshot, mode_def_snap)
+                for mode_def_snap in sorted(
+                    self._represented_pipeline.mode_def_snaps, key=lambda item: item.name
+                )
+            ]
+        return self._modes
 
 
 class DauphinPipelineConnection(dauphin.ObjectType):
@@ -25,7 +25,7 @@ from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.stats import RunStepKeyStatsSnapshot, StepEventStatus
 from dagster.core.host_representation import ExternalExecutionPlan
 from dagster.core.storage.compute_log_manager import ComputeIOType, ComputeLogFileData
-from dagster.core.storage.pipeline_run import PipelineRunStatsSnapshot, PipelineRunStatus
+from dagster.core.storage.pipeline_run import PipelineRunStatsSnapshot, PipelineRunStatus, RunRecord
 
 from .execution import DauphinExecutionStep
 
@@ -124,16 +124,35 @@ class DauphinPipelineRun(dauphin.ObjectType):
     assets = dauphin.non_null_list('Asset')
 
     def __init__(self, pipeline_run):
+        # A RunRecord is enough to list a run, the full PipelineRun is only loaded from the
+        # instance to resolve fields that are not part of the record, like runConfigYaml
+        check.inst_param(pipeline_run, 'pipeline_run', (PipelineRun, RunRecord))
         super(DauphinPipelineRun, self).__init__(
             runId=pipeline_run.run_id, status=pipeline_run.status, mode=pipeline_run.mode
         )
-        self._pipeline_run = check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        if isinstance(pipeline_run, RunRecord):
+            self._run_record = pipeline_run
+            self._pipeline_run = None
+        else:
+            self._run_record = RunRecord.from_pipeline_run(pipeline_run)
+            self._pipeline_run = pipeline_run
+
+    def _get_pipeline_run(self, graphene_info):
+        if self._pipeline_run is None:
+            self._pipeline_run = graphene_info.context.instance.get_run_by_id(self.run_id)
+        return self._pipeline_run
 
     def resolve_pipeline(self, graphene_info):
-        return get_pipeline_reference_or_raise(graphene_info, self._pipeline_run,)
+        return get_pipeline_reference_or_raise(
+            graphene_info,
+            # runs without a snapshot are referenced by their solid subset, which is not recorded
+            self._run_record
+            if self._run_record.pipeline_snapshot_id
+            else self._get_pipeline_run(graphene_info),
+        )
 
     def resolve_pipelineSnapshotId(self, _):
-        return self._pipeline_run.pipeline_snapshot_id
+        return self._run_record.pipeline_snapshot_id
 
     def resolve_stats(self, graphene_info):
         return get_stats(graphene_info, self.run_id)
@@ -145,20 +164,16 @@ class DauphinPipelineRun(dauphin.ObjectType):
         return graphene_info.schema.type_named('ComputeLogs')(runId=self.run_id, stepKey=stepKey)
 
     def resolve_executionPlan(self, graphene_info):
-        if not (
-            self._pipeline_run.execution_plan_snapshot_id
-            and self._pipeline_run.pipeline_snapshot_id
-        ):
+        pipeline_run = self._get_pipeline_run(graphene_info)
+        if not (pipeline_run.execution_plan_snapshot_id and pipeline_run.pipeline_snapshot_id):
             return None
 
         from .execution import DauphinExecutionPlan
 
         instance = graphene_info.context.instance
-        historical_pipeline = instance.get_historical_pipeline(
-            self._pipeline_run.pipeline_snapshot_id
-        )
+        historical_pipeline = instance.get_historical_pipeline(pipeline_run.pipeline_snapshot_id)
         execution_plan_snapshot = instance.get_execution_plan_snapshot(
-            self._pipeline_run.execution_plan_snapshot_id
+            pipeline_run.execution_plan_snapshot_id
         )
         return (
             DauphinExecutionPlan(
@@ -172,22 +187,24 @@ class DauphinPipelineRun(dauphin.ObjectType):
         )
 
     def resolve_stepKeysToExecute(self, _):
-        return self._pipeline_run.step_keys_to_execute
+        return self._run_record.step_keys_to_execute
 
-    def resolve_runConfigYaml(self, _graphene_info):
-        return yaml.dump(self._pipeline_run.environment_dict, default_flow_style=False)
+    def resolve_runConfigYaml(self, graphene_info):
+        return yaml.dump(
+            self._get_pipeline_run(graphene_info).environment_dict, default_flow_style=False
+        )
 
     def resolve_tags(self, graphene_info):
         return [
             graphene_info.schema.type_named('PipelineTag')(key=key, value=value)
-            for key, value in self._pipeline_run.tags.items()
+            for key, value in self._run_record.tags.items()
         ]
 
     def resolve_rootRunId(self, _):
-        return self._pipeline_run.root_run_id
+        return self._run_record.root_run_id
 
     def resolve_parentRunId(self, _):
-        return self._pipeline_run.parent_run_id
+        return self._run_record.parent_run_id
 
     @property
     def run_id(self):
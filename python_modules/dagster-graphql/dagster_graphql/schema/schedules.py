@@ -228,7 +228,7 @@ class DauphinRunningSchedule(dauphin.ObjectType):
     def resolve_runs(self, graphene_info, **kwargs):
         return [
             graphene_info.schema.type_named('PipelineRun')(r)
-            for r in graphene_info.context.instance.get_runs(
+            for r in graphene_info.context.instance.get_run_records(
                 filters=PipelineRunsFilter.for_schedule(self._schedule), limit=kwargs.get('limit'),
             )
         ]
@@ -36,7 +36,7 @@ snapshots['test_fetch_snapshot_or_error_by_snapshot_id_success 1'] = '''{
       }
     ],
     "name": "noop_pipeline",
-    "pipelineSnapshotId": "5477a4bd4f8161b7ec6c72c54ca64196f25c8375",
+    "pipelineSnapshotId": "673a73231dd01b76633489de9096ec6ce340cf55",
     "solidHandles": [
       {
         "handleID": "noop_solid"
@@ -91,7 +91,7 @@ snapshots['test_fetch_snapshot_or_error_by_active_pipeline_name_success 1'] = ''
       }
     ],
     "name": "csv_hello_world",
-    "pipelineSnapshotId": "513fe7c18f39fac1494144ba4863b7e48df76351",
+    "pipelineSnapshotId": "de435143244618281122446608c7e9efac057ee6",
     "solidHandles": [
       {
         "handleID": "sum_solid"
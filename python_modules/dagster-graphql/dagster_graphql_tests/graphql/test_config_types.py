@@ -1,6 +1,7 @@
 from dagster_graphql.test.utils import execute_dagster_graphql, get_legacy_pipeline_selector
 
-from dagster import check
+from dagster import check, seven
+from dagster.config import validate
 from dagster.config.config_type import ALL_CONFIG_BUILTINS
 from dagster.utils import file_relative_path
 
@@ -266,6 +267,63 @@ class TestConfigTypes(ReadonlyGraphQLContextTestMatrix):
         assert error_data['reason'] == 'MISSING_REQUIRED_FIELD'
         assert error_data['field']['name'] == 'num'
 
+    def test_config_revalidated_after_edit(self, graphql_context):
+        environment_dict = {
+            'solids': {'sum_solid': {'inputs': {'num': 'foo.txt'}}},
+            'storage': {'filesystem': {}},
+        }
+        result = execute_config_graphql(
+            graphql_context,
+            pipeline_name='csv_hello_world',
+            environment_dict=environment_dict,
+            mode='default',
+        )
+        assert result.data['isPipelineConfigValid']['__typename'] == 'PipelineConfigValidationValid'
+
+        with seven.mock.patch(
+            'dagster_graphql.implementation.external.revalidate_config_from_snap',
+            wraps=validate.revalidate_config_from_snap,
+        ) as revalidate:
+            environment_dict['solids']['sum_solid']['inputs']['num'] = 123
+            result = execute_config_graphql(
+                graphql_context,
+                pipeline_name='csv_hello_world',
+                environment_dict=environment_dict,
+                mode='default',
+            )
+            assert revalidate.call_args[0][2] == ['solids', 'sum_solid', 'inputs', 'num']
+
+            error_data = single_error_data(result)
+            assert error_data['reason'] == 'RUNTIME_TYPE_MISMATCH'
+            assert field_stack(error_data) == ['solids', 'sum_solid', 'inputs', 'num']
+
+            environment_dict['storage'] = {'filesystem': {}, 'in_memory': {}}
+            result = execute_config_graphql(
+                graphql_context,
+                pipeline_name='csv_hello_world',
+                environment_dict=environment_dict,
+                mode='default',
+            )
+            assert revalidate.call_args[0][2] == ['storage', 'in_memory']
+            assert sorted(
+                error_data['reason']
+                for error_data in result.data['isPipelineConfigValid']['errors']
+            ) == ['RUNTIME_TYPE_MISMATCH', 'SELECTOR_FIELD_ERROR']
+
+            environment_dict['solids']['sum_solid']['inputs']['num'] = 'foo.txt'
+            del environment_dict['storage']
+            result = execute_config_graphql(
+                graphql_context,
+                pipeline_name='csv_hello_world',
+                environment_dict=environment_dict,
+                mode='default',
+            )
+            assert revalidate.call_args[0][2] == []
+            assert (
+                result.data['isPipelineConfigValid']['__typename']
+                == 'PipelineConfigValidationValid'
+            )
+
     def test_mode_resource_config_works(self, graphql_context):
         result = execute_config_graphql(
             graphql_context,
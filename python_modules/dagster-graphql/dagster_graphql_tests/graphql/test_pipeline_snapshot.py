@@ -3,12 +3,15 @@ from dagster_graphql.implementation.fetch_pipelines import (
     _get_dauphin_pipeline_snapshot_from_instance,
 )
 from dagster_graphql.implementation.utils import UserFacingGraphQLError
+from dagster_graphql.schema.pipelines import get_pipeline_snapshot_view
 from dagster_graphql.test.utils import execute_dagster_graphql
 
 from dagster import execute_pipeline
+from dagster.core.host_representation import HistoricalPipeline
 from dagster.seven import json, mock
+from dagster.utils import LRUCache
 
-from .setup import noop_pipeline
+from .setup import composites_pipeline, noop_pipeline
 
 SNAPSHOT_OR_ERROR_QUERY_BY_SNAPSHOT_ID = '''
 query PipelineSnapshotQueryBySnapshotID($snapshotId: String!) {
@@ -126,3 +129,40 @@ def test_temporary_error_or_deletion_after_instance_check():
 
     with pytest.raises(UserFacingGraphQLError):
         _get_dauphin_pipeline_snapshot_from_instance(instance, 'kjdkfjd')
+
+
+def _historical_pipeline(pipeline_def):
+    pipeline_snapshot = pipeline_def.get_pipeline_snapshot()
+    return HistoricalPipeline(
+        pipeline_snapshot, pipeline_def.get_pipeline_snapshot_id(), parent_pipeline_snapshot=None
+    )
+
+
+def test_pipeline_snapshot_view_shared_by_snapshot():
+    view = get_pipeline_snapshot_view(_historical_pipeline(composites_pipeline))
+    assert get_pipeline_snapshot_view(_historical_pipeline(composites_pipeline)) is view
+
+    assert [handle.handleID.to_string() for handle in view.sorted_solid_handles_by_parent['']] == [
+        'add_four',
+        'div_four',
+    ]
+    assert [
+        handle.handleID.to_string()
+        for handle in view.sorted_solid_handles_by_parent['add_four.adder_1']
+    ] == ['add_four.adder_1.adder_1', 'add_four.adder_1.adder_2']
+    assert len(view.solid_handles) == len(view.sorted_solid_handles) == 10
+    assert view.solid_handles['div_four.div_2'].solid.name == 'div_2'
+    assert [solid.name for solid in view.solids] == ['add_four', 'div_four']
+
+
+def test_pipeline_snapshot_view_cache_size():
+    with mock.patch(
+        'dagster_graphql.schema.pipelines._pipeline_snapshot_view_cache', new=LRUCache(1)
+    ):
+        composites_view = get_pipeline_snapshot_view(_historical_pipeline(composites_pipeline))
+        get_pipeline_snapshot_view(_historical_pipeline(noop_pipeline))
+
+        assert (
+            get_pipeline_snapshot_view(_historical_pipeline(composites_pipeline))
+            is not composites_view
+        )
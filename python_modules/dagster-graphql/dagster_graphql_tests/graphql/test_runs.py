@@ -197,6 +197,12 @@ def test_get_runs_over_graphql(graphql_context):
     run_one_data = _get_runs_data(result, run_id_one)
     assert run_one_data
 
+    # runs are listed from run records, the fields that are not part of the record are loaded
+    # from the full run
+    assert run_one_data['mode'] == 'add_mode'
+    assert run_one_data['runConfigYaml'] == 'resources:\n  op:\n    config: 2\n'
+    assert run_one_data['executionPlan']['steps']
+
     # second is gone
     run_two_data = _get_runs_data(result, run_id_two)
     assert run_two_data is None
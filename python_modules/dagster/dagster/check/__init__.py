@@ -1,4 +1,5 @@
 import inspect
+import os
 import sys
 
 from future.utils import raise_with_traceback
@@ -13,6 +14,25 @@ else:
     type_types = (type, new.classobj)  # pylint: disable=undefined-variable
 
 
+# In production mode, the elements of collections are not checked: only the types of the
+# collections themselves are, along with the lengths of tuples of a fixed shape. This saves the time
+# of checking every element of a collection passed as a parameter, at the cost of less precise
+# errors when an element is of the wrong type.
+_production_mode = os.getenv('DAGSTER_CHECK_PRODUCTION_MODE', '').lower() in ('1', 'true')
+
+
+def set_production_mode(enabled):
+    '''Turn production mode, in which the elements of collections are not checked, on or off. It
+    can also be turned on by setting the ``DAGSTER_CHECK_PRODUCTION_MODE`` environment variable to
+    ``1`` before dagster is imported.'''
+    global _production_mode  # pylint: disable=global-statement
+    _production_mode = bool_param(enabled, 'enabled')
+
+
+def is_production_mode():
+    return _production_mode
+
+
 class CheckError(Exception):
     pass
 
@@ -255,7 +275,7 @@ def is_str(obj):
 
 
 def str_param(obj, param_name):
-    if not is_str(obj):
+    if not isinstance(obj, string_types):
         raise_with_traceback(_param_type_mismatch_exception(obj, str, param_name))
     return obj
 
@@ -353,6 +373,9 @@ def opt_tuple_param(obj, param_name, default=None, of_type=None):
 
 
 def _check_list_items(obj_list, of_type):
+    if _production_mode:
+        return obj_list
+
     if of_type is str:
         of_type = string_types
 
@@ -380,6 +403,9 @@ def _check_list_items(obj_list, of_type):
 
 
 def _check_set_items(obj_set, of_type):
+    if _production_mode:
+        return obj_set
+
     if of_type is str:
         of_type = string_types
 
@@ -417,6 +443,11 @@ def _check_tuple_items(obj_tuple, of_type):
                     '{len_type}'.format(len_tuple=len_tuple, len_type=len_type)
                 )
             )
+
+    if _production_mode:
+        return obj_tuple
+
+    if isinstance(of_type, tuple):
         for (i, obj) in enumerate(obj_tuple):
             of_type_i = of_type[i]
             if of_type_i is str:
@@ -533,6 +564,9 @@ def _check_key_value_types(obj, key_type, value_type, key_check=isinstance, valu
     if not isinstance(obj, dict):
         raise_with_traceback(_type_mismatch_error(obj, dict))
 
+    if _production_mode:
+        return obj
+
     if key_type is str:
         key_type = string_types
 
@@ -611,6 +645,9 @@ def opt_nullable_dict_param(obj, param_name, key_type=None, value_type=None, val
 def _check_two_dim_key_value_types(obj, key_type, _param_name, value_type):
     _check_key_value_types(obj, key_type, dict)  # check level one
 
+    if _production_mode:
+        return obj
+
     for level_two_dict in obj.values():
         _check_key_value_types(level_two_dict, key_type, value_type)  # check level two
 
@@ -10,6 +10,7 @@ def create_instance_cli_group():
     group = click.Group(name='instance')
     group.add_command(info_command)
     group.add_command(migrate_command)
+    group.add_command(gc_command)
     return group
 
 
@@ -51,4 +52,45 @@ def migrate_command():
     click.echo(instance.info_str())
 
 
+@click.command(
+    name='gc',
+    help='Delete the content-addressed intermediates no run artifacts refer to any more, and list '
+    'the stored artifacts of runs that are not in run storage.',
+)
+@click.option(
+    '--delete-run-artifacts',
+    is_flag=True,
+    default=False,
+    help='Also delete the listed artifacts of runs that are not in run storage. Do not use this if '
+    'the artifact storage is shared with other instances.',
+)
+def gc_command(delete_run_artifacts):
+    instance = DagsterInstance.get()
+
+    if instance.is_ephemeral:
+        click.echo('$DAGSTER_HOME is not set; ephemeral instances do not need to be collected.')
+        return
+
+    unknown_run_ids, collected_digests = instance.collect_garbage(
+        delete_run_artifacts=delete_run_artifacts
+    )
+    if unknown_run_ids:
+        click.echo(
+            '{action} the artifacts of {num_runs} runs that are not in run storage:'.format(
+                action='Deleted' if delete_run_artifacts else 'Would delete',
+                num_runs=len(unknown_run_ids),
+            )
+        )
+        for run_id in unknown_run_ids:
+            click.echo('  {run_id}'.format(run_id=run_id))
+        if not delete_run_artifacts:
+            click.echo('Pass --delete-run-artifacts to delete them.')
+
+    click.echo(
+        'Deleted {num_objects} unreferenced intermediates.'.format(
+            num_objects=len(collected_digests)
+        )
+    )
+
+
 instance_cli = create_instance_cli_group()
@@ -4,7 +4,6 @@ import os
 import re
 import sys
 import textwrap
-import time
 
 import click
 import six
@@ -16,13 +15,12 @@ from dagster.cli.load_snapshot import get_pipeline_snapshot_from_cli_args
 from dagster.core.definitions.executable import ExecutablePipeline
 from dagster.core.definitions.partition import PartitionScheduleDefinition
 from dagster.core.definitions.reconstructable import ReconstructableRepository
+from dagster.core.execution.backfill import execute_backfill
 from dagster.core.instance import DagsterInstance
 from dagster.core.snap import PipelineSnapshot, SolidInvocationSnap
-from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.core.telemetry import log_repo_stats, telemetry_wrapper
-from dagster.core.utils import make_new_backfill_id
 from dagster.seven import IS_WINDOWS, JSONDecodeError, json
-from dagster.utils import DEFAULT_REPOSITORY_YAML_FILENAME, load_yaml_from_glob_list, merge_dicts
+from dagster.utils import DEFAULT_REPOSITORY_YAML_FILENAME, load_yaml_from_glob_list
 from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.indenting_printer import IndentingPrinter
 
@@ -631,24 +629,15 @@ def execute_backfill_command(cli_args, print_fn, instance=None):
     ):
 
         print_fn('Launching runs... ')
-        backfill_id = make_new_backfill_id()
 
-        run_tags = merge_dicts(
-            PipelineRun.tags_for_backfill_id(backfill_id), get_tags_from_args(cli_args),
+        backfill_id = execute_backfill(
+            instance,
+            partition_set,
+            partitions,
+            pipeline_def=pipeline,
+            tags=get_tags_from_args(cli_args),
         )
 
-        for partition in partitions:
-            run = instance.create_run_for_pipeline(
-                pipeline_def=pipeline,
-                mode=partition_set.mode,
-                solid_subset=partition_set.solid_subset,
-                environment_dict=partition_set.environment_dict_for_partition(partition),
-                tags=merge_dicts(partition_set.tags_for_partition(partition), run_tags),
-            )
-            instance.launch_run(run.run_id)
-            # Remove once we can handle synchronous execution... currently limited by sqlite
-            time.sleep(0.1)
-
         print_fn('Launched backfill job `{}`'.format(backfill_id))
     else:
         print_fn(' Aborted!')
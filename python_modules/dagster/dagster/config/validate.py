@@ -1,3 +1,5 @@
+from collections import namedtuple
+
 import six
 
 from dagster import check
@@ -5,6 +7,7 @@ from dagster.utils import ensure_single_item, frozendict
 
 from .config_type import ConfigScalarKind, ConfigTypeKind
 from .errors import (
+    EvaluationError,
     create_array_error,
     create_dict_type_mismatch_error,
     create_enum_type_mismatch_error,
@@ -71,6 +74,203 @@ def validate_config_from_snap(config_schema_snapshot, config_type_key, config_va
     )
 
 
+class ConfigValidationHandle(
+    namedtuple('_ConfigValidationHandle', 'config_schema_snapshot config_type_key errors')
+):
+    '''The errors of validating a config value against a config type of a schema snapshot, kept so
+    that the validation can be updated when a subtree of the config value changes. See
+    ``revalidate_config_from_snap``.
+    '''
+
+    def __new__(cls, config_schema_snapshot, config_type_key, errors):
+        return super(ConfigValidationHandle, cls).__new__(
+            cls,
+            check.inst_param(
+                config_schema_snapshot, 'config_schema_snapshot', ConfigSchemaSnapshot
+            ),
+            check.str_param(config_type_key, 'config_type_key'),
+            check.list_param(errors, 'errors', of_type=EvaluationError),
+        )
+
+    @property
+    def success(self):
+        return not self.errors
+
+
+def create_config_validation_handle(config_schema_snapshot, config_type_key, config_value):
+    validated_config = validate_config_from_snap(
+        config_schema_snapshot=config_schema_snapshot,
+        config_type_key=config_type_key,
+        config_value=config_value,
+    )
+    return ConfigValidationHandle(config_schema_snapshot, config_type_key, validated_config.errors)
+
+
+def revalidate_config_from_snap(handle, config_value, changed_path):
+    '''Validate a config value that differs from the config value of a previous validation only in
+    the subtree at ``changed_path``, which may have changed, been added or been removed.
+
+    Only the parent of the changed subtree is validated again: the errors of the previous
+    validation outside of it still hold, since the validation of a subtree depends on nothing but
+    the subtree and the keys of its ancestors. A small edit to a large config value is thus cheap
+    to validate.
+
+    Args:
+        handle (ConfigValidationHandle): The validation of the previous config value.
+        config_value (Any): The new config value.
+        changed_path (List[Union[str, int]]): The field names and list indices from the root of the
+            config value to the changed subtree.
+
+    Returns:
+        ConfigValidationHandle: The validation of the new config value. It has the errors of
+            validating the whole config value, though not necessarily in the same order.
+    '''
+    check.inst_param(handle, 'handle', ConfigValidationHandle)
+    check.list_param(changed_path, 'changed_path')
+
+    context = ValidationContext(
+        config_schema_snapshot=handle.config_schema_snapshot,
+        config_type_snap=handle.config_schema_snapshot.get_config_snap(handle.config_type_key),
+        stack=EvaluationStack(entries=[]),
+    )
+    # Validate the deepest ancestor of the changed subtree that the validation of the whole config
+    # value descends into
+    for key in changed_path[:-1]:
+        child = _child_context_and_value(context, config_value, key)
+        if child is None:
+            break
+        context, config_value = child
+
+    entries = context.stack.entries
+    errors = list(handle.errors)
+    subtree_indices = [
+        index
+        for index, error in enumerate(errors)
+        if error.stack.entries[: len(entries)] == entries
+    ]
+    insert_index = subtree_indices[0] if subtree_indices else len(errors)
+    for index in reversed(subtree_indices):
+        del errors[index]
+
+    errors[insert_index:insert_index] = _validate_config(context, config_value).errors
+    return ConfigValidationHandle(handle.config_schema_snapshot, handle.config_type_key, errors)
+
+
+def get_changed_config_path(previous_config_value, config_value):
+    '''The path to the smallest subtree of a config value that holds all of its differences from a
+    previous config value, as passed to ``revalidate_config_from_snap``, or None if there are none.
+    '''
+    path = []
+    while True:
+        if isinstance(previous_config_value, dict) and isinstance(config_value, dict):
+            keys = set(previous_config_value.keys()) | set(config_value.keys())
+        elif isinstance(previous_config_value, list) and isinstance(config_value, list):
+            keys = range(max(len(previous_config_value), len(config_value)))
+        elif not path and _config_values_equal(previous_config_value, config_value):
+            return None
+        else:
+            return path
+
+        changed_keys = [
+            key
+            for key in keys
+            if not _has_key(previous_config_value, key)
+            or not _has_key(config_value, key)
+            or not _config_values_equal(previous_config_value[key], config_value[key])
+        ]
+        if not changed_keys:
+            # Only the root is compared without knowing that it changed
+            return None
+
+        if len(changed_keys) > 1:
+            return path
+
+        key = changed_keys[0]
+        path.append(key)
+        if not _has_key(previous_config_value, key) or not _has_key(config_value, key):
+            return path
+
+        previous_config_value = previous_config_value[key]
+        config_value = config_value[key]
+
+
+def _has_key(config_value, key):
+    if isinstance(config_value, list):
+        return key < len(config_value)
+    return key in config_value
+
+
+def _config_values_equal(left, right):
+    # 1 == True and 1 == 1.0, but they are not the same config value
+    if type(left) is not type(right):
+        return False
+
+    if isinstance(left, dict):
+        if len(left) != len(right):
+            return False
+        for key, value in left.items():
+            if key not in right or not _config_values_equal(value, right[key]):
+                return False
+        return True
+
+    if isinstance(left, list):
+        if len(left) != len(right):
+            return False
+        for left_item, right_item in zip(left, right):
+            if not _config_values_equal(left_item, right_item):
+                return False
+        return True
+
+    return left == right
+
+
+def _child_context_and_value(context, config_value, key):
+    '''The context and the value that the validation of a config value validates its child at
+    ``key`` with, or None if it does not validate that child.'''
+    kind = context.config_type_snap.kind
+
+    if kind == ConfigTypeKind.NONEABLE:
+        if config_value is None:
+            return None
+        return _child_context_and_value(context.for_nullable_inner_type(), config_value, key)
+
+    if kind == ConfigTypeKind.SCALAR_UNION:
+        if not isinstance(config_value, (dict, list)):
+            return None
+        return _child_context_and_value(
+            context.for_new_config_type_key(context.config_type_snap.non_scalar_type_key),
+            config_value,
+            key,
+        )
+
+    if ConfigTypeKind.has_fields(kind):
+        if (
+            not isinstance(config_value, dict)
+            or not isinstance(key, six.string_types)
+            or key not in config_value
+            or not context.config_type_snap.has_field(key)
+            or (kind == ConfigTypeKind.SELECTOR and len(config_value) > 1)
+        ):
+            return None
+
+        field_snap = context.config_type_snap.get_field(key)
+        field_value = config_value[key]
+        if kind == ConfigTypeKind.SELECTOR:
+            field_value = _selector_field_value(context, field_snap, field_value)
+        return context.for_field_snap(field_snap), field_value
+
+    if kind == ConfigTypeKind.ARRAY:
+        if (
+            not isinstance(config_value, list)
+            or not isinstance(key, six.integer_types)
+            or not 0 <= key < len(config_value)
+        ):
+            return None
+        return context.for_array(key), config_value[key]
+
+    return None
+
+
 def _validate_config(context, config_value):
     check.inst_param(context, 'context', ValidationContext)
 
@@ -170,22 +370,7 @@ def validate_selector_config(context, config_value):
     field_snap = context.config_type_snap.get_field(field_name)
 
     child_evaluate_value_result = _validate_config(
-        context.for_field_snap(field_snap),
-        # This is a very particular special case where we want someone
-        # to be able to select a selector key *without* a value
-        #
-        # e.g.
-        # storage:
-        #   filesystem:
-        #
-        # And we want the default values of the child elements of filesystem:
-        # to "fill in"
-        {}
-        if field_value is None
-        and ConfigTypeKind.has_fields(
-            context.config_schema_snapshot.get_config_snap(field_snap.type_key).kind
-        )
-        else field_value,
+        context.for_field_snap(field_snap), _selector_field_value(context, field_snap, field_value),
     )
 
     if child_evaluate_value_result.success:
@@ -196,6 +381,24 @@ def validate_selector_config(context, config_value):
         return child_evaluate_value_result
 
 
+def _selector_field_value(context, field_snap, field_value):
+    # This is a very particular special case where we want someone
+    # to be able to select a selector key *without* a value
+    #
+    # e.g.
+    # storage:
+    #   filesystem:
+    #
+    # And we want the default values of the child elements of filesystem:
+    # to "fill in"
+    if field_value is None and ConfigTypeKind.has_fields(
+        context.config_schema_snapshot.get_config_snap(field_snap.type_key).kind
+    ):
+        return {}
+
+    return field_value
+
+
 def _validate_shape_config(context, config_value, check_for_extra_incoming_fields):
     check.inst_param(context, 'context', ValidationContext)
     check.not_none_param(config_value, 'config_value')
@@ -452,12 +452,12 @@ class DependencyStructure(object):
     def get_singular_dep(self, solid_input_handle):
         check.inst_param(solid_input_handle, 'solid_input_handle', SolidInputHandle)
         dep = self._handle_dict[solid_input_handle]
-        check.invariant(
-            isinstance(dep, SolidOutputHandle),
-            'Can not call get_singular_dep when dep is not singular, got {dep}'.format(
-                dep=type(dep)
-            ),
-        )
+        if not isinstance(dep, SolidOutputHandle):
+            check.failed(
+                'Can not call get_singular_dep when dep is not singular, got {dep}'.format(
+                    dep=type(dep)
+                )
+            )
         return dep
 
     def has_multi_deps(self, solid_input_handle):
@@ -1,7 +1,7 @@
 from functools import update_wrapper
 
 from dagster import check
-from dagster.builtins import Int
+from dagster.builtins import Bool, Int
 from dagster.config.field import Field
 from dagster.config.field_utils import check_user_facing_opt_config_param
 from dagster.core.definitions.reconstructable import ReconstructablePipeline
@@ -145,7 +145,12 @@ class _ExecutorDecoratorCallable(object):
 
 @executor(
     name='in_process',
-    config={'retries': get_retries_config(), 'marker_to_close': Field(str, is_required=False),},
+    config={
+        'retries': get_retries_config(),
+        'marker_to_close': Field(str, is_required=False),
+        'type_check_cache': Field(Bool, is_required=False, default_value=True),
+        'type_check_sample_size': Field(Int, is_required=False, default_value=0),
+    },
 )
 def in_process_executor(init_context):
     '''The default in-process executor.
@@ -162,6 +167,17 @@ def in_process_executor(init_context):
     Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
+
+    When the pipeline's system storage keeps intermediates in memory, the first step input whose
+    value is the object an upstream step output was type checked as, against the same dagster type,
+    is not type checked again: the result of the output's type check is reported for the input.
+    Other inputs that receive the same object are type checked, since an earlier step may have
+    modified it. Set ``type_check_cache`` to ``False`` to type check every input.
+
+    Set ``type_check_sample_size`` to type check at most that many elements, sampled at random, of
+    the values of list types rather than all of them. Samples are drawn from a random number
+    generator seeded by the run id, step key and input or output name, so the elements checked
+    by a run are reproducible.
     '''
     from dagster.core.engine.init import InitExecutorContext
 
@@ -171,6 +187,8 @@ def in_process_executor(init_context):
         # shouldn't need to .get() here - issue with defaults in config setup
         retries=Retries.from_config(init_context.executor_config.get('retries', {'enabled': {}})),
         marker_to_close=init_context.executor_config.get('marker_to_close'),
+        type_check_cache=init_context.executor_config.get('type_check_cache', True),
+        type_check_sample_size=init_context.executor_config.get('type_check_sample_size', 0),
     )
 
 
@@ -179,6 +197,8 @@ def in_process_executor(init_context):
     config={
         'max_concurrent': Field(Int, is_required=False, default_value=0),
         'retries': get_retries_config(),
+        'prioritize_critical_path': Field(Bool, is_required=False, default_value=False),
+        'critical_path_history': Field(Int, is_required=False, default_value=0),
     },
 )
 def multiprocess_executor(init_context):
@@ -201,6 +221,11 @@ def multiprocess_executor(init_context):
     Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
+
+    Set ``prioritize_critical_path`` to run, among ready steps of equal priority, those with the
+    longest chain of downstream steps first. When ``critical_path_history`` is set, chains are
+    weighted by the mean step durations of that many of the most recent successful runs of the
+    pipeline rather than by their number of steps.
     '''
     from dagster.core.engine.init import InitExecutorContext
 
@@ -212,6 +237,8 @@ def multiprocess_executor(init_context):
         pipeline=init_context.pipeline,
         max_concurrent=init_context.executor_config['max_concurrent'],
         retries=Retries.from_config(init_context.executor_config['retries']),
+        prioritize_critical_path=init_context.executor_config['prioritize_critical_path'],
+        critical_path_history=init_context.executor_config['critical_path_history'],
     )
 
 
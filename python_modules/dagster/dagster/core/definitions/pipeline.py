@@ -208,6 +208,7 @@ class PipelineDefinition(IContainSolids):
         )
         self._cached_run_config_schemas = {}
         self._cached_external_pipeline = None
+        self._cached_pipeline_index = None
 
     def get_run_config_schema(self, mode=None):
         check.str_param(mode, 'mode')
@@ -326,12 +327,12 @@ class PipelineDefinition(IContainSolids):
             Solid:
         '''
         check.str_param(name, 'name')
-        check.invariant(
-            name in self._solid_dict,
-            'Pipeline {pipeline_name} has no solid named {name}.'.format(
-                pipeline_name=self._name, name=name
-            ),
-        )
+        if name not in self._solid_dict:
+            check.failed(
+                'Pipeline {pipeline_name} has no solid named {name}.'.format(
+                    pipeline_name=self._name, name=name
+                )
+            )
 
         return self._solid_dict[name]
 
@@ -447,9 +448,12 @@ class PipelineDefinition(IContainSolids):
         from dagster.core.snap import PipelineSnapshot
         from dagster.core.host_representation import PipelineIndex
 
-        return PipelineIndex(
-            PipelineSnapshot.from_pipeline_def(self), self.get_parent_pipeline_snapshot()
-        )
+        if self._cached_pipeline_index is None:
+            self._cached_pipeline_index = PipelineIndex(
+                PipelineSnapshot.from_pipeline_def(self), self.get_parent_pipeline_snapshot()
+            )
+
+        return self._cached_pipeline_index
 
     def get_config_schema_snapshot(self):
         return self.get_pipeline_snapshot().config_schema_snapshot
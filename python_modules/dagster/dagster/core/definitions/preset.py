@@ -2,7 +2,6 @@ import os
 from collections import namedtuple
 from glob import glob
 
-import pkg_resources
 import six
 import yaml
 
@@ -170,6 +169,9 @@ class PresetDefinition(namedtuple('_PresetDefinition', 'name environment_dict so
             DagsterInvariantViolationError: When one of the YAML documents is invalid and has a
                 parse error.
         '''
+        # pkg_resources takes ~100ms to import, so only pay for it when it is used
+        import pkg_resources
+
         pkg_resource_defs = check.opt_list_param(
             pkg_resource_defs, 'pkg_resource_defs', of_type=tuple
         )
@@ -6,6 +6,10 @@ from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
 from dagster.core.execution.config import MultiprocessExecutorConfig
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.plan.critical_path import (
+    critical_path_sort_key_fn,
+    historical_step_durations,
+)
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.instance import DagsterInstance
 from dagster.utils import get_multiprocessing_context, start_termination_thread
@@ -106,6 +110,22 @@ def execute_step_out_of_process(step_context, step, errors, term_events):
             check.failed('Unexpected return value from child process {}'.format(type(ret)))
 
 
+def _sort_key_fn(pipeline_context, execution_plan):
+    executor_config = pipeline_context.executor_config
+    if not executor_config.prioritize_critical_path:
+        return None
+
+    step_durations = None
+    if executor_config.critical_path_history:
+        step_durations = historical_step_durations(
+            pipeline_context.instance,
+            pipeline_context.pipeline_def.name,
+            executor_config.critical_path_history,
+        )
+
+    return critical_path_sort_key_fn(execution_plan, step_durations)
+
+
 class MultiprocessEngine(Engine):  # pylint: disable=no-init
     @staticmethod
     def execute(pipeline_context, execution_plan):
@@ -130,7 +150,8 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
         with time_execution_scope() as timer_result:
 
             active_execution = execution_plan.start(
-                retries=pipeline_context.executor_config.retries
+                retries=pipeline_context.executor_config.retries,
+                sort_key_fn=_sort_key_fn(pipeline_context, execution_plan),
             )
             active_iters = {}
             errors = {}
@@ -1,4 +1,4 @@
-import time
+import warnings
 
 from dagster import check
 from dagster.core.definitions import (
@@ -20,11 +20,11 @@ from dagster.core.selector import parse_solid_subset
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
 from dagster.core.system_config.objects import EnvironmentConfig
 from dagster.core.telemetry import log_repo_stats, telemetry_wrapper
-from dagster.core.utils import make_new_backfill_id, make_new_run_id, str_format_list
+from dagster.core.utils import str_format_list
 from dagster.utils import merge_dicts
 
 from .context_creation_pipeline import pipeline_initialization_manager, scoped_pipeline_context
-from .results import PipelineExecutionResult
+from .results import SUMMARY_EVENTS, PipelineExecutionResult
 
 ## Brief guide to the execution APIs
 # | function name             | operates over      | sync  | supports    | creates new PipelineRun |
@@ -85,7 +85,7 @@ def execute_run_iterator(pipeline, pipeline_run, instance):
     )
 
 
-def execute_run(pipeline, pipeline_run, instance, raise_on_error=False):
+def execute_run(pipeline, pipeline_run, instance, raise_on_error=False, retain_events=True):
     '''Executes an existing pipeline run synchronously.
 
     Synchronous version of execute_run_iterator.
@@ -96,6 +96,10 @@ def execute_run(pipeline, pipeline_run, instance, raise_on_error=False):
         instance (DagsterInstance): The instance in which the run has been created.
         raise_on_error (Optional[bool]): Whether or not to raise exceptions when they occur.
             Defaults to ``False``.
+        retain_events (Optional[bool]): Whether the result holds every event of the run. If
+            ``False``, it holds only the summary events of the run, and reads the others from the
+            event log of the instance when they are needed. If the event log of the instance is
+            held in memory, every event is retained regardless. Defaults to ``True``.
 
     Returns:
         PipelineExecutionResult: The result of the execution.
@@ -104,8 +108,18 @@ def execute_run(pipeline, pipeline_run, instance, raise_on_error=False):
 
     check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
     check.inst_param(instance, 'instance', DagsterInstance)
+    check.bool_param(retain_events, 'retain_events')
     check.invariant(pipeline_run.status == PipelineRunStatus.NOT_STARTED)
 
+    if not retain_events and not instance.has_persistent_event_log:
+        # Dropping events would save nothing, since the event log holds them in memory anyway
+        warnings.warn(
+            'Retaining every event of run {run_id}, since the event log of its instance is held '
+            'in memory. Use an instance with a persistent event log to retain only the summary '
+            'events.'.format(run_id=pipeline_run.run_id)
+        )
+        retain_events = True
+
     if pipeline_run.solid_subset:
         pipeline_def = pipeline.get_definition()
         if isinstance(pipeline_def, PipelineSubsetForExecution):
@@ -138,7 +152,12 @@ def execute_run(pipeline, pipeline_run, instance, raise_on_error=False):
         retries=None,
         raise_on_error=raise_on_error,
     )
-    event_list = list(_execute_run_iterable)
+    if retain_events:
+        event_list = list(_execute_run_iterable)
+    else:
+        event_list = [
+            event for event in _execute_run_iterable if event.event_type in SUMMARY_EVENTS
+        ]
     pipeline_context = _execute_run_iterable.pipeline_context
 
     return PipelineExecutionResult(
@@ -155,6 +174,7 @@ def execute_run(pipeline, pipeline_run, instance, raise_on_error=False):
                 file_manager=pipeline_context.file_manager,
             ),
         ),
+        instance=None if retain_events else instance,
     )
 
 
@@ -239,6 +259,7 @@ def execute_pipeline(
     solid_subset=None,
     instance=None,
     raise_on_error=True,
+    retain_events=True,
 ):
     '''Execute a pipeline synchronously.
 
@@ -261,6 +282,13 @@ def execute_pipeline(
             an ephemeral instance will be used, and no artifacts will be persisted from the run.
         raise_on_error (Optional[bool]): Whether or not to raise exceptions when they occur.
             Defaults to ``True``, since this is the most useful behavior in test.
+        retain_events (Optional[bool]): Whether the result holds every event of the run. If
+            ``False``, it holds only the summary events of the run (the pipeline events, failures,
+            step outputs and successes and skips), and reads the others from the event log of the
+            instance when they are needed, so that its memory does not grow with the number of
+            events of a long-running pipeline. Since an ephemeral instance holds its event log in
+            memory, every event is retained regardless when no persistent instance is given.
+            Defaults to ``True``.
         solid_subset (Optional[List[str]]): Optionally, a list of solid selection queries solid
             selection queries (inlcuding names of solid invocations). For example:
             - ['some_solid']: select "some_solid" itself.
@@ -306,7 +334,13 @@ def execute_pipeline(
         tags=tags,
     )
 
-    return execute_run(pipeline, pipeline_run, instance, raise_on_error=raise_on_error)
+    return execute_run(
+        pipeline,
+        pipeline_run,
+        instance,
+        raise_on_error=raise_on_error,
+        retain_events=retain_events,
+    )
 
 
 def execute_plan_iterator(
@@ -363,7 +397,12 @@ def execute_partition_set(partition_set, partition_filter, instance=None):
             a list of partitions and returns a filtered list of partitions to run the backfill
             over.
         instance (DagsterInstance): The instance to use to perform the backfill
+
+    Returns:
+        str: The id of the backfill.
     '''
+    from .backfill import execute_backfill
+
     check.inst_param(partition_set, 'partition_set', PartitionSetDefinition)
     check.callable_param(partition_filter, 'partition_filter')
     check.inst_param(instance, 'instance', DagsterInstance)
@@ -371,25 +410,7 @@ def execute_partition_set(partition_set, partition_filter, instance=None):
     candidate_partitions = partition_set.get_partitions()
     partitions = partition_filter(candidate_partitions)
 
-    instance = instance or DagsterInstance.ephemeral()
-
-    for partition in partitions:
-        run = PipelineRun(
-            pipeline_name=partition_set.pipeline_name,
-            run_id=make_new_run_id(),
-            environment_dict=partition_set.environment_dict_for_partition(partition),
-            mode='default',
-            tags=merge_dicts(
-                PipelineRun.tags_for_backfill_id(make_new_backfill_id()),
-                partition_set.tags_for_partition(partition),
-            ),
-            status=PipelineRunStatus.NOT_STARTED,
-        )
-
-        # Remove once we can handle synchronous execution... currently limited by sqlite
-        time.sleep(0.1)
-
-        instance.launch_run(run.run_id)
+    return execute_backfill(instance, partition_set, partitions)
 
 
 def _check_pipeline(pipeline):
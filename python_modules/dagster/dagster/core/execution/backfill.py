@@ -0,0 +1,179 @@
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from dagster import check
+from dagster.core.definitions import PipelineDefinition
+from dagster.core.definitions.partition import Partition, PartitionSetDefinition
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
+from dagster.core.utils import make_new_backfill_id, make_new_run_id
+from dagster.utils import merge_dicts
+
+BACKFILL_BATCH_SIZE = 100
+
+MAX_CONCURRENT_BACKFILL_LAUNCHES = 4
+
+
+class BackfillProgress(namedtuple('_BackfillProgress', 'backfill_id status_counts')):
+    '''The number of runs of a backfill in each status.
+
+    Args:
+        backfill_id (str): The id of the backfill.
+        status_counts (Dict[PipelineRunStatus, int]): The number of runs of the backfill in each
+            status. Statuses that no run is in are omitted.
+    '''
+
+    def __new__(cls, backfill_id, status_counts):
+        return super(BackfillProgress, cls).__new__(
+            cls,
+            backfill_id=check.str_param(backfill_id, 'backfill_id'),
+            status_counts=check.dict_param(
+                status_counts, 'status_counts', key_type=PipelineRunStatus, value_type=int
+            ),
+        )
+
+    @property
+    def run_count(self):
+        return sum(self.status_counts.values())
+
+    @property
+    def finished_count(self):
+        return self.status_counts.get(PipelineRunStatus.SUCCESS, 0) + self.status_counts.get(
+            PipelineRunStatus.FAILURE, 0
+        )
+
+    @property
+    def is_finished(self):
+        return self.finished_count == self.run_count
+
+
+def execute_backfill(
+    instance,
+    partition_set,
+    partitions,
+    pipeline_def=None,
+    tags=None,
+    backfill_id=None,
+    external_pipeline=None,
+    batch_size=BACKFILL_BATCH_SIZE,
+    max_concurrent_launches=MAX_CONCURRENT_BACKFILL_LAUNCHES,
+):
+    '''Create a run for each of the given partitions of a partition set and launch them with the
+    instance's run launcher.
+
+    Runs are added to run storage in batches, and the runs of each batch are launched as soon as
+    the batch has been added, with at most ``max_concurrent_launches`` launches in flight. All the
+    runs are launched even if launching one of them fails; the first launch error is then raised.
+
+    Args:
+        instance (DagsterInstance): The instance to create and launch the runs in.
+        partition_set (PartitionSetDefinition): The partition set to backfill.
+        partitions (List[Partition]): The partitions of the partition set to create runs for.
+        pipeline_def (Optional[PipelineDefinition]): The pipeline of the partition set. When set,
+            the runs are created with pipeline and execution plan snapshots.
+        tags (Optional[Dict[str, str]]): Tags to add to every run, in addition to the backfill and
+            partition tags.
+        backfill_id (Optional[str]): The id of the backfill. Defaults to a new id.
+        external_pipeline (Optional[ExternalPipeline]): Passed to the run launcher.
+        batch_size (Optional[int]): The number of runs to add to run storage at once.
+        max_concurrent_launches (Optional[int]): The number of runs to launch at once.
+
+    Returns:
+        str: The id of the backfill, which :py:func:`get_backfill_progress` takes.
+    '''
+    check.inst_param(instance, 'instance', DagsterInstance)
+    check.inst_param(partition_set, 'partition_set', PartitionSetDefinition)
+    check.list_param(partitions, 'partitions', of_type=Partition)
+    check.opt_inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
+    tags = check.opt_dict_param(tags, 'tags', key_type=str, value_type=str)
+    backfill_id = check.opt_str_param(backfill_id, 'backfill_id', default=make_new_backfill_id())
+    check.int_param(batch_size, 'batch_size')
+    check.int_param(max_concurrent_launches, 'max_concurrent_launches')
+    check.param_invariant(batch_size > 0, 'batch_size')
+    check.param_invariant(max_concurrent_launches > 0, 'max_concurrent_launches')
+
+    if pipeline_def:
+        check.invariant(
+            pipeline_def.name == partition_set.pipeline_name,
+            'Partition set {partition_set_name} is for pipeline {pipeline_name}, not {name}'.format(
+                partition_set_name=partition_set.name,
+                pipeline_name=partition_set.pipeline_name,
+                name=pipeline_def.name,
+            ),
+        )
+        # Check the mode and build the pipeline subset once, rather than once per run
+        pipeline_def.get_mode_definition(partition_set.mode)
+        pipeline_def = pipeline_def.subset_for_execution(partition_set.solid_subset)
+
+    run_tags = merge_dicts(PipelineRun.tags_for_backfill_id(backfill_id), tags)
+
+    with ThreadPoolExecutor(max_workers=max_concurrent_launches) as executor:
+        launches = []
+        for start in range(0, len(partitions), batch_size):
+            for pipeline_run in _create_backfill_runs(
+                instance,
+                partition_set,
+                partitions[start : start + batch_size],
+                pipeline_def,
+                run_tags,
+            ):
+                launches.append(
+                    executor.submit(
+                        instance.launch_run,
+                        pipeline_run.run_id,
+                        external_pipeline=external_pipeline,
+                    )
+                )
+
+        for launch in launches:
+            launch.result()
+
+    return backfill_id
+
+
+def _create_backfill_runs(instance, partition_set, partitions, pipeline_def, run_tags):
+    runs_kwargs = [
+        dict(
+            environment_dict=partition_set.environment_dict_for_partition(partition),
+            mode=partition_set.mode,
+            solid_subset=partition_set.solid_subset,
+            tags=merge_dicts(partition_set.tags_for_partition(partition), run_tags),
+        )
+        for partition in partitions
+    ]
+
+    if pipeline_def:
+        return instance.create_runs_for_pipeline(pipeline_def, runs_kwargs)
+
+    return instance.add_runs(
+        [
+            PipelineRun(
+                pipeline_name=partition_set.pipeline_name,
+                run_id=make_new_run_id(),
+                status=PipelineRunStatus.NOT_STARTED,
+                **run_kwargs
+            )
+            for run_kwargs in runs_kwargs
+        ]
+    )
+
+
+def get_backfill_progress(instance, backfill_id):
+    '''Count the runs of a backfill in each status.
+
+    Args:
+        instance (DagsterInstance): The instance the backfill was executed in.
+        backfill_id (str): The id of the backfill.
+
+    Returns:
+        BackfillProgress
+    '''
+    check.inst_param(instance, 'instance', DagsterInstance)
+    check.str_param(backfill_id, 'backfill_id')
+
+    run_records = instance.get_run_records(
+        PipelineRunsFilter(tags=PipelineRun.tags_for_backfill_id(backfill_id))
+    )
+    return BackfillProgress(
+        backfill_id, dict(Counter(run_record.status for run_record in run_records))
+    )
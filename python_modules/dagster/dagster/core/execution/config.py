@@ -18,9 +18,16 @@ class ExecutorConfig(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
 
 
 class InProcessExecutorConfig(ExecutorConfig):
-    def __init__(self, retries, marker_to_close):
+    def __init__(
+        self, retries, marker_to_close, type_check_cache=True, type_check_sample_size=0,
+    ):
         self.retries = check.inst_param(retries, 'retries', Retries)
         self.marker_to_close = check.opt_str_param(marker_to_close, 'marker_to_close')
+        self.type_check_cache = check.bool_param(type_check_cache, 'type_check_cache')
+        self.type_check_sample_size = check.int_param(
+            type_check_sample_size, 'type_check_sample_size'
+        )
+        check.param_invariant(type_check_sample_size >= 0, 'type_check_sample_size')
 
     def get_engine(self):
         from dagster.core.engine.engine_inprocess import InProcessEngine
@@ -29,12 +36,23 @@ class InProcessExecutorConfig(ExecutorConfig):
 
 
 class MultiprocessExecutorConfig(ExecutorConfig):
-    def __init__(self, pipeline, retries, max_concurrent=None):
+    def __init__(
+        self,
+        pipeline,
+        retries,
+        max_concurrent=None,
+        prioritize_critical_path=False,
+        critical_path_history=0,
+    ):
 
         self.pipeline = check.inst_param(pipeline, 'pipeline', ReconstructablePipeline)
         self.retries = check.inst_param(retries, 'retries', Retries)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
         self.max_concurrent = check.int_param(max_concurrent, 'max_concurrent')
+        self.prioritize_critical_path = check.bool_param(
+            prioritize_critical_path, 'prioritize_critical_path'
+        )
+        self.critical_path_history = check.int_param(critical_path_history, 'critical_path_history')
 
     def get_engine(self):
         from dagster.core.engine.engine_multiprocess import MultiprocessEngine
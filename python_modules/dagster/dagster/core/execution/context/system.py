@@ -24,7 +24,7 @@ class SystemPipelineExecutionContextData(
         (
             'pipeline_run scoped_resources_builder environment_config pipeline '
             'mode_def system_storage_def instance intermediates_manager file_manager '
-            'executor_config raise_on_error'
+            'executor_config raise_on_error type_check_cache'
         ),
     )
 ):
@@ -46,9 +46,11 @@ class SystemPipelineExecutionContextData(
         file_manager,
         executor_config,
         raise_on_error,
+        type_check_cache=None,
     ):
         from dagster.core.definitions.system_storage import SystemStorageDefinition
         from dagster.core.execution.config import ExecutorConfig
+        from dagster.core.execution.type_check_cache import TypeCheckCache
         from dagster.core.storage.intermediates_manager import IntermediatesManager
         from dagster.core.instance import DagsterInstance
 
@@ -73,6 +75,9 @@ class SystemPipelineExecutionContextData(
             file_manager=check.inst_param(file_manager, 'file_manager', FileManager),
             executor_config=check.inst_param(executor_config, 'executor_config', ExecutorConfig),
             raise_on_error=check.bool_param(raise_on_error, 'raise_on_error'),
+            type_check_cache=check.opt_inst_param(
+                type_check_cache, 'type_check_cache', TypeCheckCache
+            ),
         )
 
     @property
@@ -113,6 +118,10 @@ class SystemPipelineExecutionContext(object):
     def executor_config(self):
         return self._pipeline_context_data.executor_config
 
+    @property
+    def type_check_cache(self):
+        return self._pipeline_context_data.type_check_cache
+
     @property
     def pipeline_run(self):
         return self._pipeline_context_data.pipeline_run
@@ -9,13 +9,14 @@ from dagster.core.definitions.system_storage import SystemStorageData
 from dagster.core.engine.init import InitExecutorContext
 from dagster.core.errors import DagsterError
 from dagster.core.events import DagsterEvent, PipelineInitFailureData
-from dagster.core.execution.config import ExecutorConfig
+from dagster.core.execution.config import ExecutorConfig, InProcessExecutorConfig
 from dagster.core.execution.memoization import validate_reexecution_memoization
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.resources_init import (
     get_required_resource_keys_to_init,
     resource_initialization_manager,
 )
+from dagster.core.execution.type_check_cache import TypeCheckCache
 from dagster.core.instance import DagsterInstance
 from dagster.core.log_manager import DagsterLogManager
 from dagster.core.storage.init import InitSystemStorageContext
@@ -311,11 +312,27 @@ def construct_pipeline_execution_context(
             file_manager=system_storage_data.file_manager,
             executor_config=executor_config,
             raise_on_error=raise_on_error,
+            type_check_cache=_create_type_check_cache(
+                executor_config, system_storage_data.intermediates_manager
+            ),
         ),
         log_manager=log_manager,
     )
 
 
+def _create_type_check_cache(executor_config, intermediates_manager):
+    # Type checks are only worth caching when step outputs reach their downstream steps as the
+    # same objects, which is when the steps share a process and intermediates stay in memory
+    if (
+        isinstance(executor_config, InProcessExecutorConfig)
+        and executor_config.type_check_cache
+        and not intermediates_manager.is_persistent
+    ):
+        return TypeCheckCache()
+
+    return None
+
+
 @contextmanager
 def scoped_pipeline_context(
     execution_plan,
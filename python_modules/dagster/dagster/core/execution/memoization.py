@@ -1,4 +1,5 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from dagster import check
 from dagster.core.errors import DagsterInvariantViolationError, DagsterRunNotFoundError
@@ -9,6 +10,9 @@ from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.storage.object_store import ObjectStoreOperation, ObjectStoreOperationType
 
+# Upper bound on the number of intermediates copied from a parent run at once
+MAX_CONCURRENT_INTERMEDIATE_COPIES = 16
+
 
 def validate_reexecution_memoization(pipeline_context, execution_plan):
     check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
@@ -62,17 +66,36 @@ def copy_required_intermediates_for_execution(pipeline_context, execution_plan):
         output_handles_to_copy_by_step[handle.step_key].append(handle)
 
     intermediates_manager = pipeline_context.intermediates_manager
-    for step in execution_plan.topological_steps():
-        step_context = pipeline_context.for_step(step)
-        for handle in output_handles_to_copy_by_step.get(step.key, []):
-            if intermediates_manager.has_intermediate(pipeline_context, handle):
+    steps_and_handles = [
+        (step, handle)
+        for step in execution_plan.topological_steps()
+        for handle in output_handles_to_copy_by_step.get(step.key, [])
+    ]
+
+    def _copy_if_missing(step_and_handle):
+        step, handle = step_and_handle
+        if intermediates_manager.has_intermediate(pipeline_context, handle):
+            return None
+
+        return intermediates_manager.copy_intermediate_from_run(
+            pipeline_context,
+            parent_run_id,
+            handle,
+            dagster_type=step.step_output_named(handle.output_name).dagster_type,
+        )
+
+    # Copies are independent of each other, so issue them concurrently -- against remote object
+    # stores each one is dominated by round-trip latency -- and emit events in plan order
+    max_workers = max(1, min(MAX_CONCURRENT_INTERMEDIATE_COPIES, len(steps_and_handles)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        operations = executor.map(_copy_if_missing, steps_and_handles)
+
+        for (step, handle), operation in zip(steps_and_handles, operations):
+            if operation is None:
                 continue
 
-            operation = intermediates_manager.copy_intermediate_from_run(
-                pipeline_context, parent_run_id, handle
-            )
             yield DagsterEvent.object_store_operation(
-                step_context,
+                pipeline_context.for_step(step),
                 ObjectStoreOperation.serializable(operation, value_name=handle.output_name),
             )
 
@@ -1,3 +1,4 @@
+import heapq
 import time
 
 from dagster import check
@@ -13,6 +14,12 @@ def _default_sort_key(step):
 
 class ActiveExecution(object):
     '''State machine used to track progress through execution of an ExecutionPlan
+
+    Each pending step tracks how many of its dependencies have yet to complete, and completing a
+    step only visits the steps that depend on it, so the cost of each transition is proportional to
+    the number of edges it touches rather than to the size of the plan. Executable steps are kept in
+    a heap ordered by ``sort_key_fn``, with ties broken by the order in which steps became
+    executable.
     '''
 
     def __init__(self, execution_plan, retries, sort_key_fn=None):
@@ -20,14 +27,34 @@ class ActiveExecution(object):
         self._retries = check.inst_param(retries, 'retries', Retries)
         self._sort_key_fn = check.opt_callable_param(sort_key_fn, 'sort_key_fn', _default_sort_key)
 
-        # All steps to be executed start out here in _pending
-        self._pending = self._plan.execution_deps()
+        execution_deps = self._plan.execution_deps()
+
+        # position of each step in the plan, used to order steps that become ready together
+        self._step_index = {key: index for index, key in enumerate(execution_deps)}
+
+        # reverse adjacency: the steps that depend on each step
+        self._dependents = self._plan.execution_dependents()
+
+        # All steps to be executed start out here in _pending, mapped to the number of their
+        # dependencies that have not yet completed
+        self._pending = {
+            step_key: len(requirements) for step_key, requirements in execution_deps.items()
+        }
+        # pending steps with a dependency that completed without succeeding
+        self._pending_with_failed_deps = set()
+
+        # steps whose dependencies have all completed since the last _update call
+        self._newly_ready = [key for key, count in self._pending.items() if count == 0]
+        for key in self._newly_ready:
+            del self._pending[key]
+        # steps that were marked up for retry with no delay since the last _update call
+        self._newly_retryable = []
 
         # steps move in to these buckets as a result of _update calls
-        self._executable = []
+        self._executable = []  # heap of (sort key, sequence number, step key)
         self._pending_skip = []
-        self._pending_retry = []
         self._waiting_to_retry = {}
+        self._sequence = 0
 
         # then are considered _in_flight when vended via get_steps_to_*
         self._in_flight = set()
@@ -41,37 +68,48 @@ class ActiveExecution(object):
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
+    def _push_executable(self, step_key):
+        heapq.heappush(
+            self._executable,
+            (self._sort_key_fn(self._plan.get_step_by_key(step_key)), self._sequence, step_key),
+        )
+        self._sequence += 1
+
     def _update(self):
-        '''Moves steps from _pending to _executable / _pending_skip / _pending_retry
-           as a function of what has been _completed
+        '''Moves steps whose dependencies have completed to _executable / _pending_skip, and steps
+           whose retry delay has passed to _executable
         '''
-        new_steps_to_execute = []
-        new_steps_to_skip = []
-        for step_key, requirements in self._pending.items():
-
-            if requirements.issubset(self._completed):
-                if requirements.issubset(self._success):
-                    new_steps_to_execute.append(step_key)
+        if self._newly_ready:
+            for key in sorted(self._newly_ready, key=self._step_index.get):
+                if key in self._pending_with_failed_deps:
+                    self._pending_with_failed_deps.remove(key)
+                    self._pending_skip.append(key)
                 else:
-                    new_steps_to_skip.append(step_key)
-
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
-
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
-
-        ready_to_retry = []
-        tick_time = time.time()
-        for key, at_time in self._waiting_to_retry.items():
-            if tick_time >= at_time:
-                ready_to_retry.append(key)
-
-        for key in ready_to_retry:
-            self._executable.append(key)
-            del self._waiting_to_retry[key]
+                    self._push_executable(key)
+            self._newly_ready = []
+
+        for key in self._newly_retryable:
+            self._push_executable(key)
+        self._newly_retryable = []
+
+        if self._waiting_to_retry:
+            tick_time = time.time()
+            ready_to_retry = [
+                key for key, at_time in self._waiting_to_retry.items() if tick_time >= at_time
+            ]
+            for key in ready_to_retry:
+                self._push_executable(key)
+                del self._waiting_to_retry[key]
+
+    def _resolve_dependents(self, step_key, succeeded):
+        for dependent_key in self._dependents[step_key]:
+            if not succeeded:
+                self._pending_with_failed_deps.add(dependent_key)
+
+            self._pending[dependent_key] -= 1
+            if self._pending[dependent_key] == 0:
+                del self._pending[dependent_key]
+                self._newly_ready.append(dependent_key)
 
     def sleep_til_ready(self):
         now = time.time()
@@ -98,16 +136,11 @@ class ActiveExecution(object):
         check.opt_int_param(limit, 'limit')
         self._update()
 
-        steps = sorted(
-            [self._plan.get_step_by_key(key) for key in self._executable], key=self._sort_key_fn
-        )
-
-        if limit:
-            steps = steps[:limit]
-
-        for step in steps:
-            self._in_flight.add(step.key)
-            self._executable.remove(step.key)
+        steps = []
+        while self._executable and (not limit or len(steps) < limit):
+            _, _, step_key = heapq.heappop(self._executable)
+            self._in_flight.add(step_key)
+            steps.append(self._plan.get_step_by_key(step_key))
 
         return steps
 
@@ -115,11 +148,10 @@ class ActiveExecution(object):
         self._update()
 
         steps = []
-        steps_to_skip = list(self._pending_skip)
-        for key in steps_to_skip:
+        for key in self._pending_skip:
             steps.append(self._plan.get_step_by_key(key))
             self._in_flight.add(key)
-            self._pending_skip.remove(key)
+        self._pending_skip = []
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -152,15 +184,15 @@ class ActiveExecution(object):
 
     def mark_failed(self, step_key):
         self._failed.add(step_key)
-        self._mark_complete(step_key)
+        self._mark_complete(step_key, succeeded=False)
 
     def mark_success(self, step_key):
         self._success.add(step_key)
-        self._mark_complete(step_key)
+        self._mark_complete(step_key, succeeded=True)
 
     def mark_skipped(self, step_key):
         self._skipped.add(step_key)
-        self._mark_complete(step_key)
+        self._mark_complete(step_key, succeeded=False)
 
     def mark_up_for_retry(self, step_key, at_time=None):
         check.invariant(
@@ -174,27 +206,29 @@ class ActiveExecution(object):
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.execution_deps()[step_key]
+                self._newly_retryable.append(step_key)
 
         elif self._retries.deferred:
             self._completed.add(step_key)
+            self._resolve_dependents(step_key, succeeded=False)
 
         self._retries.mark_attempt(step_key)
         self._in_flight.remove(step_key)
 
-    def _mark_complete(self, step_key):
-        check.invariant(
-            step_key not in self._completed,
-            'Attempted to mark step {} as complete that was already completed'.format(step_key),
-        )
-        check.invariant(
-            step_key in self._in_flight,
-            'Attempted to mark step {} as complete that was not known to be in flight'.format(
-                step_key
-            ),
-        )
+    def _mark_complete(self, step_key, succeeded):
+        if step_key in self._completed:
+            check.failed(
+                'Attempted to mark step {} as complete that was already completed'.format(step_key)
+            )
+        if step_key not in self._in_flight:
+            check.failed(
+                'Attempted to mark step {} as complete that was not known to be in flight'.format(
+                    step_key
+                )
+            )
         self._in_flight.remove(step_key)
         self._completed.add(step_key)
+        self._resolve_dependents(step_key, succeeded)
 
     def handle_event(self, dagster_event):
         check.inst_param(dagster_event, 'dagster_event', DagsterEvent)
@@ -227,8 +261,9 @@ class ActiveExecution(object):
         return (
             len(self._pending) == 0
             and len(self._in_flight) == 0
+            and len(self._newly_ready) == 0
+            and len(self._newly_retryable) == 0
             and len(self._executable) == 0
             and len(self._pending_skip) == 0
-            and len(self._pending_retry) == 0
             and len(self._waiting_to_retry) == 0
         )
@@ -0,0 +1,104 @@
+from collections import defaultdict
+
+from dagster import check
+from dagster.core.execution.stats import StepEventStatus
+from dagster.core.storage.pipeline_run import PipelineRunStatus, PipelineRunsFilter
+
+from .active import _default_sort_key
+from .plan import ExecutionPlan
+
+
+def critical_path_lengths(execution_plan, step_durations=None):
+    '''Computes, for each step to be executed, the length of the longest path from the start of that
+    step to the end of the plan.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan to compute path lengths for.
+        step_durations (Optional[Dict[str, float]]): Expected durations by step key. Steps without
+            a known duration are assumed to take the mean of the known durations. If no durations
+            are given, every step counts as taking one unit of time.
+
+    Returns:
+        Dict[str, float]: The remaining path length for each step key.
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    step_durations = check.opt_dict_param(
+        step_durations, 'step_durations', key_type=str, value_type=float
+    )
+
+    default_duration = sum(step_durations.values()) / len(step_durations) if step_durations else 1.0
+
+    dependents = execution_plan.execution_dependents()
+
+    lengths = {}
+    for level in reversed(execution_plan.execution_step_levels()):
+        for step in level:
+            lengths[step.key] = step_durations.get(step.key, default_duration) + max(
+                [lengths[dependent_key] for dependent_key in dependents[step.key]] or [0.0]
+            )
+
+    return lengths
+
+
+def historical_step_durations(instance, pipeline_name, limit):
+    '''Averages the durations of successful steps over the most recent successful runs of a
+    pipeline.
+
+    Args:
+        instance (DagsterInstance): The instance to read run history from.
+        pipeline_name (str): The pipeline whose runs to inspect.
+        limit (int): The number of most recent successful runs to inspect.
+
+    Returns:
+        Dict[str, float]: The mean duration in seconds of each step key that succeeded in any of the
+        inspected runs.
+    '''
+    from dagster.core.instance import DagsterInstance
+
+    check.inst_param(instance, 'instance', DagsterInstance)
+    check.str_param(pipeline_name, 'pipeline_name')
+    check.int_param(limit, 'limit')
+
+    totals = defaultdict(float)
+    counts = defaultdict(int)
+    runs = instance.get_runs(
+        filters=PipelineRunsFilter(pipeline_name=pipeline_name, status=PipelineRunStatus.SUCCESS),
+        limit=limit,
+    )
+    for run in runs:
+        for step_stats in instance.get_run_step_stats(run.run_id):
+            if (
+                step_stats.status != StepEventStatus.SUCCESS
+                or step_stats.start_time is None
+                or step_stats.end_time is None
+            ):
+                continue
+            totals[step_stats.step_key] += step_stats.end_time - step_stats.start_time
+            counts[step_stats.step_key] += 1
+
+    return {step_key: totals[step_key] / counts[step_key] for step_key in totals}
+
+
+def critical_path_sort_key_fn(execution_plan, step_durations=None, base_sort_key_fn=None):
+    '''Builds a sort key function for :py:class:`ActiveExecution` that runs the ready steps with the
+    longest remaining path through the plan first, so that the steps gating the most downstream
+    work start as early as possible.
+
+    Steps are first ordered by ``base_sort_key_fn``, which defaults to ordering by the
+    ``dagster/priority`` tag, so that explicit priorities still take precedence.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan that will be executed.
+        step_durations (Optional[Dict[str, float]]): Expected durations by step key, e.g. from
+            :py:func:`historical_step_durations`. See :py:func:`critical_path_lengths`.
+        base_sort_key_fn (Optional[Callable[[ExecutionStep], Any]]): The primary sort key.
+    '''
+    base_sort_key_fn = check.opt_callable_param(
+        base_sort_key_fn, 'base_sort_key_fn', _default_sort_key
+    )
+    lengths = critical_path_lengths(execution_plan, step_durations)
+
+    def _sort_key(step):
+        return (base_sort_key_fn(step), -lengths.get(step.key, 0.0))
+
+    return _sort_key
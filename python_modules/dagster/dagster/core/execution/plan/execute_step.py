@@ -1,5 +1,8 @@
+import random
+
 from dagster import check
 from dagster.core.definitions import (
+    EventMetadataEntry,
     ExpectationResult,
     Failure,
     Materialization,
@@ -18,6 +21,7 @@ from dagster.core.errors import (
     user_code_error_boundary,
 )
 from dagster.core.events import DagsterEvent
+from dagster.core.execution.config import InProcessExecutorConfig
 from dagster.core.execution.context.system import SystemStepExecutionContext
 from dagster.core.execution.plan.objects import (
     StepInputData,
@@ -96,7 +100,31 @@ def _step_output_error_checked_user_event_sequence(step_context, user_event_sequ
                 )
 
 
-def _do_type_check(context, dagster_type, value):
+def _type_check_sample_size(step_context):
+    executor_config = step_context.executor_config
+    if isinstance(executor_config, InProcessExecutorConfig):
+        return executor_config.type_check_sample_size
+
+    return 0
+
+
+def _type_check_sample_seed(step_context, name):
+    # Samples are drawn from a generator of their own rather than the global one, so that the
+    # elements checked by a run can be reproduced
+    return '{run_id}.{step_key}.{name}'.format(
+        run_id=step_context.run_id, step_key=step_context.step.key, name=name
+    )
+
+
+def _do_type_check(context, dagster_type, value, sample_size=0, sample_seed=None):
+    if (
+        sample_size
+        and dagster_type.kind == DagsterTypeKind.LIST
+        and isinstance(value, list)
+        and len(value) > sample_size
+    ):
+        return _do_sampled_list_type_check(context, dagster_type, value, sample_size, sample_seed)
+
     type_check = dagster_type.type_check(context, value)
     if not isinstance(type_check, TypeCheck):
         return TypeCheck(
@@ -111,6 +139,24 @@ def _do_type_check(context, dagster_type, value):
     return type_check
 
 
+def _do_sampled_list_type_check(context, dagster_type, value, sample_size, sample_seed):
+    type_check = _do_type_check(
+        context, dagster_type, random.Random(sample_seed).sample(value, sample_size)
+    )
+    return TypeCheck(
+        success=type_check.success,
+        description=type_check.description,
+        metadata_entries=type_check.metadata_entries
+        + [
+            EventMetadataEntry.text(
+                '{sample_size} of {length}'.format(sample_size=sample_size, length=len(value)),
+                'sampled_elements',
+                'Only the elements in this random sample of the list were type checked.',
+            )
+        ],
+    )
+
+
 def _create_step_input_event(step_context, input_name, type_check, success):
     return DagsterEvent.step_input_event(
         step_context,
@@ -147,9 +193,19 @@ def _type_checked_event_sequence_for_input(step_context, input_name, input_value
             step_key=step_context.step.key,
         ),
     ):
-        type_check = _do_type_check(
-            step_context.for_type(step_input.dagster_type), step_input.dagster_type, input_value,
-        )
+        type_check = None
+        if step_context.type_check_cache is not None:
+            # The value is the object an upstream output was checked as against the same type
+            type_check = step_context.type_check_cache.pop(step_input.dagster_type, input_value)
+
+        if type_check is None:
+            type_check = _do_type_check(
+                step_context.for_type(step_input.dagster_type),
+                step_input.dagster_type,
+                input_value,
+                sample_size=_type_check_sample_size(step_context),
+                sample_seed=_type_check_sample_seed(step_context, input_name),
+            )
 
         yield _create_step_input_event(
             step_context, input_name, type_check=type_check, success=type_check.success
@@ -204,9 +260,16 @@ def _type_checked_step_output_event_sequence(step_context, output):
         ),
     ):
         type_check = _do_type_check(
-            step_context.for_type(step_output.dagster_type), step_output.dagster_type, output.value
+            step_context.for_type(step_output.dagster_type),
+            step_output.dagster_type,
+            output.value,
+            sample_size=_type_check_sample_size(step_context),
+            sample_seed=_type_check_sample_seed(step_context, output.output_name),
         )
 
+        if type_check.success and step_context.type_check_cache is not None:
+            step_context.type_check_cache.set(step_output.dagster_type, output.value, type_check)
+
         yield _create_step_output_event(
             step_context, output, type_check=type_check, success=type_check.success
         )
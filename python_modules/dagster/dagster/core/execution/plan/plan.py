@@ -311,25 +311,47 @@ class ExecutionPlan(
         check.str_param(key, 'key')
         return self.step_dict[key]
 
+    def _memoize(self, key, compute_fn):
+        # Plans are immutable, so structures derived from them are computed on first use and kept
+        # for the lifetime of the plan. Callers must not mutate the returned values.
+        memoized = self.__dict__.setdefault('_memoized', {})
+        if key not in memoized:
+            memoized[key] = compute_fn()
+        return memoized[key]
+
     def topological_steps(self):
-        return [step for step_level in self.topological_step_levels() for step in step_level]
+        return self._memoize(
+            'topological_steps',
+            lambda: [step for step_level in self.topological_step_levels() for step in step_level],
+        )
 
     def topological_step_levels(self):
-        return [
-            [self.step_dict[step_key] for step_key in sorted(step_key_level)]
-            for step_key_level in toposort(self.deps)
-        ]
+        return self._memoize(
+            'topological_step_levels',
+            lambda: [
+                [self.step_dict[step_key] for step_key in sorted(step_key_level)]
+                for step_key_level in toposort(self.deps)
+            ],
+        )
 
     def execution_step_levels(self):
-        return [
-            [self.step_dict[step_key] for step_key in sorted(step_key_level)]
-            for step_key_level in toposort(self.execution_deps())
-        ]
+        return self._memoize(
+            'execution_step_levels',
+            lambda: [
+                [self.step_dict[step_key] for step_key in sorted(step_key_level)]
+                for step_key_level in toposort(self.execution_deps())
+            ],
+        )
 
     def missing_steps(self):
         return [step_key for step_key in self.step_keys_to_execute if not self.has_step(step_key)]
 
     def execution_deps(self):
+        '''Maps each step key to execute to the set of step keys to execute that it depends on.'''
+        return self._memoize('execution_deps', self._build_execution_deps)
+
+    def _build_execution_deps(self):
+        step_keys_to_execute = set(self.step_keys_to_execute)
         deps = OrderedDict()
 
         for key in self.step_keys_to_execute:
@@ -338,14 +360,25 @@ class ExecutionPlan(
         for key in self.step_keys_to_execute:
             step = self.step_dict[key]
             for step_input in step.step_inputs:
-                deps[step.key].update(
-                    step_input.dependency_keys.intersection(self.step_keys_to_execute)
-                )
+                deps[step.key].update(step_input.dependency_keys.intersection(step_keys_to_execute))
         return deps
 
+    def execution_dependents(self):
+        '''Maps each step key to execute to the set of step keys to execute that depend on it. The
+        reverse of :py:meth:`execution_deps`.
+        '''
+        return self._memoize('execution_dependents', self._build_execution_dependents)
+
+    def _build_execution_dependents(self):
+        dependents = OrderedDict((key, set()) for key in self.step_keys_to_execute)
+        for step_key, requirements in self.execution_deps().items():
+            for requirement in requirements:
+                dependents[requirement].add(step_key)
+        return dependents
+
     def build_subset_plan(self, step_keys_to_execute):
         check.list_param(step_keys_to_execute, 'step_keys_to_execute', of_type=str)
-        return ExecutionPlan(
+        subset_plan = ExecutionPlan(
             self.pipeline,
             self.step_dict,
             self.deps,
@@ -353,6 +386,16 @@ class ExecutionPlan(
             step_keys_to_execute,
         )
 
+        # structures derived from the full set of steps carry over to the subset plan
+        memoized = self.__dict__.get('_memoized', {})
+        subset_plan.__dict__['_memoized'] = {
+            key: memoized[key]
+            for key in ('topological_steps', 'topological_step_levels')
+            if key in memoized
+        }
+
+        return subset_plan
+
     def start(
         self, retries, sort_key_fn=None,
     ):
@@ -8,8 +8,17 @@ from dagster.core.definitions.events import ObjectStoreOperation
 from dagster.core.definitions.solid_container import IContainSolids
 from dagster.core.definitions.utils import DEFAULT_OUTPUT
 from dagster.core.errors import DagsterInvariantViolationError
-from dagster.core.events import DagsterEvent, DagsterEventType
+from dagster.core.events import FAILURE_EVENTS, PIPELINE_EVENTS, DagsterEvent, DagsterEventType
 from dagster.core.execution.plan.objects import StepKind
+from dagster.core.instance import DagsterInstance
+
+# The events that a pipeline execution result keeps when it does not retain every event: enough to
+# tell whether the run and each of its steps succeeded, and where step outputs are stored
+SUMMARY_EVENTS = (
+    PIPELINE_EVENTS
+    | FAILURE_EVENTS
+    | {DagsterEventType.STEP_OUTPUT, DagsterEventType.STEP_SUCCESS, DagsterEventType.STEP_SKIPPED,}
+)
 
 
 def _construct_events_by_step_key(event_list):
@@ -20,18 +29,38 @@ def _construct_events_by_step_key(event_list):
     return dict(events_by_step_key)
 
 
+def _construct_events_by_kind(event_list):
+    events_by_kind = defaultdict(list)
+    for event in event_list:
+        events_by_kind[event.step_kind].append(event)
+
+    return events_by_kind
+
+
 class IContainSolidsExecutionResult(object):
-    def __init__(self, container, event_list, reconstruct_context, handle=None):
+    def __init__(self, container, event_list, reconstruct_context, handle=None, load_events=None):
         self.container = check.inst_param(container, 'container', IContainSolids)
-        self.event_list = check.list_param(event_list, 'step_event_list', of_type=DagsterEvent)
+        self._event_list = check.list_param(event_list, 'step_event_list', of_type=DagsterEvent)
         self.reconstruct_context = check.callable_param(reconstruct_context, 'reconstruct_context')
         self.handle = check.opt_inst_param(handle, 'handle', SolidHandle)
-        self._events_by_step_key = _construct_events_by_step_key(event_list)
+        # Set when event_list holds only the summary events of the execution, to load all of them
+        self._load_events = check.opt_callable_param(load_events, 'load_events')
+        self._events_by_step_key = None
+
+    @property
+    def event_list(self):
+        '''List[DagsterEvent]: The full list of events generated by the execution.'''
+        if self._load_events:
+            return self._load_events()
+
+        return self._event_list
 
     @property
     def success(self):
         '''bool: Whether all steps in the execution were successful.'''
-        return all([not event.is_failure for event in self.event_list])
+        # Failure events are among the summary events, so this holds whether or not every event was
+        # retained
+        return all([not event.is_failure for event in self._event_list])
 
     @property
     def step_event_list(self):
@@ -43,6 +72,11 @@ class IContainSolidsExecutionResult(object):
 
     @property
     def events_by_step_key(self):
+        if self._load_events:
+            return _construct_events_by_step_key(self.event_list)
+
+        if self._events_by_step_key is None:
+            self._events_by_step_key = _construct_events_by_step_key(self.event_list)
         return self._events_by_step_key
 
     def result_for_solid(self, name):
@@ -90,30 +124,36 @@ class IContainSolidsExecutionResult(object):
                 'Can not find solid handle {handle_str}.'.format(handle_str=handle.to_string())
             )
 
-        events_by_kind = defaultdict(list)
+        solid_handle = handle.with_ancestor(self.handle)
 
-        if solid.is_composite:
-            events = []
-            for event in self.event_list:
-                if event.is_step_event:
-                    if event.solid_handle.is_or_descends_from(handle.with_ancestor(self.handle)):
-                        events_by_kind[event.step_kind].append(event)
-                        events.append(event)
+        def _solid_events(event_list):
+            return [
+                event
+                for event in event_list
+                if event.is_step_event and event.solid_handle.is_or_descends_from(solid_handle)
+            ]
+
+        # Solid results are built from the events held by this result, and load the rest of their
+        # events only when they are asked for them
+        events = _solid_events(self._event_list)
+        load_events = (lambda: _solid_events(self._load_events())) if self._load_events else None
 
+        if solid.is_composite:
             return CompositeSolidExecutionResult(
                 solid,
                 events,
-                events_by_kind,
+                _construct_events_by_kind(events),
                 self.reconstruct_context,
-                handle=handle.with_ancestor(self.handle),
+                handle=solid_handle,
+                load_events=load_events,
             )
         else:
-            for event in self.event_list:
-                if event.is_step_event:
-                    if event.solid_handle.is_or_descends_from(handle.with_ancestor(self.handle)):
-                        events_by_kind[event.step_kind].append(event)
-
-            return SolidExecutionResult(solid, events_by_kind, self.reconstruct_context)
+            return SolidExecutionResult(
+                solid,
+                _construct_events_by_kind(events),
+                self.reconstruct_context,
+                load_events=load_events,
+            )
 
     def result_for_handle(self, handle):
         '''Get the result of a solid by its solid handle.
@@ -142,20 +182,57 @@ class PipelineExecutionResult(IContainSolidsExecutionResult):
     '''The result of executing a pipeline.
 
     Returned by :py:func:`execute_pipeline`. Users should not instantiate this class.
+
+    When the result does not retain every event of the run, it keeps only the events in
+    ``SUMMARY_EVENTS``, so that its size grows with the number of steps rather than the number of
+    events. Whether the run and its solids succeeded, and their outputs, are answered from those
+    events. The other events, e.g. the materializations of a solid, are read from the event log of
+    the instance when they are asked for.
     '''
 
-    def __init__(self, pipeline_def, run_id, event_list, reconstruct_context):
+    def __init__(self, pipeline_def, run_id, event_list, reconstruct_context, instance=None):
         self.run_id = check.str_param(run_id, 'run_id')
         check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
+        # Set when event_list holds only the summary events of the run
+        self._instance = check.opt_inst_param(instance, 'instance', DagsterInstance)
 
         super(PipelineExecutionResult, self).__init__(
-            container=pipeline_def, event_list=event_list, reconstruct_context=reconstruct_context,
+            container=pipeline_def,
+            event_list=event_list,
+            reconstruct_context=reconstruct_context,
+            load_events=self._load_run_events if instance else None,
         )
 
     @property
     def pipeline_def(self):
         return self.container
 
+    @property
+    def retains_events(self):
+        '''bool: Whether the result holds every event of the run, rather than only the summary
+        events.'''
+        return self._instance is None
+
+    def _load_run_events(self):
+        if not self._instance.has_persistent_event_log:
+            raise DagsterInvariantViolationError(
+                'The events of run {run_id} were not retained by its result, and cannot be read '
+                'from the event log of its instance, which is not persistent.'.format(
+                    run_id=self.run_id
+                )
+            )
+
+        return [
+            record.dagster_event
+            for record in self._instance.all_logs(self.run_id)
+            if record.is_dagster_event
+        ]
+
+    @property
+    def summary_event_list(self):
+        '''List[DagsterEvent]: The events of the run in ``SUMMARY_EVENTS``.'''
+        return [event for event in self._event_list if event.event_type in SUMMARY_EVENTS]
+
 
 class CompositeSolidExecutionResult(IContainSolidsExecutionResult):
     '''Execution result for a composite solid in a pipeline.
@@ -163,7 +240,15 @@ class CompositeSolidExecutionResult(IContainSolidsExecutionResult):
     Users should not instantiate this class.
     '''
 
-    def __init__(self, solid, event_list, step_events_by_kind, reconstruct_context, handle=None):
+    def __init__(
+        self,
+        solid,
+        event_list,
+        step_events_by_kind,
+        reconstruct_context,
+        handle=None,
+        load_events=None,
+    ):
         check.inst_param(solid, 'solid', Solid)
         check.invariant(
             solid.is_composite,
@@ -179,6 +264,7 @@ class CompositeSolidExecutionResult(IContainSolidsExecutionResult):
             event_list=event_list,
             reconstruct_context=reconstruct_context,
             handle=handle,
+            load_events=load_events,
         )
 
     def output_values_for_solid(self, name):
@@ -242,17 +328,34 @@ class SolidExecutionResult(object):
     Users should not instantiate this class.
     '''
 
-    def __init__(self, solid, step_events_by_kind, reconstruct_context):
+    def __init__(self, solid, step_events_by_kind, reconstruct_context, load_events=None):
         check.inst_param(solid, 'solid', Solid)
         check.invariant(
             not solid.is_composite,
             desc='Tried to instantiate a SolidExecutionResult with a composite solid',
         )
         self.solid = solid
-        self.step_events_by_kind = check.dict_param(
+        self._step_events_by_kind = check.dict_param(
             step_events_by_kind, 'step_events_by_kind', key_type=StepKind, value_type=list
         )
         self.reconstruct_context = check.callable_param(reconstruct_context, 'reconstruct_context')
+        # Set when step_events_by_kind holds only the summary events of the solid, to load all of
+        # them the first time they are needed
+        self._load_events = check.opt_callable_param(load_events, 'load_events')
+
+    @property
+    def step_events_by_kind(self):
+        if self._load_events:
+            self._step_events_by_kind = _construct_events_by_kind(self._load_events())
+            self._load_events = None
+
+        return self._step_events_by_kind
+
+    @property
+    def _summary_compute_step_events(self):
+        # The events in SUMMARY_EVENTS are held whether or not every event was retained, so
+        # success, failures, skips and outputs are answered without loading the others
+        return self._step_events_by_kind.get(StepKind.COMPUTE, [])
 
     @property
     def compute_input_event_dict(self):
@@ -311,9 +414,12 @@ class SolidExecutionResult(object):
         return self._compute_steps_of_type(DagsterEventType.STEP_EXPECTATION_RESULT)
 
     def _compute_steps_of_type(self, dagster_event_type):
-        return list(
-            filter(lambda se: se.event_type == dagster_event_type, self.compute_step_events)
+        compute_step_events = (
+            self._summary_compute_step_events
+            if dagster_event_type in SUMMARY_EVENTS
+            else self.compute_step_events
         )
+        return list(filter(lambda se: se.event_type == dagster_event_type, compute_step_events))
 
     @property
     def expectation_results_during_compute(self):
@@ -325,7 +431,7 @@ class SolidExecutionResult(object):
 
     def get_step_success_event(self):
         '''DagsterEvent: The ``STEP_SUCCESS`` event, throws if not present.'''
-        for step_event in self.compute_step_events:
+        for step_event in self._summary_compute_step_events:
             if step_event.event_type == DagsterEventType.STEP_SUCCESS:
                 return step_event
 
@@ -347,7 +453,7 @@ class SolidExecutionResult(object):
     def success(self):
         '''bool: Whether solid execution was successful.'''
         any_success = False
-        for step_event in self.compute_step_events:
+        for step_event in self._summary_compute_step_events:
             if step_event.event_type == DagsterEventType.STEP_FAILURE:
                 return False
             if step_event.event_type == DagsterEventType.STEP_SUCCESS:
@@ -361,7 +467,7 @@ class SolidExecutionResult(object):
         return all(
             [
                 step_event.event_type == DagsterEventType.STEP_SKIPPED
-                for step_event in self.compute_step_events
+                for step_event in self._summary_compute_step_events
             ]
         )
 
@@ -378,7 +484,7 @@ class SolidExecutionResult(object):
         '''
         from .api import create_execution_plan
 
-        if self.success and self.compute_step_events:
+        if self.success and self._summary_compute_step_events:
             with self.reconstruct_context() as context:
                 execution_plan = create_execution_plan(
                     pipeline=context.pipeline,
@@ -387,7 +493,7 @@ class SolidExecutionResult(object):
                     step_keys_to_execute=context.pipeline_run.step_keys_to_execute,
                 )
                 values = {}
-                for compute_step_event in self.compute_step_events:
+                for compute_step_event in self._summary_compute_step_events:
                     if compute_step_event.is_successful_output:
                         values[compute_step_event.step_output_data.output_name] = self._get_value(
                             context.for_step(
@@ -427,7 +533,7 @@ class SolidExecutionResult(object):
             )
 
         if self.success:
-            for compute_step_event in self.compute_step_events:
+            for compute_step_event in self._summary_compute_step_events:
                 if (
                     compute_step_event.is_successful_output
                     and compute_step_event.step_output_data.output_name == output_name
@@ -472,6 +578,6 @@ class SolidExecutionResult(object):
     def failure_data(self):
         '''Union[None, StepFailureData]: Any data corresponding to this step's failure, if it
         failed.'''
-        for step_event in self.compute_step_events:
+        for step_event in self._summary_compute_step_events:
             if step_event.event_type == DagsterEventType.STEP_FAILURE:
                 return step_event.step_failure_data
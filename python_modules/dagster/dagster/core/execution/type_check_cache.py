@@ -0,0 +1,46 @@
+from dagster import check
+from dagster.core.definitions import TypeCheck
+from dagster.core.types.dagster_type import DagsterType
+
+
+class TypeCheckCache(object):
+    '''The results of the type checks of the step outputs of a run whose values are handed to
+    downstream steps in memory.
+
+    A step input whose value is the very object a step output was type checked as, against the
+    same dagster type, does not need to be type checked again. Values are compared by identity, so
+    a value that has been serialized and loaded again is never found in the cache.
+
+    Each type check is only used once, by the first step input that loads the value. Steps that
+    load it later, or that are retried, may see it after it was modified in place by a step, so
+    they check it again.
+
+    Entries hold a reference to their value, so that the id of a value cannot be taken by another
+    object while its type check is cached.
+    '''
+
+    def __init__(self):
+        self._type_checks = {}
+
+    def set(self, dagster_type, value, type_check):
+        check.inst_param(dagster_type, 'dagster_type', DagsterType)
+        check.inst_param(type_check, 'type_check', TypeCheck)
+
+        self._type_checks[(dagster_type.key, id(value))] = (value, type_check)
+
+    def pop(self, dagster_type, value):
+        '''Removes and returns the cached type check of a value against a dagster type, if there
+        is one.
+
+        Returns:
+            Optional[TypeCheck]
+        '''
+        check.inst_param(dagster_type, 'dagster_type', DagsterType)
+
+        key = (dagster_type.key, id(value))
+        entry = self._type_checks.get(key)
+        if entry is None or entry[0] is not value:
+            return None
+
+        del self._type_checks[key]
+        return entry[1]
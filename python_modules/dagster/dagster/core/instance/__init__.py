@@ -1,6 +1,7 @@
 import datetime
 import logging
 import os
+import shutil
 import time
 from abc import ABCMeta
 from collections import defaultdict, namedtuple
@@ -8,7 +9,6 @@ from enum import Enum
 
 import six
 import yaml
-from rx import Observable
 
 from dagster import check, seven
 from dagster.config import Field, Permissive
@@ -19,10 +19,12 @@ from dagster.core.errors import (
     DagsterRunAlreadyExists,
     DagsterRunConflict,
 )
+from dagster.core.storage.object_store import ContentAddressedFilesystemObjectStore
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
 from dagster.core.utils import str_format_list
 from dagster.serdes import ConfigurableClass, whitelist_for_serdes
 from dagster.seven import get_current_datetime_in_utc
+from dagster.utils import LRUCache
 from dagster.utils.merger import merge_dicts
 from dagster.utils.yaml_utils import load_yaml_from_globs
 
@@ -84,6 +86,52 @@ def _format_field_diff(field_diff):
     )
 
 
+EXECUTION_PLAN_SNAPSHOT_CACHE_SIZE = 128
+
+# Run artifact directories modified more recently than this, in seconds, are never collected, as
+# their run may still be being created
+RUN_ARTIFACTS_GC_MIN_AGE = 60 * 60
+
+_execution_plan_snapshot_cache = LRUCache(EXECUTION_PLAN_SNAPSHOT_CACHE_SIZE)
+
+
+def _execution_plan_snapshot_for_run(pipeline_def, environment_dict, mode, step_keys_to_execute):
+    '''Builds the execution plan snapshot for a run, reusing the snapshot built for an earlier run
+    of the same pipeline snapshot with the same environment, mode and step subset.
+    '''
+    from dagster.core.execution.api import create_execution_plan
+    from dagster.core.snap import snapshot_from_execution_plan
+
+    try:
+        cache_key = (
+            pipeline_def.get_pipeline_snapshot_id(),
+            seven.json.dumps(environment_dict, sort_keys=True),
+            mode if mode is not None else pipeline_def.get_default_mode_name(),
+            tuple(step_keys_to_execute) if step_keys_to_execute is not None else None,
+        )
+    except TypeError:
+        # environment_dict is not serializable, so runs can not share its plan snapshot
+        cache_key = None
+
+    if cache_key is not None:
+        snapshot = _execution_plan_snapshot_cache.get(cache_key)
+        if snapshot is not None:
+            return snapshot
+
+    execution_plan = create_execution_plan(
+        pipeline_def,
+        environment_dict=environment_dict,
+        mode=mode,
+        step_keys_to_execute=step_keys_to_execute,
+    )
+    snapshot = snapshot_from_execution_plan(execution_plan, pipeline_def.get_pipeline_snapshot_id())
+
+    if cache_key is not None:
+        _execution_plan_snapshot_cache.set(cache_key, snapshot)
+
+    return snapshot
+
+
 class _EventListenerLogHandler(logging.Handler):
     def __init__(self, instance):
         self._instance = instance
@@ -208,6 +256,11 @@ class DagsterInstance:
 
         self._subscribers = defaultdict(list)
 
+        # ids of snapshots known to be in run storage, so that creating runs from the same
+        # pipelines does not need to query for them again
+        self._known_pipeline_snapshot_ids = set()
+        self._known_execution_plan_snapshot_ids = set()
+
     # ctors
 
     @staticmethod
@@ -285,6 +338,10 @@ class DagsterInstance:
     def is_ephemeral(self):
         return self._instance_type == InstanceType.EPHEMERAL
 
+    @property
+    def has_persistent_event_log(self):
+        return self._event_storage.is_persistent
+
     def get_ref(self):
         if self._ref:
             return self._ref
@@ -459,7 +516,57 @@ class DagsterInstance:
         root_run_id=None,
         parent_run_id=None,
     ):
-        from dagster.core.execution.api import create_execution_plan
+        return self._run_storage.add_run(
+            self._construct_run_for_pipeline(
+                pipeline_def,
+                execution_plan=execution_plan,
+                run_id=run_id,
+                environment_dict=environment_dict,
+                mode=mode,
+                solid_subset=solid_subset,
+                step_keys_to_execute=step_keys_to_execute,
+                status=status,
+                tags=tags,
+                root_run_id=root_run_id,
+                parent_run_id=parent_run_id,
+            )
+        )
+
+    def create_runs_for_pipeline(self, pipeline_def, runs_kwargs):
+        '''Create a batch of runs of a pipeline, adding them to run storage together.
+
+        Args:
+            pipeline_def (PipelineDefinition): The pipeline to create runs of. Pass the subset of
+                the pipeline to execute, rather than a ``solid_subset`` for each run, to subset the
+                pipeline once for the whole batch.
+            runs_kwargs (List[Dict[str, Any]]): The keyword arguments to
+                :py:meth:`create_run_for_pipeline` for each run.
+
+        Returns:
+            List[PipelineRun]
+        '''
+        check.list_param(runs_kwargs, 'runs_kwargs', of_type=dict)
+        return self._run_storage.add_runs(
+            [
+                self._construct_run_for_pipeline(pipeline_def, **run_kwargs)
+                for run_kwargs in runs_kwargs
+            ]
+        )
+
+    def _construct_run_for_pipeline(
+        self,
+        pipeline_def,
+        execution_plan=None,
+        run_id=None,
+        environment_dict=None,
+        mode=None,
+        solid_subset=None,
+        step_keys_to_execute=None,
+        status=None,
+        tags=None,
+        root_run_id=None,
+        parent_run_id=None,
+    ):
         from dagster.core.execution.plan.plan import ExecutionPlan
         from dagster.core.snap import snapshot_from_execution_plan
 
@@ -481,14 +588,15 @@ class DagsterInstance:
                 pipeline_def = pipeline_def.subset_for_execution(solid_subset=solid_subset)
 
         if execution_plan is None:
-            execution_plan = create_execution_plan(
-                pipeline_def,
-                environment_dict=environment_dict,
-                mode=mode,
-                step_keys_to_execute=step_keys_to_execute,
+            execution_plan_snapshot = _execution_plan_snapshot_for_run(
+                pipeline_def, environment_dict, mode, step_keys_to_execute
+            )
+        else:
+            execution_plan_snapshot = snapshot_from_execution_plan(
+                execution_plan, pipeline_def.get_pipeline_snapshot_id()
             )
 
-        return self.create_run(
+        return self._construct_run_with_snapshots(
             pipeline_name=pipeline_def.name,
             run_id=run_id,
             environment_dict=environment_dict,
@@ -500,12 +608,30 @@ class DagsterInstance:
             root_run_id=root_run_id,
             parent_run_id=parent_run_id,
             pipeline_snapshot=pipeline_def.get_pipeline_snapshot(),
-            execution_plan_snapshot=snapshot_from_execution_plan(
-                execution_plan, pipeline_def.get_pipeline_snapshot_id()
-            ),
+            execution_plan_snapshot=execution_plan_snapshot,
             parent_pipeline_snapshot=pipeline_def.get_parent_pipeline_snapshot(),
         )
 
+    def _has_pipeline_snapshot(self, snapshot_id):
+        if snapshot_id in self._known_pipeline_snapshot_ids:
+            return True
+
+        if self._run_storage.has_pipeline_snapshot(snapshot_id):
+            self._known_pipeline_snapshot_ids.add(snapshot_id)
+            return True
+
+        return False
+
+    def _has_execution_plan_snapshot(self, snapshot_id):
+        if snapshot_id in self._known_execution_plan_snapshot_ids:
+            return True
+
+        if self._run_storage.has_execution_plan_snapshot(snapshot_id):
+            self._known_execution_plan_snapshot_ids.add(snapshot_id)
+            return True
+
+        return False
+
     def _construct_run_with_snapshots(
         self,
         pipeline_name,
@@ -545,7 +671,7 @@ class DagsterInstance:
             from dagster.core.snap import create_pipeline_snapshot_id
 
             if pipeline_snapshot.lineage_snapshot:
-                if not self._run_storage.has_pipeline_snapshot(
+                if not self._has_pipeline_snapshot(
                     pipeline_snapshot.lineage_snapshot.parent_snapshot_id
                 ):
                     check.invariant(
@@ -561,13 +687,15 @@ class DagsterInstance:
                         pipeline_snapshot.lineage_snapshot.parent_snapshot_id
                         == returned_pipeline_snapshot_id
                     )
+                    self._known_pipeline_snapshot_ids.add(returned_pipeline_snapshot_id)
 
             pipeline_snapshot_id = create_pipeline_snapshot_id(pipeline_snapshot)
-            if not self._run_storage.has_pipeline_snapshot(pipeline_snapshot_id):
+            if not self._has_pipeline_snapshot(pipeline_snapshot_id):
                 returned_pipeline_snapshot_id = self._run_storage.add_pipeline_snapshot(
                     pipeline_snapshot
                 )
                 check.invariant(pipeline_snapshot_id == returned_pipeline_snapshot_id)
+                self._known_pipeline_snapshot_ids.add(pipeline_snapshot_id)
 
             pipeline_run = pipeline_run.with_pipeline_snapshot_id(pipeline_snapshot_id)
 
@@ -589,12 +717,13 @@ class DagsterInstance:
 
             execution_plan_snapshot_id = create_execution_plan_snapshot_id(execution_plan_snapshot)
 
-            if not self._run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id):
+            if not self._has_execution_plan_snapshot(execution_plan_snapshot_id):
                 returned_execution_plan_snapshot_id = self._run_storage.add_execution_plan_snapshot(
                     execution_plan_snapshot
                 )
 
                 check.invariant(execution_plan_snapshot_id == returned_execution_plan_snapshot_id)
+                self._known_execution_plan_snapshot_ids.add(execution_plan_snapshot_id)
 
             pipeline_run = pipeline_run.with_execution_plan_snapshot_id(execution_plan_snapshot_id)
 
@@ -700,15 +829,24 @@ class DagsterInstance:
     def add_run(self, pipeline_run):
         return self._run_storage.add_run(pipeline_run)
 
+    def add_runs(self, pipeline_runs):
+        return self._run_storage.add_runs(pipeline_runs)
+
     def handle_run_event(self, run_id, event):
         return self._run_storage.handle_run_event(run_id, event)
 
+    def update_run_status(self, run_id, status):
+        return self._run_storage.update_run_status(run_id, status)
+
     def has_run(self, run_id):
         return self._run_storage.has_run(run_id)
 
     def get_runs(self, filters=None, cursor=None, limit=None):
         return self._run_storage.get_runs(filters, cursor, limit)
 
+    def get_run_records(self, filters=None, cursor=None, limit=None):
+        return self._run_storage.get_run_records(filters, cursor, limit)
+
     def get_runs_count(self, filters=None):
         return self._run_storage.get_runs_count(filters)
 
@@ -718,6 +856,8 @@ class DagsterInstance:
     def wipe(self):
         self._run_storage.wipe()
         self._event_storage.wipe()
+        self._known_pipeline_snapshot_ids.clear()
+        self._known_execution_plan_snapshot_ids.clear()
 
     def delete_run(self, run_id):
         self._run_storage.delete_run(run_id)
@@ -831,9 +971,56 @@ class DagsterInstance:
     def intermediates_directory(self, run_id):
         return self._local_artifact_storage.intermediates_dir(run_id)
 
+    def objects_directory(self):
+        return self._local_artifact_storage.objects_dir
+
     def schedules_directory(self):
         return self._local_artifact_storage.schedules_dir
 
+    def collect_garbage(self, delete_run_artifacts=False):
+        '''Delete the content-addressed intermediates that no run artifacts refer to any more.
+
+        The artifacts stored for runs that are not in run storage are only listed, unless
+        ``delete_run_artifacts`` is set: the artifact storage of the instance may be shared with
+        instances that keep their runs elsewhere, or run storage may have been wiped. Artifacts
+        modified in the last ``RUN_ARTIFACTS_GC_MIN_AGE`` seconds are never listed.
+
+        Args:
+            delete_run_artifacts (Optional[bool]): Whether to delete the listed run artifacts before
+                collecting intermediates. (default: False)
+
+        Returns:
+            Tuple[List[str], List[str]]: The ids of the runs not in run storage whose artifacts
+                were listed, and the digests of the intermediate content that was deleted.
+        '''
+        check.bool_param(delete_run_artifacts, 'delete_run_artifacts')
+
+        storage_dir = self._local_artifact_storage.storage_dir
+        unknown_run_ids = []
+        if os.path.isdir(storage_dir):
+            min_mtime = time.time() - RUN_ARTIFACTS_GC_MIN_AGE
+            for run_id in sorted(os.listdir(storage_dir)):
+                run_dir = os.path.join(storage_dir, run_id)
+                if (
+                    os.path.isdir(run_dir)
+                    and os.path.getmtime(run_dir) < min_mtime
+                    and not self.has_run(run_id)
+                ):
+                    unknown_run_ids.append(run_id)
+
+        if delete_run_artifacts:
+            for run_id in unknown_run_ids:
+                shutil.rmtree(os.path.join(storage_dir, run_id))
+
+        objects_dir = self._local_artifact_storage.objects_dir
+        if not os.path.isdir(objects_dir):
+            return unknown_run_ids, []
+
+        return (
+            unknown_run_ids,
+            ContentAddressedFilesystemObjectStore(objects_dir).collect_garbage(),
+        )
+
     # Run launcher
 
     def launch_run(self, run_id, external_pipeline=None):
@@ -1,39 +1,111 @@
+import itertools
 import os
+import sys
 import threading
 import time
+from collections import namedtuple
 
-from dagster import check
+from dagster import Field, check
 from dagster.api.execute_run import cli_api_execute_run
+from dagster.core.definitions.events import EventMetadataEntry
+from dagster.core.events import EngineEventData
 from dagster.core.host_representation import ExternalPipeline
 from dagster.core.instance import DagsterInstance
-from dagster.core.storage.pipeline_run import PipelineRun
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
+from dagster.core.storage.tags import PRIORITY_TAG
 from dagster.serdes import ConfigurableClass
 from dagster.serdes.ipc import interrupt_ipc_subprocess
 from dagster.seven.temp_dir import get_system_temp_directory
+from dagster.utils.error import serializable_error_info_from_exc_info
 
 from .base import RunLauncher
 
 SUBPROCESS_TICK = 0.5
 
+# How often, in seconds, the launcher reads the runs that are queued in run storage, so that it also
+# starts the runs queued by other processes, e.g. by the CLI or by a backfill
+QUEUED_RUNS_POLL_INTERVAL = 5
+
+# The label of the metadata entry in which the engine event for a queued run records the repository
+# to launch it from, so that queued runs can be started again after the launcher restarts
+REPO_CLI_ARGS_LABEL = 'repo_cli_args'
+
 
 def _is_alive(popen):
     return popen.poll() is None
 
 
+def _queued_repo_cli_args(event_records):
+    for record in reversed(event_records):
+        if not (record.dagster_event and record.dagster_event.is_engine_event):
+            continue
+
+        for entry in record.dagster_event.engine_event_data.metadata_entries:
+            if entry.label == REPO_CLI_ARGS_LABEL:
+                return entry.entry_data.text
+
+    return None
+
+
+def _run_priority(run):
+    try:
+        return int(run.tags.get(PRIORITY_TAG, 0))
+    except ValueError:
+        return 0
+
+
+class _QueuedRun(namedtuple('_QueuedRun', 'run repo_cli_args priority sequence')):
+    @property
+    def sort_key(self):
+        # Higher priorities first, then first in first out
+        return (-self.priority, self.sequence)
+
+
 class CliApiRunLauncher(RunLauncher, ConfigurableClass):
     '''
     This run launcher launches a new process which invokes
     the command `dagster api execute_run`.
+
+    If ``max_concurrent_runs`` or ``tag_concurrency_limits`` are set, launched runs are not started
+    immediately. Instead they are marked ``QUEUED`` in run storage and started by the launcher as
+    capacity becomes available, highest ``dagster/priority`` tag first and otherwise in the order
+    they were launched. The queue is kept in run storage, which the launcher polls for queued runs,
+    so that it also starts the runs queued by other processes and the runs queued before it was
+    last stopped. Call :py:meth:`resume_queued_runs` when the process that launches runs starts, as
+    dagit does, to start those runs without waiting for the first poll.
+
+    Args:
+        max_concurrent_runs (Optional[int]): The maximum number of runs to execute at once.
+        tag_concurrency_limits (Optional[List[Dict[str, Any]]]): Limits on the number of runs with
+            a given tag that may execute at once. Each limit has a ``key``, a ``limit`` and,
+            optionally, a ``value``; if no value is given the limit applies to all runs with the
+            tag key.
     '''
 
-    def __init__(self, inst_data=None):
+    def __init__(self, inst_data=None, max_concurrent_runs=None, tag_concurrency_limits=None):
         self._instance = None
         self._living_process_by_run_id = {}
         self._output_files_by_run_id = {}
+        self._tags_by_run_id = {}
+        self._queued_runs = []
+        self._last_queued_runs_poll = None
+        self._sequence = itertools.count()
         self._processes_lock = threading.Lock()
+        # Serializes dequeueing, so that the database writes and process starts of the runs being
+        # dequeued can happen outside of _processes_lock
+        self._dequeue_lock = threading.Lock()
         self._stopping = False
         self._thread = None
         self._inst_data = inst_data
+        self._max_concurrent_runs = check.opt_int_param(max_concurrent_runs, 'max_concurrent_runs')
+        check.param_invariant(
+            self._max_concurrent_runs is None or self._max_concurrent_runs > 0,
+            'max_concurrent_runs',
+            'max_concurrent_runs must be positive',
+        )
+        self._tag_concurrency_limits = check.opt_list_param(
+            tag_concurrency_limits, 'tag_concurrency_limits', of_type=dict
+        )
 
     @property
     def inst_data(self):
@@ -41,11 +113,21 @@ class CliApiRunLauncher(RunLauncher, ConfigurableClass):
 
     @classmethod
     def config_type(cls):
-        return {}
+        return {
+            'max_concurrent_runs': Field(int, is_required=False),
+            'tag_concurrency_limits': Field(
+                [{'key': str, 'value': Field(str, is_required=False), 'limit': int}],
+                is_required=False,
+            ),
+        }
 
     @staticmethod
     def from_config_value(inst_data, config_value):
-        return CliApiRunLauncher(inst_data=inst_data)
+        return CliApiRunLauncher(inst_data=inst_data, **config_value)
+
+    @property
+    def is_queued(self):
+        return self._max_concurrent_runs is not None or bool(self._tag_concurrency_limits)
 
     def initialize(self, instance):
         check.inst_param(instance, 'instance', DagsterInstance)
@@ -56,6 +138,63 @@ class CliApiRunLauncher(RunLauncher, ConfigurableClass):
         self._thread.daemon = True
         self._thread.start()
 
+    def resume_queued_runs(self, instance):
+        '''Rebuild the launch queue from the runs that are ``QUEUED`` in run storage, and start them
+        as capacity becomes available.
+        '''
+        check.inst_param(instance, 'instance', DagsterInstance)
+        if not self.is_queued:
+            return
+
+        if not self._instance:
+            self.initialize(instance)
+
+        self._poll_queued_runs()
+        self._dequeue_runs()
+
+    def _poll_queued_runs(self):
+        '''
+        Adds to the queue the runs that are ``QUEUED`` in run storage but not yet in the queue. Holds
+        the dequeue lock, so that a run being dequeued is not added back while its status is updated.
+        '''
+        with self._dequeue_lock:
+            self._last_queued_runs_poll = time.time()
+
+            # get_runs returns the most recent runs first
+            for run in reversed(
+                self._instance.get_runs(PipelineRunsFilter(status=PipelineRunStatus.QUEUED))
+            ):
+                with self._processes_lock:
+                    if self._is_known_run(run.run_id):
+                        continue
+
+                repo_cli_args = _queued_repo_cli_args(self._instance.all_logs(run.run_id))
+                if repo_cli_args is None:
+                    self._instance.report_engine_event(
+                        'Could not find the repository to launch the queued run from.',
+                        run,
+                        cls=self.__class__,
+                    )
+                    self._instance.report_run_failed(run)
+                    continue
+
+                self._enqueue(run, repo_cli_args)
+
+    # always call this within lock
+    def _is_known_run(self, run_id):
+        return run_id in self._living_process_by_run_id or any(
+            queued_run.run.run_id == run_id for queued_run in self._queued_runs
+        )
+
+    def _enqueue(self, run, repo_cli_args):
+        with self._processes_lock:
+            if self._is_known_run(run.run_id):
+                return
+
+            self._queued_runs.append(
+                _QueuedRun(run, repo_cli_args, _run_priority(run), next(self._sequence))
+            )
+
     def _generate_synthetic_error_from_crash(self, run):
         message = 'Pipeline execution process for {run_id} unexpectedly exited.'.format(
             run_id=run.run_id
@@ -71,10 +210,17 @@ class CliApiRunLauncher(RunLauncher, ConfigurableClass):
         '''
         This function polls the instance to synchronize it with the state of processes managed
         by this manager instance. On every tick (every 0.5 seconds currently) it checks for zombie
-        processes
+        processes and starts queued runs, and every QUEUED_RUNS_POLL_INTERVAL seconds it reads the
+        queued runs from run storage
         '''
         while not self._stopping:
             self._check_for_zombies()
+            if self.is_queued and (
+                self._last_queued_runs_poll is None
+                or time.time() - self._last_queued_runs_poll >= QUEUED_RUNS_POLL_INTERVAL
+            ):
+                self._poll_queued_runs()
+            self._dequeue_runs()
 
             time.sleep(SUBPROCESS_TICK)
 
@@ -111,6 +257,7 @@ class CliApiRunLauncher(RunLauncher, ConfigurableClass):
     # always call this within lock
     def _delete_process(self, run_id):
         del self._living_process_by_run_id[run_id]
+        self._tags_by_run_id.pop(run_id, None)
         output_file = self._output_files_by_run_id[run_id]
         try:
             if os.path.exists(output_file):
@@ -125,11 +272,34 @@ class CliApiRunLauncher(RunLauncher, ConfigurableClass):
         check.inst_param(run, 'run', PipelineRun)
         check.inst_param(external_pipeline, 'external_pipeline', ExternalPipeline)
         env_handle = external_pipeline.handle.repository_handle.location_handle
+        repo_cli_args = env_handle.pointer.get_cli_args()
 
         # initialize when the first run happens
         if not self._instance:
             self.initialize(instance)
 
+        if not self.is_queued:
+            self._start_process(run, repo_cli_args)
+            return run
+
+        # Record the repository before marking the run as queued, so that any launcher that finds
+        # the run queued in run storage can start it
+        self._instance.report_engine_event(
+            'Queued run for launch.',
+            run,
+            EngineEventData(
+                metadata_entries=[EventMetadataEntry.text(repo_cli_args, REPO_CLI_ARGS_LABEL)]
+            ),
+            cls=self.__class__,
+        )
+        self._instance.update_run_status(run.run_id, PipelineRunStatus.QUEUED)
+
+        self._enqueue(run.with_status(PipelineRunStatus.QUEUED), repo_cli_args)
+        self._dequeue_runs()
+
+        return self._instance.get_run_by_id(run.run_id)
+
+    def _start_process(self, run, repo_cli_args):
         output_file = os.path.join(
             get_system_temp_directory(), 'cli-api-execute-run-{}'.format(run.run_id)
         )
@@ -137,15 +307,109 @@ class CliApiRunLauncher(RunLauncher, ConfigurableClass):
         process = cli_api_execute_run(
             output_file=output_file,
             instance=self._instance,
-            repo_cli_args=env_handle.pointer.get_cli_args(),
+            repo_cli_args=repo_cli_args,
             pipeline_run=run,
         )
 
         with self._processes_lock:
             self._living_process_by_run_id[run.run_id] = process
             self._output_files_by_run_id[run.run_id] = output_file
+            self._tags_by_run_id[run.run_id] = run.tags
+
+    def _tag_limits_for_run(self, run):
+        return [
+            limit
+            for limit in self._tag_concurrency_limits
+            if limit['key'] in run.tags
+            and (limit.get('value') is None or run.tags[limit['key']] == limit['value'])
+        ]
+
+    # always call this within lock
+    def _count_running_runs_for_limit(self, limit, starting_runs):
+        return sum(
+            1
+            for tags in itertools.chain(
+                (
+                    tags
+                    for run_id, tags in self._tags_by_run_id.items()
+                    if _is_alive(self._living_process_by_run_id[run_id])
+                ),
+                (run.tags for run in starting_runs),
+            )
+            if limit['key'] in tags
+            and (limit.get('value') is None or tags[limit['key']] == limit['value'])
+        )
+
+    # always call this within lock
+    def _take_runs_to_dequeue(self):
+        '''
+        Removes from the queue the runs to start, highest priority first, for as long as there is
+        capacity under the global limit. Runs that are blocked by a tag concurrency limit are
+        skipped over so that they do not hold up runs behind them in the queue.
+        '''
+        running_count = sum(
+            1 for process in self._living_process_by_run_id.values() if _is_alive(process)
+        )
+
+        to_start = []
+        for queued_run in sorted(self._queued_runs, key=lambda queued: queued.sort_key):
+            if (
+                self._max_concurrent_runs is not None
+                and running_count + len(to_start) >= self._max_concurrent_runs
+            ):
+                break
+
+            starting_runs = [starting.run for starting in to_start]
+            if any(
+                self._count_running_runs_for_limit(limit, starting_runs) >= limit['limit']
+                for limit in self._tag_limits_for_run(queued_run.run)
+            ):
+                continue
+
+            to_start.append(queued_run)
+
+        for queued_run in to_start:
+            self._queued_runs.remove(queued_run)
+
+        return to_start
+
+    def _dequeue_runs(self):
+        '''
+        Starts queued runs as capacity becomes available. A run that fails to start is marked as
+        failed, without holding up the rest of the queue.
+        '''
+        with self._dequeue_lock:
+            with self._processes_lock:
+                if not self._queued_runs:
+                    return
+
+                to_start = self._take_runs_to_dequeue()
+
+            for queued_run in to_start:
+                # Skip runs that were started or terminated by another process since they were
+                # queued, e.g. by an earlier launcher of the instance
+                stored_run = self._instance.get_run_by_id(queued_run.run.run_id)
+                if not stored_run or stored_run.status != PipelineRunStatus.QUEUED:
+                    continue
 
-        return run
+                # The execute_run subprocess expects a run that has not yet been started
+                run = stored_run.with_status(PipelineRunStatus.NOT_STARTED)
+                try:
+                    self._instance.update_run_status(run.run_id, PipelineRunStatus.NOT_STARTED)
+                    self._instance.report_engine_event(
+                        'Dequeued run for launch.', run, cls=self.__class__
+                    )
+                    self._start_process(run, queued_run.repo_cli_args)
+                except Exception:  # pylint: disable=broad-except
+                    self._instance.report_engine_event(
+                        'Failed to start the queued run.',
+                        run,
+                        EngineEventData.engine_error(
+                            serializable_error_info_from_exc_info(sys.exc_info())
+                        ),
+                        cls=self.__class__,
+                    )
+                    self._instance.report_run_failed(run)
 
     def join(self):
         # If this hasn't been initialize at all, we can just do a noop
@@ -156,8 +420,11 @@ class CliApiRunLauncher(RunLauncher, ConfigurableClass):
         self._stopping = True
         self._thread.join()
 
-        # Wrap up all open executions
+        # Wrap up all open executions. Queued runs are not started, and stay queued in run storage
+        # until the queue is resumed
         with self._processes_lock:
+            self._queued_runs = []
+
             for run_id, process in self._living_process_by_run_id.items():
                 if _is_alive(process):
                     _stdout, _std_error = process.communicate()
@@ -183,9 +450,23 @@ class CliApiRunLauncher(RunLauncher, ConfigurableClass):
         process = self._get_process(run_id)
         return _is_alive(process) if process else False
 
+    def _get_queued_run(self, run_id):
+        if not self._instance:
+            return None
+
+        with self._processes_lock:
+            for queued_run in self._queued_runs:
+                if queued_run.run.run_id == run_id:
+                    return queued_run
+
+        return None
+
     def can_terminate(self, run_id):
         check.str_param(run_id, 'run_id')
 
+        if self._get_queued_run(run_id):
+            return True
+
         process = self._get_process(run_id)
 
         if not process:
@@ -199,6 +480,20 @@ class CliApiRunLauncher(RunLauncher, ConfigurableClass):
     def terminate(self, run_id):
         check.str_param(run_id, 'run_id')
 
+        queued_run = self._get_queued_run(run_id)
+        if queued_run:
+            with self._processes_lock:
+                if queued_run not in self._queued_runs:
+                    return False
+                self._queued_runs.remove(queued_run)
+
+            run = self._instance.get_run_by_id(run_id)
+            self._instance.report_engine_event(
+                'Removed run from the launch queue.', run, cls=self.__class__
+            )
+            self._instance.report_run_failed(run)
+            return True
+
         process = self._get_process(run_id)
 
         if not process:
@@ -220,9 +515,16 @@ class CliApiRunLauncher(RunLauncher, ConfigurableClass):
         with self._processes_lock:
             return len(self._living_process_by_run_id)
 
+    def get_queued_run_count(self):
+        if not self._instance:
+            return 0
+
+        with self._processes_lock:
+            return len(self._queued_runs)
+
     def is_active(self, run_id):
         if not self._instance:
             return False
 
         with self._processes_lock:
-            return run_id in self._living_process_by_run_id
+            return self._is_known_run(run_id)
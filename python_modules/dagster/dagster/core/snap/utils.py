@@ -4,7 +4,17 @@ from dagster.serdes import serialize_dagster_namedtuple
 
 
 def create_snapshot_id(snapshot):
+    # Snapshots are immutable, so the id is memoized on the snapshot object to avoid serializing
+    # and hashing it again each time it is needed
+    memoized = getattr(snapshot, '__dict__', None)
+    if memoized is not None and '_snapshot_id' in memoized:
+        return memoized['_snapshot_id']
+
     json_rep = serialize_dagster_namedtuple(snapshot)
     m = hashlib.sha1()  # so that hexdigest is 40, not 64 bytes
     m.update(json_rep.encode())
-    return m.hexdigest()
+    snapshot_id = m.hexdigest()
+
+    if memoized is not None:
+        memoized['_snapshot_id'] = snapshot_id
+    return snapshot_id
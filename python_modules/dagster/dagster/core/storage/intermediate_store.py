@@ -6,7 +6,7 @@ from dagster import check
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.types.dagster_type import DagsterType
 
-from .object_store import FilesystemObjectStore, ObjectStore
+from .object_store import ContentAddressedFilesystemObjectStore, FilesystemObjectStore, ObjectStore
 from .type_storage import TypeStoragePluginRegistry
 
 
@@ -66,14 +66,21 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         key = self.object_store.key_for_paths([self.root] + paths)
         self.object_store.rm_object(key)
 
-    def copy_object_from_run(self, _context, run_id, paths):
+    def copy_object_from_run(self, _context, run_id, paths, dagster_type=None):
         check.str_param(run_id, 'run_id')
         check.list_param(paths, 'paths', of_type=str)
         check.param_invariant(len(paths) > 0, 'paths')
+        check.opt_inst_param(dagster_type, 'dagster_type', DagsterType)
 
         src = self.object_store.key_for_paths([self.root_for_run_id(run_id)] + paths)
         dst = self.object_store.key_for_paths([self.root] + paths)
 
+        # Values of types without a storage plugin were written by the object store's set_object
+        if dagster_type is not None and not self.type_storage_plugin_registry.is_registered(
+            dagster_type
+        ):
+            return self.object_store.cp_set_object(src, dst)
+
         return self.object_store.cp_object(src, dst)
 
     def set_value(self, obj, context, dagster_type, paths):
@@ -100,9 +107,14 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         return self.get_object(context, dagster_type, paths)
 
 
-def build_fs_intermediate_store(root_for_run_id, run_id, type_storage_plugin_registry=None):
+def build_fs_intermediate_store(
+    root_for_run_id, run_id, type_storage_plugin_registry=None, objects_dir=None
+):
+    check.opt_str_param(objects_dir, 'objects_dir')
     return IntermediateStore(
-        FilesystemObjectStore(),
+        ContentAddressedFilesystemObjectStore(objects_dir)
+        if objects_dir
+        else FilesystemObjectStore(),
         root_for_run_id,
         run_id,
         type_storage_plugin_registry
@@ -29,7 +29,7 @@ class IntermediatesManager(six.with_metaclass(ABCMeta)):  # pylint: disable=no-i
         pass
 
     @abstractmethod
-    def copy_intermediate_from_run(self, context, run_id, step_output_handle):
+    def copy_intermediate_from_run(self, context, run_id, step_output_handle, dagster_type=None):
         pass
 
     @abstractproperty
@@ -90,7 +90,7 @@ class InMemoryIntermediatesManager(IntermediatesManager):
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
         return step_output_handle in self.values
 
-    def copy_intermediate_from_run(self, context, run_id, step_output_handle):
+    def copy_intermediate_from_run(self, context, run_id, step_output_handle, dagster_type=None):
         check.failed('not implemented in in memory')
 
     @property
@@ -136,7 +136,9 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
         check.inst_param(canonicalize_dagster_type, 'dagster_type', DagsterType)
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
 
-        if self.has_intermediate(context, step_output_handle):
+        if self._intermediate_store.object_store.check_existing and self.has_intermediate(
+            context, step_output_handle
+        ):
             context.log.warning(
                 'Replacing existing intermediate for %s.%s'
                 % (step_output_handle.step_key, step_output_handle.output_name)
@@ -155,9 +157,12 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
 
         return self._intermediate_store.has_object(context, self._get_paths(step_output_handle))
 
-    def copy_intermediate_from_run(self, context, run_id, step_output_handle):
+    def copy_intermediate_from_run(self, context, run_id, step_output_handle, dagster_type=None):
         return self._intermediate_store.copy_object_from_run(
-            context, run_id, self._get_paths(step_output_handle)
+            context,
+            run_id,
+            self._get_paths(step_output_handle),
+            dagster_type=resolve_dagster_type(dagster_type) if dagster_type else None,
         )
 
     @property
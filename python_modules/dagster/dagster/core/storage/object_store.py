@@ -1,17 +1,27 @@
+import errno
+import hashlib
 import logging
 import os
 import shutil
+import threading
+import uuid
+import weakref
 from abc import ABCMeta, abstractmethod
 
 import six
 
 from dagster import check
 from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
+from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.types.marshal import PickleSerializationStrategy, SerializationStrategy
 from dagster.utils import mkdir_p
 
 
 class ObjectStore(six.with_metaclass(ABCMeta)):
+    # Whether set_object probes for an existing object at the key before writing. Stores that skip
+    # the probe also skip the intermediates manager's check for an intermediate being replaced.
+    check_existing = True
+
     def __init__(self, name, sep):
         '''Create an ObjectStore.
         
@@ -57,6 +67,16 @@ class ObjectStore(six.with_metaclass(ABCMeta)):
         Should return an ObjectStoreOperation with op==ObjectStoreOperationType.CP_OBJECT
         on success.'''
 
+    def cp_set_object(self, src, dst):
+        '''Copy an object written by ``set_object`` from one key to another.
+
+        Object stores whose ``set_object`` never writes into an existing object in place may
+        override this method to share the object between the two keys rather than copy it.
+
+        Should return an ObjectStoreOperation with op==ObjectStoreOperationType.CP_OBJECT
+        on success.'''
+        return self.cp_object(src, dst)
+
     @abstractmethod
     def uri_for_key(self, key, protocol=None):
         '''Implement this method to get a URI for a key in the object store.
@@ -71,6 +91,56 @@ class ObjectStore(six.with_metaclass(ABCMeta)):
 DEFAULT_SERIALIZATION_STRATEGY = PickleSerializationStrategy()
 
 
+def _link_or_copy(src, dst):
+    # Fall back to a byte copy across devices or on filesystems that do not support links
+    try:
+        os.link(src, dst)
+    except (AttributeError, OSError):
+        shutil.copy(src, dst)
+
+
+class _FilesystemReadCache(object):
+    '''Process-wide cache of values read from the filesystem with strategies whose values are
+    read-only, so that fan-out consumers of one intermediate share a single value (e.g. one memory
+    map) rather than each loading their own.
+
+    Entries are keyed by file identity and modification stamp, so rewritten files are reloaded and
+    hard-linked copies of the same file share an entry. Values are held weakly: an entry lives only
+    as long as some reader still references the value.
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = weakref.WeakValueDictionary()
+
+    def get_or_load(self, path, serialization_strategy):
+        stat = os.stat(path)
+        cache_key = (
+            stat.st_dev,
+            stat.st_ino,
+            stat.st_size,
+            getattr(stat, 'st_mtime_ns', stat.st_mtime),
+            serialization_strategy.name,
+        )
+
+        with self._lock:
+            value = self._values.get(cache_key)
+        if value is not None:
+            return value
+
+        value = serialization_strategy.deserialize_from_file(path)
+        try:
+            with self._lock:
+                value = self._values.setdefault(cache_key, value)
+        except TypeError:
+            # value does not support weak references, so it cannot be cached
+            pass
+        return value
+
+
+_READ_CACHE = _FilesystemReadCache()
+
+
 class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
     def __init__(self):
         super(FilesystemObjectStore, self).__init__(name='filesystem', sep=os.sep)
@@ -87,7 +157,18 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
         # Ensure path exists
         mkdir_p(os.path.dirname(key))
 
-        serialization_strategy.serialize_to_file(obj, key)
+        # Serialize to a scratch file and move it into place, so that no file is ever written in
+        # place: this is what allows cp_set_object to hard link files written here
+        scratch_path = os.path.join(
+            os.path.dirname(key),
+            '.{name}.{uuid}.tmp'.format(name=os.path.basename(key), uuid=uuid.uuid4().hex),
+        )
+        try:
+            serialization_strategy.serialize_to_file(obj, scratch_path)
+            os.rename(scratch_path, key)
+        finally:
+            if os.path.exists(scratch_path):
+                os.unlink(scratch_path)
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.SET_OBJECT,
@@ -103,7 +184,10 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
         check.param_invariant(len(key) > 0, 'key')
         check.inst_param(serialization_strategy, 'serialization_strategy', SerializationStrategy)
 
-        obj = serialization_strategy.deserialize_from_file(key)
+        if serialization_strategy.read_only_values:
+            obj = _READ_CACHE.get_or_load(key, serialization_strategy)
+        else:
+            obj = serialization_strategy.deserialize_from_file(key)
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.GET_OBJECT,
@@ -161,6 +245,29 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
             object_store_name=self.name,
         )
 
+    def cp_set_object(self, src, dst):
+        # set_object replaces files rather than writing into them, so a hard link to a file it
+        # wrote is indistinguishable from a copy. Directories were written by other means, e.g. by
+        # type storage plugins, and may be written in place, so they are copied.
+        if not os.path.isfile(src):
+            return self.cp_object(src, dst)
+
+        check.invariant(not os.path.exists(dst), 'Path already exists {}'.format(dst))
+
+        # Ensure output path exists
+        mkdir_p(os.path.dirname(dst))
+
+        _link_or_copy(src, dst)
+
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.CP_OBJECT,
+            key=src,
+            dest_key=dst,
+            obj=None,
+            serialization_strategy_name=None,
+            object_store_name=self.name,
+        )
+
     def uri_for_key(self, key, protocol=None):
         check.str_param(key, 'key')
         protocol = check.opt_str_param(protocol, 'protocol', default='file://')
@@ -169,3 +276,140 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
     def key_for_paths(self, path_fragments):
         '''Joins path fragments into a key using the object-store specific path separator.'''
         return os.path.join(*path_fragments)
+
+
+class ContentAddressedFilesystemObjectStore(FilesystemObjectStore):  # pylint: disable=no-init
+    '''A filesystem object store that stores each distinct serialized value once.
+
+    Values are serialized to a scratch file, hashed, and moved into ``objects_dir`` under their
+    SHA-256 digest; the requested key becomes a hard link to that content. Identical outputs
+    across retries, re-executions and scheduled runs therefore share a single copy on disk.
+
+    The hard link count of a content file is its reference count: removing a key only drops a
+    reference, and :py:meth:`collect_garbage` deletes content that no key refers to any more. A key
+    is always linked before the content it refers to is published, so content is never seen
+    unreferenced while it is being written.
+
+    Args:
+        objects_dir (str): The directory in which content is stored. Must be on the same filesystem
+            as the keys written to this store, and that filesystem must support hard links.
+    '''
+
+    def __init__(self, objects_dir):
+        super(ContentAddressedFilesystemObjectStore, self).__init__()
+        self.objects_dir = check.str_param(objects_dir, 'objects_dir')
+        self._check_hard_links()
+
+    def _scratch_dir(self):
+        scratch_dir = os.path.join(self.objects_dir, 'tmp')
+        mkdir_p(scratch_dir)
+        return scratch_dir
+
+    def _check_hard_links(self):
+        # Without hard links there is no reference count, so content could not be collected safely
+        probe_path = os.path.join(self._scratch_dir(), uuid.uuid4().hex)
+        open(probe_path, 'wb').close()
+        try:
+            _hard_link(probe_path, probe_path + '.link')
+            os.unlink(probe_path + '.link')
+        finally:
+            os.unlink(probe_path)
+
+    def path_for_digest(self, digest):
+        check.str_param(digest, 'digest')
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def set_object(self, key, obj, serialization_strategy=DEFAULT_SERIALIZATION_STRATEGY):
+        check.str_param(key, 'key')
+        # obj is an arbitrary Python object
+        check.inst_param(serialization_strategy, 'serialization_strategy', SerializationStrategy)
+
+        if os.path.exists(key):
+            logging.warning('Removing existing path {path}'.format(path=key))
+            os.unlink(key)
+
+        # Ensure path exists
+        mkdir_p(os.path.dirname(key))
+
+        # The scratch directory is never collected, so the scratch file is safe until it is linked
+        scratch_path = os.path.join(self._scratch_dir(), uuid.uuid4().hex)
+        try:
+            serialization_strategy.serialize_to_file(obj, scratch_path)
+            content_path = self.path_for_digest(_file_digest(scratch_path))
+            if not _hard_link(content_path, key, missing_ok=True):
+                # The content is new, or was collected since it was last written: publish ours,
+                # linking the key first so that the content is referenced once it is visible.
+                _hard_link(scratch_path, key)
+                mkdir_p(os.path.dirname(content_path))
+                # rename is atomic, so concurrent writers of the same content are harmless: keys
+                # keep referring to whichever copy they were linked to.
+                os.rename(scratch_path, content_path)
+        finally:
+            if os.path.exists(scratch_path):
+                os.unlink(scratch_path)
+
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.SET_OBJECT,
+            key=key,
+            dest_key=None,
+            obj=obj,
+            serialization_strategy_name=serialization_strategy.name,
+            object_store_name=self.name,
+        )
+
+    def collect_garbage(self):
+        '''Delete stored content that is no longer referenced by any key.
+
+        A key linked to content while it is being collected keeps the content alive, as a hard link
+        refers to the file itself rather than to its path; the content is then stored again by the
+        next write of the same value.
+
+        Returns:
+            List[str]: The digests of the content that was deleted.
+        '''
+        collected = []
+        if not os.path.isdir(self.objects_dir):
+            return collected
+
+        for prefix in os.listdir(self.objects_dir):
+            prefix_dir = os.path.join(self.objects_dir, prefix)
+            if prefix == 'tmp' or not os.path.isdir(prefix_dir):
+                continue
+
+            for digest in os.listdir(prefix_dir):
+                content_path = os.path.join(prefix_dir, digest)
+                if os.stat(content_path).st_nlink <= 1:
+                    os.unlink(content_path)
+                    collected.append(digest)
+
+        return collected
+
+
+def _hard_link(src, dst, missing_ok=False):
+    '''Hard link dst to src. Returns False if src does not exist and missing_ok is set.'''
+    try:
+        os.link(src, dst)
+    except OSError as exc:
+        if missing_ok and exc.errno == errno.ENOENT and not os.path.exists(src):
+            return False
+        if exc.errno == errno.ENOENT:
+            raise
+        raise DagsterInvariantViolationError(
+            'Content-addressed storage could not hard link {dst} to {src}: {exc}. Content-addressed '
+            'storage requires a filesystem that supports hard links, with the objects directory '
+            'on the same filesystem as the intermediates.'.format(src=src, dst=dst, exc=exc)
+        )
+    except AttributeError:
+        raise DagsterInvariantViolationError(
+            'Content-addressed storage requires hard links, which are not supported on this '
+            'platform.'
+        )
+    return True
+
+
+def _file_digest(path, chunk_size=1024 * 1024):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
@@ -1,4 +1,5 @@
 from collections import namedtuple
+from datetime import datetime
 from enum import Enum
 
 from dagster import check
@@ -19,6 +20,7 @@ from .tags import (
 class PipelineRunStatus(Enum):
     NOT_STARTED = 'NOT_STARTED'
     MANAGED = 'MANAGED'
+    QUEUED = 'QUEUED'
     STARTED = 'STARTED'
     SUCCESS = 'SUCCESS'
     FAILURE = 'FAILURE'
@@ -252,6 +254,87 @@ class PipelineRunsFilter(namedtuple('_PipelineRunsFilter', 'run_ids pipeline_nam
         return PipelineRunsFilter(tags=PipelineRun.tags_for_partition_set(partition_set, partition))
 
 
+class RunRecord(
+    namedtuple(
+        '_RunRecord',
+        (
+            'run_id pipeline_name status mode step_keys_to_execute tags root_run_id parent_run_id '
+            'pipeline_snapshot_id create_timestamp update_timestamp start_time end_time'
+        ),
+    )
+):
+    '''A compact view of a :py:class:`PipelineRun` as stored in a
+    :py:class:`~dagster.core.storage.runs.RunStorage`, for listing runs.
+
+    Run records are read without deserializing the rest of the run, e.g. its environment dict.
+    Load the full run with :py:meth:`DagsterInstance.get_run_by_id` when it is needed.
+
+    The timestamps are ``None`` for run storages that do not record them. ``start_time`` and
+    ``end_time`` are seconds since the epoch.
+    '''
+
+    def __new__(
+        cls,
+        run_id,
+        pipeline_name,
+        status,
+        mode=None,
+        step_keys_to_execute=None,
+        tags=None,
+        root_run_id=None,
+        parent_run_id=None,
+        pipeline_snapshot_id=None,
+        create_timestamp=None,
+        update_timestamp=None,
+        start_time=None,
+        end_time=None,
+    ):
+        return super(RunRecord, cls).__new__(
+            cls,
+            run_id=check.str_param(run_id, 'run_id'),
+            pipeline_name=check.opt_str_param(pipeline_name, 'pipeline_name'),
+            status=check.inst_param(status, 'status', PipelineRunStatus),
+            mode=check.opt_str_param(mode, 'mode'),
+            step_keys_to_execute=check.opt_nullable_list_param(
+                step_keys_to_execute, 'step_keys_to_execute', of_type=str
+            ),
+            tags=check.opt_dict_param(tags, 'tags', key_type=str),
+            root_run_id=check.opt_str_param(root_run_id, 'root_run_id'),
+            parent_run_id=check.opt_str_param(parent_run_id, 'parent_run_id'),
+            pipeline_snapshot_id=check.opt_str_param(pipeline_snapshot_id, 'pipeline_snapshot_id'),
+            create_timestamp=check.opt_inst_param(create_timestamp, 'create_timestamp', datetime),
+            update_timestamp=check.opt_inst_param(update_timestamp, 'update_timestamp', datetime),
+            start_time=check.opt_float_param(start_time, 'start_time'),
+            end_time=check.opt_float_param(end_time, 'end_time'),
+        )
+
+    @staticmethod
+    def from_pipeline_run(pipeline_run, **timestamps):
+        check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        return RunRecord(
+            run_id=pipeline_run.run_id,
+            pipeline_name=pipeline_run.pipeline_name,
+            status=pipeline_run.status,
+            mode=pipeline_run.mode,
+            step_keys_to_execute=pipeline_run.step_keys_to_execute,
+            tags=pipeline_run.tags,
+            root_run_id=pipeline_run.root_run_id,
+            parent_run_id=pipeline_run.parent_run_id,
+            pipeline_snapshot_id=pipeline_run.pipeline_snapshot_id,
+            **timestamps
+        )
+
+    def get_root_run_id(self):
+        return self.tags.get(ROOT_RUN_ID_TAG)
+
+    def get_parent_run_id(self):
+        return self.tags.get(PARENT_RUN_ID_TAG)
+
+    @property
+    def is_finished(self):
+        return self.status == PipelineRunStatus.SUCCESS or self.status == PipelineRunStatus.FAILURE
+
+
 ###################################################################################################
 # GRAVEYARD
 #
@@ -26,6 +26,20 @@ class RunStorage(six.with_metaclass(ABCMeta)):
             pipeline_run (PipelineRun): The run to add.
         '''
 
+    def add_runs(self, pipeline_runs):
+        '''Add a batch of runs to storage.
+
+        Storages that can add many runs at once, e.g. with a single statement, should override
+        this; by default the runs are added one at a time.
+
+        Args:
+            pipeline_runs (List[PipelineRun]): The runs to add.
+
+        Returns:
+            List[PipelineRun]
+        '''
+        return [self.add_run(pipeline_run) for pipeline_run in pipeline_runs]
+
     @abstractmethod
     def handle_run_event(self, run_id, event):
         '''Update run storage in accordance to a pipeline run related DagsterEvent
@@ -35,6 +49,16 @@ class RunStorage(six.with_metaclass(ABCMeta)):
             event (DagsterEvent)
         '''
 
+    @abstractmethod
+    def update_run_status(self, run_id, status):
+        '''Set the status of a run directly, for status changes that are not the result of a
+        pipeline run event, such as a run entering a launch queue.
+
+        Args:
+            run_id (str)
+            status (PipelineRunStatus)
+        '''
+
     @abstractmethod
     def get_runs(self, filters=None, cursor=None, limit=None):
         '''Return all the runs present in the storage that match the given filters.
@@ -50,6 +74,22 @@ class RunStorage(six.with_metaclass(ABCMeta)):
             List[PipelineRun]
         '''
 
+    @abstractmethod
+    def get_run_records(self, filters=None, cursor=None, limit=None):
+        '''Return compact records of the runs present in the storage that match the given filters,
+        without loading the full runs.
+
+        Args:
+            filters (Optional[PipelineRunsFilter]) -- The
+                :py:class:`~dagster.core.storage.pipeline_run.PipelineRunFilter` by which to filter
+                runs
+            cursor (Optional[str]): Starting cursor (run_id) of range of runs
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+
+        Returns:
+            List[RunRecord]
+        '''
+
     @abstractmethod
     def get_runs_count(self, filters=None):
         '''Return the number of runs present in the storage that match the given filters.
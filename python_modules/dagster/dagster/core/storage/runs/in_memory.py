@@ -11,7 +11,7 @@ from dagster.core.snap import (
 )
 from dagster.utils import frozendict
 
-from ..pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
+from ..pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter, RunRecord
 from .base import RunStorage
 
 
@@ -49,14 +49,23 @@ class InMemoryRunStorage(RunStorage):
     def handle_run_event(self, run_id, event):
         check.str_param(run_id, 'run_id')
         check.inst_param(event, 'event', DagsterEvent)
-        run = self._runs[run_id]
+        run = self._runs.get(run_id)
+        if not run:
+            return
 
         if event.event_type == DagsterEventType.PIPELINE_START:
             self._runs[run_id] = run.with_status(PipelineRunStatus.STARTED)
         elif event.event_type == DagsterEventType.PIPELINE_SUCCESS:
             self._runs[run_id] = run.with_status(PipelineRunStatus.SUCCESS)
         elif event.event_type == DagsterEventType.PIPELINE_FAILURE:
-            self._runs[run_id] = self._runs[run_id].with_status(PipelineRunStatus.FAILURE)
+            self._runs[run_id] = run.with_status(PipelineRunStatus.FAILURE)
+
+    def update_run_status(self, run_id, status):
+        check.str_param(run_id, 'run_id')
+        check.inst_param(status, 'status', PipelineRunStatus)
+        if run_id not in self._runs:
+            return
+        self._runs[run_id] = self._runs[run_id].with_status(status)
 
     def get_runs(self, filters=None, cursor=None, limit=None):
         check.opt_inst_param(filters, 'filters', PipelineRunsFilter)
@@ -86,6 +95,12 @@ class InMemoryRunStorage(RunStorage):
         matching_runs = list(filter(run_filter, reversed(self._runs.values())))
         return self._slice(matching_runs, cursor=cursor, limit=limit)
 
+    def get_run_records(self, filters=None, cursor=None, limit=None):
+        return [
+            RunRecord.from_pipeline_run(run)
+            for run in self.get_runs(filters=filters, cursor=cursor, limit=limit)
+        ]
+
     def get_runs_count(self, filters=None):
         check.opt_inst_param(filters, 'filters', PipelineRunsFilter)
 
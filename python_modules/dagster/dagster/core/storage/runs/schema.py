@@ -17,6 +17,12 @@ RunsTable = db.Table(
     db.Column('run_body', db.String),
     db.Column('create_timestamp', db.DateTime, server_default=db.text('CURRENT_TIMESTAMP')),
     db.Column('update_timestamp', db.DateTime, server_default=db.text('CURRENT_TIMESTAMP')),
+    db.Column('start_time', db.Float),
+    db.Column('end_time', db.Float),
+    db.Column('mode', db.String),
+    db.Column('root_run_id', db.String(255)),
+    db.Column('parent_run_id', db.String(255)),
+    db.Column('step_keys_to_execute', db.String),
 )
 
 RunTagsTable = db.Table(
@@ -28,6 +34,9 @@ RunTagsTable = db.Table(
     db.Column('value', db.String),
 )
 
+db.Index('idx_run_tags', RunTagsTable.c.key, RunTagsTable.c.value, RunTagsTable.c.run_id)
+db.Index('idx_run_pipeline_name_status', RunsTable.c.pipeline_name, RunsTable.c.status)
+
 SnapshotsTable = db.Table(
     'snapshots',
     RunStorageSqlMetadata,
@@ -1,7 +1,9 @@
 import logging
+import time
 import zlib
 from abc import abstractmethod
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
 
@@ -19,18 +21,47 @@ from dagster.core.snap import (
 )
 from dagster.core.storage.tags import ROOT_RUN_ID_TAG
 from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
-from dagster.seven import JSONDecodeError
+from dagster.seven import JSONDecodeError, json
 
-from ..pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
+from ..pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter, RunRecord
 from .base import RunStorage
 from .schema import RunTagsTable, RunsTable, SnapshotsTable
 
+RUN_RECORD_COLUMNS = [
+    'run_id',
+    'pipeline_name',
+    'status',
+    'mode',
+    'step_keys_to_execute',
+    'root_run_id',
+    'parent_run_id',
+    'snapshot_id',
+    'create_timestamp',
+    'update_timestamp',
+    'start_time',
+    'end_time',
+]
+
 
 class SnapshotType(Enum):
     PIPELINE = 'PIPELINE'
     EXECUTION_PLAN = 'EXECUTION_PLAN'
 
 
+@contextmanager
+def _begin(connectable):
+    '''Yields a connection within a transaction that commits on exit, or rolls back if an error
+    is raised. The postgres run storage yields its engine rather than a connection from connect, in
+    which case the transaction is begun on a connection of its own.
+    '''
+    if isinstance(connectable, db.engine.Engine):
+        with connectable.begin() as conn:
+            yield conn
+    else:
+        with connectable.begin():
+            yield connectable
+
+
 class SqlRunStorage(RunStorage):  # pylint: disable=no-init
     '''Base class for SQL based run storages
     '''
@@ -63,39 +94,63 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
 
     def add_run(self, pipeline_run):
         check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        self._add_runs([pipeline_run])
+        return pipeline_run
+
+    def add_runs(self, pipeline_runs):
+        check.list_param(pipeline_runs, 'pipeline_runs', of_type=PipelineRun)
+        if pipeline_runs:
+            self._add_runs(pipeline_runs)
+        return pipeline_runs
 
-        if pipeline_run.pipeline_snapshot_id and not self.has_pipeline_snapshot(
-            pipeline_run.pipeline_snapshot_id
+    def _add_runs(self, pipeline_runs):
+        for pipeline_snapshot_id in set(
+            pipeline_run.pipeline_snapshot_id for pipeline_run in pipeline_runs
         ):
-            raise DagsterSnapshotDoesNotExist(
-                'Snapshot {ss_id} does not exist in run storage'.format(
-                    ss_id=pipeline_run.pipeline_snapshot_id
+            if pipeline_snapshot_id and not self._has_snapshot_id(pipeline_snapshot_id):
+                raise DagsterSnapshotDoesNotExist(
+                    'Snapshot {ss_id} does not exist in run storage'.format(
+                        ss_id=pipeline_snapshot_id
+                    )
                 )
-            )
 
-        with self.connect() as conn:
+        # One multi-row insert for the runs and one for their tags, however many runs there are,
+        # committed together so that no run is stored without its tags
+        with self.connect() as connectable:
             try:
-                runs_insert = RunsTable.insert().values(  # pylint: disable=no-value-for-parameter
-                    run_id=pipeline_run.run_id,
-                    pipeline_name=pipeline_run.pipeline_name,
-                    status=pipeline_run.status.value,
-                    run_body=serialize_dagster_namedtuple(pipeline_run),
-                    snapshot_id=pipeline_run.pipeline_snapshot_id,
-                )
-                conn.execute(runs_insert)
-            except db.exc.IntegrityError as exc:
-                six.raise_from(DagsterRunAlreadyExists, exc)
+                with _begin(connectable) as conn:
+                    conn.execute(
+                        RunsTable.insert(),  # pylint: disable=no-value-for-parameter
+                        [
+                            dict(
+                                run_id=pipeline_run.run_id,
+                                pipeline_name=pipeline_run.pipeline_name,
+                                status=pipeline_run.status.value,
+                                run_body=serialize_dagster_namedtuple(pipeline_run),
+                                snapshot_id=pipeline_run.pipeline_snapshot_id,
+                                mode=pipeline_run.mode,
+                                root_run_id=pipeline_run.root_run_id,
+                                parent_run_id=pipeline_run.parent_run_id,
+                                step_keys_to_execute=json.dumps(pipeline_run.step_keys_to_execute)
+                                if pipeline_run.step_keys_to_execute is not None
+                                else None,
+                            )
+                            for pipeline_run in pipeline_runs
+                        ],
+                    )
 
-            if pipeline_run.tags and len(pipeline_run.tags) > 0:
-                conn.execute(
-                    RunTagsTable.insert(),  # pylint: disable=no-value-for-parameter
-                    [
+                    run_tags = [
                         dict(run_id=pipeline_run.run_id, key=k, value=v)
+                        for pipeline_run in pipeline_runs
                         for k, v in pipeline_run.tags.items()
-                    ],
-                )
-
-        return pipeline_run
+                    ]
+                    if run_tags:
+                        conn.execute(
+                            RunTagsTable.insert(),  # pylint: disable=no-value-for-parameter
+                            run_tags,
+                        )
+            except db.exc.IntegrityError as exc:
+                six.raise_from(DagsterRunAlreadyExists, exc)
 
     def handle_run_event(self, run_id, event):
         check.str_param(run_id, 'run_id')
@@ -110,26 +165,34 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         if event.event_type not in lookup:
             return
 
-        run = self.get_run_by_id(run_id)
-        if not run:
-            # TODO log?
-            return
+        if event.event_type == DagsterEventType.PIPELINE_START:
+            self._update_run_status(run_id, lookup[event.event_type], start_time=time.time())
+        else:
+            self._update_run_status(run_id, lookup[event.event_type], end_time=time.time())
 
-        new_pipeline_status = lookup[event.event_type]
+    def update_run_status(self, run_id, status):
+        check.str_param(run_id, 'run_id')
+        check.inst_param(status, 'status', PipelineRunStatus)
 
+        self._update_run_status(run_id, status)
+
+    def _update_run_status(self, run_id, status, **timestamps):
+        # The run body keeps the status the run was created with, the status column is the source
+        # of truth for the current status and is merged into the run when it is read. This saves
+        # reading, deserializing and rewriting the run body on every status change. Updating a run
+        # that does not exist matches no rows.
         with self.connect() as conn:
             conn.execute(
                 RunsTable.update()  # pylint: disable=no-value-for-parameter
                 .where(RunsTable.c.run_id == run_id)
-                .values(
-                    status=new_pipeline_status.value,
-                    run_body=serialize_dagster_namedtuple(run.with_status(new_pipeline_status)),
-                    update_timestamp=datetime.now(),
-                )
+                .values(status=status.value, update_timestamp=datetime.now(), **timestamps)
             )
 
     def _row_to_run(self, row):
-        return deserialize_json_to_dagster_namedtuple(row[0])
+        # rows are (run_body, status)
+        pipeline_run = deserialize_json_to_dagster_namedtuple(row[0])
+        status = PipelineRunStatus(row[1])
+        return pipeline_run if pipeline_run.status == status else pipeline_run.with_status(status)
 
     def _rows_to_runs(self, rows):
         return list(map(self._row_to_run, rows))
@@ -159,18 +222,16 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         if filters.status:
             query = query.where(RunsTable.c.status == filters.status.value)
 
-        if filters.tags:
+        for key, value in filters.tags.items():
+            # One uncorrelated subquery per tag, each answered from the idx_run_tags covering index.
+            # Unlike a correlated EXISTS, SQLite evaluates these once rather than once per run.
             query = query.where(
-                db.or_(
-                    *(
+                RunsTable.c.run_id.in_(
+                    db.select([RunTagsTable.c.run_id]).where(
                         db.and_(RunTagsTable.c.key == key, RunTagsTable.c.value == value)
-                        for key, value in filters.tags.items()
                     )
                 )
-            ).group_by(RunsTable.c.run_body, RunsTable.c.id)
-
-            if len(filters.tags) > 0:
-                query = query.having(db.func.count(RunsTable.c.run_id) == len(filters.tags))
+            )
 
         return query
 
@@ -184,17 +245,10 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         check.opt_list_param(columns, 'columns')
 
         if columns is None:
-            columns = ['run_body']
+            columns = ['run_body', 'status']
 
         base_query_columns = [getattr(RunsTable.c, column) for column in columns]
-
-        # If we have a tags filter, then we need to select from a joined table
-        if filters.tags:
-            base_query = db.select(base_query_columns).select_from(
-                RunsTable.outerjoin(RunTagsTable, RunsTable.c.run_id == RunTagsTable.c.run_id)
-            )
-        else:
-            base_query = db.select(base_query_columns).select_from(RunsTable)
+        base_query = db.select(base_query_columns).select_from(RunsTable)
 
         query = self._add_filters_to_query(base_query, filters)
         query = self._add_cursor_limit_to_query(query, cursor, limit)
@@ -207,14 +261,82 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         rows = self.fetchall(query)
         return self._rows_to_runs(rows)
 
-    def get_runs_count(self, filters=None):
-        subquery = self._runs_query(filters=filters).alias('subquery')
+    def get_run_records(self, filters=None, cursor=None, limit=None):
+        query = self._runs_query(filters, cursor, limit, columns=RUN_RECORD_COLUMNS)
+        rows = self.fetchall(query)
+        if not rows:
+            return []
+
+        # The run ids of the page, used as a subquery so that the size of the page is not bounded
+        # by the number of parameters the database accepts
+        page_run_ids = self._runs_query(filters, cursor, limit, columns=['run_id'])
+
+        tags_by_run_id = defaultdict(dict)
+        for run_id, key, value in self.fetchall(
+            db.select([RunTagsTable.c.run_id, RunTagsTable.c.key, RunTagsTable.c.value]).where(
+                RunTagsTable.c.run_id.in_(page_run_ids)
+            )
+        ):
+            tags_by_run_id[run_id][key] = value
+
+        # Runs added before the run record columns were migrated have no mode, so the fields of
+        # their records are read from their run bodies instead
+        legacy_runs_by_id = {}
+        if any(row.mode is None for row in rows):
+            legacy_runs_by_id = {
+                pipeline_run.run_id: pipeline_run
+                for pipeline_run in self._rows_to_runs(
+                    self.fetchall(
+                        db.select([RunsTable.c.run_body, RunsTable.c.status]).where(
+                            db.and_(
+                                RunsTable.c.run_id.in_(page_run_ids), RunsTable.c.mode.is_(None)
+                            )
+                        )
+                    )
+                )
+            }
+
+        return [
+            self._row_to_run_record(
+                row, tags_by_run_id[row.run_id], legacy_runs_by_id.get(row.run_id)
+            )
+            for row in rows
+        ]
+
+    def _row_to_run_record(self, row, tags, legacy_run):
+        timestamps = dict(
+            create_timestamp=row.create_timestamp,
+            update_timestamp=row.update_timestamp,
+            start_time=row.start_time,
+            end_time=row.end_time,
+        )
+        if legacy_run:
+            return RunRecord.from_pipeline_run(legacy_run, **timestamps)
+
+        return RunRecord(
+            run_id=row.run_id,
+            pipeline_name=row.pipeline_name,
+            status=PipelineRunStatus(row.status),
+            mode=row.mode,
+            step_keys_to_execute=json.loads(row.step_keys_to_execute)
+            if row.step_keys_to_execute is not None
+            else None,
+            tags=tags,
+            root_run_id=row.root_run_id,
+            parent_run_id=row.parent_run_id,
+            pipeline_snapshot_id=row.snapshot_id,
+            **timestamps
+        )
 
-        # We use an alias here because Postgres requires subqueries to be
-        # aliased.
-        subquery = subquery.alias("subquery")
+    def get_runs_count(self, filters=None):
+        filters = check.opt_inst_param(
+            filters, 'filters', PipelineRunsFilter, default=PipelineRunsFilter()
+        )
 
-        query = db.select([db.func.count()]).select_from(subquery)
+        # Count the matching rows directly rather than wrapping the ordered query for run bodies
+        query = self._add_filters_to_query(
+            db.select([db.func.count()]).select_from(RunsTable), filters
+        )
         rows = self.fetchall(query)
         count = rows[0][0]
         return count
@@ -230,9 +352,11 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         '''
         check.str_param(run_id, 'run_id')
 
-        query = db.select([RunsTable.c.run_body]).where(RunsTable.c.run_id == run_id)
+        query = db.select([RunsTable.c.run_body, RunsTable.c.status]).where(
+            RunsTable.c.run_id == run_id
+        )
         rows = self.fetchall(query)
-        return deserialize_json_to_dagster_namedtuple(rows[0][0]) if len(rows) else None
+        return self._row_to_run(rows[0]) if len(rows) else None
 
     def get_run_tags(self):
         result = defaultdict(set)
@@ -264,7 +388,7 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         )
         # get run group
         run_group_query = (
-            db.select([RunsTable.c.run_body])
+            db.select([RunsTable.c.run_body, RunsTable.c.status])
             .select_from(
                 root_to_run.join(
                     RunsTable, root_to_run.c.run_id == RunsTable.c.run_id, isouter=True,
@@ -361,18 +485,19 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         #
         # pseudosql:
         #
-        #    select runs.run_body, count(all_descendant_runs.id) as child_counts
+        #    select runs.run_body, runs.status, count(all_descendant_runs.id) as child_counts
         #    from runs
         #    join runs_and_root_runs on runs.run_id = runs_and_root_runs.run_id
         #    left outer join all_descendant_runs
         #      on all_descendant_runs.value = runs_and_root_runs.run_id
-        #    group by runs.run_body
+        #    group by runs.run_body, runs.status
         #    order by child_counts desc
 
         runs_and_root_runs_with_descendant_counts = (
             db.select(
                 [
                     RunsTable.c.run_body,
+                    RunsTable.c.status,
                     db.func.count(all_descendant_runs.c.id).label('child_counts'),
                 ]
             )
@@ -385,7 +510,7 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
                     isouter=True,
                 )
             )
-            .group_by(RunsTable.c.run_body)
+            .group_by(RunsTable.c.run_body, RunsTable.c.status)
             .order_by(db.desc(db.column('child_counts')))
         )
 
@@ -394,9 +519,8 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
 
         # Postprocess: descendant runs get aggregated with their roots
         run_groups = defaultdict(lambda: {'runs': [], 'count': 0})
-        for (run_body, count) in res:
-            row = (run_body,)
-            pipeline_run = self._row_to_run(row)
+        for (run_body, status, count) in res:
+            pipeline_run = self._row_to_run((run_body, status))
             root_run_id = pipeline_run.get_root_run_id()
             if root_run_id is not None:
                 run_groups[root_run_id]['runs'].append(pipeline_run)
@@ -418,7 +542,7 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
 
     def has_pipeline_snapshot(self, pipeline_snapshot_id):
         check.str_param(pipeline_snapshot_id, 'pipeline_snapshot_id')
-        return bool(self.get_pipeline_snapshot(pipeline_snapshot_id))
+        return self._has_snapshot_id(pipeline_snapshot_id)
 
     def add_pipeline_snapshot(self, pipeline_snapshot):
         check.inst_param(pipeline_snapshot, 'pipeline_snapshot', PipelineSnapshot)
@@ -434,7 +558,7 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
 
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id):
         check.str_param(execution_plan_snapshot_id, 'execution_plan_snapshot_id')
-        return bool(self.get_execution_plan_snapshot(execution_plan_snapshot_id))
+        return self._has_snapshot_id(execution_plan_snapshot_id)
 
     def add_execution_plan_snapshot(self, execution_plan_snapshot):
         check.inst_param(execution_plan_snapshot, 'execution_plan_snapshot', ExecutionPlanSnapshot)
@@ -463,6 +587,15 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
             conn.execute(snapshot_insert)
             return snapshot_id
 
+    def _has_snapshot_id(self, snapshot_id):
+        query = db.select([SnapshotsTable.c.snapshot_id]).where(
+            SnapshotsTable.c.snapshot_id == snapshot_id
+        )
+
+        row = self.fetchone(query)
+
+        return bool(row)
+
     def _get_snapshot(self, snapshot_id):
         query = db.select([SnapshotsTable.c.snapshot_body]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
@@ -0,0 +1,37 @@
+"""add indexes for run filters
+
+Revision ID: 0da417ae1b81
+Revises: c63a27054f08
+Create Date: 2020-05-18 10:12:41.350622
+
+"""
+from alembic import op
+
+from dagster.core.storage.migration.utils import has_index, has_table
+
+# alembic magic breaks pylint
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = '0da417ae1b81'
+down_revision = 'c63a27054f08'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if has_table('run_tags') and not has_index('run_tags', 'idx_run_tags'):
+        op.create_index('idx_run_tags', 'run_tags', ['key', 'value', 'run_id'], unique=False)
+
+    if has_table('runs') and not has_index('runs', 'idx_run_pipeline_name_status'):
+        op.create_index(
+            'idx_run_pipeline_name_status', 'runs', ['pipeline_name', 'status'], unique=False
+        )
+
+
+def downgrade():
+    if has_index('run_tags', 'idx_run_tags'):
+        op.drop_index('idx_run_tags', 'run_tags')
+
+    if has_index('runs', 'idx_run_pipeline_name_status'):
+        op.drop_index('idx_run_pipeline_name_status', 'runs')
@@ -1,3 +1,5 @@
+import os
+
 from dagster.config import Field
 from dagster.core.definitions.system_storage import SystemStorageData, system_storage
 
@@ -37,7 +39,10 @@ def mem_system_storage(init_context):
 @system_storage(
     name='filesystem',
     is_persistent=True,
-    config={'base_dir': Field(str, is_required=False)},
+    config={
+        'base_dir': Field(str, is_required=False),
+        'content_addressed': Field(bool, is_required=False),
+    },
     required_resource_keys=set(),
 )
 def fs_system_storage(init_context):
@@ -55,14 +60,20 @@ def fs_system_storage(init_context):
 
     You may omit the ``base_dir`` config value, in which case the filesystem storage will use
     the :py:class:`DagsterInstance`-provided default.
+
+    Set ``content_addressed: true`` to store each distinct intermediate value once, keyed by its
+    digest, with per-run paths hard linked to the shared content. See
+    :py:class:`~dagster.core.storage.object_store.ContentAddressedFilesystemObjectStore`.
     '''
     override_dir = init_context.system_storage_config.get('base_dir')
+    content_addressed = init_context.system_storage_config.get('content_addressed')
     if override_dir:
         file_manager = LocalFileManager(override_dir)
         intermediate_store = build_fs_intermediate_store(
             root_for_run_id=lambda _: override_dir,
             run_id=init_context.pipeline_run.run_id,
             type_storage_plugin_registry=init_context.type_storage_plugin_registry,
+            objects_dir=os.path.join(override_dir, 'objects') if content_addressed else None,
         )
     else:
         file_manager = LocalFileManager.for_instance(
@@ -72,6 +83,7 @@ def fs_system_storage(init_context):
             init_context.instance.intermediates_directory,
             run_id=init_context.pipeline_run.run_id,
             type_storage_plugin_registry=init_context.type_storage_plugin_registry,
+            objects_dir=init_context.instance.objects_directory() if content_addressed else None,
         )
 
     return SystemStorageData(
@@ -22,8 +22,6 @@ from collections import namedtuple
 from functools import wraps
 from logging.handlers import RotatingFileHandler
 
-import click
-import requests
 import six
 import yaml
 
@@ -260,8 +258,10 @@ def _get_telemetry_instance_id():
 
 # Sets the instance_id at $DAGSTER_HOME/.telemetry/id.yaml
 def _set_telemetry_instance_id():
-    click.secho(TELEMETRY_TEXT)
-    click.secho(SLACK_PROMPT)
+    import click
+
+    click.secho(TELEMETRY_TEXT % {'telemetry': click.style('Telemetry:', fg='blue', bold=True)})
+    click.secho(SLACK_PROMPT % {'welcome': click.style('Welcome to Dagster!', bold=True)})
 
     telemetry_id_path = os.path.join(get_dir_from_dagster_home(TELEMETRY_STR), 'id.yaml')
     instance_id = str(uuid.uuid4())
@@ -339,18 +339,14 @@ TELEMETRY_TEXT = '''
 
     telemetry:
       enabled: false
-''' % {
-    'telemetry': click.style('Telemetry:', fg='blue', bold=True)
-}
+'''
 
 SLACK_PROMPT = '''
   %(welcome)s
 
   If you have any questions or would like to engage with the Dagster team, please join us on Slack
   (https://bit.ly/39dvSsF).
-''' % {
-    'welcome': click.style('Welcome to Dagster!', bold=True)
-}
+'''
 
 
 def upload_logs():
@@ -399,6 +395,8 @@ def upload_logs():
 
 def _upload_logs(dagster_log_dir, log_size, dagster_log_queue_dir):
     '''Send POST request to telemetry server with the contents of $DAGSTER_HOME/logs/ directory '''
+    import requests
+
     try:
         if log_size > 0:
             # Delete contents of dagster_log_queue_dir so that new logs can be copied over
@@ -1,4 +1,6 @@
+import mmap
 import pickle
+import struct
 import sys
 from abc import ABCMeta, abstractmethod
 
@@ -34,6 +36,16 @@ class SerializationStrategy(six.with_metaclass(ABCMeta)):  # pylint: disable=no-
     def write_mode(self):
         return self._write_mode
 
+    @property
+    def read_only_values(self):
+        '''Whether values returned by :py:meth:`deserialize_from_file` are immutable views of the
+        file, such as read-only memory maps.
+
+        Object stores may share such values between readers of the same file in one process
+        instead of deserializing it once per reader. Defaults to False.
+        '''
+        return False
+
     @property
     def encoding(self):
         # Default to utf-8/ascii only if we are expecting to read and write strings
@@ -71,3 +83,93 @@ class PickleSerializationStrategy(SerializationStrategy):  # pylint: disable=no-
 
     def deserialize(self, read_file_obj):
         return pickle.load(read_file_obj)
+
+
+class PickleProtocol5SerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Serializes values with pickle protocol 5, writing large buffers out-of-band.
+
+    Objects that support out-of-band buffers (e.g. NumPy arrays and pandas DataFrames) have their
+    underlying memory written directly after the pickle stream, aligned to 64 bytes, rather than
+    copied into it. When reading from a file, those buffers are memory-mapped (copy-on-write) so
+    that large arrays are loaded without being read into memory up front.
+
+    Requires Python 3.8 or later.
+    '''
+
+    _MAGIC = b'DAGSTER_PICKLE5\n'
+    _ALIGNMENT = 64
+
+    def __init__(self, name='pickle5'):
+        check.invariant(
+            pickle.HIGHEST_PROTOCOL >= 5, 'Pickle protocol 5 requires Python 3.8 or later'
+        )
+        super(PickleProtocol5SerializationStrategy, self).__init__(name)
+
+    def _padding(self, offset):
+        return -offset % self._ALIGNMENT
+
+    def serialize(self, value, write_file_obj):
+        buffers = []
+        data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        raw_buffers = [buffer.raw() for buffer in buffers]
+
+        header = (
+            self._MAGIC
+            + struct.pack('<QI', len(data), len(raw_buffers))
+            + b''.join(struct.pack('<Q', raw.nbytes) for raw in raw_buffers)
+        )
+        write_file_obj.write(header)
+        write_file_obj.write(data)
+
+        offset = len(header) + len(data)
+        for raw in raw_buffers:
+            padding = self._padding(offset)
+            write_file_obj.write(b'\0' * padding)
+            write_file_obj.write(raw)
+            offset += padding + raw.nbytes
+
+    def _read_header(self, read_file_obj):
+        magic = read_file_obj.read(len(self._MAGIC))
+        check.invariant(magic == self._MAGIC, 'Not a pickle protocol 5 serialized object')
+        data_size, num_buffers = struct.unpack('<QI', read_file_obj.read(12))
+        buffer_sizes = [struct.unpack('<Q', read_file_obj.read(8))[0] for _ in range(num_buffers)]
+        return data_size, buffer_sizes
+
+    def deserialize(self, read_file_obj):
+        data_size, buffer_sizes = self._read_header(read_file_obj)
+        offset = len(self._MAGIC) + 12 + 8 * len(buffer_sizes)
+
+        data = read_file_obj.read(data_size)
+        offset += data_size
+
+        buffers = []
+        for size in buffer_sizes:
+            padding = self._padding(offset)
+            read_file_obj.read(padding)
+            buffers.append(bytearray(read_file_obj.read(size)))
+            offset += padding + size
+
+        return pickle.loads(data, buffers=buffers)
+
+    def deserialize_from_file(self, read_path):
+        check.str_param(read_path, 'read_path')
+
+        with open(read_path, self.read_mode) as read_obj:
+            data_size, buffer_sizes = self._read_header(read_obj)
+            offset = read_obj.tell()
+            data = read_obj.read(data_size)
+            offset += data_size
+
+            if not buffer_sizes:
+                return pickle.loads(data)
+
+            # The map stays open for as long as any deserialized value references its buffers
+            mapped = memoryview(mmap.mmap(read_obj.fileno(), 0, access=mmap.ACCESS_COPY))
+
+        buffers = []
+        for size in buffer_sizes:
+            offset += self._padding(offset)
+            buffers.append(mapped[offset : offset + size])
+            offset += size
+
+        return pickle.loads(data, buffers=buffers)
@@ -117,17 +117,35 @@ elif IS_WINDOWS:
 else:
     time_fn = time.time
 
-try:
-    from unittest import mock
-except ImportError:
-    # Because this dependency is not encoded setup.py deliberately
-    # (we do not want to override or conflict with our users mocks)
-    # we never fail when importing this.
 
-    # This will only be used within *our* test environment of which
-    # we have total control
+def _import_mock():
     try:
+        from unittest import mock
+    except ImportError:
+        # Because this dependency is not encoded setup.py deliberately
+        # (we do not want to override or conflict with our users mocks)
+        # we never fail when importing this.
+
+        # This will only be used within *our* test environment of which
+        # we have total control
         import mock
+    return mock
+
+
+if sys.version_info >= (3, 7):
+    # unittest.mock imports asyncio, which is slow to import and only needed in tests, so resolve
+    # seven.mock on first access (PEP 562)
+    def __getattr__(name):
+        if name == 'mock':
+            return _import_mock()
+        raise AttributeError(
+            'module {name!r} has no attribute {attr!r}'.format(name=__name__, attr=name)
+        )
+
+
+else:
+    try:
+        mock = _import_mock()
     except ImportError:
         pass
 
@@ -179,6 +197,7 @@ def builtin_print():
 
 
 def print_single_line_str(single_line_str):
+    mock = _import_mock()
     if sys.version_info.major >= 3:
         return [
             mock.call(single_line_str),
@@ -10,7 +10,7 @@ import subprocess
 import sys
 import tempfile
 import threading
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from enum import Enum
 from warnings import warn
 
@@ -344,6 +344,40 @@ class frozentags(frozendict):
         return frozentags(updated)
 
 
+class LRUCache(object):
+    '''A thread-safe mapping that keeps the ``max_size`` most recently used entries, evicting the
+    least recently used entry when one too many is set.
+    '''
+
+    def __init__(self, max_size):
+        self._max_size = check.int_param(max_size, 'max_size')
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+
+            value = self._entries.pop(key)
+            self._entries[key] = value
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = value
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
 class EventGenerationManager(object):
     ''' Utility class that wraps an event generator function, that also yields a single instance of
     a typed object.  All events yielded before the typed object are yielded through the method
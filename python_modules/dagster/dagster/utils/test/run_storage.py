@@ -2,8 +2,14 @@ import pytest
 
 from dagster.core.definitions import PipelineDefinition
 from dagster.core.errors import DagsterRunAlreadyExists, DagsterSnapshotDoesNotExist
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster.core.snap import create_pipeline_snapshot_id
-from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
+from dagster.core.storage.pipeline_run import (
+    PipelineRun,
+    PipelineRunStatus,
+    PipelineRunsFilter,
+    RunRecord,
+)
 from dagster.core.storage.tags import PARENT_RUN_ID_TAG, ROOT_RUN_ID_TAG
 from dagster.core.utils import make_new_run_id
 from dagster.serdes import serialize_pp
@@ -372,6 +378,152 @@ class TestRunStorage:
             for run in storage.get_runs(PipelineRunsFilter(status=PipelineRunStatus.SUCCESS))
         } == set()
 
+    def test_update_run_status(self, storage):
+        assert storage
+        run_id = make_new_run_id()
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=run_id, pipeline_name='some_pipeline', status=PipelineRunStatus.NOT_STARTED
+            )
+        )
+
+        storage.update_run_status(run_id, PipelineRunStatus.QUEUED)
+        assert storage.get_run_by_id(run_id).status == PipelineRunStatus.QUEUED
+        assert [
+            run.run_id
+            for run in storage.get_runs(PipelineRunsFilter(status=PipelineRunStatus.QUEUED))
+        ] == [run_id]
+
+        # updating a run that does not exist is a noop
+        storage.update_run_status(make_new_run_id(), PipelineRunStatus.QUEUED)
+        assert len(storage.get_runs()) == 1
+
+    def test_handle_run_event(self, storage):
+        assert storage
+        root_run_id = make_new_run_id()
+        run_id = make_new_run_id()
+        storage.add_run(TestRunStorage.build_run(run_id=root_run_id, pipeline_name='some_pipeline'))
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=run_id,
+                pipeline_name='some_pipeline',
+                root_run_id=root_run_id,
+                parent_run_id=root_run_id,
+                tags={PARENT_RUN_ID_TAG: root_run_id, ROOT_RUN_ID_TAG: root_run_id},
+            )
+        )
+
+        def _event(event_type, event_specific_data=None):
+            return DagsterEvent(
+                event_type.value, 'some_pipeline', event_specific_data=event_specific_data
+            )
+
+        storage.handle_run_event(run_id, _event(DagsterEventType.PIPELINE_START))
+        assert storage.get_run_by_id(run_id).status == PipelineRunStatus.STARTED
+
+        # events that do not change the run status are ignored
+        storage.handle_run_event(run_id, _event(DagsterEventType.ENGINE_EVENT, EngineEventData()))
+        assert storage.get_run_by_id(run_id).status == PipelineRunStatus.STARTED
+
+        storage.handle_run_event(run_id, _event(DagsterEventType.PIPELINE_SUCCESS))
+        storage.handle_run_event(root_run_id, _event(DagsterEventType.PIPELINE_FAILURE))
+        statuses = {run_id: PipelineRunStatus.SUCCESS, root_run_id: PipelineRunStatus.FAILURE}
+
+        assert storage.get_run_by_id(run_id).status == PipelineRunStatus.SUCCESS
+        assert {run.run_id: run.status for run in storage.get_runs()} == statuses
+        assert {run.run_id: run.status for run in storage.get_run_group(run_id)[1]} == statuses
+        assert {
+            run.run_id: run.status for run in storage.get_run_groups()[root_run_id]['runs']
+        } == statuses
+
+        # events for a run that does not exist are a noop
+        storage.handle_run_event(make_new_run_id(), _event(DagsterEventType.PIPELINE_FAILURE))
+        assert len(storage.get_runs()) == 2
+
+    def test_add_runs(self, storage):
+        assert storage
+        runs = [
+            TestRunStorage.build_run(
+                run_id=make_new_run_id(), pipeline_name='some_pipeline', tags={'index': str(i)}
+            )
+            for i in range(3)
+        ] + [TestRunStorage.build_run(run_id=make_new_run_id(), pipeline_name='some_pipeline')]
+
+        assert storage.add_runs(runs) == runs
+        assert storage.add_runs([]) == []
+
+        assert [run.run_id for run in storage.get_runs()] == [run.run_id for run in runs[::-1]]
+        assert storage.get_run_by_id(runs[1].run_id).tags == {'index': '1'}
+        assert [
+            run.run_id for run in storage.get_runs(PipelineRunsFilter(tags={'index': '2'}))
+        ] == [runs[2].run_id]
+
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs(
+                [
+                    TestRunStorage.build_run(
+                        run_id=make_new_run_id(), pipeline_name='some_pipeline'
+                    ),
+                    TestRunStorage.build_run(run_id=runs[0].run_id, pipeline_name='some_pipeline'),
+                ]
+            )
+
+    def test_get_run_records(self, storage):
+        assert storage
+        one, two, three = [make_new_run_id(), make_new_run_id(), make_new_run_id()]
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one, pipeline_name='some_pipeline', tags={'mytag': 'hello'}
+            )
+        )
+        storage.add_run(
+            PipelineRun(
+                pipeline_name='some_pipeline',
+                run_id=two,
+                environment_dict={'solids': {'some_solid': {'config': 'foo'}}},
+                mode='other_mode',
+                step_keys_to_execute=['some_solid.compute'],
+                tags={'mytag': 'hello', PARENT_RUN_ID_TAG: one, ROOT_RUN_ID_TAG: one},
+                root_run_id=one,
+                parent_run_id=one,
+            )
+        )
+        storage.add_run(TestRunStorage.build_run(run_id=three, pipeline_name='other_pipeline'))
+        storage.update_run_status(two, PipelineRunStatus.STARTED)
+
+        run_records = storage.get_run_records()
+        assert all(isinstance(run_record, RunRecord) for run_record in run_records)
+        assert [run_record.run_id for run_record in run_records] == [
+            run.run_id for run in storage.get_runs()
+        ]
+
+        run_record = storage.get_run_records(PipelineRunsFilter(run_ids=[two]))[0]
+        assert run_record.pipeline_name == 'some_pipeline'
+        assert run_record.status == PipelineRunStatus.STARTED
+        assert run_record.mode == 'other_mode'
+        assert run_record.step_keys_to_execute == ['some_solid.compute']
+        assert run_record.tags == {'mytag': 'hello', PARENT_RUN_ID_TAG: one, ROOT_RUN_ID_TAG: one}
+        assert run_record.root_run_id == one
+        assert run_record.parent_run_id == one
+        assert run_record.get_root_run_id() == one
+        assert run_record.pipeline_snapshot_id is None
+
+        run_record = storage.get_run_records(PipelineRunsFilter(run_ids=[one]))[0]
+        assert run_record.step_keys_to_execute is None
+        assert run_record.root_run_id is None
+        assert run_record.tags == {'mytag': 'hello'}
+
+        assert storage.get_run_records(PipelineRunsFilter(run_ids=[three]))[0].tags == {}
+
+        assert [
+            run_record.run_id
+            for run_record in storage.get_run_records(PipelineRunsFilter(tags={'mytag': 'hello'}))
+        ] == [two, one]
+        assert [
+            run_record.run_id for run_record in storage.get_run_records(cursor=three, limit=1)
+        ] == [two]
+        assert storage.get_run_records(PipelineRunsFilter(pipeline_name='nonexistent')) == []
+
     def test_fetch_by_status_cursored(self, storage):
         assert storage
         one = make_new_run_id()
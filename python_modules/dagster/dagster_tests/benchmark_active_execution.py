@@ -0,0 +1,96 @@
+'''Times driving an ActiveExecution through execution plans of increasing size.
+
+Run with ``python -m dagster_tests.benchmark_active_execution [max_steps] [concurrency]``. Each
+plan is a binary tree that fans in from its source steps to a single root, with plans from 100 steps
+up to ``max_steps``. Steps are vended ``concurrency`` at a time, as the multiprocess executor
+does, and marked successful as soon as they are vended. In the failing run, one source step in ten
+fails, so that skips propagate up the tree. Only the ActiveExecution is timed, not the construction
+of the pipeline or of its execution plan.
+'''
+import sys
+import time
+
+from dagster import pipeline, solid
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.retries import Retries, RetryMode
+
+PLAN_SIZES = [100, 1000, 10000, 50000]
+
+
+@solid
+def source(_):
+    return 1
+
+
+@solid
+def combine(_, left, right):
+    return left + right
+
+
+def define_tree_pipeline(num_steps):
+    num_sources = (num_steps + 1) // 2
+
+    @pipeline(name='tree_{num_steps}'.format(num_steps=num_steps))
+    def tree_pipeline():
+        level = [source.alias('source_{i}'.format(i=i))() for i in range(num_sources)]
+        num_combined = 0
+        while len(level) > 1:
+            next_level = []
+            for i in range(0, len(level) - 1, 2):
+                next_level.append(
+                    combine.alias('combine_{i}'.format(i=num_combined))(level[i], level[i + 1])
+                )
+                num_combined += 1
+            if len(level) % 2:
+                next_level.append(level[-1])
+            level = next_level
+
+    return tree_pipeline
+
+
+def drive(execution_plan, concurrency, fail_every=None):
+    active_execution = execution_plan.start(retries=Retries(RetryMode.DISABLED))
+    num_failed = 0
+    num_skipped = 0
+    start = time.time()
+    while not active_execution.is_complete:
+        for step in active_execution.get_steps_to_execute(limit=concurrency):
+            index = int(step.key.split('.')[0].split('_')[-1])
+            if fail_every and step.key.startswith('source_') and index % fail_every == 0:
+                active_execution.mark_failed(step.key)
+                num_failed += 1
+            else:
+                active_execution.mark_success(step.key)
+
+        for step in active_execution.get_steps_to_skip():
+            active_execution.mark_skipped(step.key)
+            num_skipped += 1
+
+    return time.time() - start, num_failed, num_skipped
+
+
+def main(max_steps, concurrency):
+    for num_steps in [size for size in PLAN_SIZES if size <= max_steps]:
+        execution_plan = create_execution_plan(define_tree_pipeline(num_steps))
+        num_plan_steps = len(execution_plan.step_keys_to_execute)
+
+        elapsed, _, _ = drive(execution_plan, concurrency)
+        failing_elapsed, num_failed, num_skipped = drive(execution_plan, concurrency, fail_every=10)
+        print(
+            '{num_steps:>6} steps: {elapsed:.3f}s, {per_step:.1f}us per step; with {num_failed} '
+            'failures and {num_skipped} skips: {failing_elapsed:.3f}s'.format(
+                num_steps=num_plan_steps,
+                elapsed=elapsed,
+                per_step=elapsed * 1000000 / num_plan_steps,
+                num_failed=num_failed,
+                num_skipped=num_skipped,
+                failing_elapsed=failing_elapsed,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 50000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 4,
+    )
@@ -0,0 +1,120 @@
+'''Times creating and launching the runs of a partition set backfill.
+
+Run with ``python -m dagster_tests.benchmark_backfill [num_partitions] [postgres_url]``. Runs are
+stored in SQLite, or in Postgres when a database url is given (this requires dagster-postgres and
+wipes the run storage of that database). The run launcher does no work beyond sleeping for
+``LAUNCH_LATENCY`` seconds, like a launcher that makes a request per run would.
+
+The serial backfill creates and launches one run at a time, as the ``dagster pipeline backfill``
+command used to (without the 0.1s sleep it also took between runs).
+'''
+import sys
+import time
+
+from dagster import PartitionSetDefinition, check, pipeline, seven, solid
+from dagster.core.execution.backfill import execute_backfill
+from dagster.core.instance import DagsterInstance, InstanceType
+from dagster.core.launcher import RunLauncher
+from dagster.core.storage.event_log import InMemoryEventLogStorage
+from dagster.core.storage.local_compute_log_manager import NoOpComputeLogManager
+from dagster.core.storage.root import LocalArtifactStorage
+from dagster.core.storage.runs import SqliteRunStorage
+from dagster.utils import merge_dicts
+
+LAUNCH_LATENCY = 0.005
+
+
+class SleepingRunLauncher(RunLauncher):
+    def launch_run(self, instance, run, external_pipeline=None):
+        time.sleep(LAUNCH_LATENCY)
+        return run
+
+    def can_terminate(self, run_id):
+        return False
+
+    def terminate(self, run_id):
+        check.not_implemented('Termination not supported')
+
+
+@solid(config={'date': str})
+def ingest(_):
+    pass
+
+
+@solid
+def summarize(_, _data):
+    pass
+
+
+@pipeline
+def daily_pipeline():
+    summarize(ingest())
+
+
+def define_partition_set(num_partitions):
+    return PartitionSetDefinition(
+        name='daily',
+        pipeline_name='daily_pipeline',
+        partition_fn=lambda: ['p{:05d}'.format(i) for i in range(num_partitions)],
+        environment_dict_fn_for_partition=lambda partition: {
+            'solids': {'ingest': {'config': {'date': partition.name}}}
+        },
+    )
+
+
+def serial_backfill(instance, partition_set, partitions):
+    for partition in partitions:
+        run = instance.create_run_for_pipeline(
+            pipeline_def=daily_pipeline,
+            mode=partition_set.mode,
+            solid_subset=partition_set.solid_subset,
+            environment_dict=partition_set.environment_dict_for_partition(partition),
+            tags=merge_dicts(partition_set.tags_for_partition(partition), {'backfill': 'serial'}),
+        )
+        instance.launch_run(run.run_id)
+
+
+def batched_backfill(instance, partition_set, partitions):
+    execute_backfill(instance, partition_set, partitions, pipeline_def=daily_pipeline)
+
+
+def define_run_storage(temp_dir, postgres_url):
+    if not postgres_url:
+        return SqliteRunStorage.from_local(temp_dir)
+
+    from dagster_postgres import PostgresRunStorage
+
+    return PostgresRunStorage.create_clean_storage(postgres_url)
+
+
+def main(num_partitions, postgres_url=None):
+    partition_set = define_partition_set(num_partitions)
+    partitions = partition_set.get_partitions()
+
+    for label, backfill_fn in [('serial', serial_backfill), ('batched', batched_backfill)]:
+        with seven.TemporaryDirectory() as temp_dir:
+            instance = DagsterInstance(
+                instance_type=InstanceType.EPHEMERAL,
+                local_artifact_storage=LocalArtifactStorage(temp_dir),
+                run_storage=define_run_storage(temp_dir, postgres_url),
+                event_storage=InMemoryEventLogStorage(),
+                compute_log_manager=NoOpComputeLogManager(temp_dir),
+                run_launcher=SleepingRunLauncher(),
+            )
+
+            start = time.time()
+            backfill_fn(instance, partition_set, partitions)
+            elapsed = time.time() - start
+
+            assert instance.get_runs_count() == num_partitions
+            print(
+                '{:<8} {} runs in {:.2f}s, {:.1f} runs/s'.format(
+                    label, num_partitions, elapsed, num_partitions / elapsed
+                )
+            )
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 3000, sys.argv[2] if len(sys.argv) > 2 else None
+    )
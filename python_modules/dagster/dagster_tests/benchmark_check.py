@@ -0,0 +1,101 @@
+'''Times the overhead of the checks of dagster.check on the execution of a pipeline, with and
+without the production mode of dagster.check.
+
+Run with ``python -m dagster_tests.benchmark_check [num_steps] [num_events] [num_runs]``. The
+pipeline is a chain of ``num_steps`` solids, each of which logs ``num_events`` materializations,
+and is executed ``num_runs`` times in each mode. In production mode, the elements of the
+collections passed to the checks are not checked, only the collections themselves.
+'''
+import sys
+import time
+
+from dagster import (
+    DagsterInstance,
+    Materialization,
+    Output,
+    check,
+    execute_pipeline,
+    pipeline,
+    solid,
+)
+
+
+def define_pipeline(num_steps, num_events):
+    @solid
+    def emit(_, num):
+        for i in range(num_events):
+            yield Materialization('materialization_{i}'.format(i=i))
+        yield Output(num + 1)
+
+    @solid
+    def start(_):
+        return 0
+
+    @pipeline
+    def chain_pipeline():
+        num = start()
+        for i in range(num_steps - 1):
+            num = emit.alias('emit_{i}'.format(i=i))(num)
+
+    return chain_pipeline
+
+
+# The console logger would dominate the time of the runs
+QUIET_ENVIRONMENT_DICT = {'loggers': {'console': {'config': {'log_level': 'CRITICAL'}}}}
+
+
+def time_executions(pipeline_def, num_runs):
+    instance = DagsterInstance.ephemeral()
+    start = time.time()
+    for _ in range(num_runs):
+        result = execute_pipeline(
+            pipeline_def, environment_dict=QUIET_ENVIRONMENT_DICT, instance=instance,
+        )
+        assert result.success
+    return (time.time() - start) / num_runs
+
+
+def time_collection_checks(num_calls):
+    list_value = list(range(100))
+    dict_value = {str(i): i for i in range(100)}
+    start = time.time()
+    for _ in range(num_calls):
+        check.list_param(list_value, 'list_value', of_type=int)
+        check.dict_param(dict_value, 'dict_value', key_type=str, value_type=int)
+    return (time.time() - start) / num_calls
+
+
+def main(num_steps, num_events, num_runs):
+    pipeline_def = define_pipeline(num_steps, num_events)
+    # warm up
+    execute_pipeline(
+        pipeline_def, environment_dict=QUIET_ENVIRONMENT_DICT, instance=DagsterInstance.ephemeral(),
+    )
+
+    num_step_events = num_steps * num_events
+    for production_mode in [False, True]:
+        check.set_production_mode(production_mode)
+        try:
+            elapsed = time_executions(pipeline_def, num_runs)
+            collection_elapsed = time_collection_checks(10000)
+        finally:
+            check.set_production_mode(False)
+
+        print(
+            '{:<11} {:.3f}s per run, {:.3f}ms per step, {:.1f}us per event, '
+            '{:.1f}us per check of a 100 element list and dict'.format(
+                'production' if production_mode else 'default',
+                elapsed,
+                elapsed * 1000 / num_steps,
+                elapsed * 1000000 / max(num_step_events, 1),
+                collection_elapsed * 1000000,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+        int(sys.argv[3]) if len(sys.argv) > 3 else 3,
+    )
@@ -0,0 +1,118 @@
+'''Times validating the environment config of a large pipeline after an edit to the config of one
+solid, as the config editor of dagit has it validated after every edit.
+
+Run with ``python -m dagster_tests.benchmark_config_validation [num_solids] [num_edits]``. The
+pipeline has ``num_solids`` solids, each with a config of a few fields. Every edit changes a field
+of the config of a random solid. The full validation validates the whole config after each edit,
+as dagit used to; the incremental one finds the changed subtree of the config and validates only
+that against the schema snapshot, starting from the validation of the config before the edit.
+'''
+import copy
+import random
+import sys
+import time
+
+from dagster import Field, Int, String, pipeline, solid
+from dagster.config.validate import (
+    create_config_validation_handle,
+    get_changed_config_path,
+    revalidate_config_from_snap,
+    validate_config_from_snap,
+)
+
+
+def define_pipeline(num_solids):
+    @solid(
+        config={
+            'num': Int,
+            'name': String,
+            'tags': [String],
+            'options': Field({'retries': Int, 'verbose': bool}, is_required=False),
+        }
+    )
+    def configured(_):
+        pass
+
+    @pipeline
+    def large_pipeline():
+        for i in range(num_solids):
+            configured.alias('configured_{i}'.format(i=i))()
+
+    return large_pipeline
+
+
+def define_environment_dict(num_solids):
+    return {
+        'solids': {
+            'configured_{i}'.format(i=i): {
+                'config': {
+                    'num': i,
+                    'name': 'solid {i}'.format(i=i),
+                    'tags': ['a', 'b', 'c'],
+                    'options': {'retries': 3, 'verbose': False},
+                }
+            }
+            for i in range(num_solids)
+        }
+    }
+
+
+def define_edits(num_solids, num_edits):
+    environment_dict = define_environment_dict(num_solids)
+    edits = []
+    for edit in range(num_edits):
+        environment_dict = copy.deepcopy(environment_dict)
+        solid_config = environment_dict['solids'][
+            'configured_{i}'.format(i=random.randrange(num_solids))
+        ]['config']
+        # every other edit makes the config invalid
+        solid_config['num'] = edit if edit % 2 else 'not an int'
+        edits.append(environment_dict)
+    return edits
+
+
+def main(num_solids, num_edits):
+    pipeline_snapshot = define_pipeline(num_solids).get_pipeline_snapshot()
+    config_schema_snapshot = pipeline_snapshot.config_schema_snapshot
+    config_type_key = pipeline_snapshot.mode_def_snaps[0].root_config_key
+    initial_environment_dict = define_environment_dict(num_solids)
+    edits = define_edits(num_solids, num_edits)
+
+    start = time.time()
+    full_errors = [
+        validate_config_from_snap(config_schema_snapshot, config_type_key, environment_dict).errors
+        for environment_dict in edits
+    ]
+    full_elapsed = time.time() - start
+
+    start = time.time()
+    handle = create_config_validation_handle(
+        config_schema_snapshot, config_type_key, initial_environment_dict
+    )
+    previous_environment_dict = initial_environment_dict
+    incremental_errors = []
+    for environment_dict in edits:
+        handle = revalidate_config_from_snap(
+            handle,
+            environment_dict,
+            get_changed_config_path(previous_environment_dict, environment_dict),
+        )
+        previous_environment_dict = environment_dict
+        incremental_errors.append(handle.errors)
+    incremental_elapsed = time.time() - start
+
+    assert [len(errors) for errors in incremental_errors] == [len(errors) for errors in full_errors]
+
+    for label, elapsed in [('full', full_elapsed), ('incremental', incremental_elapsed)]:
+        print(
+            '{:<12} {} edits to the config of {} solids in {:.2f}s, {:.2f}ms per edit'.format(
+                label, num_edits, num_solids, elapsed, elapsed * 1000 / num_edits
+            )
+        )
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+    )
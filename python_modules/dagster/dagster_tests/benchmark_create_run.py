@@ -0,0 +1,88 @@
+'''Times creating the runs of a pipeline in an instance, with and without reusing the pipeline and
+execution plan snapshots of earlier runs.
+
+Run with ``python -m dagster_tests.benchmark_create_run [num_runs] [num_solids]``. The pipeline is a
+chain of ``num_solids`` configured solids, and runs are stored in SQLite. Without reuse, the caches
+of the pipeline index, of the snapshot ids known to the instance and of execution plan snapshots are
+cleared before each run, so every run builds and checks for its snapshots from scratch, as
+``create_run_for_pipeline`` used to. With reuse, all runs either have the same config, which reuses
+both snapshots, or a config of their own, as the runs of a partitioned backfill do, which reuses only
+the pipeline snapshot.
+'''
+import sys
+import time
+
+from dagster import Field, Int, pipeline, seven, solid
+from dagster.core.instance import DagsterInstance
+from dagster.core.instance import _execution_plan_snapshot_cache as execution_plan_snapshot_cache
+
+
+@solid(config={'num': Field(Int, is_required=False, default_value=0)})
+def add_config(context, num):
+    return num + context.solid_config['num']
+
+
+@solid
+def start(_):
+    return 0
+
+
+def define_chain_pipeline(num_solids):
+    @pipeline
+    def chain_pipeline():
+        num = start()
+        for i in range(num_solids - 1):
+            num = add_config.alias('add_config_{i}'.format(i=i))(num)
+
+    return chain_pipeline
+
+
+def clear_caches(instance, pipeline_def):
+    # pylint: disable=protected-access
+    pipeline_def._cached_pipeline_index = None
+    instance._known_pipeline_snapshot_ids.clear()
+    instance._known_execution_plan_snapshot_ids.clear()
+    execution_plan_snapshot_cache.clear()
+
+
+def create_runs(instance, pipeline_def, num_runs, distinct_configs, reuse):
+    for i in range(num_runs):
+        if not reuse:
+            clear_caches(instance, pipeline_def)
+
+        instance.create_run_for_pipeline(
+            pipeline_def=pipeline_def,
+            environment_dict={
+                'solids': {'add_config_0': {'config': {'num': i if distinct_configs else 1}}}
+            },
+        )
+
+
+def main(num_runs, num_solids):
+    for label, distinct_configs, reuse in [
+        ('no reuse', False, False),
+        ('same config', False, True),
+        ('own config', True, True),
+    ]:
+        pipeline_def = define_chain_pipeline(num_solids)
+        with seven.TemporaryDirectory() as temp_dir:
+            instance = DagsterInstance.local_temp(temp_dir)
+            execution_plan_snapshot_cache.clear()
+
+            start_time = time.time()
+            create_runs(instance, pipeline_def, num_runs, distinct_configs, reuse)
+            elapsed = time.time() - start_time
+
+            assert instance.get_runs_count() == num_runs
+            print(
+                '{:<12} {} runs of {} solids in {:.2f}s, {:.1f} runs/s'.format(
+                    label, num_runs, num_solids, elapsed, num_runs / elapsed
+                )
+            )
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 60,
+    )
@@ -0,0 +1,48 @@
+'''Measures the time taken by ``import dagster`` in a fresh interpreter.
+
+Run with ``python -m dagster_tests.benchmark_import_time [iterations]``. On Python 3.7+ the modules
+with the largest cumulative import times, as reported by ``python -X importtime``, are also listed.
+'''
+import subprocess
+import sys
+import time
+
+TOP_MODULES = 15
+
+
+def time_import(module_name):
+    start = time.time()
+    subprocess.check_call([sys.executable, '-c', 'import {}'.format(module_name)])
+    return time.time() - start
+
+
+def slowest_imports(module_name):
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', 'import {}'.format(module_name)],
+        stderr=subprocess.STDOUT,
+    ).decode('utf-8')
+
+    timings = []
+    for line in output.splitlines()[1:]:
+        _, cumulative, imported = line.split('|')
+        timings.append((int(cumulative), imported.rstrip()))
+    return sorted(timings, reverse=True)[:TOP_MODULES]
+
+
+def main(iterations):
+    baseline = sorted(time_import('sys') for _ in range(iterations))[iterations // 2]
+    timings = sorted(time_import('dagster') for _ in range(iterations))
+    print(
+        'import dagster: {:.3f}s median over {} runs'.format(
+            timings[iterations // 2] - baseline, iterations
+        )
+    )
+
+    if sys.version_info >= (3, 7):
+        print('\nslowest imports (cumulative us):')
+        for cumulative, imported in slowest_imports('dagster'):
+            print('{:>10} {}'.format(cumulative, imported))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
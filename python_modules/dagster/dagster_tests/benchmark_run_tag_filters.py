@@ -0,0 +1,110 @@
+'''Times filtered run queries against SQLite run storage holding a large number of synthetic runs.
+
+Run with ``python -m dagster_tests.benchmark_run_tag_filters [num_runs]``. Each run has a partition
+set tag, a partition tag and a team tag, similar to the runs launched by partition backfills.
+'''
+import os
+import random
+import sys
+import time
+
+from dagster import seven
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
+from dagster.core.storage.runs import SqliteRunStorage
+from dagster.core.storage.runs.schema import RunTagsTable, RunsTable
+from dagster.serdes import serialize_dagster_namedtuple
+
+BATCH_SIZE = 50000
+NUM_PIPELINES = 50
+NUM_PARTITIONS = 5000
+NUM_TEAMS = 7
+REPETITIONS = 3
+
+
+def populate(storage, num_runs):
+    rng = random.Random(0)
+    statuses = [PipelineRunStatus.SUCCESS.value] * 8 + [
+        PipelineRunStatus.FAILURE.value,
+        PipelineRunStatus.STARTED.value,
+    ]
+    # Every row shares one run body, which is only deserialized for the runs that are returned
+    run_body = serialize_dagster_namedtuple(
+        PipelineRun(pipeline_name='pipeline', run_id='run', environment_dict={'padding': 'x' * 400})
+    )
+
+    with storage.connect() as conn:
+        for start in range(0, num_runs, BATCH_SIZE):
+            runs = []
+            tags = []
+            for i in range(start, min(num_runs, start + BATCH_SIZE)):
+                run_id = 'run-{:08d}'.format(i)
+                pipeline_name = 'pipeline_{}'.format(i % NUM_PIPELINES)
+                runs.append(
+                    dict(
+                        run_id=run_id,
+                        pipeline_name=pipeline_name,
+                        status=rng.choice(statuses),
+                        run_body=run_body,
+                    )
+                )
+                tags.extend(
+                    [
+                        dict(
+                            run_id=run_id,
+                            key='dagster/partition_set',
+                            value='{}_partitions'.format(pipeline_name),
+                        ),
+                        dict(
+                            run_id=run_id,
+                            key='dagster/partition',
+                            value='p{}'.format(i % NUM_PARTITIONS),
+                        ),
+                        dict(run_id=run_id, key='team', value='team_{}'.format(i % NUM_TEAMS)),
+                    ]
+                )
+            conn.execute(RunsTable.insert(), runs)  # pylint: disable=no-value-for-parameter
+            conn.execute(RunTagsTable.insert(), tags)  # pylint: disable=no-value-for-parameter
+
+
+def time_query(label, fn):
+    best = min(_time_once(fn) for _ in range(REPETITIONS))
+    print('{:<40} {:.3f}s'.format(label, best))
+
+
+def _time_once(fn):
+    start = time.time()
+    fn()
+    return time.time() - start
+
+
+def main(num_runs):
+    with seven.TemporaryDirectory() as base_dir:
+        storage = SqliteRunStorage.from_local(base_dir)
+
+        start = time.time()
+        populate(storage, num_runs)
+        print('inserted {} runs in {:.1f}s'.format(num_runs, time.time() - start))
+
+        partition_filter = PipelineRunsFilter(
+            tags={'dagster/partition_set': 'pipeline_3_partitions', 'dagster/partition': 'p1003'}
+        )
+        team_filter = PipelineRunsFilter(tags={'team': 'team_3'})
+        pipeline_filter = PipelineRunsFilter(
+            pipeline_name='pipeline_7', status=PipelineRunStatus.FAILURE
+        )
+
+        time_query('runs for a partition', lambda: storage.get_runs(partition_filter))
+        time_query('latest 25 runs with a tag', lambda: storage.get_runs(team_filter, limit=25))
+        time_query('count of runs with a tag', lambda: storage.get_runs_count(team_filter))
+        time_query(
+            'latest 25 runs by pipeline and status',
+            lambda: storage.get_runs(pipeline_filter, limit=25),
+        )
+        time_query(
+            'count of runs by pipeline',
+            lambda: storage.get_runs_count(PipelineRunsFilter(pipeline_name='pipeline_7')),
+        )
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -1053,3 +1053,61 @@ def test_opt_generator():
 def test_internals():
     with pytest.raises(CheckError):
         check._check_key_value_types(None, str, str)  # pylint: disable=protected-access
+
+
+@contextmanager
+def production_mode():
+    check.set_production_mode(True)
+    try:
+        yield
+    finally:
+        check.set_production_mode(False)
+
+
+def test_production_mode():
+    assert not check.is_production_mode()
+
+    with production_mode():
+        assert check.is_production_mode()
+
+        # the elements of collections are not checked
+        assert check.list_param([1, 'a'], 'list_param', of_type=int) == [1, 'a']
+        assert check.opt_list_param([1, 'a'], 'list_param', of_type=int) == [1, 'a']
+        assert check.set_param({1, 'a'}, 'set_param', of_type=int) == {1, 'a'}
+        assert check.tuple_param((1, 'a'), 'tuple_param', of_type=int) == (1, 'a')
+        assert check.dict_param({1: 'a'}, 'dict_param', key_type=str, value_type=int) == {1: 'a'}
+        assert check.opt_dict_param({'a': int}, 'dict_param', value_class=str) == {'a': int}
+        assert check.two_dim_dict_param({'a': {'b': 1}}, 'dict_param', value_type=str)
+        assert check.is_list([1, 'a'], of_type=int) == [1, 'a']
+
+        # the collections themselves are
+        with pytest.raises(ParameterCheckError):
+            check.list_param((1, 2), 'list_param', of_type=int)
+
+        with pytest.raises(ParameterCheckError):
+            check.dict_param([1, 2], 'dict_param', key_type=str)
+
+        with pytest.raises(CheckError):
+            check.is_list((1, 2), of_type=int)
+
+        # as are the lengths of tuples of a fixed shape, though not the types of their members
+        assert check.tuple_param((1, 'a'), 'tuple_param', of_type=(str, int)) == (1, 'a')
+        with pytest.raises(CheckError, match='tuple had 1 members but type had 2'):
+            check.tuple_param((1,), 'tuple_param', of_type=(int, str))
+
+        with pytest.raises(CheckError, match='tuple had 3 members but type had 2'):
+            check.opt_tuple_param((1, 'a', 2), 'tuple_param', of_type=(int, str))
+
+        # as are other params
+        with pytest.raises(ParameterCheckError):
+            check.inst_param(1, 'inst_param', str)
+
+        with pytest.raises(CheckError):
+            check.invariant(False)
+
+    assert not check.is_production_mode()
+    with pytest.raises(CheckError):
+        check.list_param([1, 'a'], 'list_param', of_type=int)
+
+    with pytest.raises(ParameterCheckError):
+        check.set_production_mode(1)
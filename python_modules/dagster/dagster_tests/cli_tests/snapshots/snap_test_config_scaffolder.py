@@ -16,12 +16,16 @@ snapshots['test_basic_solids_config 1'] = {
                     },
                     'enabled': {
                     }
-                }
+                },
+                'type_check_cache': True,
+                'type_check_sample_size': 0
             }
         },
         'multiprocess': {
             'config': {
+                'critical_path_history': 0,
                 'max_concurrent': 0,
+                'prioritize_critical_path': True,
                 'retries': {
                     'disabled': {
                     },
@@ -51,7 +55,8 @@ snapshots['test_basic_solids_config 1'] = {
     'storage': {
         'filesystem': {
             'config': {
-                'base_dir': ''
+                'base_dir': '',
+                'content_addressed': True
             }
         },
         'in_memory': {
@@ -79,12 +84,16 @@ snapshots['test_two_modes 2'] = {
                     },
                     'enabled': {
                     }
-                }
+                },
+                'type_check_cache': True,
+                'type_check_sample_size': 0
             }
         },
         'multiprocess': {
             'config': {
+                'critical_path_history': 0,
                 'max_concurrent': 0,
+                'prioritize_critical_path': True,
                 'retries': {
                     'disabled': {
                     },
@@ -114,7 +123,8 @@ snapshots['test_two_modes 2'] = {
     'storage': {
         'filesystem': {
             'config': {
-                'base_dir': ''
+                'base_dir': '',
+                'content_addressed': True
             }
         },
         'in_memory': {
@@ -142,12 +152,16 @@ snapshots['test_two_modes 4'] = {
                     },
                     'enabled': {
                     }
-                }
+                },
+                'type_check_cache': True,
+                'type_check_sample_size': 0
             }
         },
         'multiprocess': {
             'config': {
+                'critical_path_history': 0,
                 'max_concurrent': 0,
+                'prioritize_critical_path': True,
                 'retries': {
                     'disabled': {
                     },
@@ -177,7 +191,8 @@ snapshots['test_two_modes 4'] = {
     'storage': {
         'filesystem': {
             'config': {
-                'base_dir': ''
+                'base_dir': '',
+                'content_addressed': True
             }
         },
         'in_memory': {
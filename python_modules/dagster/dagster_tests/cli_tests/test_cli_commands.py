@@ -2,6 +2,7 @@ from __future__ import print_function
 
 import os
 import string
+import time
 from contextlib import contextmanager
 
 import mock
@@ -15,12 +16,14 @@ from dagster import (
     RepositoryDefinition,
     ScheduleDefinition,
     check,
+    execute_pipeline,
     lambda_solid,
     pipeline,
     seven,
     solid,
 )
 from dagster.check import CheckError
+from dagster.cli.instance import gc_command
 from dagster.cli.pipeline import (
     execute_backfill_command,
     execute_execute_command,
@@ -44,7 +47,7 @@ from dagster.cli.schedule import (
     schedule_wipe_command,
 )
 from dagster.config.field_utils import Shape
-from dagster.core.instance import DagsterInstance, InstanceType
+from dagster.core.instance import RUN_ARTIFACTS_GC_MIN_AGE, DagsterInstance, InstanceType
 from dagster.core.launcher import RunLauncher
 from dagster.core.launcher.sync_in_memory_run_launcher import SyncInMemoryRunLauncher
 from dagster.core.storage.event_log import InMemoryEventLogStorage
@@ -646,6 +649,37 @@ def test_run_wipe_incorrect_delete_message():
     assert result.exit_code == 0
 
 
+def test_instance_gc_command():
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        environment_dict = {'storage': {'filesystem': {'config': {'content_addressed': True}}}}
+        result = execute_pipeline(
+            foo_pipeline, environment_dict=environment_dict, instance=instance
+        )
+        run_id = result.run_id
+        instance.delete_run(run_id)
+        run_dir = instance.intermediates_directory(run_id)
+        mtime = time.time() - RUN_ARTIFACTS_GC_MIN_AGE - 60
+        os.utime(run_dir, (mtime, mtime))
+
+        with mock.patch('dagster.core.instance.DagsterInstance.get', return_value=instance):
+            result = CliRunner().invoke(gc_command)
+
+        assert result.exit_code == 0
+        assert 'Would delete the artifacts of 1 runs that are not in run storage:' in result.output
+        assert run_id in result.output
+        assert 'Deleted 0 unreferenced intermediates.' in result.output
+        assert os.path.isdir(run_dir)
+
+        with mock.patch('dagster.core.instance.DagsterInstance.get', return_value=instance):
+            result = CliRunner().invoke(gc_command, ['--delete-run-artifacts'])
+
+        assert result.exit_code == 0
+        assert 'Deleted the artifacts of 1 runs that are not in run storage:' in result.output
+        assert 'Deleted 1 unreferenced intermediates.' in result.output
+        assert not os.path.exists(run_dir)
+
+
 def define_bar_schedules():
     return [
         ScheduleDefinition(
@@ -156,6 +156,13 @@ def get_current_alembic_version(db_path):
     return cursor.fetchall()[0][0]
 
 
+def get_sqlite3_indexes(db_path, table_name):
+    con = sqlite3.connect(db_path)
+    cursor = con.cursor()
+    cursor.execute('PRAGMA index_list("{}");'.format(table_name))
+    return [r[1] for r in cursor.fetchall()]
+
+
 def get_sqlite3_columns(db_path, table_name):
     con = sqlite3.connect(db_path)
     cursor = con.cursor()
@@ -196,12 +203,14 @@ def test_snapshot_0_7_6_pre_add_pipeline_snapshot():
         # Make sure the schema is migrated
         instance.upgrade()
 
-        assert get_current_alembic_version(db_path) == 'c63a27054f08'
+        assert get_current_alembic_version(db_path) == 'c34498c29964'
 
         assert 'snapshots' in get_sqlite3_tables(db_path)
         assert {'id', 'snapshot_id', 'snapshot_body', 'snapshot_type'} == set(
             get_sqlite3_columns(db_path, 'snapshots')
         )
+        assert 'idx_run_tags' in get_sqlite3_indexes(db_path, 'run_tags')
+        assert 'idx_run_pipeline_name_status' in get_sqlite3_indexes(db_path, 'runs')
 
         assert len(instance.get_runs()) == 1
 
@@ -210,6 +219,11 @@ def test_snapshot_0_7_6_pre_add_pipeline_snapshot():
         assert run.run_id == run_id
         assert run.pipeline_snapshot_id is None
 
+        # Runs added before the run record columns existed are read from their run bodies
+        run_record = instance.get_run_records()[0]
+        assert run_record.run_id == run_id
+        assert run_record.mode == run.mode
+
         result = execute_pipeline(noop_pipeline, instance=instance)
 
         assert result.success
@@ -223,6 +237,12 @@ def test_snapshot_0_7_6_pre_add_pipeline_snapshot():
 
         assert new_run.pipeline_snapshot_id
 
+        assert [run_record.run_id for run_record in instance.get_run_records()] == [
+            new_run_id,
+            run_id,
+        ]
+        assert instance.get_run_records(limit=1)[0].mode == new_run.mode
+
 
 def test_downgrade_and_upgrade():
     test_dir = file_relative_path(__file__, 'snapshot_0_7_6_pre_add_pipeline_snapshot/sqlite')
@@ -242,7 +262,7 @@ def test_downgrade_and_upgrade():
         # Make sure the schema is migrated
         instance.upgrade()
 
-        assert get_current_alembic_version(db_path) == 'c63a27054f08'
+        assert get_current_alembic_version(db_path) == 'c34498c29964'
 
         assert 'snapshots' in get_sqlite3_tables(db_path)
         assert {'id', 'snapshot_id', 'snapshot_body', 'snapshot_type'} == set(
@@ -263,7 +283,7 @@ def test_downgrade_and_upgrade():
 
         instance.upgrade()
 
-        assert get_current_alembic_version(db_path) == 'c63a27054f08'
+        assert get_current_alembic_version(db_path) == 'c34498c29964'
 
         assert 'snapshots' in get_sqlite3_tables(db_path)
         assert {'id', 'snapshot_id', 'snapshot_body', 'snapshot_type'} == set(
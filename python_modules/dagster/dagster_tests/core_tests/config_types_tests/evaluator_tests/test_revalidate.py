@@ -0,0 +1,205 @@
+import pytest
+
+from dagster import (
+    Any,
+    Array,
+    Field,
+    Int,
+    Noneable,
+    Permissive,
+    ScalarUnion,
+    Selector,
+    Shape,
+    String,
+)
+from dagster.config.field import resolve_to_config_type
+from dagster.config.iterate_types import config_schema_snapshot_from_config_type
+from dagster.config.validate import (
+    create_config_validation_handle,
+    get_changed_config_path,
+    revalidate_config_from_snap,
+    validate_config,
+)
+
+ConfigType = resolve_to_config_type(
+    Shape(
+        {
+            'solids': Shape(
+                {
+                    'first': Shape(
+                        {'config': Shape({'num': Int, 'name': Field(String, is_required=False)})}
+                    ),
+                    'second': Shape({'config': Array(Shape({'num': Int}))}),
+                    'third': Field(
+                        Shape({'config': Noneable(Shape({'num': Int}))}), is_required=False
+                    ),
+                }
+            ),
+            'storage': Selector(
+                {
+                    'in_memory': Field(Shape({}), is_required=False),
+                    'filesystem': Shape({'path': String}),
+                }
+            ),
+            'loose': Field(Permissive({'num': Field(Int, is_required=False)}), is_required=False),
+            'anything': Field(Any, is_required=False),
+            'union': Field(
+                ScalarUnion(
+                    scalar_type=resolve_to_config_type(String),
+                    non_scalar_type=resolve_to_config_type({'path': String}),
+                ),
+                is_required=False,
+            ),
+        }
+    )
+)
+
+VALID_CONFIG = {
+    'solids': {
+        'first': {'config': {'num': 1, 'name': 'one'}},
+        'second': {'config': [{'num': 2}, {'num': 3}]},
+    },
+    'storage': {'filesystem': {'path': '/tmp'}},
+    'loose': {'undeclared': {}},
+    'anything': {},
+    'union': {'path': '/tmp'},
+}
+
+
+def _replace(config_value, path, new_value=None, remove=False):
+    if not path:
+        return new_value
+
+    copied = list(config_value) if isinstance(config_value, list) else dict(config_value)
+    if len(path) == 1:
+        if remove:
+            del copied[path[0]]
+        else:
+            copied[path[0]] = new_value
+    else:
+        copied[path[0]] = _replace(config_value[path[0]], path[1:], new_value, remove)
+    return copied
+
+
+def _error_set(errors):
+    return sorted((error.message, repr(error.stack)) for error in errors)
+
+
+EDITS = [
+    (['solids', 'first', 'config', 'num'], 'not an int', False),
+    (['solids', 'first', 'config', 'name'], None, True),
+    (['solids', 'first', 'config', 'name'], 2, False),
+    (['solids', 'first', 'config', 'extra'], 1, False),
+    (['solids', 'first', 'config'], None, True),
+    (['solids', 'first'], 'not a dict', False),
+    (['solids', 'second', 'config', 1, 'num'], 'three', False),
+    (['solids', 'second', 'config', 1], None, True),
+    (['solids', 'second', 'config'], {'num': 2}, False),
+    (['solids', 'third'], {'config': None}, False),
+    (['solids', 'third'], {'config': {'num': 'four'}}, False),
+    (['storage', 'filesystem', 'path'], 5, False),
+    (['storage', 'filesystem'], None, False),
+    (['storage', 'filesystem'], None, True),
+    (['storage', 'in_memory'], None, False),
+    (['storage', 'in_memory'], {}, False),
+    (['loose', 'num'], 'five', False),
+    (['loose', 'undeclared', 'deep'], 'anything', False),
+    (['anything', 'deep'], 'anything', False),
+    (['union', 'path'], 5, False),
+    (['union'], 'a string', False),
+    ([], 'not a dict', False),
+]
+
+
+@pytest.mark.parametrize('path,new_value,remove', EDITS)
+@pytest.mark.parametrize(
+    'initial_config',
+    [
+        VALID_CONFIG,
+        # an error in a sibling subtree and an error at the root are kept
+        _replace(
+            _replace(VALID_CONFIG, ['solids', 'second', 'config', 0, 'num'], 'two'), ['extra'], 1
+        ),
+    ],
+)
+def test_revalidate_matches_full_validation(initial_config, path, new_value, remove):
+    config_schema_snapshot = config_schema_snapshot_from_config_type(ConfigType)
+    handle = create_config_validation_handle(config_schema_snapshot, ConfigType.key, initial_config)
+    assert _error_set(handle.errors) == _error_set(
+        validate_config(ConfigType, initial_config).errors
+    )
+
+    edited_config = _replace(initial_config, path, new_value, remove)
+    edited_handle = revalidate_config_from_snap(handle, edited_config, path)
+    full_result = validate_config(ConfigType, edited_config)
+    assert edited_handle.success == full_result.success
+    assert _error_set(edited_handle.errors) == _error_set(full_result.errors)
+
+    # with the changed path found by comparing the config values
+    changed_path = get_changed_config_path(initial_config, edited_config)
+    assert changed_path is not None and changed_path == path[: len(changed_path)]
+    assert _error_set(
+        revalidate_config_from_snap(handle, edited_config, changed_path).errors
+    ) == _error_set(full_result.errors)
+
+    # and back again
+    reverted_handle = revalidate_config_from_snap(edited_handle, initial_config, path)
+    assert _error_set(reverted_handle.errors) == _error_set(handle.errors)
+
+
+def test_revalidate_only_changed_subtree():
+    config_schema_snapshot = config_schema_snapshot_from_config_type(ConfigType)
+    handle = create_config_validation_handle(config_schema_snapshot, ConfigType.key, VALID_CONFIG)
+    assert handle.success
+
+    # the stale error under second is kept, as only the config of first is validated again
+    stale_handle = revalidate_config_from_snap(
+        handle._replace(
+            errors=validate_config(
+                ConfigType, _replace(VALID_CONFIG, ['solids', 'second', 'config', 0, 'num'], 'two'),
+            ).errors
+        ),
+        _replace(VALID_CONFIG, ['solids', 'first', 'config', 'num'], 'one'),
+        ['solids', 'first', 'config', 'num'],
+    )
+    assert [error.stack.levels for error in stale_handle.errors] == [
+        ['solids', 'second', 'config', 'num'],
+        ['solids', 'first', 'config', 'num'],
+    ]
+
+
+def test_get_changed_config_path():
+    assert get_changed_config_path(VALID_CONFIG, VALID_CONFIG) is None
+    assert get_changed_config_path(VALID_CONFIG, dict(VALID_CONFIG)) is None
+    assert get_changed_config_path(None, None) is None
+
+    for path in [
+        ['solids', 'first', 'config', 'num'],
+        ['solids', 'second', 'config', 1],
+        ['storage', 'filesystem'],
+        ['extra'],
+    ]:
+        assert get_changed_config_path(VALID_CONFIG, _replace(VALID_CONFIG, path, 'edited')) == path
+
+    assert get_changed_config_path(
+        VALID_CONFIG, _replace(VALID_CONFIG, ['solids', 'first', 'config', 'name'], remove=True)
+    ) == ['solids', 'first', 'config', 'name']
+    assert get_changed_config_path(
+        VALID_CONFIG,
+        _replace(
+            VALID_CONFIG, ['solids', 'second', 'config'], [{'num': 2}, {'num': 3}, {'num': 4}]
+        ),
+    ) == ['solids', 'second', 'config', 2]
+    # several changes
+    assert get_changed_config_path(
+        VALID_CONFIG,
+        _replace(
+            _replace(VALID_CONFIG, ['solids', 'first', 'config', 'num'], 2),
+            ['solids', 'second', 'config', 0, 'num'],
+            3,
+        ),
+    ) == ['solids']
+    assert get_changed_config_path(VALID_CONFIG, 'not a dict') == []
+    # values that compare equal but are not the same config value
+    assert get_changed_config_path({'num': 1}, {'num': True}) == ['num']
+    assert get_changed_config_path({'num': 1}, {'num': 1.0}) == ['num']
@@ -101,6 +101,24 @@ def define_error_pipeline():
     return error_pipeline
 
 
+def test_diamond_multi_execution_critical_path():
+    pipe = reconstructable(define_diamond_pipeline)
+    instance = DagsterInstance.local_temp()
+    environment_dict = {
+        'storage': {'filesystem': {}},
+        'execution': {
+            'multiprocess': {
+                'config': {'prioritize_critical_path': True, 'critical_path_history': 5}
+            }
+        },
+    }
+
+    for _ in range(2):
+        result = execute_pipeline(pipe, environment_dict=environment_dict, instance=instance)
+        assert result.success
+        assert result.result_for_solid('adder').output_value() == 11
+
+
 def test_error_pipeline():
     pipe = define_error_pipeline()
     result = execute_pipeline(pipe, raise_on_error=False)
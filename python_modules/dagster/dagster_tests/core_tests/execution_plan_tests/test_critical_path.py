@@ -0,0 +1,105 @@
+from dagster import DagsterInstance, execute_pipeline, lambda_solid, pipeline, solid
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.critical_path import (
+    critical_path_lengths,
+    critical_path_sort_key_fn,
+    historical_step_durations,
+)
+from dagster.core.execution.retries import Retries, RetryMode
+
+
+def define_chain_and_shorts_pipeline():
+    @lambda_solid
+    def short():
+        return 1
+
+    @solid
+    def link(_, num):
+        return num
+
+    @pipeline
+    def chain_and_shorts():
+        for i in range(4):
+            short.alias('a_short_{}'.format(i))()
+
+        value = short.alias('z_chain_start')()
+        for i in range(3):
+            value = link.alias('z_chain_{}'.format(i))(value)
+
+    return chain_and_shorts
+
+
+def _simulate_makespan(execution_plan, sort_key_fn, workers, step_durations=None):
+    step_durations = step_durations or {}
+    active_execution = execution_plan.start(Retries(RetryMode.DISABLED), sort_key_fn)
+    running = []
+    now = 0.0
+    while not active_execution.is_complete:
+        for step in active_execution.get_steps_to_execute(limit=workers - len(running)):
+            running.append((now + step_durations.get(step.key, 1.0), step.key))
+
+        running.sort()
+        now, step_key = running.pop(0)
+        active_execution.mark_success(step_key)
+
+    return now
+
+
+def test_critical_path_lengths():
+    plan = create_execution_plan(define_chain_and_shorts_pipeline())
+
+    lengths = critical_path_lengths(plan)
+    assert lengths['a_short_0.compute'] == 1.0
+    assert lengths['z_chain_start.compute'] == 4.0
+    assert lengths['z_chain_2.compute'] == 1.0
+
+    lengths = critical_path_lengths(plan, {'z_chain_start.compute': 10.0, 'a_short_0.compute': 2.0})
+    # steps without a known duration are assumed to take the mean of the known durations
+    assert lengths['z_chain_start.compute'] == 10.0 + 3 * 6.0
+    assert lengths['a_short_0.compute'] == 2.0
+    assert lengths['a_short_1.compute'] == 6.0
+
+
+def test_critical_path_shortens_makespan():
+    plan = create_execution_plan(define_chain_and_shorts_pipeline())
+
+    assert _simulate_makespan(plan, None, workers=2) == 6.0
+    assert _simulate_makespan(plan, critical_path_sort_key_fn(plan), workers=2) == 4.0
+
+
+def test_critical_path_respects_priority_tags():
+    @solid(tags={'dagster/priority': '1'})
+    def urgent(_):
+        pass
+
+    @lambda_solid
+    def start():
+        return 1
+
+    @solid
+    def follow(_, num):
+        return num
+
+    @pipeline
+    def priorities():
+        urgent()
+        follow(start())
+
+    plan = create_execution_plan(priorities)
+    active_execution = plan.start(Retries(RetryMode.DISABLED), critical_path_sort_key_fn(plan))
+    steps = active_execution.get_steps_to_execute()
+    assert [step.key for step in steps] == ['urgent.compute', 'start.compute']
+
+
+def test_historical_step_durations():
+    pipeline_def = define_chain_and_shorts_pipeline()
+    instance = DagsterInstance.ephemeral()
+
+    assert historical_step_durations(instance, pipeline_def.name, 5) == {}
+
+    assert execute_pipeline(pipeline_def, instance=instance).success
+    assert execute_pipeline(pipeline_def, instance=instance).success
+
+    durations = historical_step_durations(instance, pipeline_def.name, 5)
+    assert set(durations.keys()) == set(create_execution_plan(pipeline_def).step_keys_to_execute)
+    assert all(duration >= 0 for duration in durations.values())
@@ -20,6 +20,36 @@ def test_topological_sort():
     assert [step.key for step in levels[2]] == ['adder.compute']
 
 
+def test_execution_plan_structures_are_memoized():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    assert plan.execution_deps() is plan.execution_deps()
+    assert plan.topological_steps() is plan.topological_steps()
+    assert plan.execution_step_levels() is plan.execution_step_levels()
+
+    assert plan.execution_dependents() == {
+        'return_two.compute': {'add_three.compute', 'mult_three.compute'},
+        'add_three.compute': {'adder.compute'},
+        'mult_three.compute': {'adder.compute'},
+        'adder.compute': set(),
+    }
+
+    subset_plan = plan.build_subset_plan(['add_three.compute', 'adder.compute'])
+    assert subset_plan.topological_steps() is plan.topological_steps()
+    assert subset_plan.execution_deps() == {
+        'add_three.compute': set(),
+        'adder.compute': {'add_three.compute'},
+    }
+    assert subset_plan.execution_dependents() == {
+        'add_three.compute': {'adder.compute'},
+        'adder.compute': set(),
+    }
+    assert [[step.key for step in level] for level in subset_plan.execution_step_levels()] == [
+        ['add_three.compute'],
+        ['adder.compute'],
+    ]
+
+
 def test_create_execution_plan_with_bad_inputs():
     with pytest.raises(DagsterInvalidConfigError):
         create_execution_plan(
@@ -287,3 +317,61 @@ def test_priorities():
     assert steps[3].key == 'pri_2.compute'
     assert steps[4].key == 'pri_none.compute'
     assert steps[5].key == 'pri_neg_1.compute'
+
+
+def test_active_execution_wide_plan():
+    @solid
+    def root(_):
+        return 1
+
+    @solid
+    def branch(_, num):
+        return num
+
+    @solid
+    def leaf(_, num):
+        return num
+
+    width = 200
+
+    @pipeline
+    def wide():
+        value = root()
+        for i in range(width):
+            leaf.alias('leaf_{:03}'.format(i))(branch.alias('branch_{:03}'.format(i))(value))
+
+    plan = create_execution_plan(wide)
+    active_execution = plan.start(retries=Retries(RetryMode.DISABLED))
+
+    steps = active_execution.get_steps_to_execute()
+    assert [step.key for step in steps] == ['root.compute']
+    active_execution.mark_success('root.compute')
+
+    # limits are honoured and ties are vended in plan order
+    steps = active_execution.get_steps_to_execute(limit=10)
+    assert [step.key for step in steps] == ['branch_{:03}.compute'.format(i) for i in range(10)]
+
+    steps.extend(active_execution.get_steps_to_execute())
+    assert len(steps) == width
+
+    for i, step in enumerate(steps):
+        if i % 2:
+            active_execution.mark_failed(step.key)
+        else:
+            active_execution.mark_success(step.key)
+
+    steps = active_execution.get_steps_to_execute()
+    assert [step.key for step in steps] == [
+        'leaf_{:03}.compute'.format(i) for i in range(0, width, 2)
+    ]
+    skipped = active_execution.get_steps_to_skip()
+    assert [step.key for step in skipped] == [
+        'leaf_{:03}.compute'.format(i) for i in range(1, width, 2)
+    ]
+
+    for step in steps:
+        active_execution.mark_success(step.key)
+    for step in skipped:
+        active_execution.mark_skipped(step.key)
+
+    assert active_execution.is_complete
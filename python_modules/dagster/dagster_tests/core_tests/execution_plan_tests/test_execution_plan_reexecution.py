@@ -4,6 +4,8 @@ from dagster import (
     DependencyDefinition,
     InputDefinition,
     Int,
+    List,
+    MultiDependencyDefinition,
     OutputDefinition,
     PipelineDefinition,
     execute_pipeline,
@@ -14,12 +16,13 @@ from dagster.core.errors import (
     DagsterInvariantViolationError,
     DagsterRunNotFoundError,
 )
-from dagster.core.events import get_step_output_event
+from dagster.core.events import DagsterEventType, get_step_output_event
 from dagster.core.execution.api import create_execution_plan, execute_plan, execute_run
 from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.intermediate_store import build_fs_intermediate_store
 from dagster.core.storage.intermediates_manager import IntermediateStoreIntermediatesManager
+from dagster.core.storage.object_store import ObjectStoreOperationType
 from dagster.utils import merge_dicts
 
 
@@ -230,3 +233,63 @@ def test_pipeline_step_key_subset_execution():
             parent_run_id=result.run_id,
             root_run_id=result.run_id,
         )
+
+
+def define_fan_in_pipeline(width):
+    def make_source(i):
+        @lambda_solid(name='source_{i}'.format(i=i), output_def=OutputDefinition(Int))
+        def source():
+            return i
+
+        return source
+
+    @lambda_solid(input_defs=[InputDefinition('nums', List[Int])], output_def=OutputDefinition(Int))
+    def total(nums):
+        return sum(nums)
+
+    sources = [make_source(i) for i in range(width)]
+    return PipelineDefinition(
+        name='fan_in_reexecution',
+        solid_defs=sources + [total],
+        dependencies={
+            'total': {
+                'nums': MultiDependencyDefinition(
+                    [DependencyDefinition(source.name) for source in sources]
+                )
+            }
+        },
+    )
+
+
+def test_fan_in_reexecution_copies_all_intermediates():
+    width = 40
+    pipeline_def = define_fan_in_pipeline(width)
+    instance = DagsterInstance.ephemeral()
+    environment_dict = env_with_fs({})
+    result = execute_pipeline(pipeline_def, environment_dict=environment_dict, instance=instance)
+    assert result.success
+
+    pipeline_run = instance.create_run_for_pipeline(
+        pipeline_def,
+        environment_dict=environment_dict,
+        step_keys_to_execute=['total.compute'],
+        parent_run_id=result.run_id,
+        root_run_id=result.run_id,
+    )
+    reexecution_result = execute_run(pipeline_def, pipeline_run, instance)
+    assert reexecution_result.success
+
+    copy_step_keys = [
+        event.step_key
+        for event in reexecution_result.event_list
+        if event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+        and event.event_specific_data.op == ObjectStoreOperationType.CP_OBJECT.value
+    ]
+    assert sorted(copy_step_keys) == sorted('source_{i}.compute'.format(i=i) for i in range(width))
+
+    intermediates_manager = IntermediateStoreIntermediatesManager(
+        build_fs_intermediate_store(instance.intermediates_directory, pipeline_run.run_id)
+    )
+    assert intermediates_manager.get_intermediate(
+        None, Int, StepOutputHandle('total.compute')
+    ).obj == sum(range(width))
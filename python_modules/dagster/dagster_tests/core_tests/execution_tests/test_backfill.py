@@ -0,0 +1,197 @@
+import threading
+
+import pytest
+
+from dagster import PartitionSetDefinition, check, execute_partition_set, pipeline, seven, solid
+from dagster.core.execution.backfill import execute_backfill, get_backfill_progress
+from dagster.core.instance import DagsterInstance, InstanceType
+from dagster.core.launcher import RunLauncher
+from dagster.core.storage.event_log import InMemoryEventLogStorage
+from dagster.core.storage.local_compute_log_manager import NoOpComputeLogManager
+from dagster.core.storage.pipeline_run import PipelineRunStatus
+from dagster.core.storage.root import LocalArtifactStorage
+from dagster.core.storage.runs import InMemoryRunStorage, SqliteRunStorage
+from dagster.core.storage.tags import BACKFILL_ID_TAG, PARTITION_NAME_TAG
+
+
+class RecordingRunLauncher(RunLauncher):
+    def __init__(self, fail_partitions=None):
+        self._lock = threading.Lock()
+        self._fail_partitions = fail_partitions or []
+        self.launched_runs = []
+
+    def launch_run(self, instance, run, external_pipeline=None):
+        if run.tags[PARTITION_NAME_TAG] in self._fail_partitions:
+            raise Exception('Failed to launch {}'.format(run.tags[PARTITION_NAME_TAG]))
+
+        with self._lock:
+            self.launched_runs.append(run)
+        return run
+
+    def can_terminate(self, run_id):
+        return False
+
+    def terminate(self, run_id):
+        check.not_implemented('Termination not supported')
+
+
+@solid(config=int)
+def double(context):
+    return context.solid_config * 2
+
+
+@solid
+def noop(_):
+    pass
+
+
+@pipeline
+def backfill_pipeline():
+    double()
+    noop()
+
+
+doubles_partition_set = PartitionSetDefinition(
+    name='doubles',
+    pipeline_name='backfill_pipeline',
+    partition_fn=lambda: [str(i) for i in range(7)],
+    solid_subset=['double'],
+    environment_dict_fn_for_partition=lambda partition: {
+        'solids': {'double': {'config': int(partition.name)}}
+    },
+    tags_fn_for_partition=lambda partition: {'parity': str(int(partition.name) % 2)},
+)
+
+
+def define_instance(temp_dir, run_launcher, run_storage=None):
+    return DagsterInstance(
+        instance_type=InstanceType.EPHEMERAL,
+        local_artifact_storage=LocalArtifactStorage(temp_dir),
+        run_storage=run_storage or InMemoryRunStorage(),
+        event_storage=InMemoryEventLogStorage(),
+        compute_log_manager=NoOpComputeLogManager(temp_dir),
+        run_launcher=run_launcher,
+    )
+
+
+@pytest.mark.parametrize('storage_type', ['in_memory', 'sqlite'])
+def test_execute_backfill(storage_type):
+    run_launcher = RecordingRunLauncher()
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = define_instance(
+            temp_dir,
+            run_launcher,
+            run_storage=SqliteRunStorage.from_local(temp_dir) if storage_type == 'sqlite' else None,
+        )
+        partitions = doubles_partition_set.get_partitions()
+
+        backfill_id = execute_backfill(
+            instance,
+            doubles_partition_set,
+            partitions,
+            pipeline_def=backfill_pipeline,
+            tags={'foo': 'bar'},
+            batch_size=3,
+            max_concurrent_launches=2,
+        )
+
+        runs = instance.get_runs()
+        assert len(runs) == 7
+        assert sorted(run.run_id for run in run_launcher.launched_runs) == sorted(
+            run.run_id for run in runs
+        )
+
+        for run in runs:
+            partition = int(run.tags[PARTITION_NAME_TAG])
+            assert run.tags[BACKFILL_ID_TAG] == backfill_id
+            assert run.tags['foo'] == 'bar'
+            assert run.tags['parity'] == str(partition % 2)
+            assert run.environment_dict == {'solids': {'double': {'config': partition}}}
+            assert run.mode == 'default'
+            assert run.solid_subset == ['double']
+            assert run.pipeline_snapshot_id
+            assert run.execution_plan_snapshot_id
+
+        progress = get_backfill_progress(instance, backfill_id)
+        assert progress.run_count == 7
+        assert progress.status_counts == {PipelineRunStatus.NOT_STARTED: 7}
+        assert not progress.is_finished
+
+        for run in runs[:5]:
+            instance.update_run_status(run.run_id, PipelineRunStatus.SUCCESS)
+        instance.update_run_status(runs[5].run_id, PipelineRunStatus.FAILURE)
+
+        progress = get_backfill_progress(instance, backfill_id)
+        assert progress.status_counts == {
+            PipelineRunStatus.SUCCESS: 5,
+            PipelineRunStatus.FAILURE: 1,
+            PipelineRunStatus.NOT_STARTED: 1,
+        }
+        assert progress.finished_count == 6
+        assert not progress.is_finished
+
+        instance.update_run_status(runs[6].run_id, PipelineRunStatus.SUCCESS)
+        assert get_backfill_progress(instance, backfill_id).is_finished
+
+        assert get_backfill_progress(instance, 'nonexistent').run_count == 0
+
+
+def test_execute_backfill_launch_failure():
+    run_launcher = RecordingRunLauncher(fail_partitions=['2'])
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = define_instance(temp_dir, run_launcher)
+
+        with pytest.raises(Exception, match='Failed to launch 2'):
+            execute_backfill(
+                instance,
+                doubles_partition_set,
+                doubles_partition_set.get_partitions(),
+                pipeline_def=backfill_pipeline,
+                batch_size=2,
+            )
+
+        # the other runs are launched regardless
+        assert len(instance.get_runs()) == 7
+        assert sorted(run.tags[PARTITION_NAME_TAG] for run in run_launcher.launched_runs) == [
+            '0',
+            '1',
+            '3',
+            '4',
+            '5',
+            '6',
+        ]
+
+
+def test_execute_backfill_wrong_pipeline():
+    @pipeline
+    def other_pipeline():
+        noop()
+
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = define_instance(temp_dir, RecordingRunLauncher())
+        with pytest.raises(check.CheckError, match='is for pipeline backfill_pipeline'):
+            execute_backfill(
+                instance,
+                doubles_partition_set,
+                doubles_partition_set.get_partitions(),
+                pipeline_def=other_pipeline,
+            )
+
+        assert instance.get_runs() == []
+
+
+def test_execute_partition_set():
+    run_launcher = RecordingRunLauncher()
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = define_instance(temp_dir, run_launcher)
+
+        backfill_id = execute_partition_set(
+            doubles_partition_set, lambda partitions: partitions[:3], instance=instance
+        )
+
+        runs = instance.get_runs()
+        assert len(runs) == 3
+        assert len(run_launcher.launched_runs) == 3
+        assert {run.tags[BACKFILL_ID_TAG] for run in runs} == {backfill_id}
+        assert sorted(run.tags[PARTITION_NAME_TAG] for run in runs) == ['0', '1', '2']
+        assert get_backfill_progress(instance, backfill_id).run_count == 3
@@ -0,0 +1,177 @@
+import pytest
+
+from dagster import (
+    DagsterInstance,
+    DagsterInvariantViolationError,
+    Failure,
+    Materialization,
+    Output,
+    execute_pipeline,
+    pipeline,
+    seven,
+    solid,
+)
+from dagster.core.execution.results import SUMMARY_EVENTS, PipelineExecutionResult
+from dagster.seven import mock
+
+
+@solid
+def emit_events(context):
+    for i in range(10):
+        context.log.info('Message {i}'.format(i=i))
+        yield Materialization('materialization_{i}'.format(i=i))
+    yield Output(1)
+
+
+@solid
+def add_one(_, num):
+    return num + 1
+
+
+@pipeline
+def events_pipeline():
+    add_one(emit_events())
+
+
+def test_summary_events_only():
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        full_result = execute_pipeline(events_pipeline, instance=instance)
+        result = execute_pipeline(events_pipeline, instance=instance, retain_events=False)
+
+        assert full_result.retains_events
+        assert not result.retains_events
+        assert result.success
+
+        # only the summary events are held by the result
+        assert [event.event_type_value for event in result._event_list] == [
+            'PIPELINE_START',
+            'STEP_OUTPUT',
+            'STEP_SUCCESS',
+            'STEP_OUTPUT',
+            'STEP_SUCCESS',
+            'PIPELINE_SUCCESS',
+        ]
+        assert result.summary_event_list == result._event_list
+        assert all(event.event_type in SUMMARY_EVENTS for event in full_result.summary_event_list)
+
+        # the other events are read from the event log
+        assert [event.event_type for event in result.event_list] == [
+            event.event_type for event in full_result.event_list
+        ]
+        assert sorted(result.events_by_step_key.keys(), key=str) == sorted(
+            full_result.events_by_step_key.keys(), key=str
+        )
+        assert len(result.step_event_list) == len(full_result.step_event_list)
+
+        # solid results load the events that are not held from the event log
+        assert result.output_for_solid('add_one') == 2
+        emit_events_result = result.result_for_solid('emit_events')
+        assert emit_events_result.success
+        assert emit_events_result.output_value() == 1
+        assert (
+            emit_events_result.materializations_during_compute
+            == full_result.result_for_solid('emit_events').materializations_during_compute
+        )
+        assert len(emit_events_result.materializations_during_compute) == 10
+        assert [event.event_type for event in emit_events_result.compute_step_events] == [
+            event.event_type
+            for event in full_result.result_for_solid('emit_events').compute_step_events
+        ]
+        assert list(result.result_for_solid('add_one').compute_input_event_dict.keys()) == ['num']
+
+
+def test_solid_results_do_not_read_event_log():
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        result = execute_pipeline(events_pipeline, instance=instance, retain_events=False)
+
+        with mock.patch.object(instance, 'all_logs', wraps=instance.all_logs) as all_logs:
+            assert result.success
+            assert result.output_for_solid('add_one') == 2
+            assert [solid_result.success for solid_result in result.solid_result_list] == [
+                True,
+                True,
+            ]
+            emit_events_result = result.result_for_solid('emit_events')
+            assert not emit_events_result.skipped
+            assert emit_events_result.failure_data is None
+            assert not all_logs.called
+
+            # the other events of a solid are loaded once, when they are first needed
+            assert len(emit_events_result.materializations_during_compute) == 10
+            assert len(emit_events_result.compute_step_events) > 10
+            assert all_logs.call_count == 1
+
+            assert len(result.event_list) > len(result.summary_event_list)
+            assert all_logs.call_count == 2
+
+
+def test_summary_events_without_persistent_event_log():
+    full_result = execute_pipeline(events_pipeline)
+    result = PipelineExecutionResult(
+        events_pipeline,
+        full_result.run_id,
+        full_result.summary_event_list,
+        full_result.reconstruct_context,
+        instance=DagsterInstance.ephemeral(),
+    )
+
+    assert result.success
+    assert result.result_for_solid('emit_events').success
+    with pytest.raises(
+        DagsterInvariantViolationError, match='event log of its instance, which is not persistent'
+    ):
+        result.result_for_solid('emit_events').materializations_during_compute
+
+
+def test_in_memory_event_log_retains_events():
+    with pytest.warns(UserWarning, match='event log of its instance is held in memory'):
+        result = execute_pipeline(events_pipeline, retain_events=False)
+
+    assert result.retains_events
+    assert len(result.result_for_solid('emit_events').materializations_during_compute) == 10
+
+
+def test_summary_events_failure():
+    @solid
+    def fail(_):
+        raise Failure('Failed')
+
+    @pipeline
+    def failure_pipeline():
+        add_one(fail())
+
+    with seven.TemporaryDirectory() as temp_dir:
+        result = execute_pipeline(
+            failure_pipeline,
+            instance=DagsterInstance.local_temp(temp_dir),
+            raise_on_error=False,
+            retain_events=False,
+        )
+
+        assert not result.success
+        assert [event.event_type_value for event in result._event_list] == [
+            'PIPELINE_START',
+            'STEP_FAILURE',
+            'STEP_SKIPPED',
+            'PIPELINE_FAILURE',
+        ]
+        assert not result.result_for_solid('fail').success
+        assert (
+            result.result_for_solid('fail').failure_data.user_failure_data.description == 'Failed'
+        )
+        assert result.result_for_solid('add_one').skipped
+
+
+@pytest.mark.parametrize('retain_events', [True, False])
+def test_events_by_step_key(retain_events):
+    with seven.TemporaryDirectory() as temp_dir:
+        result = execute_pipeline(
+            events_pipeline,
+            instance=DagsterInstance.local_temp(temp_dir),
+            retain_events=retain_events,
+        )
+        assert [
+            event.event_type_value for event in result.events_by_step_key['add_one.compute']
+        ] == ['STEP_START', 'STEP_INPUT', 'STEP_OUTPUT', 'STEP_SUCCESS',]
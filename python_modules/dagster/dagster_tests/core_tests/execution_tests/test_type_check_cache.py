@@ -0,0 +1,208 @@
+import pytest
+
+from dagster import (
+    DagsterInstance,
+    DagsterType,
+    DagsterTypeCheckDidNotPass,
+    EventMetadataEntry,
+    InputDefinition,
+    Int,
+    List,
+    OutputDefinition,
+    TypeCheck,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+)
+from dagster.core.execution.api import execute_run
+from dagster.core.utils import make_new_run_id
+
+
+def define_counted_type(name, checked_values):
+    def type_check_fn(_, value):
+        checked_values.append(value)
+        return TypeCheck(
+            success=isinstance(value, int),
+            description='Checked {value}'.format(value=value),
+            metadata_entries=[EventMetadataEntry.text(str(value), 'value')],
+        )
+
+    return DagsterType(name=name, type_check_fn=type_check_fn)
+
+
+def define_handoff_pipeline(output_type, input_type):
+    @lambda_solid(output_def=OutputDefinition(output_type))
+    def produce():
+        return 5
+
+    @lambda_solid(input_defs=[InputDefinition('num', input_type)])
+    def consume(num):
+        return num
+
+    @pipeline
+    def handoff_pipeline():
+        consume(produce())
+
+    return handoff_pipeline
+
+
+def test_input_type_check_cached():
+    checked_values = []
+    counted_type = define_counted_type('Counted', checked_values)
+
+    result = execute_pipeline(define_handoff_pipeline(counted_type, counted_type))
+    assert result.success
+    assert checked_values == [5]
+
+    output_type_check = (
+        result.result_for_solid('produce')
+        .compute_output_event_dict['result']
+        .event_specific_data.type_check_data
+    )
+    input_type_check = (
+        result.result_for_solid('consume')
+        .compute_input_event_dict['num']
+        .event_specific_data.type_check_data
+    )
+    assert input_type_check.success
+    assert input_type_check.label == 'num'
+    assert input_type_check.description == output_type_check.description == 'Checked 5'
+    assert input_type_check.metadata_entries == output_type_check.metadata_entries
+
+
+def test_input_type_check_different_type():
+    checked_values = []
+    output_type = define_counted_type('CountedOutput', checked_values)
+    input_type = define_counted_type('CountedInput', checked_values)
+
+    result = execute_pipeline(define_handoff_pipeline(output_type, input_type))
+    assert result.success
+    assert checked_values == [5, 5]
+
+
+@pytest.mark.parametrize(
+    'environment_dict',
+    [
+        {'execution': {'in_process': {'config': {'type_check_cache': False}}}},
+        {'storage': {'filesystem': {}}},
+    ],
+)
+def test_input_type_check_not_cached(environment_dict):
+    checked_values = []
+    counted_type = define_counted_type('Counted', checked_values)
+
+    result = execute_pipeline(
+        define_handoff_pipeline(counted_type, counted_type), environment_dict=environment_dict
+    )
+    assert result.success
+    assert checked_values == [5, 5]
+
+
+def test_input_type_check_cached_for_first_input_only():
+    @lambda_solid(output_def=OutputDefinition(List[Int]))
+    def produce_nums():
+        return [1, 2, 3]
+
+    @lambda_solid(input_defs=[InputDefinition('nums', List[Int])])
+    def append_to_nums(nums):
+        nums.append('not an int')
+
+    @lambda_solid(input_defs=[InputDefinition('nums', List[Int]), InputDefinition('after')])
+    def sum_nums(nums, after):  # pylint: disable=unused-argument
+        return sum(nums)
+
+    @pipeline
+    def mutating_pipeline():
+        nums = produce_nums()
+        sum_nums(nums, append_to_nums(nums))
+
+    # the list was modified by append_to_nums after it was type checked as an output
+    with pytest.raises(DagsterTypeCheckDidNotPass):
+        execute_pipeline(mutating_pipeline)
+
+
+def define_list_pipeline(checked_values, values):
+    counted_list_type = List[define_counted_type('Counted', checked_values)]
+
+    @lambda_solid(output_def=OutputDefinition(counted_list_type))
+    def produce_list():
+        return values
+
+    @lambda_solid(input_defs=[InputDefinition('nums', counted_list_type)])
+    def consume_list(nums):
+        return len(nums)
+
+    @pipeline
+    def list_pipeline():
+        consume_list(produce_list())
+
+    return list_pipeline
+
+
+def test_sampled_list_type_check():
+    checked_values = []
+    result = execute_pipeline(
+        define_list_pipeline(checked_values, list(range(1000))),
+        environment_dict={'execution': {'in_process': {'config': {'type_check_sample_size': 10}}}},
+    )
+    assert result.success
+    assert result.result_for_solid('consume_list').output_value() == 1000
+
+    # the input's type check is the output's, so only the sample is checked
+    assert len(checked_values) == 10
+    assert len(set(checked_values)) == 10
+
+    type_check_data = (
+        result.result_for_solid('consume_list')
+        .compute_input_event_dict['nums']
+        .event_specific_data.type_check_data
+    )
+    assert type_check_data.success
+    assert (
+        EventMetadataEntry.text(
+            '10 of 1000',
+            'sampled_elements',
+            'Only the elements in this random sample of the list were type checked.',
+        )
+        in type_check_data.metadata_entries
+    )
+
+
+def test_sampled_list_type_check_small_list():
+    checked_values = []
+    result = execute_pipeline(
+        define_list_pipeline(checked_values, [1, 2, 3]),
+        environment_dict={'execution': {'in_process': {'config': {'type_check_sample_size': 10}}}},
+    )
+    assert result.success
+    assert checked_values == [1, 2, 3]
+
+
+def test_sampled_list_type_check_failure():
+    with pytest.raises(DagsterTypeCheckDidNotPass):
+        execute_pipeline(
+            define_list_pipeline([], ['not an int'] * 100),
+            environment_dict={
+                'execution': {'in_process': {'config': {'type_check_sample_size': 10}}}
+            },
+        )
+
+
+def test_sampled_list_type_check_seeded_by_run():
+    def sampled_values(run_id):
+        checked_values = []
+        pipeline_def = define_list_pipeline(checked_values, list(range(1000)))
+        instance = DagsterInstance.ephemeral()
+        pipeline_run = instance.create_run_for_pipeline(
+            pipeline_def=pipeline_def,
+            run_id=run_id,
+            environment_dict={
+                'execution': {'in_process': {'config': {'type_check_sample_size': 10}}}
+            },
+        )
+        assert execute_run(pipeline_def, pipeline_run, instance).success
+        return checked_values
+
+    run_id = make_new_run_id()
+    assert sampled_values(run_id) == sampled_values(run_id)
+    assert sampled_values(run_id) != sampled_values(make_new_run_id())
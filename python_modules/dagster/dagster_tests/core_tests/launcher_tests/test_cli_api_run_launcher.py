@@ -3,11 +3,16 @@ import time
 from contextlib import contextmanager
 
 from dagster import RepositoryDefinition, file_relative_path, pipeline, seven, solid
+from dagster.api.execute_run import cli_api_execute_run
+from dagster.core.definitions.events import EventMetadataEntry
 from dagster.core.definitions.reconstructable import ReconstructableRepository
+from dagster.core.events import EngineEventData
 from dagster.core.host_representation import LocationHandle, RepositoryHandle
 from dagster.core.instance import DagsterInstance
 from dagster.core.launcher import CliApiRunLauncher
+from dagster.core.launcher.cli_api_run_launcher import REPO_CLI_ARGS_LABEL
 from dagster.core.storage.pipeline_run import PipelineRunStatus
+from dagster.seven import mock
 from dagster.utils.hosted_user_process import external_repo_from_def
 
 
@@ -49,9 +54,20 @@ def define_repository():
 
 
 @contextmanager
-def temp_instance():
+def temp_instance(run_launcher_config=None):
     with seven.TemporaryDirectory() as temp_dir:
-        instance = DagsterInstance.local_temp(temp_dir)
+        overrides = (
+            {
+                'run_launcher': {
+                    'module': 'dagster.core.launcher',
+                    'class': 'CliApiRunLauncher',
+                    'config': run_launcher_config,
+                }
+            }
+            if run_launcher_config
+            else None
+        )
+        instance = DagsterInstance.local_temp(temp_dir, overrides=overrides)
         try:
             yield instance
         finally:
@@ -319,3 +335,235 @@ def test_not_initialized():
     assert run_launcher.terminate(run_id) is False
     assert run_launcher.get_active_run_count() == 0
     assert run_launcher.is_active(run_id) is False
+
+
+def _launch(instance, pipeline_def, tags=None):
+    repo_yaml = file_relative_path(__file__, 'repo.yaml')
+    pipeline_run = instance.create_run_for_pipeline(
+        pipeline_def=pipeline_def, environment_dict=None, tags=tags
+    )
+    external_pipeline = get_full_external_pipeline(repo_yaml, pipeline_run.pipeline_name)
+    return instance.run_launcher.launch_run(instance, pipeline_run, external_pipeline)
+
+
+def _wait_for(condition, timeout=30):
+    start = time.time()
+    while not condition():
+        assert time.time() - start < timeout, 'Timed out waiting for condition'
+        time.sleep(0.1)
+
+
+def _dequeue_time(instance, run_id):
+    for record in _get_engine_events(instance.all_logs(run_id)):
+        if 'Dequeued run for launch' in record.message:
+            return record.timestamp
+    return None
+
+
+def test_max_concurrent_runs():
+    with temp_instance({'max_concurrent_runs': 1}) as instance:
+        launcher = instance.run_launcher
+
+        first_run = _launch(instance, sleepy_pipeline)
+        second_run = _launch(instance, sleepy_pipeline)
+
+        assert first_run.status == PipelineRunStatus.NOT_STARTED
+        assert second_run.status == PipelineRunStatus.QUEUED
+        assert instance.get_run_by_id(second_run.run_id).status == PipelineRunStatus.QUEUED
+        assert launcher.get_queued_run_count() == 1
+        assert launcher.is_active(second_run.run_id)
+        assert not launcher.is_process_running(second_run.run_id)
+
+        assert launcher.terminate(first_run.run_id)
+
+        # the freed slot goes to the queued run
+        _wait_for(lambda: launcher.is_process_running(second_run.run_id))
+        assert launcher.get_queued_run_count() == 0
+
+        time.sleep(0.5)
+        assert launcher.terminate(second_run.run_id)
+        launcher.join()
+
+        assert instance.get_run_by_id(first_run.run_id).status == PipelineRunStatus.FAILURE
+        assert instance.get_run_by_id(second_run.run_id).status == PipelineRunStatus.FAILURE
+
+
+def test_queued_runs_start_in_priority_order():
+    with temp_instance({'max_concurrent_runs': 1}) as instance:
+        launcher = instance.run_launcher
+
+        blocking_run = _launch(instance, sleepy_pipeline)
+        low_run = _launch(instance, noop_pipeline)
+        high_run = _launch(instance, noop_pipeline, tags={'dagster/priority': '5'})
+        assert launcher.get_queued_run_count() == 2
+
+        time.sleep(0.5)
+        assert launcher.terminate(blocking_run.run_id)
+        _wait_for(
+            lambda: instance.get_run_by_id(low_run.run_id).status == PipelineRunStatus.SUCCESS
+        )
+        launcher.join()
+
+        assert instance.get_run_by_id(high_run.run_id).status == PipelineRunStatus.SUCCESS
+        assert _dequeue_time(instance, high_run.run_id) < _dequeue_time(instance, low_run.run_id)
+
+
+def test_tag_concurrency_limits():
+    with temp_instance(
+        {'tag_concurrency_limits': [{'key': 'database', 'value': 'a', 'limit': 1}]}
+    ) as instance:
+        launcher = instance.run_launcher
+
+        running_run = _launch(instance, sleepy_pipeline, tags={'database': 'a'})
+        blocked_run = _launch(instance, sleepy_pipeline, tags={'database': 'a'})
+        other_run = _launch(instance, noop_pipeline, tags={'database': 'b'})
+
+        assert running_run.status == PipelineRunStatus.NOT_STARTED
+        assert blocked_run.status == PipelineRunStatus.QUEUED
+        # runs behind a blocked run are not held up by it
+        assert other_run.status == PipelineRunStatus.NOT_STARTED
+
+        # queued runs can be removed from the queue
+        assert launcher.can_terminate(blocked_run.run_id)
+        assert launcher.terminate(blocked_run.run_id)
+        assert not launcher.terminate(blocked_run.run_id)
+        assert launcher.get_queued_run_count() == 0
+
+        time.sleep(0.5)
+        assert launcher.terminate(running_run.run_id)
+        launcher.join()
+
+        assert instance.get_run_by_id(blocked_run.run_id).status == PipelineRunStatus.FAILURE
+        assert instance.get_run_by_id(other_run.run_id).status == PipelineRunStatus.SUCCESS
+
+
+def test_queued_runs_resumed_after_restart():
+    with temp_instance({'max_concurrent_runs': 1}) as instance:
+        launcher = instance.run_launcher
+
+        blocking_run = _launch(instance, sleepy_pipeline)
+        queued_run = _launch(instance, noop_pipeline)
+        assert queued_run.status == PipelineRunStatus.QUEUED
+
+        # a launcher for the same instance, as created when dagit restarts
+        restarted_instance = DagsterInstance.from_ref(instance.get_ref())
+        restarted_launcher = restarted_instance.run_launcher
+        assert restarted_launcher is not launcher
+        restarted_launcher.resume_queued_runs(restarted_instance)
+        restarted_launcher.join()
+
+        assert instance.get_run_by_id(queued_run.run_id).status == PipelineRunStatus.SUCCESS
+
+        # the run is not started again by the launcher that queued it
+        time.sleep(0.5)
+        assert launcher.terminate(blocking_run.run_id)
+        launcher.join()
+        assert (
+            len(
+                [
+                    record
+                    for record in _get_engine_events(instance.all_logs(queued_run.run_id))
+                    if 'About to start process' in record.message
+                ]
+            )
+            == 1
+        )
+
+
+def _queue_run_from_other_process(instance, pipeline_def):
+    # What a launcher of another process, e.g. the CLI, leaves in run storage when it queues a run
+    repo_yaml = file_relative_path(__file__, 'repo.yaml')
+    pipeline_run = instance.create_run_for_pipeline(
+        pipeline_def=pipeline_def, environment_dict=None
+    )
+    external_pipeline = get_full_external_pipeline(repo_yaml, pipeline_run.pipeline_name)
+    repo_cli_args = (
+        external_pipeline.handle.repository_handle.location_handle.pointer.get_cli_args()
+    )
+    instance.report_engine_event(
+        'Queued run for launch.',
+        pipeline_run,
+        EngineEventData(
+            metadata_entries=[EventMetadataEntry.text(repo_cli_args, REPO_CLI_ARGS_LABEL)]
+        ),
+    )
+    instance.update_run_status(pipeline_run.run_id, PipelineRunStatus.QUEUED)
+    return pipeline_run
+
+
+def test_runs_queued_by_other_processes_are_polled():
+    with mock.patch(
+        'dagster.core.launcher.cli_api_run_launcher.QUEUED_RUNS_POLL_INTERVAL', 0.1
+    ), temp_instance({'max_concurrent_runs': 1}) as instance:
+        launcher = instance.run_launcher
+
+        blocking_run = _launch(instance, sleepy_pipeline)
+        queued_run = _queue_run_from_other_process(instance, noop_pipeline)
+
+        _wait_for(lambda: launcher.get_queued_run_count() == 1)
+        assert launcher.is_active(queued_run.run_id)
+        assert instance.get_run_by_id(queued_run.run_id).status == PipelineRunStatus.QUEUED
+
+        time.sleep(0.5)
+        assert launcher.terminate(blocking_run.run_id)
+        _wait_for(
+            lambda: instance.get_run_by_id(queued_run.run_id).status == PipelineRunStatus.SUCCESS
+        )
+        launcher.join()
+
+
+def test_join_leaves_runs_queued():
+    with temp_instance({'max_concurrent_runs': 1}) as instance:
+        launcher = instance.run_launcher
+
+        running_run = _launch(instance, noop_pipeline)
+        queued_run = _launch(instance, noop_pipeline)
+        assert queued_run.status == PipelineRunStatus.QUEUED
+
+        # waits for the run in flight only
+        launcher.join()
+        assert instance.get_run_by_id(running_run.run_id).status == PipelineRunStatus.SUCCESS
+        assert instance.get_run_by_id(queued_run.run_id).status == PipelineRunStatus.QUEUED
+        assert launcher.get_queued_run_count() == 0
+
+        restarted_instance = DagsterInstance.from_ref(instance.get_ref())
+        restarted_instance.run_launcher.resume_queued_runs(restarted_instance)
+        _wait_for(
+            lambda: instance.get_run_by_id(queued_run.run_id).status == PipelineRunStatus.SUCCESS
+        )
+        restarted_instance.run_launcher.join()
+
+
+def test_failed_dequeue_fails_run():
+    with temp_instance({'max_concurrent_runs': 1}) as instance:
+        launcher = instance.run_launcher
+
+        blocking_run = _launch(instance, sleepy_pipeline)
+        failing_run = _launch(instance, noop_pipeline)
+        queued_run = _launch(instance, noop_pipeline)
+
+        def fail_to_start(output_file, instance, repo_cli_args, pipeline_run):
+            if pipeline_run.run_id == failing_run.run_id:
+                raise Exception('Could not start process')
+            return cli_api_execute_run(output_file, instance, repo_cli_args, pipeline_run)
+
+        time.sleep(0.5)
+        with mock.patch(
+            'dagster.core.launcher.cli_api_run_launcher.cli_api_execute_run',
+            side_effect=fail_to_start,
+        ):
+            assert launcher.terminate(blocking_run.run_id)
+            _wait_for(
+                lambda: instance.get_run_by_id(failing_run.run_id).status
+                == PipelineRunStatus.FAILURE
+            )
+
+        # the queue is still being dequeued by the launcher's thread
+        _wait_for(
+            lambda: instance.get_run_by_id(queued_run.run_id).status == PipelineRunStatus.SUCCESS
+        )
+        launcher.join()
+
+        assert _message_exists(
+            instance.all_logs(failing_run.run_id), 'Failed to start the queued run.'
+        )
@@ -1,4 +1,12 @@
-from dagster.core.types.marshal import PickleSerializationStrategy
+import pickle
+import sys
+
+import pytest
+
+from dagster.core.types.marshal import (
+    PickleProtocol5SerializationStrategy,
+    PickleSerializationStrategy,
+)
 from dagster.utils import safe_tempfile_path
 
 
@@ -7,3 +15,44 @@ def test_serialization_strategy():
     with safe_tempfile_path() as tempfile_path:
         serialization_strategy.serialize_to_file('foo', tempfile_path)
         assert serialization_strategy.deserialize_from_file(tempfile_path) == 'foo'
+
+
+class ByteArrayHolder(object):
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return ByteArrayHolder, (pickle.PickleBuffer(self.data),)
+        return ByteArrayHolder, (bytes(self.data),)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason='Requires pickle protocol 5')
+def test_pickle_protocol_5_serialization_strategy():
+    serialization_strategy = PickleProtocol5SerializationStrategy()
+    value = {
+        'foo': 'bar',
+        'holders': [ByteArrayHolder(bytearray(b'x' * 1000)), ByteArrayHolder(bytearray(b'abc'))],
+    }
+
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(value, tempfile_path)
+        from_file = serialization_strategy.deserialize_from_file(tempfile_path)
+        with open(tempfile_path, 'rb') as read_obj:
+            from_stream = serialization_strategy.deserialize(read_obj)
+
+    for result in [from_file, from_stream]:
+        assert result['foo'] == 'bar'
+        assert bytes(result['holders'][0].data) == b'x' * 1000
+        assert bytes(result['holders'][1].data) == b'abc'
+
+    # out-of-band buffers read from a file are memory-mapped rather than copied
+    assert isinstance(from_file['holders'][0].data, memoryview)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason='Requires pickle protocol 5')
+def test_pickle_protocol_5_serialization_strategy_no_buffers():
+    serialization_strategy = PickleProtocol5SerializationStrategy()
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file('foo', tempfile_path)
+        assert serialization_strategy.deserialize_from_file(tempfile_path) == 'foo'
@@ -207,7 +207,7 @@ snapshots['test_external_repository_data 1'] = '''{
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975": {
+            "Selector.3c7b369d394cc5ead27fd2786aa64c517d33f460": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -215,24 +215,56 @@ snapshots['test_external_repository_data 1'] = '''{
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+                  "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}, \\"type_check_cache\\": true, \\"type_check_sample_size\\": 0}}",
                   "description": null,
                   "is_required": false,
                   "name": "in_process",
-                  "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+                  "type_key": "Shape.a49a559bd0d8caf499d2af6e646eab65ae0aa61c"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+                  "default_value_as_json_str": "{\\"config\\": {\\"critical_path_history\\": 0, \\"max_concurrent\\": 0, \\"prioritize_critical_path\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
                   "description": null,
                   "is_required": false,
                   "name": "multiprocess",
-                  "type_key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e"
+                  "type_key": "Shape.b253d6bb7fab857014d2f09929bb0873f5db6911"
                 }
               ],
               "given_name": null,
-              "key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975",
+              "key": "Selector.3c7b369d394cc5ead27fd2786aa64c517d33f460",
+              "kind": {
+                "__enum__": "ConfigTypeKind.SELECTOR"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Selector.83ae77bba85245721fa821933dd1f578657e5c1c": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"config\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "filesystem",
+                  "type_key": "Shape.3dfc1a8e86b3e744723f1b7e5f7f70f986dd6c5b"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "in_memory",
+                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+                }
+              ],
+              "given_name": null,
+              "key": "Selector.83ae77bba85245721fa821933dd1f578657e5c1c",
               "kind": {
                 "__enum__": "ConfigTypeKind.SELECTOR"
               },
@@ -435,38 +467,6 @@ snapshots['test_external_repository_data 1'] = '''{
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Selector.efc7a1aa788fafe8121049790c968cbf2ebc247b": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "filesystem",
-                  "type_key": "Shape.889b7348071b49700db678dab98bb0a15fd57ecd"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "in_memory",
-                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
-                }
-              ],
-              "given_name": null,
-              "key": "Selector.efc7a1aa788fafe8121049790c968cbf2ebc247b",
-              "kind": {
-                "__enum__": "ConfigTypeKind.SELECTOR"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
             "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -508,7 +508,7 @@ snapshots['test_external_repository_data 1'] = '''{
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
+            "Shape.03ab30e513b4c18fde6e2855b7c2a97a966b2f68": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -516,54 +516,49 @@ snapshots['test_external_repository_data 1'] = '''{
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "\\"INFO\\"",
+                  "default_value_as_json_str": "0",
                   "description": null,
                   "is_required": false,
-                  "name": "log_level",
-                  "type_key": "String"
+                  "name": "critical_path_history",
+                  "type_key": "Int"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "\\"dagster\\"",
+                  "default_value_as_json_str": "0",
                   "description": null,
                   "is_required": false,
-                  "name": "name",
-                  "type_key": "String"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
-            "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
+                  "name": "max_concurrent",
+                  "type_key": "Int"
+                },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
+                  "default_value_as_json_str": "false",
                   "description": null,
                   "is_required": false,
-                  "name": "config",
-                  "type_key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441"
+                  "name": "prioritize_critical_path",
+                  "type_key": "Bool"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "retries",
+                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
                 }
               ],
               "given_name": null,
-              "key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb",
+              "key": "Shape.03ab30e513b4c18fde6e2855b7c2a97a966b2f68",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
+            "Shape.0684c71be3cfec941a8b7c9d325d6e9350095038": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -574,42 +569,28 @@ snapshots['test_external_repository_data 1'] = '''{
                   "default_value_as_json_str": null,
                   "description": null,
                   "is_required": false,
-                  "name": "result",
-                  "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
-            "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
+                  "name": "base_dir",
+                  "type_key": "String"
+                },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": false,
                   "default_value_as_json_str": null,
                   "description": null,
-                  "is_required": true,
-                  "name": "path",
-                  "type_key": "String"
+                  "is_required": false,
+                  "name": "content_addressed",
+                  "type_key": "Bool"
                 }
               ],
               "given_name": null,
-              "key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2",
+              "key": "Shape.0684c71be3cfec941a8b7c9d325d6e9350095038",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.5363863c1eac4948c2bc0d847c505a54ec36976b": {
+            "Shape.0a6c312df659838370573d111527e2b1a185c0a6": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -620,55 +601,46 @@ snapshots['test_external_repository_data 1'] = '''{
                   "default_value_as_json_str": null,
                   "description": null,
                   "is_required": false,
-                  "name": "execution",
-                  "type_key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975"
+                  "name": "marker_to_close",
+                  "type_key": "String"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{}",
+                  "default_value_as_json_str": "{\\"enabled\\": {}}",
                   "description": null,
                   "is_required": false,
-                  "name": "loggers",
-                  "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+                  "name": "retries",
+                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{}",
+                  "default_value_as_json_str": "true",
                   "description": null,
                   "is_required": false,
-                  "name": "resources",
-                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+                  "name": "type_check_cache",
+                  "type_key": "Bool"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"a_solid\\": {}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "solids",
-                  "type_key": "Shape.5a712cc73cd18a717376d6ed2fd442949644d5bb"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
+                  "default_value_as_json_str": "0",
                   "description": null,
                   "is_required": false,
-                  "name": "storage",
-                  "type_key": "Selector.efc7a1aa788fafe8121049790c968cbf2ebc247b"
+                  "name": "type_check_sample_size",
+                  "type_key": "Int"
                 }
               ],
               "given_name": null,
-              "key": "Shape.5363863c1eac4948c2bc0d847c505a54ec36976b",
+              "key": "Shape.0a6c312df659838370573d111527e2b1a185c0a6",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.5a712cc73cd18a717376d6ed2fd442949644d5bb": {
+            "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -676,45 +648,54 @@ snapshots['test_external_repository_data 1'] = '''{
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{}",
+                  "default_value_as_json_str": "\\"INFO\\"",
                   "description": null,
                   "is_required": false,
-                  "name": "a_solid",
-                  "type_key": "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2"
+                  "name": "log_level",
+                  "type_key": "String"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "\\"dagster\\"",
+                  "description": null,
+                  "is_required": false,
+                  "name": "name",
+                  "type_key": "String"
                 }
               ],
               "given_name": null,
-              "key": "Shape.5a712cc73cd18a717376d6ed2fd442949644d5bb",
+              "key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2": {
+            "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
                   "description": null,
                   "is_required": false,
-                  "name": "outputs",
-                  "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
+                  "name": "config",
+                  "type_key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441"
                 }
               ],
               "given_name": null,
-              "key": "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2",
+              "key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.889b7348071b49700db678dab98bb0a15fd57ecd": {
+            "Shape.3dfc1a8e86b3e744723f1b7e5f7f70f986dd6c5b": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -726,18 +707,18 @@ snapshots['test_external_repository_data 1'] = '''{
                   "description": null,
                   "is_required": false,
                   "name": "config",
-                  "type_key": "Shape.e26e0c525e2d2c66b5a06f4cfdd053de6d44e3ed"
+                  "type_key": "Shape.0684c71be3cfec941a8b7c9d325d6e9350095038"
                 }
               ],
               "given_name": null,
-              "key": "Shape.889b7348071b49700db678dab98bb0a15fd57ecd",
+              "key": "Shape.3dfc1a8e86b3e744723f1b7e5f7f70f986dd6c5b",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+            "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -748,60 +729,42 @@ snapshots['test_external_repository_data 1'] = '''{
                   "default_value_as_json_str": null,
                   "description": null,
                   "is_required": false,
-                  "name": "marker_to_close",
-                  "type_key": "String"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"enabled\\": {}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "retries",
-                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+                  "name": "result",
+                  "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
                 }
               ],
               "given_name": null,
-              "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+              "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023": {
+            "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "0",
-                  "description": null,
-                  "is_required": false,
-                  "name": "max_concurrent",
-                  "type_key": "Int"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
                   "description": null,
-                  "is_required": false,
-                  "name": "retries",
-                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+                  "is_required": true,
+                  "name": "path",
+                  "type_key": "String"
                 }
               ],
               "given_name": null,
-              "key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023",
+              "key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+            "Shape.5a712cc73cd18a717376d6ed2fd442949644d5bb": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -809,35 +772,22 @@ snapshots['test_external_repository_data 1'] = '''{
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+                  "default_value_as_json_str": "{}",
                   "description": null,
                   "is_required": false,
-                  "name": "config",
-                  "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+                  "name": "a_solid",
+                  "type_key": "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2"
                 }
               ],
               "given_name": null,
-              "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
-            "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [],
-              "given_name": null,
-              "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+              "key": "Shape.5a712cc73cd18a717376d6ed2fd442949644d5bb",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.e26e0c525e2d2c66b5a06f4cfdd053de6d44e3ed": {
+            "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -848,58 +798,153 @@ snapshots['test_external_repository_data 1'] = '''{
                   "default_value_as_json_str": null,
                   "description": null,
                   "is_required": false,
-                  "name": "base_dir",
-                  "type_key": "String"
+                  "name": "outputs",
+                  "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
                 }
               ],
               "given_name": null,
-              "key": "Shape.e26e0c525e2d2c66b5a06f4cfdd053de6d44e3ed",
+              "key": "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+            "Shape.a49a559bd0d8caf499d2af6e646eab65ae0aa61c": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}, \\"type_check_cache\\": true, \\"type_check_sample_size\\": 0}",
                   "description": null,
                   "is_required": false,
-                  "name": "console",
-                  "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
+                  "name": "config",
+                  "type_key": "Shape.0a6c312df659838370573d111527e2b1a185c0a6"
                 }
               ],
               "given_name": null,
-              "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
+              "key": "Shape.a49a559bd0d8caf499d2af6e646eab65ae0aa61c",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e": {
+            "Shape.aa0d8a55f425b61710cee358ae58ef784101eb20": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": null,
+                  "is_required": false,
+                  "name": "execution",
+                  "type_key": "Selector.3c7b369d394cc5ead27fd2786aa64c517d33f460"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "loggers",
+                  "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "resources",
+                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"a_solid\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "solids",
+                  "type_key": "Shape.5a712cc73cd18a717376d6ed2fd442949644d5bb"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": null,
+                  "is_required": false,
+                  "name": "storage",
+                  "type_key": "Selector.83ae77bba85245721fa821933dd1f578657e5c1c"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.aa0d8a55f425b61710cee358ae58ef784101eb20",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.b253d6bb7fab857014d2f09929bb0873f5db6911": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"critical_path_history\\": 0, \\"max_concurrent\\": 0, \\"prioritize_critical_path\\": false, \\"retries\\": {\\"enabled\\": {}}}",
                   "description": null,
                   "is_required": false,
                   "name": "config",
-                  "type_key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023"
+                  "type_key": "Shape.03ab30e513b4c18fde6e2855b7c2a97a966b2f68"
                 }
               ],
               "given_name": null,
-              "key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e",
+              "key": "Shape.b253d6bb7fab857014d2f09929bb0873f5db6911",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [],
+              "given_name": null,
+              "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": null,
+                  "is_required": false,
+                  "name": "console",
+                  "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -1048,7 +1093,7 @@ snapshots['test_external_repository_data 1'] = '''{
             ],
             "name": "default",
             "resource_def_snaps": [],
-            "root_config_key": "Shape.5363863c1eac4948c2bc0d847c505a54ec36976b"
+            "root_config_key": "Shape.aa0d8a55f425b61710cee358ae58ef784101eb20"
           },
           {
             "__class__": "ModeDefSnap",
@@ -1071,7 +1116,7 @@ snapshots['test_external_repository_data 1'] = '''{
             ],
             "name": "mode_one",
             "resource_def_snaps": [],
-            "root_config_key": "Shape.5363863c1eac4948c2bc0d847c505a54ec36976b"
+            "root_config_key": "Shape.aa0d8a55f425b61710cee358ae58ef784101eb20"
           }
         ],
         "name": "a_pipeline",
@@ -1304,7 +1349,7 @@ snapshots['test_external_pipeline_data 1'] = '''{
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975": {
+        "Selector.3c7b369d394cc5ead27fd2786aa64c517d33f460": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -1312,24 +1357,56 @@ snapshots['test_external_pipeline_data 1'] = '''{
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+              "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}, \\"type_check_cache\\": true, \\"type_check_sample_size\\": 0}}",
               "description": null,
               "is_required": false,
               "name": "in_process",
-              "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+              "type_key": "Shape.a49a559bd0d8caf499d2af6e646eab65ae0aa61c"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+              "default_value_as_json_str": "{\\"config\\": {\\"critical_path_history\\": 0, \\"max_concurrent\\": 0, \\"prioritize_critical_path\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
               "description": null,
               "is_required": false,
               "name": "multiprocess",
-              "type_key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e"
+              "type_key": "Shape.b253d6bb7fab857014d2f09929bb0873f5db6911"
+            }
+          ],
+          "given_name": null,
+          "key": "Selector.3c7b369d394cc5ead27fd2786aa64c517d33f460",
+          "kind": {
+            "__enum__": "ConfigTypeKind.SELECTOR"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Selector.83ae77bba85245721fa821933dd1f578657e5c1c": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"config\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "filesystem",
+              "type_key": "Shape.3dfc1a8e86b3e744723f1b7e5f7f70f986dd6c5b"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{}",
+              "description": null,
+              "is_required": false,
+              "name": "in_memory",
+              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
             }
           ],
           "given_name": null,
-          "key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975",
+          "key": "Selector.83ae77bba85245721fa821933dd1f578657e5c1c",
           "kind": {
             "__enum__": "ConfigTypeKind.SELECTOR"
           },
@@ -1532,7 +1609,48 @@ snapshots['test_external_pipeline_data 1'] = '''{
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Selector.efc7a1aa788fafe8121049790c968cbf2ebc247b": {
+        "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": null,
+              "is_required": true,
+              "name": "json",
+              "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": null,
+              "is_required": true,
+              "name": "pickle",
+              "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": null,
+              "is_required": true,
+              "name": "value",
+              "type_key": "Any"
+            }
+          ],
+          "given_name": null,
+          "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
+          "kind": {
+            "__enum__": "ConfigTypeKind.SELECTOR"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.03ab30e513b4c18fde6e2855b7c2a97a966b2f68": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -1540,31 +1658,49 @@ snapshots['test_external_pipeline_data 1'] = '''{
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {}}",
+              "default_value_as_json_str": "0",
               "description": null,
               "is_required": false,
-              "name": "filesystem",
-              "type_key": "Shape.889b7348071b49700db678dab98bb0a15fd57ecd"
+              "name": "critical_path_history",
+              "type_key": "Int"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{}",
+              "default_value_as_json_str": "0",
               "description": null,
               "is_required": false,
-              "name": "in_memory",
-              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+              "name": "max_concurrent",
+              "type_key": "Int"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "false",
+              "description": null,
+              "is_required": false,
+              "name": "prioritize_critical_path",
+              "type_key": "Bool"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "retries",
+              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
             }
           ],
           "given_name": null,
-          "key": "Selector.efc7a1aa788fafe8121049790c968cbf2ebc247b",
+          "key": "Shape.03ab30e513b4c18fde6e2855b7c2a97a966b2f68",
           "kind": {
-            "__enum__": "ConfigTypeKind.SELECTOR"
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
+        "Shape.0684c71be3cfec941a8b7c9d325d6e9350095038": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -1574,33 +1710,74 @@ snapshots['test_external_pipeline_data 1'] = '''{
               "default_provided": false,
               "default_value_as_json_str": null,
               "description": null,
-              "is_required": true,
-              "name": "json",
-              "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+              "is_required": false,
+              "name": "base_dir",
+              "type_key": "String"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": false,
               "default_value_as_json_str": null,
               "description": null,
-              "is_required": true,
-              "name": "pickle",
-              "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-            },
+              "is_required": false,
+              "name": "content_addressed",
+              "type_key": "Bool"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.0684c71be3cfec941a8b7c9d325d6e9350095038",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.0a6c312df659838370573d111527e2b1a185c0a6": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": false,
               "default_value_as_json_str": null,
               "description": null,
-              "is_required": true,
-              "name": "value",
-              "type_key": "Any"
+              "is_required": false,
+              "name": "marker_to_close",
+              "type_key": "String"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "retries",
+              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "true",
+              "description": null,
+              "is_required": false,
+              "name": "type_check_cache",
+              "type_key": "Bool"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "0",
+              "description": null,
+              "is_required": false,
+              "name": "type_check_sample_size",
+              "type_key": "Int"
             }
           ],
           "given_name": null,
-          "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
+          "key": "Shape.0a6c312df659838370573d111527e2b1a185c0a6",
           "kind": {
-            "__enum__": "ConfigTypeKind.SELECTOR"
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
@@ -1660,30 +1837,30 @@ snapshots['test_external_pipeline_data 1'] = '''{
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
+        "Shape.3dfc1a8e86b3e744723f1b7e5f7f70f986dd6c5b": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
+              "default_provided": true,
+              "default_value_as_json_str": "{}",
               "description": null,
               "is_required": false,
-              "name": "result",
-              "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
+              "name": "config",
+              "type_key": "Shape.0684c71be3cfec941a8b7c9d325d6e9350095038"
             }
           ],
           "given_name": null,
-          "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
+          "key": "Shape.3dfc1a8e86b3e744723f1b7e5f7f70f986dd6c5b",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
+        "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -1693,20 +1870,20 @@ snapshots['test_external_pipeline_data 1'] = '''{
               "default_provided": false,
               "default_value_as_json_str": null,
               "description": null,
-              "is_required": true,
-              "name": "path",
-              "type_key": "String"
+              "is_required": false,
+              "name": "result",
+              "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
             }
           ],
           "given_name": null,
-          "key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2",
+          "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.5363863c1eac4948c2bc0d847c505a54ec36976b": {
+        "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -1716,49 +1893,13 @@ snapshots['test_external_pipeline_data 1'] = '''{
               "default_provided": false,
               "default_value_as_json_str": null,
               "description": null,
-              "is_required": false,
-              "name": "execution",
-              "type_key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{}",
-              "description": null,
-              "is_required": false,
-              "name": "loggers",
-              "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{}",
-              "description": null,
-              "is_required": false,
-              "name": "resources",
-              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"a_solid\\": {}}",
-              "description": null,
-              "is_required": false,
-              "name": "solids",
-              "type_key": "Shape.5a712cc73cd18a717376d6ed2fd442949644d5bb"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
-              "description": null,
-              "is_required": false,
-              "name": "storage",
-              "type_key": "Selector.efc7a1aa788fafe8121049790c968cbf2ebc247b"
+              "is_required": true,
+              "name": "path",
+              "type_key": "String"
             }
           ],
           "given_name": null,
-          "key": "Shape.5363863c1eac4948c2bc0d847c505a54ec36976b",
+          "key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -1811,7 +1952,7 @@ snapshots['test_external_pipeline_data 1'] = '''{
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.889b7348071b49700db678dab98bb0a15fd57ecd": {
+        "Shape.a49a559bd0d8caf499d2af6e646eab65ae0aa61c": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -1819,22 +1960,22 @@ snapshots['test_external_pipeline_data 1'] = '''{
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{}",
+              "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}, \\"type_check_cache\\": true, \\"type_check_sample_size\\": 0}",
               "description": null,
               "is_required": false,
               "name": "config",
-              "type_key": "Shape.e26e0c525e2d2c66b5a06f4cfdd053de6d44e3ed"
+              "type_key": "Shape.0a6c312df659838370573d111527e2b1a185c0a6"
             }
           ],
           "given_name": null,
-          "key": "Shape.889b7348071b49700db678dab98bb0a15fd57ecd",
+          "key": "Shape.a49a559bd0d8caf499d2af6e646eab65ae0aa61c",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+        "Shape.aa0d8a55f425b61710cee358ae58ef784101eb20": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -1845,60 +1986,55 @@ snapshots['test_external_pipeline_data 1'] = '''{
               "default_value_as_json_str": null,
               "description": null,
               "is_required": false,
-              "name": "marker_to_close",
-              "type_key": "String"
+              "name": "execution",
+              "type_key": "Selector.3c7b369d394cc5ead27fd2786aa64c517d33f460"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "default_value_as_json_str": "{}",
               "description": null,
               "is_required": false,
-              "name": "retries",
-              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
-        "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
+              "name": "loggers",
+              "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+            },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "0",
+              "default_value_as_json_str": "{}",
               "description": null,
               "is_required": false,
-              "name": "max_concurrent",
-              "type_key": "Int"
+              "name": "resources",
+              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "default_value_as_json_str": "{\\"a_solid\\": {}}",
               "description": null,
               "is_required": false,
-              "name": "retries",
-              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+              "name": "solids",
+              "type_key": "Shape.5a712cc73cd18a717376d6ed2fd442949644d5bb"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": null,
+              "is_required": false,
+              "name": "storage",
+              "type_key": "Selector.83ae77bba85245721fa821933dd1f578657e5c1c"
             }
           ],
           "given_name": null,
-          "key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023",
+          "key": "Shape.aa0d8a55f425b61710cee358ae58ef784101eb20",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+        "Shape.b253d6bb7fab857014d2f09929bb0873f5db6911": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -1906,15 +2042,15 @@ snapshots['test_external_pipeline_data 1'] = '''{
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+              "default_value_as_json_str": "{\\"critical_path_history\\": 0, \\"max_concurrent\\": 0, \\"prioritize_critical_path\\": false, \\"retries\\": {\\"enabled\\": {}}}",
               "description": null,
               "is_required": false,
               "name": "config",
-              "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+              "type_key": "Shape.03ab30e513b4c18fde6e2855b7c2a97a966b2f68"
             }
           ],
           "given_name": null,
-          "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+          "key": "Shape.b253d6bb7fab857014d2f09929bb0873f5db6911",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -1934,29 +2070,6 @@ snapshots['test_external_pipeline_data 1'] = '''{
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.e26e0c525e2d2c66b5a06f4cfdd053de6d44e3ed": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
-              "description": null,
-              "is_required": false,
-              "name": "base_dir",
-              "type_key": "String"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.e26e0c525e2d2c66b5a06f4cfdd053de6d44e3ed",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
         "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -1980,29 +2093,6 @@ snapshots['test_external_pipeline_data 1'] = '''{
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-              "description": null,
-              "is_required": false,
-              "name": "config",
-              "type_key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
         "String": {
           "__class__": "ConfigTypeSnap",
           "description": "",
@@ -2145,7 +2235,7 @@ snapshots['test_external_pipeline_data 1'] = '''{
         ],
         "name": "default",
         "resource_def_snaps": [],
-        "root_config_key": "Shape.5363863c1eac4948c2bc0d847c505a54ec36976b"
+        "root_config_key": "Shape.aa0d8a55f425b61710cee358ae58ef784101eb20"
       },
       {
         "__class__": "ModeDefSnap",
@@ -2168,7 +2258,7 @@ snapshots['test_external_pipeline_data 1'] = '''{
         ],
         "name": "mode_one",
         "resource_def_snaps": [],
-        "root_config_key": "Shape.5363863c1eac4948c2bc0d847c505a54ec36976b"
+        "root_config_key": "Shape.aa0d8a55f425b61710cee358ae58ef784101eb20"
       }
     ],
     "name": "a_pipeline",
@@ -3,7 +3,11 @@ from contextlib import contextmanager
 import pytest
 
 from dagster import seven
+from dagster.core.storage.pipeline_run import PipelineRunsFilter
 from dagster.core.storage.runs import InMemoryRunStorage, SqliteRunStorage
+from dagster.core.storage.runs.schema import RunTagsTable
+from dagster.core.utils import make_new_run_id
+from dagster.seven import mock
 from dagster.utils.test.run_storage import TestRunStorage
 
 
@@ -29,6 +33,23 @@ class TestSqliteImplementation(TestRunStorage):
         with request.param() as s:
             yield s
 
+    def test_add_runs_is_atomic(self, storage):
+        new_run_id = make_new_run_id()
+        with pytest.raises(Exception, match='tags insert failed'):
+            with mock.patch.object(
+                RunTagsTable, 'insert', side_effect=Exception('tags insert failed')
+            ):
+                storage.add_runs(
+                    [
+                        TestRunStorage.build_run(
+                            run_id=new_run_id, pipeline_name='some_pipeline', tags={'foo': 'bar'}
+                        )
+                    ]
+                )
+
+        assert not storage.has_run(new_run_id)
+        assert not storage.get_runs(PipelineRunsFilter(tags={'foo': 'bar'}))
+
 
 class TestInMemoryImplementation(TestRunStorage):
     __test__ = True
@@ -7,6 +7,7 @@ from dagster.core.snap import (
     snapshot_from_execution_plan,
 )
 from dagster.core.test_utils import create_run_for_test
+from dagster.seven import mock
 
 
 def test_get_run_by_id():
@@ -86,3 +87,47 @@ def test_create_execution_plan_snapshot():
 
     assert run.execution_plan_snapshot_id == ep_snapshot_id
     assert run.execution_plan_snapshot_id == create_execution_plan_snapshot_id(ep_snapshot)
+
+
+def test_create_runs_reuses_snapshots():
+    @solid
+    def noop_solid(_):
+        pass
+
+    @pipeline
+    def noop_pipeline():
+        noop_solid()
+
+    instance = DagsterInstance.local_temp()
+
+    assert noop_pipeline.get_pipeline_snapshot() is noop_pipeline.get_pipeline_snapshot()
+
+    with mock.patch.object(
+        instance._run_storage,  # pylint: disable=protected-access
+        'has_pipeline_snapshot',
+        wraps=instance._run_storage.has_pipeline_snapshot,  # pylint: disable=protected-access
+    ) as has_pipeline_snapshot, mock.patch(
+        'dagster.core.execution.api.create_execution_plan', wraps=create_execution_plan
+    ) as create_plan:
+        environment_dict = {'storage': {'filesystem': {}}}
+        first = instance.create_run_for_pipeline(
+            noop_pipeline, run_id='first', environment_dict=environment_dict
+        )
+        second = instance.create_run_for_pipeline(
+            noop_pipeline, run_id='second', environment_dict=environment_dict
+        )
+        assert has_pipeline_snapshot.call_count == 1
+        assert create_plan.call_count == 1
+
+        third = instance.create_run_for_pipeline(noop_pipeline, run_id='third')
+        assert create_plan.call_count == 2
+
+        assert first.pipeline_snapshot_id == second.pipeline_snapshot_id
+        assert first.execution_plan_snapshot_id == second.execution_plan_snapshot_id
+        assert third.pipeline_snapshot_id == first.pipeline_snapshot_id
+
+        # snapshots are written again after the storage is wiped
+        instance.wipe()
+        run = instance.create_run_for_pipeline(noop_pipeline, run_id='fourth')
+        assert instance.has_pipeline_snapshot(run.pipeline_snapshot_id)
+        assert instance.get_execution_plan_snapshot(run.execution_plan_snapshot_id)
@@ -1,16 +1,34 @@
+import errno
 import os
+import time
 
 import pytest
 
-from dagster import Bool, List, Optional, String, check
-from dagster.core.instance import DagsterInstance
+from dagster import (
+    Bool,
+    DagsterInvariantViolationError,
+    List,
+    Optional,
+    String,
+    check,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+    seven,
+)
+from dagster.core.instance import RUN_ARTIFACTS_GC_MIN_AGE, DagsterInstance
 from dagster.core.storage.intermediate_store import build_fs_intermediate_store
+from dagster.core.storage.object_store import (
+    ContentAddressedFilesystemObjectStore,
+    FilesystemObjectStore,
+)
 from dagster.core.storage.type_storage import TypeStoragePlugin, TypeStoragePluginRegistry
 from dagster.core.types.dagster_type import Bool as RuntimeBool
 from dagster.core.types.dagster_type import String as RuntimeString
 from dagster.core.types.dagster_type import create_any_type, resolve_dagster_type
-from dagster.core.types.marshal import SerializationStrategy
+from dagster.core.types.marshal import PickleSerializationStrategy, SerializationStrategy
 from dagster.core.utils import make_new_run_id
+from dagster.seven import mock
 from dagster.utils import mkdir_p
 from dagster.utils.test import yield_empty_pipeline_context
 
@@ -172,3 +190,302 @@ def test_file_system_intermediate_store_with_composite_type_storage_plugin():
             intermediate_store.set_value(
                 ['hello'], context, resolve_dagster_type(Optional[List[String]]), ['obj_name']
             )
+
+
+def test_file_system_intermediate_store_copy_from_run_links():
+    run_id = make_new_run_id()
+    instance = DagsterInstance.ephemeral()
+    intermediate_store = build_fs_intermediate_store(
+        instance.intermediates_directory, run_id=run_id
+    )
+    intermediate_store_2 = build_fs_intermediate_store(
+        instance.intermediates_directory, run_id=make_new_run_id()
+    )
+
+    with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+        intermediate_store.set_object('foo', context, RuntimeString, ['foo'])
+        intermediate_store_2.copy_object_from_run(
+            context, run_id, ['foo'], dagster_type=RuntimeString
+        )
+        assert intermediate_store_2.get_object(context, RuntimeString, ['foo']).obj == 'foo'
+
+        src = intermediate_store.key_for_paths(['foo'])
+        dst = intermediate_store_2.key_for_paths(['foo'])
+        assert os.stat(src).st_ino == os.stat(dst).st_ino
+
+        # overwriting the copy must not affect the source
+        intermediate_store_2.set_object('bar', context, RuntimeString, ['foo'])
+        assert os.stat(src).st_ino != os.stat(dst).st_ino
+        assert intermediate_store_2.get_object(context, RuntimeString, ['foo']).obj == 'bar'
+        assert intermediate_store.get_object(context, RuntimeString, ['foo']).obj == 'foo'
+
+
+def test_file_system_intermediate_store_copy_from_run_copies_values_not_set_by_object_store():
+    run_id = make_new_run_id()
+    instance = DagsterInstance.ephemeral()
+    intermediate_store = build_fs_intermediate_store(
+        instance.intermediates_directory,
+        run_id=run_id,
+        type_storage_plugin_registry=TypeStoragePluginRegistry(
+            [(RuntimeString, FancyStringFilesystemTypeStoragePlugin)]
+        ),
+    )
+    intermediate_store_2 = build_fs_intermediate_store(
+        instance.intermediates_directory, run_id=make_new_run_id()
+    )
+
+    with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+        intermediate_store.set_object('foo', context, RuntimeString, ['foo'])
+        intermediate_store.set_object('bar', context, RuntimeString, ['bar'])
+        src = intermediate_store.key_for_paths(['foo'])
+
+        # without a type, the value may have been written by anything
+        intermediate_store_2.copy_object_from_run(context, run_id, ['foo'])
+        dst = intermediate_store_2.key_for_paths(['foo'])
+        assert os.stat(src).st_ino != os.stat(dst).st_ino
+
+        # values of types with a storage plugin are written by the plugin
+        registry_store = build_fs_intermediate_store(
+            instance.intermediates_directory,
+            run_id=make_new_run_id(),
+            type_storage_plugin_registry=intermediate_store.type_storage_plugin_registry,
+        )
+        registry_store.copy_object_from_run(context, run_id, ['bar'], dagster_type=RuntimeString)
+        assert (
+            os.stat(intermediate_store.key_for_paths(['bar'])).st_ino
+            != os.stat(registry_store.key_for_paths(['bar'])).st_ino
+        )
+
+        # so writing into the source in place does not affect the copies
+        with open(src, 'wb') as src_file:
+            src_file.write(b'corrupt')
+        assert intermediate_store_2.get_object(context, RuntimeString, ['foo']).obj == 'foo'
+
+
+def test_file_system_object_store_set_object_replaces_file():
+    with seven.TemporaryDirectory() as temp_dir:
+        object_store = FilesystemObjectStore()
+        key = os.path.join(temp_dir, 'run', 'foo')
+        object_store.set_object(key, 'foo')
+        link = os.path.join(temp_dir, 'link')
+        os.link(key, link)
+
+        # the file is replaced rather than written into, so links to it are unaffected
+        object_store.set_object(key, 'bar')
+        assert object_store.get_object(key).obj == 'bar'
+        assert object_store.get_object(link).obj == 'foo'
+        assert os.listdir(os.path.dirname(key)) == ['foo']
+
+
+def test_content_addressed_intermediate_store_dedupes():
+    instance = DagsterInstance.ephemeral()
+    run_id = make_new_run_id()
+    intermediate_store = build_fs_intermediate_store(
+        instance.intermediates_directory, run_id=run_id, objects_dir=instance.objects_directory()
+    )
+    intermediate_store_2 = build_fs_intermediate_store(
+        instance.intermediates_directory,
+        run_id=make_new_run_id(),
+        objects_dir=instance.objects_directory(),
+    )
+    object_store = intermediate_store.object_store
+    assert isinstance(object_store, ContentAddressedFilesystemObjectStore)
+
+    with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+        intermediate_store.set_object('foo', context, RuntimeString, ['foo'])
+        intermediate_store.set_object('foo', context, RuntimeString, ['also_foo'])
+        intermediate_store_2.set_object('foo', context, RuntimeString, ['foo'])
+        intermediate_store_2.set_object('bar', context, RuntimeString, ['bar'])
+
+        assert intermediate_store.get_object(context, RuntimeString, ['foo']).obj == 'foo'
+        assert intermediate_store_2.get_object(context, RuntimeString, ['bar']).obj == 'bar'
+
+        foo_path = intermediate_store.key_for_paths(['foo'])
+        assert (
+            os.stat(foo_path).st_ino == os.stat(intermediate_store_2.key_for_paths(['foo'])).st_ino
+        )
+        assert (
+            os.stat(foo_path).st_ino
+            == os.stat(intermediate_store.key_for_paths(['also_foo'])).st_ino
+        )
+        assert os.stat(foo_path).st_nlink == 4  # three keys plus the content file
+
+        assert object_store.collect_garbage() == []
+
+        intermediate_store_2.rm_object(context, ['bar'])
+        collected = object_store.collect_garbage()
+        assert len(collected) == 1
+        assert not os.path.exists(object_store.path_for_digest(collected[0]))
+
+        intermediate_store.rm_object(context, ['foo'])
+        intermediate_store.rm_object(context, ['also_foo'])
+        assert object_store.collect_garbage() == []
+        assert intermediate_store_2.get_object(context, RuntimeString, ['foo']).obj == 'foo'
+
+
+def test_content_addressed_fs_system_storage():
+    @lambda_solid
+    def return_one():
+        return 1
+
+    @pipeline
+    def one_pipeline():
+        return_one()
+
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        environment_dict = {'storage': {'filesystem': {'config': {'content_addressed': True}}}}
+        run_ids = [
+            execute_pipeline(
+                one_pipeline, environment_dict=environment_dict, instance=instance
+            ).run_id
+            for _ in range(2)
+        ]
+
+        paths = [
+            os.path.join(
+                instance.intermediates_directory(run_id),
+                'intermediates',
+                'return_one.compute',
+                'result',
+            )
+            for run_id in run_ids
+        ]
+        assert os.stat(paths[0]).st_ino == os.stat(paths[1]).st_ino
+        assert os.path.isdir(instance.objects_directory())
+
+        # recently modified run artifacts are not listed, as their run may still be being created
+        instance.delete_run(run_ids[0])
+        assert instance.collect_garbage() == ([], [])
+        for run_id in run_ids:
+            age_run_artifacts(instance, run_id)
+
+        # the artifacts of runs not in run storage are only listed by default
+        assert instance.collect_garbage() == ([run_ids[0]], [])
+        assert os.path.exists(paths[0])
+
+        # the content is kept for as long as either run's artifacts are
+        assert instance.collect_garbage(delete_run_artifacts=True) == ([run_ids[0]], [])
+        assert not os.path.exists(paths[0])
+        assert os.path.exists(paths[1])
+
+        instance.delete_run(run_ids[1])
+        unknown_run_ids, collected = instance.collect_garbage(delete_run_artifacts=True)
+        assert unknown_run_ids == [run_ids[1]]
+        assert len(collected) == 1
+        assert instance.collect_garbage(delete_run_artifacts=True) == ([], [])
+
+
+def age_run_artifacts(instance, run_id):
+    run_dir = instance.intermediates_directory(run_id)
+    mtime = time.time() - RUN_ARTIFACTS_GC_MIN_AGE - 60
+    os.utime(run_dir, (mtime, mtime))
+
+
+def test_content_addressed_key_linked_before_content_published():
+    with seven.TemporaryDirectory() as temp_dir:
+        object_store = ContentAddressedFilesystemObjectStore(os.path.join(temp_dir, 'objects'))
+        key = os.path.join(temp_dir, 'run', 'foo')
+        rename = os.rename
+
+        def checked_rename(src, dst):
+            # a collection at this point must not find the content unreferenced
+            assert os.stat(src).st_nlink == 2
+            assert os.path.exists(key)
+            return rename(src, dst)
+
+        with mock.patch('os.rename', side_effect=checked_rename) as patched_rename:
+            object_store.set_object(key, 'foo')
+            assert patched_rename.call_count == 1
+
+        assert object_store.collect_garbage() == []
+
+        # unreferenced content that is written again before it is collected is kept
+        object_store.rm_object(key)
+        other_key = os.path.join(temp_dir, 'run', 'other_foo')
+        object_store.set_object(other_key, 'foo')
+        assert object_store.collect_garbage() == []
+        assert object_store.get_object(other_key).obj == 'foo'
+
+        # content that is collected while a key is linked to it stays readable through the key
+        content_paths = [
+            os.path.join(root, name)
+            for root, _, names in os.walk(object_store.objects_dir)
+            if not root.endswith('tmp')
+            for name in names
+        ]
+        assert len(content_paths) == 1
+        os.unlink(content_paths[0])
+        assert object_store.get_object(other_key).obj == 'foo'
+        object_store.set_object(key, 'foo')
+        assert os.path.exists(content_paths[0])
+        assert object_store.get_object(key).obj == 'foo'
+
+
+def test_content_addressed_requires_hard_links():
+    with seven.TemporaryDirectory() as temp_dir:
+        with mock.patch('os.link', side_effect=OSError(errno.EPERM, 'Operation not permitted')):
+            with pytest.raises(DagsterInvariantViolationError, match='hard link'):
+                ContentAddressedFilesystemObjectStore(os.path.join(temp_dir, 'objects'))
+
+        object_store = ContentAddressedFilesystemObjectStore(os.path.join(temp_dir, 'objects'))
+        with mock.patch('os.link', side_effect=OSError(errno.EXDEV, 'Cross-device link')):
+            with pytest.raises(DagsterInvariantViolationError, match='same filesystem'):
+                object_store.set_object(
+                    os.path.join(temp_dir, 'run', 'foo'), 'foo', PickleSerializationStrategy()
+                )
+
+        # nothing is left behind in the scratch directory
+        assert os.listdir(os.path.join(temp_dir, 'objects', 'tmp')) == []
+
+
+class ReadOnlyListSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    def __init__(self):
+        super(ReadOnlyListSerializationStrategy, self).__init__('read_only_list')
+        self.reads = 0
+
+    @property
+    def read_only_values(self):
+        return True
+
+    def serialize(self, value, write_file_obj):
+        write_file_obj.write(','.join(value).encode('utf-8'))
+
+    def deserialize(self, read_file_obj):
+        self.reads += 1
+        return SharedList(read_file_obj.read().decode('utf-8').split(','))
+
+
+class SharedList(list):
+    # subclassed so that instances support weak references
+    pass
+
+
+def test_file_system_intermediate_store_shares_read_only_values():
+    serialization_strategy = ReadOnlyListSerializationStrategy()
+    ReadOnlyList = create_any_type('ReadOnlyList', serialization_strategy=serialization_strategy)
+
+    run_id = make_new_run_id()
+    instance = DagsterInstance.ephemeral()
+    intermediate_store = build_fs_intermediate_store(
+        instance.intermediates_directory, run_id=run_id
+    )
+
+    with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+        intermediate_store.set_object(['a', 'b'], context, ReadOnlyList, ['list'])
+        first = intermediate_store.get_object(context, ReadOnlyList, ['list']).obj
+        second = intermediate_store.get_object(context, ReadOnlyList, ['list']).obj
+        assert first == ['a', 'b']
+        assert first is second
+        assert serialization_strategy.reads == 1
+
+        # rewriting the file invalidates the cached value
+        intermediate_store.set_object(['c'], context, ReadOnlyList, ['list'])
+        assert intermediate_store.get_object(context, ReadOnlyList, ['list']).obj == ['c']
+        assert serialization_strategy.reads == 2
+
+        # values are only shared while a reader holds on to them
+        del first, second
+        intermediate_store.get_object(context, ReadOnlyList, ['list'])
+        intermediate_store.get_object(context, ReadOnlyList, ['list'])
+        assert serialization_strategy.reads == 4
@@ -0,0 +1,55 @@
+import json
+import subprocess
+import sys
+
+# Dependencies that are slow to import and only needed by some code paths, so `import dagster` must
+# not import them
+DEFERRED_DEPENDENCIES = [
+    'alembic',
+    'click',
+    'coloredlogs',
+    'pkg_resources',
+    'requests',
+    'rx',
+    'sqlalchemy',
+    'watchdog',
+]
+
+if sys.version_info >= (3, 7):
+    DEFERRED_DEPENDENCIES.append('unittest.mock')
+
+
+def _modules_imported_by(source):
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            '-c',
+            '{source}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))'.format(
+                source=source
+            ),
+        ]
+    )
+    return set(json.loads(output.decode('utf-8').splitlines()[-1]))
+
+
+def test_import_dagster_defers_dependencies():
+    preloaded = _modules_imported_by('pass')
+    imported = _modules_imported_by('import dagster') - preloaded
+
+    assert (
+        sorted(
+            module_name
+            for module_name in imported
+            if any(
+                module_name == dependency or module_name.startswith(dependency + '.')
+                for dependency in DEFERRED_DEPENDENCIES
+            )
+        )
+        == []
+    )
+
+
+def test_seven_mock():
+    from dagster.seven import mock
+
+    assert mock.MagicMock
@@ -3,7 +3,13 @@ import os
 import pytest
 
 from dagster.check import CheckError, ParameterCheckError
-from dagster.utils import EventGenerationManager, ensure_dir, ensure_gen, ensure_single_item
+from dagster.utils import (
+    EventGenerationManager,
+    LRUCache,
+    ensure_dir,
+    ensure_gen,
+    ensure_single_item,
+)
 
 
 def test_ensure_single_item():
@@ -57,3 +63,26 @@ def test_event_generation_manager():
     assert result == 2
     teardown_events = list(basic_manager.generate_teardown_events())
     assert teardown_events == ['C']
+
+
+def test_lru_cache():
+    cache = LRUCache(2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+
+    # b is now the least recently used entry
+    cache.set('c', 3)
+    assert len(cache) == 2
+    assert cache.get('b') is None
+    assert cache.get('b', 'missing') == 'missing'
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+    cache.set('a', 4)
+    cache.set('d', 5)
+    assert cache.get('c') is None
+    assert cache.get('a') == 4
+
+    cache.clear()
+    assert len(cache) == 0
@@ -64,6 +64,7 @@ def _do_setup(name='dagster'):
             # standard python 2/3 compatability things
             'enum34; python_version < "3.4"',
             'future',
+            'futures; python_version < "3"',
             'funcsigs',
             'functools32; python_version<"3"',
             'contextlib2>=0.5.4',
@@ -2,7 +2,7 @@ from dagster import check
 from dagster.core.storage.intermediate_store import IntermediateStore
 from dagster.core.storage.type_storage import TypeStoragePluginRegistry
 
-from .object_store import S3ObjectStore
+from .object_store import DEFAULT_MAX_CONCURRENCY, DEFAULT_MULTIPART_CHUNKSIZE, S3ObjectStore
 
 
 class S3IntermediateStore(IntermediateStore):
@@ -13,12 +13,21 @@ class S3IntermediateStore(IntermediateStore):
         s3_session=None,
         type_storage_plugin_registry=None,
         s3_prefix='dagster',
+        check_existing=True,
+        multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
     ):
         check.str_param(s3_bucket, 's3_bucket')
         check.str_param(s3_prefix, 's3_prefix')
         check.str_param(run_id, 'run_id')
 
-        object_store = S3ObjectStore(s3_bucket, s3_session=s3_session)
+        object_store = S3ObjectStore(
+            s3_bucket,
+            s3_session=s3_session,
+            check_existing=check_existing,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+        )
 
         def root_for_run_id(r_id):
             return object_store.key_for_paths([s3_prefix, 'storage', r_id])
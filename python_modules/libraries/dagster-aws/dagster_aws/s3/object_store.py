@@ -1,6 +1,8 @@
+import io
 import logging
 import sys
-from io import BytesIO, StringIO
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 
@@ -9,10 +11,213 @@ from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOpe
 from dagster.core.storage.object_store import ObjectStore
 from dagster.core.types.marshal import SerializationStrategy
 
+# S3 rejects multipart uploads whose parts (other than the last) are smaller than 5MiB
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+
+DEFAULT_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+class _S3MultipartWriter(io.RawIOBase):
+    '''Writable file-like object that streams to an S3 key.
+
+    Bytes are buffered until a full part is available, at which point the part is handed to a
+    thread pool for upload. At most ``max_concurrency`` parts are in flight at any time, so memory
+    use is bounded by roughly ``(max_concurrency + 1) * part_size`` regardless of object size.
+    Objects smaller than a single part are written with one ``put_object`` call.
+
+    Callers must call ``complete`` once all data has been written, or ``abort`` on failure.
+    '''
+
+    def __init__(self, s3, bucket, key, part_size, max_concurrency):
+        super(_S3MultipartWriter, self).__init__()
+        self._s3 = s3
+        self._bucket = bucket
+        self._key = key
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._buffer = bytearray()
+        self._upload_id = None
+        self._executor = None
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._futures = []
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        check.invariant(not self.closed, 'Cannot write to a closed S3 writer')
+        self._buffer.extend(b)
+        while len(self._buffer) >= self._part_size:
+            part = bytes(self._buffer[: self._part_size])
+            del self._buffer[: self._part_size]
+            self._submit_part(part)
+        return len(b)
+
+    def _submit_part(self, data):
+        if self._upload_id is None:
+            self._upload_id = self._s3.create_multipart_upload(Bucket=self._bucket, Key=self._key)[
+                'UploadId'
+            ]
+            self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency)
+
+        for future in self._futures:
+            if future.done() and future.exception() is not None:
+                raise future.exception()
+
+        part_number = len(self._futures) + 1
+        # Blocks until an upload slot frees up, which bounds the number of buffered parts
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._upload_part, part_number, data)
+        except Exception:  # pylint: disable=broad-except
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    def _upload_part(self, part_number, data):
+        response = self._s3.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return {'ETag': response['ETag'], 'PartNumber': part_number}
+
+    def complete(self):
+        try:
+            if self._upload_id is None:
+                self._s3.put_object(
+                    Bucket=self._bucket, Key=self._key, Body=io.BytesIO(bytes(self._buffer))
+                )
+            else:
+                if self._buffer:
+                    self._submit_part(bytes(self._buffer))
+                parts = [future.result() for future in self._futures]
+                self._s3.complete_multipart_upload(
+                    Bucket=self._bucket,
+                    Key=self._key,
+                    UploadId=self._upload_id,
+                    MultipartUpload={'Parts': parts},
+                )
+        except Exception:  # pylint: disable=broad-except
+            self.abort()
+            raise
+        finally:
+            self._shutdown()
+
+    def abort(self):
+        if self._upload_id is not None:
+            for future in self._futures:
+                future.cancel()
+            self._shutdown()
+            self._s3.abort_multipart_upload(
+                Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+            )
+            self._upload_id = None
+        self._buffer = bytearray()
+
+    def _shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._buffer = bytearray()
+
+
+class _S3RangedReader(io.RawIOBase):
+    '''Seekable, readable file-like object over an S3 key.
+
+    Each read is served by a ranged ``get_object`` request, so wrapping this in an
+    ``io.BufferedReader`` streams the object in buffer-sized chunks rather than loading it whole.
+    '''
+
+    def __init__(self, s3, bucket, key, size):
+        super(_S3RangedReader, self).__init__()
+        self._s3 = s3
+        self._bucket = bucket
+        self._key = key
+        self._size = size
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            check.failed('Invalid whence {whence}'.format(whence=whence))
+        self._position = max(0, position)
+        return self._position
+
+    def readinto(self, b):
+        if self._position >= self._size or not len(b):
+            return 0
+
+        end = min(self._position + len(b), self._size) - 1
+        data = self._s3.get_object(
+            Bucket=self._bucket,
+            Key=self._key,
+            Range='bytes={start}-{end}'.format(start=self._position, end=end),
+        )['Body'].read()
+        b[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
 
 class S3ObjectStore(ObjectStore):
-    def __init__(self, bucket, s3_session=None):
+    '''Object store backed by an S3 bucket.
+
+    Objects are streamed to and from S3: writes pipe the serialization strategy's output into a
+    concurrent multipart upload, and reads deserialize directly from ranged ``get_object`` requests,
+    so neither path holds a full serialized copy of the object in memory.
+
+    Args:
+        bucket (str): The S3 bucket to use.
+        s3_session (Optional[Any]): A boto3 S3 client. Defaults to ``boto3.client('s3')``.
+        check_existing (Optional[bool]): Whether ``set_object`` should probe for and remove an
+            existing object at the key before writing. S3 replaces keys atomically on write, so
+            setting this to False saves two round-trips per write when the key is known not to
+            hold a prefix of other objects. (default: True)
+        multipart_chunksize (Optional[int]): The size in bytes of each uploaded part and of each
+            ranged read. Must be at least 5MiB. (default: 8MiB)
+        max_concurrency (Optional[int]): The maximum number of parts uploaded concurrently.
+            (default: 4)
+    '''
+
+    def __init__(
+        self,
+        bucket,
+        s3_session=None,
+        check_existing=True,
+        multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+    ):
         self.bucket = check.str_param(bucket, 'bucket')
+        self.check_existing = check.bool_param(check_existing, 'check_existing')
+        self.multipart_chunksize = check.int_param(multipart_chunksize, 'multipart_chunksize')
+        check.param_invariant(
+            self.multipart_chunksize >= S3_MIN_PART_SIZE,
+            'multipart_chunksize',
+            'S3 multipart uploads require parts of at least {size} bytes'.format(
+                size=S3_MIN_PART_SIZE
+            ),
+        )
+        self.max_concurrency = check.int_param(max_concurrency, 'max_concurrency')
+        check.param_invariant(self.max_concurrency > 0, 'max_concurrency')
         self.s3 = s3_session or boto3.client('s3')
         self.s3.head_bucket(Bucket=bucket)
         super(S3ObjectStore, self).__init__('s3', sep='/')
@@ -27,21 +232,31 @@ class S3ObjectStore(ObjectStore):
             serialization_strategy, 'serialization_strategy', SerializationStrategy
         )  # cannot be none here
 
-        if self.has_object(key):
+        if self.check_existing and self.has_object(key):
             logging.warning('Removing existing S3 key: {key}'.format(key=key))
             self.rm_object(key)
 
-        with BytesIO() as bytes_io:
+        writer = _S3MultipartWriter(
+            self.s3, self.bucket, key, self.multipart_chunksize, self.max_concurrency
+        )
+        try:
             if serialization_strategy.write_mode == 'w' and sys.version_info >= (3, 0):
-                with StringIO() as string_io:
-                    string_io = StringIO()
-                    serialization_strategy.serialize(obj, string_io)
-                    string_io.seek(0)
-                    bytes_io.write(string_io.read().encode('utf-8'))
+                text_io = io.TextIOWrapper(
+                    io.BufferedWriter(writer, buffer_size=self.multipart_chunksize),
+                    encoding=serialization_strategy.encoding,
+                    newline='',
+                )
+                try:
+                    serialization_strategy.serialize(obj, text_io)
+                finally:
+                    # Flush and release the wrappers without closing the underlying writer
+                    text_io.detach().detach()
             else:
-                serialization_strategy.serialize(obj, bytes_io)
-            bytes_io.seek(0)
-            self.s3.put_object(Bucket=self.bucket, Key=key, Body=bytes_io)
+                serialization_strategy.serialize(obj, writer)
+        except Exception:  # pylint: disable=broad-except
+            writer.abort()
+            raise
+        writer.complete()
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.SET_OBJECT,
@@ -60,15 +275,18 @@ class S3ObjectStore(ObjectStore):
         )  # cannot be none here
 
         # FIXME we need better error handling for object store
-        obj = serialization_strategy.deserialize(
-            BytesIO(self.s3.get_object(Bucket=self.bucket, Key=key)['Body'].read())
-            if serialization_strategy.read_mode == 'rb'
-            else StringIO(
-                self.s3.get_object(Bucket=self.bucket, Key=key)['Body']
-                .read()
-                .decode(serialization_strategy.encoding)
-            )
+        size = self.s3.head_object(Bucket=self.bucket, Key=key)['ContentLength']
+        read_io = io.BufferedReader(
+            _S3RangedReader(self.s3, self.bucket, key, size), buffer_size=self.multipart_chunksize,
         )
+        if serialization_strategy.read_mode != 'rb':
+            read_io = io.TextIOWrapper(
+                read_io, encoding=serialization_strategy.encoding, newline=''
+            )
+
+        with read_io:
+            obj = serialization_strategy.deserialize(read_io)
+
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.GET_OBJECT,
             key=self.uri_for_key(key),
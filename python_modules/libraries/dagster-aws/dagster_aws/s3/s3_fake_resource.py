@@ -1,4 +1,6 @@
+import hashlib
 import io
+import uuid
 from collections import defaultdict
 
 from botocore.exceptions import ClientError
@@ -9,6 +11,10 @@ def create_s3_fake_resource(buckets=None):
     return S3FakeSession(buckets=buckets)
 
 
+def _read_body(body):
+    return body if isinstance(body, bytes) else body.read()
+
+
 class S3FakeSession(object):
     '''Stateful mock of a boto3 s3 session for test.
 
@@ -19,6 +25,7 @@ class S3FakeSession(object):
         from dagster.seven import mock
 
         self.buckets = defaultdict(dict, buckets) if buckets else defaultdict(dict)
+        self.multipart_uploads = {}
         self.mock_extras = mock.MagicMock()
 
     def head_bucket(self, Bucket, *args, **kwargs):  # pylint: disable=unused-argument
@@ -38,15 +45,42 @@ class S3FakeSession(object):
 
     def put_object(self, Bucket, Key, Body, *args, **kwargs):
         self.mock_extras.put_object(*args, **kwargs)
-        self.buckets[Bucket][Key] = Body.read()
+        self.buckets[Bucket][Key] = _read_body(Body)
 
     def get_object(self, Bucket, Key, *args, **kwargs):
         if not self.has_object(Bucket, Key):
             raise ClientError({}, None)
 
         self.mock_extras.get_object(*args, **kwargs)
+        byte_range = kwargs.get('Range')
+        if byte_range:
+            start, end = byte_range[len('bytes=') :].split('-')
+            return {'Body': io.BytesIO(self.buckets[Bucket][Key][int(start) : int(end) + 1])}
         return {'Body': self._get_byte_stream(Bucket, Key)}
 
+    def create_multipart_upload(self, Bucket, Key, *args, **kwargs):
+        self.mock_extras.create_multipart_upload(*args, **kwargs)
+        upload_id = str(uuid.uuid4())
+        self.multipart_uploads[upload_id] = {'Bucket': Bucket, 'Key': Key, 'Parts': {}}
+        return {'UploadId': upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, *args, **kwargs):
+        self.mock_extras.upload_part(*args, **kwargs)
+        data = _read_body(Body)
+        self.multipart_uploads[UploadId]['Parts'][PartNumber] = data
+        return {'ETag': hashlib.md5(data).hexdigest()}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload, *args, **kwargs):
+        self.mock_extras.complete_multipart_upload(*args, **kwargs)
+        upload = self.multipart_uploads.pop(UploadId)
+        self.buckets[Bucket][Key] = b''.join(
+            upload['Parts'][part['PartNumber']] for part in MultipartUpload['Parts']
+        )
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId, *args, **kwargs):
+        self.mock_extras.abort_multipart_upload(*args, **kwargs)
+        self.multipart_uploads.pop(UploadId, None)
+
     def upload_fileobj(self, fileobj, bucket, key, *args, **kwargs):
         self.mock_extras.upload_fileobj(*args, **kwargs)
         self.buckets[bucket][key] = fileobj.read()
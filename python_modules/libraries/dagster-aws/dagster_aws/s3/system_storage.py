@@ -1,9 +1,10 @@
-from dagster import Field, String, SystemStorageData, system_storage
+from dagster import Bool, Field, Int, String, SystemStorageData, system_storage
 from dagster.core.storage.intermediates_manager import IntermediateStoreIntermediatesManager
 from dagster.core.storage.system_storage import fs_system_storage, mem_system_storage
 
 from .file_manager import S3FileManager
 from .intermediate_store import S3IntermediateStore
+from .object_store import DEFAULT_MAX_CONCURRENCY, DEFAULT_MULTIPART_CHUNKSIZE
 
 
 @system_storage(
@@ -12,6 +13,27 @@ from .intermediate_store import S3IntermediateStore
     config={
         's3_bucket': Field(String),
         's3_prefix': Field(String, is_required=False, default_value='dagster'),
+        'check_existing': Field(
+            Bool,
+            is_required=False,
+            default_value=True,
+            description='Whether to probe for and remove an existing object at the key of each '
+            'intermediate before writing it. S3 replaces keys atomically, so this can be turned '
+            'off to save two requests per step output.',
+        ),
+        'multipart_chunksize': Field(
+            Int,
+            is_required=False,
+            default_value=DEFAULT_MULTIPART_CHUNKSIZE,
+            description='The size in bytes of each uploaded part and each ranged read of an '
+            'intermediate. Must be at least 5MiB.',
+        ),
+        'max_concurrency': Field(
+            Int,
+            is_required=False,
+            default_value=DEFAULT_MAX_CONCURRENCY,
+            description='The maximum number of parts of an intermediate uploaded concurrently.',
+        ),
     },
     required_resource_keys={'s3'},
 )
@@ -47,6 +69,7 @@ def s3_system_storage(init_context):
             config:
               s3_bucket: my-cool-bucket
               s3_prefix: good/prefix-for-files-
+              check_existing: false
     '''
     s3_session = init_context.resources.s3
     s3_key = '{prefix}/storage/{run_id}/files'.format(
@@ -66,6 +89,9 @@ def s3_system_storage(init_context):
                 s3_prefix=init_context.system_storage_config['s3_prefix'],
                 run_id=init_context.pipeline_run.run_id,
                 type_storage_plugin_registry=init_context.type_storage_plugin_registry,
+                check_existing=init_context.system_storage_config['check_existing'],
+                multipart_chunksize=init_context.system_storage_config['multipart_chunksize'],
+                max_concurrency=init_context.system_storage_config['max_concurrency'],
             )
         ),
     )
@@ -0,0 +1,91 @@
+'''Times writing step outputs to the S3 intermediate store, with and without the existence check.
+
+Run with ``python -m dagster_aws_tests.benchmark_intermediate_store [num_outputs] [latency_ms]``.
+The step outputs are written through the intermediates manager of the s3 system storage to a fake
+S3 session that sleeps for ``latency_ms`` milliseconds on every request, standing in for the round
+trip to S3. The number of requests and the time taken per step output are reported.
+'''
+import sys
+import time
+
+from dagster_aws.s3 import S3IntermediateStore
+from dagster_aws.s3.s3_fake_resource import S3FakeSession
+
+from dagster.core.execution.plan.objects import StepOutputHandle
+from dagster.core.storage.intermediates_manager import IntermediateStoreIntermediatesManager
+from dagster.core.types.dagster_type import Int as RuntimeInt
+from dagster.core.utils import make_new_run_id
+from dagster.utils.test import yield_empty_pipeline_context
+
+S3_BUCKET = 'benchmark-bucket'
+
+REQUEST_METHODS = [
+    'head_bucket',
+    'head_object',
+    'list_objects_v2',
+    'put_object',
+    'get_object',
+    'create_multipart_upload',
+    'upload_part',
+    'complete_multipart_upload',
+    'abort_multipart_upload',
+]
+
+
+class LatentS3FakeSession(S3FakeSession):
+    '''Fake S3 session that sleeps on every request, and counts them.'''
+
+    def __init__(self, latency):
+        super(LatentS3FakeSession, self).__init__()
+        self.latency = latency
+        self.request_count = 0
+
+    def __getattribute__(self, name):
+        attr = super(LatentS3FakeSession, self).__getattribute__(name)
+        if name not in REQUEST_METHODS:
+            return attr
+
+        def request(*args, **kwargs):
+            self.request_count += 1
+            time.sleep(self.latency)
+            return attr(*args, **kwargs)
+
+        return request
+
+
+def time_writes(num_outputs, latency, check_existing):
+    s3_session = LatentS3FakeSession(latency)
+    run_id = make_new_run_id()
+    intermediates_manager = IntermediateStoreIntermediatesManager(
+        S3IntermediateStore(S3_BUCKET, run_id, s3_session=s3_session, check_existing=check_existing)
+    )
+    with yield_empty_pipeline_context(run_id=run_id) as context:
+        s3_session.request_count = 0
+        start = time.time()
+        for i in range(num_outputs):
+            intermediates_manager.set_intermediate(
+                context, RuntimeInt, StepOutputHandle('step_{i}.compute'.format(i=i)), i
+            )
+        elapsed = time.time() - start
+
+    return elapsed / num_outputs, float(s3_session.request_count) / num_outputs
+
+
+def main(num_outputs, latency_ms):
+    for check_existing in [True, False]:
+        elapsed, request_count = time_writes(num_outputs, latency_ms / 1000.0, check_existing)
+        print(
+            'check_existing={check_existing:<5} {request_count:.1f} requests and '
+            '{elapsed_ms:.1f}ms per step output'.format(
+                check_existing=str(check_existing),
+                request_count=request_count,
+                elapsed_ms=elapsed * 1000,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 20.0,
+    )
@@ -3,7 +3,12 @@ import os
 from collections import OrderedDict
 
 import pytest
-from dagster_aws.s3 import S3IntermediateStore, s3_plus_default_storage_defs, s3_resource
+from dagster_aws.s3 import (
+    S3IntermediateStore,
+    create_s3_fake_resource,
+    s3_plus_default_storage_defs,
+    s3_resource,
+)
 
 from dagster import (
     Bool,
@@ -13,6 +18,7 @@ from dagster import (
     ModeDefinition,
     OutputDefinition,
     PipelineRun,
+    ResourceDefinition,
     SerializationStrategy,
     String,
     check,
@@ -407,3 +413,62 @@ def test_custom_read_write_mode(s3_bucket):
 
     finally:
         intermediate_store.rm_object(context, ['data_frame'])
+
+
+def _list_requests_for_fake_s3_pipeline(s3_bucket, check_existing):
+    s3_session = create_s3_fake_resource()
+
+    @lambda_solid
+    def return_one():
+        return 1
+
+    @lambda_solid(input_defs=[InputDefinition('num', Int)], output_def=OutputDefinition(Int))
+    def add_one(num):
+        return num + 1
+
+    @pipeline(
+        mode_defs=[
+            ModeDefinition(
+                system_storage_defs=s3_plus_default_storage_defs,
+                resource_defs={'s3': ResourceDefinition.hardcoded_resource(s3_session)},
+            )
+        ]
+    )
+    def fake_s3_pipeline():
+        add_one(return_one())
+
+    result = execute_pipeline(
+        fake_s3_pipeline,
+        environment_dict={
+            'storage': {
+                's3': {'config': {'s3_bucket': s3_bucket, 'check_existing': check_existing}}
+            }
+        },
+    )
+    assert result.success
+    assert s3_session.mock_extras.put_object.call_count == 2
+    return s3_session.mock_extras.list_objects_v2.call_count
+
+
+def test_s3_storage_skips_existence_check(s3_bucket):
+    # with check_existing, each of the two step outputs is probed for by the intermediates manager
+    # and by the object store before it is written
+    assert (
+        _list_requests_for_fake_s3_pipeline(s3_bucket, check_existing=True)
+        - _list_requests_for_fake_s3_pipeline(s3_bucket, check_existing=False)
+        == 4
+    )
+
+
+def test_s3_intermediate_store_passes_object_store_options(s3_bucket):
+    intermediate_store = S3IntermediateStore(
+        run_id=make_new_run_id(),
+        s3_bucket=s3_bucket,
+        s3_session=create_s3_fake_resource(),
+        check_existing=False,
+        multipart_chunksize=16 * 1024 * 1024,
+        max_concurrency=2,
+    )
+    assert intermediate_store.object_store.check_existing is False
+    assert intermediate_store.object_store.multipart_chunksize == 16 * 1024 * 1024
+    assert intermediate_store.object_store.max_concurrency == 2
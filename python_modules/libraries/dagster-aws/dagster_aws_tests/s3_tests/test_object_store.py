@@ -1,8 +1,14 @@
+import os
+
 import boto3
-from dagster_aws.s3 import S3ObjectStore
+import pytest
+from dagster_aws.s3 import S3ObjectStore, create_s3_fake_resource
+from dagster_aws.s3.object_store import S3_MIN_PART_SIZE
 from moto import mock_s3
 
+from dagster.check import CheckError
 from dagster.core.storage.object_store import DEFAULT_SERIALIZATION_STRATEGY
+from dagster.core.types.marshal import SerializationStrategy
 
 
 @mock_s3
@@ -32,3 +38,110 @@ def test_s3_object_store(s3_bucket, caplog):
     assert s3_obj_store.uri_for_key(key) == 's3://{s3_bucket}/{key}'.format(
         s3_bucket=s3_bucket, key=key
     )
+
+
+class LinesSerializationStrategy(SerializationStrategy):
+    def __init__(self):
+        super(LinesSerializationStrategy, self).__init__('lines', read_mode='r', write_mode='w')
+
+    def serialize(self, value, write_file_obj):
+        for line in value:
+            write_file_obj.write(line + '\n')
+
+    def deserialize(self, read_file_obj):
+        return [line.rstrip('\n') for line in read_file_obj]
+
+
+class ExplodingSerializationStrategy(SerializationStrategy):
+    def __init__(self):
+        super(ExplodingSerializationStrategy, self).__init__('exploding')
+
+    def serialize(self, value, write_file_obj):
+        write_file_obj.write(value)
+        raise Exception('boom')
+
+    def deserialize(self, read_file_obj):
+        return read_file_obj.read()
+
+
+def test_s3_object_store_small_object_single_put(s3_bucket):
+    s3_session = create_s3_fake_resource()
+    s3_obj_store = S3ObjectStore(s3_bucket, s3_session=s3_session)
+
+    s3_obj_store.set_object('foo', {'a': 1}, DEFAULT_SERIALIZATION_STRATEGY)
+
+    assert s3_session.mock_extras.put_object.call_count == 1
+    assert s3_session.mock_extras.create_multipart_upload.call_count == 0
+    assert s3_obj_store.get_object('foo', DEFAULT_SERIALIZATION_STRATEGY).obj == {'a': 1}
+
+
+def test_s3_object_store_multipart_upload(s3_bucket):
+    s3_session = create_s3_fake_resource()
+    s3_obj_store = S3ObjectStore(
+        s3_bucket, s3_session=s3_session, multipart_chunksize=S3_MIN_PART_SIZE, max_concurrency=2
+    )
+
+    value = os.urandom(S3_MIN_PART_SIZE * 3 + 17)
+    s3_obj_store.set_object('foo', value, DEFAULT_SERIALIZATION_STRATEGY)
+
+    assert s3_session.mock_extras.put_object.call_count == 0
+    assert s3_session.mock_extras.create_multipart_upload.call_count == 1
+    assert s3_session.mock_extras.upload_part.call_count > 1
+    assert s3_session.mock_extras.complete_multipart_upload.call_count == 1
+    assert not s3_session.multipart_uploads
+
+    assert s3_obj_store.get_object('foo', DEFAULT_SERIALIZATION_STRATEGY).obj == value
+    # reads are served by ranged requests of at most one chunk each
+    assert s3_session.mock_extras.get_object.call_count > 1
+
+
+def test_s3_object_store_text_strategy(s3_bucket):
+    s3_session = create_s3_fake_resource()
+    s3_obj_store = S3ObjectStore(s3_bucket, s3_session=s3_session)
+
+    lines = ['foo', 'bar', u'bäz']
+    s3_obj_store.set_object('lines', lines, LinesSerializationStrategy())
+    assert s3_obj_store.get_object('lines', LinesSerializationStrategy()).obj == lines
+
+
+def test_s3_object_store_skip_existence_check(s3_bucket):
+    s3_session = create_s3_fake_resource()
+    s3_obj_store = S3ObjectStore(s3_bucket, s3_session=s3_session, check_existing=False)
+
+    s3_obj_store.set_object('foo', 1, DEFAULT_SERIALIZATION_STRATEGY)
+    s3_obj_store.set_object('foo', 2, DEFAULT_SERIALIZATION_STRATEGY)
+
+    assert s3_session.mock_extras.list_objects_v2.call_count == 0
+    assert s3_obj_store.get_object('foo', DEFAULT_SERIALIZATION_STRATEGY).obj == 2
+
+
+def test_s3_object_store_aborts_failed_upload(s3_bucket):
+    s3_session = create_s3_fake_resource()
+    s3_obj_store = S3ObjectStore(s3_bucket, s3_session=s3_session)
+
+    with pytest.raises(Exception, match='boom'):
+        s3_obj_store.set_object(
+            'foo', os.urandom(S3_MIN_PART_SIZE * 2), ExplodingSerializationStrategy()
+        )
+
+    assert s3_session.mock_extras.abort_multipart_upload.call_count == 1
+    assert not s3_session.multipart_uploads
+    assert not s3_session.has_object(s3_bucket, 'foo')
+
+
+def test_s3_object_store_rejects_small_chunksize(s3_bucket):
+    with pytest.raises(CheckError):
+        S3ObjectStore(
+            s3_bucket, s3_session=create_s3_fake_resource(), multipart_chunksize=1024 * 1024
+        )
+
+
+@mock_s3
+def test_s3_object_store_multipart_round_trip(s3_bucket):
+    s3 = boto3.client('s3')
+    s3.create_bucket(Bucket=s3_bucket)
+
+    s3_obj_store = S3ObjectStore(s3_bucket)
+    value = os.urandom(S3_MIN_PART_SIZE * 2 + 1)
+    s3_obj_store.set_object('foo', value, DEFAULT_SERIALIZATION_STRATEGY)
+    assert s3_obj_store.get_object('foo', DEFAULT_SERIALIZATION_STRATEGY).obj == value
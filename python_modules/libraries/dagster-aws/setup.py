@@ -41,6 +41,7 @@ def _do_setup(name='dagster-aws'):
         install_requires=[
             'boto3>=1.9',
             'dagster',
+            'futures; python_version < "3"',
             'psycopg2-binary',
             'requests',
             'terminaltables',
@@ -1,16 +1,27 @@
 from dagster.core.utils import check_dagster_package_version
 
+from .chunked import DataFrameChunks
 from .constraints import RowCountConstraint, StrictColumnsConstraint
 from .data_frame import DataFrame, create_dagster_pandas_dataframe_type
-from .validation import PandasColumn
+from .serialization import (
+    ArrowSerializationStrategy,
+    NumpySerializationStrategy,
+    ParquetSerializationStrategy,
+)
+from .validation import DataFrameValidator, PandasColumn
 from .version import __version__
 
 check_dagster_package_version('dagster-pandas', __version__)
 
 __all__ = [
     'DataFrame',
+    'DataFrameChunks',
     'create_dagster_pandas_dataframe_type',
     'PandasColumn',
+    'DataFrameValidator',
     'RowCountConstraint',
     'StrictColumnsConstraint',
+    'ArrowSerializationStrategy',
+    'NumpySerializationStrategy',
+    'ParquetSerializationStrategy',
 ]
@@ -0,0 +1,404 @@
+import operator
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from dagster import (
+    Any,
+    DagsterInvariantViolationError,
+    Enum,
+    EnumValue,
+    Field,
+    Int,
+    Materialization,
+    String,
+    check,
+    usable_as_dagster_type,
+)
+from dagster.config.field_utils import Selector
+from dagster.core.types.config_schema import input_selector_schema, output_selector_schema
+
+DEFAULT_CHUNK_SIZE = 100000
+
+_FILTER_OPS = {
+    '=': operator.eq,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda column, value: column.isin(value),
+    'not in': lambda column, value: ~column.isin(value),
+}
+
+FILTER_OP = Enum(name='PandasFilterOp', enum_values=[EnumValue(op) for op in sorted(_FILTER_OPS)])
+
+FILTERS_CONFIG = Field(
+    [{'column': String, 'op': FILTER_OP, 'value': Any}],
+    is_required=False,
+    description='Only rows matching all of these predicates are read.',
+)
+
+COLUMNS_CONFIG = Field([String], is_required=False, description='The columns to read.')
+
+
+def filters_from_config(filters_config):
+    '''Converts filters from config into the ``(column, op, value)`` tuples used by pyarrow.'''
+    return [
+        (filter_config['column'], filter_config['op'], filter_config['value'])
+        for filter_config in check.opt_list_param(filters_config, 'filters_config', of_type=dict)
+    ]
+
+
+def _check_filters(filters):
+    filters = check.opt_list_param(filters, 'filters', of_type=tuple)
+    for filter_ in filters:
+        check.param_invariant(
+            len(filter_) == 3 and filter_[1] in _FILTER_OPS,
+            'filters',
+            'Filters must be (column, op, value) tuples with op one of {ops}. Got {filter_}'.format(
+                ops=sorted(_FILTER_OPS), filter_=filter_
+            ),
+        )
+    return filters
+
+
+def columns_to_read(columns, filters):
+    '''The columns to read in order to project onto ``columns`` after applying ``filters``.'''
+    if columns is None:
+        return None
+
+    return columns + [
+        column
+        for column in sorted({column for column, _op, _value in filters})
+        if column not in columns
+    ]
+
+
+def filter_dataframe(dataframe, filters, columns=None):
+    '''Selects the rows of a dataframe matching all of the filters, then the given columns.
+
+    As with pyarrow, missing values never match a filter.
+    '''
+    check.inst_param(dataframe, 'dataframe', pd.DataFrame)
+    filters = _check_filters(filters)
+    check.opt_list_param(columns, 'columns', of_type=str)
+
+    if filters:
+        mask = np.ones(len(dataframe), dtype=bool)
+        for column, op, value in filters:
+            series = dataframe[column]
+            mask &= np.asarray(_FILTER_OPS[op](series, value), dtype=bool)
+            mask &= series.notnull().values
+        if not mask.all():
+            dataframe = dataframe[mask]
+
+    if columns is not None and list(dataframe.columns) != columns:
+        dataframe = dataframe[columns]
+
+    return dataframe
+
+
+def _row_group_may_match(row_group_metadata, filters):
+    column_statistics = {}
+    for i in range(row_group_metadata.num_columns):
+        column_metadata = row_group_metadata.column(i)
+        column_statistics[column_metadata.path_in_schema] = column_metadata.statistics
+
+    for column, op, value in filters:
+        statistics = column_statistics.get(column)
+        if statistics is None or not statistics.has_min_max:
+            continue
+
+        low, high = statistics.min, statistics.max
+        try:
+            if op in ('=', '==') and (value < low or value > high):
+                return False
+            if op == '<' and low >= value:
+                return False
+            if op == '<=' and low > value:
+                return False
+            if op == '>' and high <= value:
+                return False
+            if op == '>=' and high < value:
+                return False
+            if op == 'in' and all(item < low or item > high for item in value):
+                return False
+        except TypeError:
+            # The statistics are not comparable with the filter value, e.g. for timestamps
+            continue
+
+    return True
+
+
+def _import_pyarrow_parquet():
+    try:
+        import pyarrow.parquet  # pylint: disable=import-error
+    except ImportError:
+        raise ImportError(
+            'pyarrow is required to read and write Parquet files in chunks. Install it with '
+            '`pip install dagster-pandas[pyarrow]`.'
+        )
+    return pyarrow.parquet
+
+
+def _iter_csv(path, chunksize, sep, columns, filters):
+    for chunk in pd.read_csv(
+        path, sep=sep, chunksize=chunksize, usecols=columns_to_read(columns, filters)
+    ):
+        yield filter_dataframe(chunk, filters, columns)
+
+
+def _iter_parquet(path, columns, filters):
+    parquet = _import_pyarrow_parquet()
+    parquet_file = parquet.ParquetFile(path)
+    read_columns = columns_to_read(columns, filters)
+    for i in range(parquet_file.num_row_groups):
+        if filters and not _row_group_may_match(parquet_file.metadata.row_group(i), filters):
+            continue
+        chunk = parquet_file.read_row_group(i, columns=read_columns).to_pandas()
+        yield filter_dataframe(chunk, filters, columns)
+
+
+def _iter_frames(frames):
+    for frame in frames:
+        yield frame
+
+
+def _iter_slices(dataframe, chunksize):
+    # An empty dataframe still yields one chunk, so that its columns are written
+    for start in range(0, max(len(dataframe), 1), chunksize):
+        yield dataframe.iloc[start : start + chunksize]
+
+
+def _iter_mapped(chunks, fn):
+    for chunk in chunks:
+        yield fn(chunk)
+
+
+@output_selector_schema(
+    Selector(
+        {
+            'csv': {'path': String, 'sep': Field(String, is_required=False, default_value=','),},
+            'parquet': {'path': String},
+            'table': {'path': String},
+        },
+    )
+)
+def dataframe_chunks_output_schema(_context, file_type, file_options, chunks):
+    check.str_param(file_type, 'file_type')
+    check.dict_param(file_options, 'file_options')
+    check.inst_param(chunks, 'chunks', DataFrameChunks)
+
+    path = file_options['path']
+    if file_type == 'csv':
+        chunks.write_csv(path, sep=file_options['sep'])
+    elif file_type == 'parquet':
+        chunks.write_parquet(path)
+    elif file_type == 'table':
+        chunks.write_csv(path, sep='\t')
+    else:
+        check.failed('Unsupported file_type {file_type}'.format(file_type=file_type))
+
+    return Materialization.file(path)
+
+
+@input_selector_schema(
+    Selector(
+        {
+            'csv': {
+                'path': String,
+                'sep': Field(String, is_required=False, default_value=','),
+                'chunksize': Field(Int, is_required=False, default_value=DEFAULT_CHUNK_SIZE),
+                'columns': COLUMNS_CONFIG,
+                'filters': FILTERS_CONFIG,
+            },
+            'parquet': {'path': String, 'columns': COLUMNS_CONFIG, 'filters': FILTERS_CONFIG},
+            'table': {
+                'path': String,
+                'chunksize': Field(Int, is_required=False, default_value=DEFAULT_CHUNK_SIZE),
+                'columns': COLUMNS_CONFIG,
+                'filters': FILTERS_CONFIG,
+            },
+        },
+    )
+)
+def dataframe_chunks_input_schema(_context, file_type, file_options):
+    check.str_param(file_type, 'file_type')
+    check.dict_param(file_options, 'file_options')
+
+    path = file_options['path']
+    columns = file_options.get('columns')
+    filters = filters_from_config(file_options.get('filters'))
+    if file_type == 'csv':
+        return DataFrameChunks.read_csv(
+            path,
+            chunksize=file_options['chunksize'],
+            sep=file_options['sep'],
+            columns=columns,
+            filters=filters,
+        )
+    elif file_type == 'parquet':
+        return DataFrameChunks.read_parquet(path, columns=columns, filters=filters)
+    elif file_type == 'table':
+        return DataFrameChunks.read_csv(
+            path, chunksize=file_options['chunksize'], sep='\t', columns=columns, filters=filters
+        )
+    else:
+        raise DagsterInvariantViolationError(
+            'Unsupported file_type {file_type}'.format(file_type=file_type)
+        )
+
+
+@usable_as_dagster_type(
+    name='PandasDataFrameChunks',
+    description='''A pandas DataFrame that is read, transformed and written one chunk at a time,
+    so that only a bounded number of rows are held in memory.''',
+    input_hydration_config=dataframe_chunks_input_schema,
+    output_materialization_config=dataframe_chunks_output_schema,
+)
+class DataFrameChunks(object):
+    '''A lazily evaluated sequence of pandas DataFrames that together make up one dataset.
+
+    Chunks are produced anew each time the object is iterated over, so memory use is bounded by the
+    size of a chunk rather than the size of the dataset. When configured as a solid input, CSV files
+    are read ``chunksize`` rows at a time and Parquet files one row group at a time. Column
+    projection and filters are applied to each chunk as it is read. Parquet row groups whose
+    statistics show that no row can match the filters are skipped without being read.
+
+    Values of this type are pickled as the recipe for producing their chunks rather than the chunks
+    themselves, so functions passed to :py:meth:`map` must be picklable in order to use a persistent
+    intermediate store.
+
+    Args:
+        chunks_fn (Callable[[], Iterator[pandas.DataFrame]]): Produces the chunks.
+    '''
+
+    def __init__(self, chunks_fn):
+        self._chunks_fn = check.callable_param(chunks_fn, 'chunks_fn')
+
+    def __iter__(self):
+        for chunk in self._chunks_fn():
+            if not isinstance(chunk, pd.DataFrame):
+                raise DagsterInvariantViolationError(
+                    'DataFrameChunks must produce pandas DataFrames, got {type_name}'.format(
+                        type_name=type(chunk).__name__
+                    )
+                )
+            yield chunk
+
+    @staticmethod
+    def from_frames(frames):
+        '''Wraps an already materialized list of DataFrames.'''
+        return DataFrameChunks(
+            partial(_iter_frames, check.list_param(frames, 'frames', of_type=pd.DataFrame))
+        )
+
+    @staticmethod
+    def from_frame(dataframe, chunksize):
+        '''Lazily slices a DataFrame into chunks of ``chunksize`` rows.'''
+        return DataFrameChunks(
+            partial(
+                _iter_slices,
+                check.inst_param(dataframe, 'dataframe', pd.DataFrame),
+                check.int_param(chunksize, 'chunksize'),
+            )
+        )
+
+    @staticmethod
+    def read_csv(path, chunksize=DEFAULT_CHUNK_SIZE, sep=',', columns=None, filters=None):
+        '''Reads a CSV file ``chunksize`` rows at a time.
+
+        Args:
+            path (str): The file to read.
+            chunksize (int): The number of rows to parse at a time.
+            sep (str): The field delimiter.
+            columns (Optional[List[str]]): The columns to read. Defaults to all of them.
+            filters (Optional[List[Tuple[str, str, Any]]]): ``(column, op, value)`` predicates that
+                rows must all match. Only the rows of each chunk that match are kept.
+        '''
+        return DataFrameChunks(
+            partial(
+                _iter_csv,
+                check.str_param(path, 'path'),
+                check.int_param(chunksize, 'chunksize'),
+                check.str_param(sep, 'sep'),
+                check.opt_nullable_list_param(columns, 'columns', of_type=str),
+                _check_filters(filters),
+            )
+        )
+
+    @staticmethod
+    def read_parquet(path, columns=None, filters=None):
+        '''Reads a Parquet file one row group at a time. Requires ``pyarrow``.
+
+        Args:
+            path (str): The file to read.
+            columns (Optional[List[str]]): The columns to read. Defaults to all of them.
+            filters (Optional[List[Tuple[str, str, Any]]]): ``(column, op, value)`` predicates that
+                rows must all match. Row groups whose statistics rule out any match are skipped.
+        '''
+        return DataFrameChunks(
+            partial(
+                _iter_parquet,
+                check.str_param(path, 'path'),
+                check.opt_nullable_list_param(columns, 'columns', of_type=str),
+                _check_filters(filters),
+            )
+        )
+
+    def map(self, fn):
+        '''Lazily applies a function to each chunk.
+
+        Args:
+            fn (Callable[[pandas.DataFrame], pandas.DataFrame]): The function to apply.
+        '''
+        return DataFrameChunks(partial(_iter_mapped, self, check.callable_param(fn, 'fn')))
+
+    def to_frame(self):
+        '''Concatenates all of the chunks into a single DataFrame.'''
+        chunks = list(self)
+        if not chunks:
+            return pd.DataFrame()
+        return pd.concat(chunks, ignore_index=True)
+
+    def write_csv(self, path, sep=','):
+        '''Writes the chunks to a CSV file one at a time.'''
+        check.str_param(path, 'path')
+        check.str_param(sep, 'sep')
+
+        header = True
+        with open(path, 'w') as fd:
+            for chunk in self:
+                chunk.to_csv(fd, sep=sep, index=False, header=header)
+                header = False
+
+    def write_parquet(self, path):
+        '''Writes each chunk as a row group of a Parquet file. Requires ``pyarrow``.
+
+        All chunks must have the schema of the first one.
+        '''
+        check.str_param(path, 'path')
+        parquet = _import_pyarrow_parquet()
+        import pyarrow  # pylint: disable=import-error
+
+        writer = None
+        try:
+            for chunk in self:
+                if writer is None:
+                    table = pyarrow.Table.from_pandas(chunk, preserve_index=False)
+                    writer = parquet.ParquetWriter(path, table.schema)
+                else:
+                    table = pyarrow.Table.from_pandas(
+                        chunk, schema=writer.schema, preserve_index=False
+                    )
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is None:
+            # Without any chunks there is no schema to write
+            pd.DataFrame().to_parquet(path, engine='pyarrow')
@@ -1,9 +1,14 @@
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
 from pandas import DataFrame
 
 from dagster import check
 
+# The number of offending rows shown in the message of a ColumnConstraintViolationException
+MAX_REPORTED_OFFENDING_ROWS = 20
+
 
 class ConstraintViolationException(Exception):
     '''Indicates that a constraint has been violated.'''
@@ -27,22 +32,116 @@ class ColumnConstraintViolationException(ConstraintViolationException):
         self.constraint_name = constraint_name
         self.constraint_description = constraint_description
         self.column_name = column_name
-        self.offending_rows = offending_rows
+        self._offending_rows = offending_rows
         super(ColumnConstraintViolationException, self).__init__(self.construct_message())
 
+    @property
+    def offending_rows(self):
+        '''The rows that violate the constraint: a DataFrame, or a list of (index, value) pairs for
+        NonNullableColumnConstraint. They are selected from the dataframe when first accessed.'''
+        if isinstance(self._offending_rows, OffendingRows):
+            return self._offending_rows.value
+        return self._offending_rows
+
     def construct_message(self):
         base_message = "Violated {constraint_name} ({constraint_description}) for Column Name ({column_name}) ".format(
             constraint_name=self.constraint_name,
             constraint_description=self.constraint_description,
             column_name=self.column_name,
         )
-        if self.offending_rows is not None:
+        if self._offending_rows is not None:
             base_message += "The offending (index, row values) are the following: {}".format(
-                self.offending_rows
+                self._offending_rows
             )
         return base_message
 
 
+class OffendingRows(object):
+    '''The rows of a dataframe that violate a column constraint.
+
+    Rows are only selected from the dataframe when they are accessed, and the string form of this
+    object shows at most ``MAX_REPORTED_OFFENDING_ROWS`` of them.
+
+    Args:
+        dataframe (DataFrame): The validated dataframe.
+        mask (numpy.ndarray): A boolean array marking the offending rows by position.
+        column_name (Optional[str]): If set, the rows are given as (index, value) pairs of this
+            column by ``value``.
+    '''
+
+    def __init__(self, dataframe, mask, column_name=None):
+        self._dataframe = check.inst_param(dataframe, 'dataframe', DataFrame)
+        self._mask = check.inst_param(mask, 'mask', np.ndarray)
+        self._column_name = check.opt_str_param(column_name, 'column_name')
+        self._rows = None
+
+    def __len__(self):
+        return int(np.count_nonzero(self._mask))
+
+    def head(self, n):
+        return self._dataframe.iloc[np.flatnonzero(self._mask)[:n]]
+
+    @property
+    def dataframe(self):
+        if self._rows is None:
+            self._rows = self._dataframe[self._mask]
+        return self._rows
+
+    @property
+    def value(self):
+        '''The rows as ``ColumnConstraintViolationException.offending_rows`` gives them.'''
+        if self._column_name is None:
+            return self.dataframe
+        return list(zip(self.dataframe.index.tolist(), self.dataframe[self._column_name].tolist()))
+
+    def for_column(self, column_name):
+        return OffendingRows(self._dataframe, self._mask, column_name)
+
+    def __str__(self):
+        count = len(self)
+        message = str(self.head(MAX_REPORTED_OFFENDING_ROWS))
+        if count > MAX_REPORTED_OFFENDING_ROWS:
+            message += '\n({count} offending rows in total)'.format(count=count)
+        return message
+
+
+class ColumnValues(object):
+    '''The values of a column being validated.
+
+    Arrays derived from the values are computed when they are first used and then shared between
+    the constraints that use them.
+
+    Args:
+        series (Series): The column's values.
+        factorize (Optional[bool]): Whether a constraint will factorize the values. Default: False.
+    '''
+
+    def __init__(self, series, factorize=False):
+        self.series = check.inst_param(series, 'series', pd.Series)
+        self._factorize = check.bool_param(factorize, 'factorize')
+        self._null_mask = None
+        self._factorized = None
+
+    @property
+    def null_mask(self):
+        '''A boolean array marking the missing values.'''
+        if self._null_mask is None:
+            if self._factorize and self.series.dtype == object:
+                # For object columns, factorizing is about as expensive as finding missing values,
+                # so when the codes are needed anyway they also give the missing values
+                self._null_mask = self.factorized[0] == -1
+            else:
+                self._null_mask = self.series.isnull().values
+        return self._null_mask
+
+    @property
+    def factorized(self):
+        '''The result of ``pandas.factorize`` for the values. Missing values have code -1.'''
+        if self._factorized is None:
+            self._factorized = pd.factorize(self.series)
+        return self._factorized
+
+
 class Constraint(object):
     '''
     Base constraint object that all constraints inherit from.
@@ -166,18 +265,49 @@ class ColumnConstraint(Constraint):
     '''
     Base constraint object that represent dataframe column shape constraints.
 
+    Constraints that check each value of a column can set ``vectorized`` and implement
+    ``invalid_mask`` instead of ``validate``, which lets validation evaluate them together with the
+    column's other constraints. Those that only depend on the row being checked can also set
+    ``row_wise``, which allows them to be evaluated on chunks of a column, and those that use
+    ``ColumnValues.factorized`` should set ``factorizes``.
+
     Args:
         error_description (Optional[str]): The plain string description that is output in the terminal if the constraint fails.
         markdown_description (Optional[str]): A markdown supported description that is emitted by dagit if the constraint fails.
     '''
 
+    vectorized = False
+    row_wise = False
+    factorizes = False
+
     def __init__(self, error_description=None, markdown_description=None):
         super(ColumnConstraint, self).__init__(
             error_description=error_description, markdown_description=markdown_description
         )
 
     def validate(self, dataframe, column_name):
-        pass
+        if not self.vectorized:
+            return
+
+        invalid = self.invalid_mask(ColumnValues(dataframe[column_name], self.factorizes))
+        if invalid.any():
+            raise self.violation(column_name, OffendingRows(dataframe, invalid))
+
+    def invalid_mask(self, values):
+        '''Returns a boolean array marking the values of the column that violate the constraint.
+
+        Args:
+            values (ColumnValues): The values to check.
+        '''
+        raise NotImplementedError()
+
+    def violation(self, column_name, offending_rows):
+        return ColumnConstraintViolationException(
+            constraint_name=self.name,
+            constraint_description=self.error_description,
+            column_name=column_name,
+            offending_rows=offending_rows,
+        )
 
     @staticmethod
     def get_offending_row_pairs(dataframe, column_name):
@@ -248,21 +378,23 @@ class NonNullableColumnConstraint(ColumnConstraint):
     A column constraint that ensures all values in a pandas column are not null.
     '''
 
+    vectorized = True
+    row_wise = True
+
     def __init__(self):
         description = "No Null values allowed."
         super(NonNullableColumnConstraint, self).__init__(
             error_description=description, markdown_description=description
         )
 
-    def validate(self, dataframe, column_name):
-        rows_with_null_columns = dataframe[dataframe[column_name].isna()]
-        if not rows_with_null_columns.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=self.get_offending_row_pairs(rows_with_null_columns, column_name),
-            )
+    def invalid_mask(self, values):
+        return values.null_mask
+
+    def violation(self, column_name, offending_rows):
+        # The offending rows of missing values are reported as (index, value) pairs
+        return super(NonNullableColumnConstraint, self).violation(
+            column_name, offending_rows.for_column(column_name)
+        )
 
 
 class UniqueColumnConstraint(ColumnConstraint):
@@ -273,6 +405,9 @@ class UniqueColumnConstraint(ColumnConstraint):
         ignore_missing_vals (bool): If true, this constraint will enforce the constraint on non missing values.
     '''
 
+    vectorized = True
+    row_wise = False
+
     def __init__(self, ignore_missing_vals):
         description = "Column must be unique."
         self.ignore_missing_vals = check.bool_param(ignore_missing_vals, 'ignore_missing_vals')
@@ -280,18 +415,11 @@ class UniqueColumnConstraint(ColumnConstraint):
             error_description=description, markdown_description=description
         )
 
-    def validate(self, dataframe, column_name):
-        invalid = dataframe[column_name].duplicated()
+    def invalid_mask(self, values):
+        invalid = values.series.duplicated().values
         if self.ignore_missing_vals:
-            invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        rows_with_duplicated_values = dataframe[invalid]
-        if not rows_with_duplicated_values.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=rows_with_duplicated_values,
-            )
+            invalid &= ~values.null_mask
+        return invalid
 
 
 class CategoricalColumnConstraint(ColumnConstraint):
@@ -303,6 +431,10 @@ class CategoricalColumnConstraint(ColumnConstraint):
         ignore_missing_vals (bool): If true, this constraint will enforce the constraint on non missing values.
     '''
 
+    vectorized = True
+    row_wise = True
+    factorizes = True
+
     def __init__(self, categories, ignore_missing_vals):
         self.categories = list(check.set_param(categories, 'categories', of_type=str))
         self.ignore_missing_vals = check.bool_param(ignore_missing_vals, 'ignore_missing_vals')
@@ -311,18 +443,14 @@ class CategoricalColumnConstraint(ColumnConstraint):
             markdown_description="Category examples are {}...".format(self.categories[:5]),
         )
 
-    def validate(self, dataframe, column_name):
-        invalid = ~dataframe[column_name].isin(self.categories)
+    def invalid_mask(self, values):
+        codes, uniques = values.factorized
+        # Missing values have code -1, which selects the appended False
+        is_category = np.append(np.asarray(pd.Index(uniques).isin(self.categories)), False)
+        invalid = ~is_category[codes]
         if self.ignore_missing_vals:
-            invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        rows_with_unexpected_buckets = dataframe[invalid]
-        if not rows_with_unexpected_buckets.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=rows_with_unexpected_buckets,
-            )
+            invalid &= ~values.null_mask
+        return invalid
 
 
 class MinValueColumnConstraint(ColumnConstraint):
@@ -335,6 +463,9 @@ class MinValueColumnConstraint(ColumnConstraint):
         ignore_missing_vals (bool): If true, this constraint will enforce the constraint on non missing values.
     '''
 
+    vectorized = True
+    row_wise = True
+
     def __init__(self, min_value, ignore_missing_vals):
         self.min_value = check.inst_param(min_value, 'min_value', (int, float, datetime))
         self.ignore_missing_vals = check.bool_param(ignore_missing_vals, 'ignore_missing_vals')
@@ -343,18 +474,11 @@ class MinValueColumnConstraint(ColumnConstraint):
             error_description="Column must have values > {}".format(self.min_value),
         )
 
-    def validate(self, dataframe, column_name):
-        invalid = dataframe[column_name] < self.min_value
+    def invalid_mask(self, values):
+        invalid = (values.series < self.min_value).values
         if self.ignore_missing_vals:
-            invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        out_of_bounds_rows = dataframe[invalid]
-        if not out_of_bounds_rows.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+            invalid &= ~values.null_mask
+        return invalid
 
 
 class MaxValueColumnConstraint(ColumnConstraint):
@@ -367,6 +491,9 @@ class MaxValueColumnConstraint(ColumnConstraint):
         ignore_missing_vals (bool): If true, this constraint will enforce the constraint on non missing values.
     '''
 
+    vectorized = True
+    row_wise = True
+
     def __init__(self, max_value, ignore_missing_vals):
         self.max_value = check.inst_param(max_value, 'max_value', (int, float, datetime))
         self.ignore_missing_vals = check.bool_param(ignore_missing_vals, 'ignore_missing_vals')
@@ -375,18 +502,11 @@ class MaxValueColumnConstraint(ColumnConstraint):
             error_description="Column must have values < {}".format(self.max_value),
         )
 
-    def validate(self, dataframe, column_name):
-        invalid = dataframe[column_name] > self.max_value
+    def invalid_mask(self, values):
+        invalid = (values.series > self.max_value).values
         if self.ignore_missing_vals:
-            invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        out_of_bounds_rows = dataframe[invalid]
-        if not out_of_bounds_rows.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+            invalid &= ~values.null_mask
+        return invalid
 
 
 class InRangeColumnConstraint(ColumnConstraint):
@@ -399,6 +519,9 @@ class InRangeColumnConstraint(ColumnConstraint):
         ignore_missing_vals (bool): If true, this constraint will enforce the constraint on non missing values.
     '''
 
+    vectorized = True
+    row_wise = True
+
     def __init__(self, min_value, max_value, ignore_missing_vals):
         self.min_value = check.inst_param(min_value, 'min_value', (int, float, datetime))
         self.max_value = check.inst_param(max_value, 'max_value', (int, float, datetime))
@@ -410,15 +533,12 @@ class InRangeColumnConstraint(ColumnConstraint):
             ),
         )
 
-    def validate(self, dataframe, column_name):
-        invalid = ~dataframe[column_name].between(self.min_value, self.max_value)
+    def invalid_mask(self, values):
+        if self.min_value == -float('inf') and self.max_value == float('inf'):
+            # Only missing values can fall outside of an unbounded range
+            invalid = values.null_mask.copy()
+        else:
+            invalid = ~values.series.between(self.min_value, self.max_value).values
         if self.ignore_missing_vals:
-            invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        out_of_bounds_rows = dataframe[invalid]
-        if not out_of_bounds_rows.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+            invalid &= ~values.null_mask
+        return invalid
@@ -1,16 +1,25 @@
 import pandas as pd
+from dagster_pandas.chunked import (
+    COLUMNS_CONFIG,
+    FILTERS_CONFIG,
+    DataFrameChunks,
+    columns_to_read,
+    filter_dataframe,
+    filters_from_config,
+)
 from dagster_pandas.constraints import (
     ColumnDTypeFnConstraint,
     ColumnDTypeInSetConstraint,
     ConstraintViolationException,
 )
-from dagster_pandas.validation import PandasColumn, validate_constraints
+from dagster_pandas.validation import DataFrameValidator, PandasColumn
 
 from dagster import (
     DagsterInvariantViolationError,
     DagsterType,
     EventMetadataEntry,
     Field,
+    Int,
     Materialization,
     String,
     TypeCheck,
@@ -30,7 +39,19 @@ def dict_without_keys(ddict, *keys):
     Selector(
         {
             'csv': {'path': String, 'sep': Field(String, is_required=False, default_value=','),},
-            'parquet': {'path': String},
+            'parquet': {
+                'path': String,
+                'row_group_size': Field(
+                    Int,
+                    is_required=False,
+                    description=(
+                        'The maximum number of rows in each row group. Smaller row groups let '
+                        'readers of the file skip more data when filtering or reading in chunks. '
+                        'When set, the dataframe is converted and written one row group at a '
+                        'time, rather than all at once.'
+                    ),
+                ),
+            },
             'table': {'path': String},
         },
     )
@@ -44,7 +65,12 @@ def dataframe_output_schema(_context, file_type, file_options, pandas_df):
         path = file_options['path']
         pandas_df.to_csv(path, index=False, **dict_without_keys(file_options, 'path'))
     elif file_type == 'parquet':
-        pandas_df.to_parquet(file_options['path'])
+        if file_options.get('row_group_size'):
+            DataFrameChunks.from_frame(pandas_df, file_options['row_group_size']).write_parquet(
+                file_options['path']
+            )
+        else:
+            pandas_df.to_parquet(file_options['path'])
     elif file_type == 'table':
         pandas_df.to_csv(file_options['path'], sep='\t', index=False)
     else:
@@ -56,9 +82,14 @@ def dataframe_output_schema(_context, file_type, file_options, pandas_df):
 @input_selector_schema(
     Selector(
         {
-            'csv': {'path': String, 'sep': Field(String, is_required=False, default_value=','),},
-            'parquet': {'path': String},
-            'table': {'path': String},
+            'csv': {
+                'path': String,
+                'sep': Field(String, is_required=False, default_value=','),
+                'columns': COLUMNS_CONFIG,
+                'filters': FILTERS_CONFIG,
+            },
+            'parquet': {'path': String, 'columns': COLUMNS_CONFIG, 'filters': FILTERS_CONFIG},
+            'table': {'path': String, 'columns': COLUMNS_CONFIG, 'filters': FILTERS_CONFIG},
         },
     )
 )
@@ -66,13 +97,23 @@ def dataframe_input_schema(_context, file_type, file_options):
     check.str_param(file_type, 'file_type')
     check.dict_param(file_options, 'file_options')
 
+    path = file_options['path']
+    columns = file_options.get('columns')
+    filters = filters_from_config(file_options.get('filters'))
+    read_columns = columns_to_read(columns, filters)
+
     if file_type == 'csv':
-        path = file_options['path']
-        return pd.read_csv(path, **dict_without_keys(file_options, 'path'))
+        return filter_dataframe(
+            pd.read_csv(path, sep=file_options['sep'], usecols=read_columns), filters, columns
+        )
     elif file_type == 'parquet':
-        return pd.read_parquet(file_options['path'])
+        kwargs = {'columns': read_columns}
+        if filters:
+            # Lets the parquet engine skip row groups, the rows themselves are filtered below
+            kwargs['filters'] = filters
+        return filter_dataframe(pd.read_parquet(path, **kwargs), filters, columns)
     elif file_type == 'table':
-        return pd.read_csv(file_options['path'], sep='\t')
+        return filter_dataframe(pd.read_csv(path, sep='\t', usecols=read_columns), filters, columns)
     else:
         raise DagsterInvariantViolationError(
             'Unsupported file_type {file_type}'.format(file_type=file_type)
@@ -150,6 +191,10 @@ def create_dagster_pandas_dataframe_type(
     dataframe_constraints=None,
     input_hydration_config=None,
     output_materialization_config=None,
+    serialization_strategy=None,
+    validation_sample_size=None,
+    validation_chunk_size=None,
+    validation_sample_seed=0,
 ):
     """
     Constructs a custom pandas dataframe dagster type.
@@ -169,6 +214,18 @@ def create_dagster_pandas_dataframe_type(
         output_materialization_config (Optional[OutputMaterializationConfig]): An instance of a class
             that inherits from :py:class:`~dagster.OutputMaterializationConfig`. If None, we will
             default to using the `dataframe_output_schema` output_materialization_config.
+        serialization_strategy (Optional[SerializationStrategy]): An instance of a class that
+            inherits from :py:class:`~dagster.SerializationStrategy`, used to store intermediate
+            values of this type. :py:class:`~dagster_pandas.ParquetSerializationStrategy` and
+            :py:class:`~dagster_pandas.ArrowSerializationStrategy` are typically much faster than
+            the default pickle-based strategy for large dataframes.
+        validation_sample_size (Optional[int]): If set, the values of dataframes with more rows
+            than this are only checked against column constraints on a random sample of this many
+            rows. See :py:class:`~dagster_pandas.DataFrameValidator`.
+        validation_chunk_size (Optional[int]): If set, the values of dataframes are checked against
+            column constraints this many rows at a time.
+        validation_sample_seed (Optional[int]): The seed of the sample taken when
+            ``validation_sample_size`` is set. Default: 0.
     """
     # We allow for the plugging in of input_hydration_config/output_materialization_configs so that
     # Users can hydrate and persist their custom dataframes via configuration their own way if the default
@@ -180,6 +237,14 @@ def create_dagster_pandas_dataframe_type(
         check.opt_list_param(columns, 'columns', of_type=PandasColumn),
     )
 
+    validator = DataFrameValidator(
+        pandas_columns=columns,
+        dataframe_constraints=dataframe_constraints,
+        sample_size=validation_sample_size,
+        chunk_size=validation_chunk_size,
+        sample_seed=validation_sample_seed,
+    )
+
     def _dagster_type_check(_, value):
         if not isinstance(value, pd.DataFrame):
             return TypeCheck(
@@ -190,9 +255,7 @@ def create_dagster_pandas_dataframe_type(
             )
 
         try:
-            validate_constraints(
-                value, pandas_columns=columns, dataframe_constraints=dataframe_constraints
-            )
+            validator.validate(value)
         except ConstraintViolationException as e:
             return TypeCheck(success=False, description=str(e))
 
@@ -213,6 +276,7 @@ def create_dagster_pandas_dataframe_type(
         if output_materialization_config
         else dataframe_output_schema,
         description=description,
+        serialization_strategy=serialization_strategy,
     )
 
 
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+
+from dagster import SerializationStrategy, check
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow  # pylint: disable=import-error
+    except ImportError:
+        raise ImportError(
+            'pyarrow is required for Arrow and Parquet serialization. Install it with '
+            '`pip install dagster-pandas[pyarrow]`.'
+        )
+    return pyarrow
+
+
+class ParquetSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Serializes pandas DataFrames as Parquet.
+
+    Parquet is columnar and compressed, so intermediates are typically much smaller than their
+    pickled equivalent. Requires ``pyarrow``.
+    '''
+
+    def __init__(self, name='parquet', compression='snappy'):
+        self._compression = check.opt_str_param(compression, 'compression')
+        super(ParquetSerializationStrategy, self).__init__(name)
+
+    def serialize(self, value, write_file_obj):
+        check.inst_param(value, 'value', pd.DataFrame)
+        _import_pyarrow()
+        value.to_parquet(write_file_obj, engine='pyarrow', compression=self._compression)
+
+    def deserialize(self, read_file_obj):
+        _import_pyarrow()
+        return pd.read_parquet(read_file_obj, engine='pyarrow')
+
+
+class ArrowSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Serializes pandas DataFrames in the Arrow IPC file format.
+
+    The Arrow format is uncompressed and laid out as it is in memory, so writing and reading it is
+    close to a memory copy. When read from the filesystem the file is memory-mapped rather than read
+    into a separate buffer first, but converting the Arrow table to a DataFrame still copies its
+    data into memory: reads are not zero-copy. Requires ``pyarrow``.
+    '''
+
+    def __init__(self, name='arrow'):
+        super(ArrowSerializationStrategy, self).__init__(name)
+
+    def serialize(self, value, write_file_obj):
+        check.inst_param(value, 'value', pd.DataFrame)
+        pyarrow = _import_pyarrow()
+        table = pyarrow.Table.from_pandas(value)
+        writer = pyarrow.ipc.new_file(write_file_obj, table.schema)
+        writer.write_table(table)
+        writer.close()
+
+    def deserialize(self, read_file_obj):
+        pyarrow = _import_pyarrow()
+        return pyarrow.ipc.open_file(read_file_obj).read_all().to_pandas()
+
+    def deserialize_from_file(self, read_path):
+        check.str_param(read_path, 'read_path')
+        pyarrow = _import_pyarrow()
+        with pyarrow.memory_map(read_path, 'r') as source:
+            return pyarrow.ipc.open_file(source).read_all().to_pandas()
+
+
+class NumpySerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Serializes NumPy arrays in the ``.npy`` format.
+
+    When read from the filesystem, arrays are memory-mapped using ``mmap_mode`` instead of being
+    read into memory. The default, ``'c'`` (copy-on-write), lets downstream solids modify the array
+    without affecting the stored intermediate. With ``mmap_mode='r'`` arrays are read-only, and the
+    filesystem object store shares a single mapping between all readers in a process. Pass
+    ``mmap_mode=None`` to always load arrays fully.
+
+    Object arrays are not supported, since the ``.npy`` format would have to pickle them.
+    '''
+
+    def __init__(self, name='npy', mmap_mode='c'):
+        self._mmap_mode = check.opt_str_param(mmap_mode, 'mmap_mode')
+        check.param_invariant(
+            self._mmap_mode in (None, 'r', 'c'),
+            'mmap_mode',
+            'mmap_mode must be one of None, \'r\' or \'c\'',
+        )
+        super(NumpySerializationStrategy, self).__init__(name)
+
+    @property
+    def read_only_values(self):
+        return self._mmap_mode == 'r'
+
+    def serialize(self, value, write_file_obj):
+        check.inst_param(value, 'value', np.ndarray)
+        np.save(write_file_obj, value, allow_pickle=False)
+
+    def deserialize(self, read_file_obj):
+        return np.load(read_file_obj, allow_pickle=False)
+
+    def deserialize_from_file(self, read_path):
+        check.str_param(read_path, 'read_path')
+        return np.load(read_path, mmap_mode=self._mmap_mode, allow_pickle=False)
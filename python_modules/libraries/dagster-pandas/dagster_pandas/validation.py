@@ -1,12 +1,15 @@
 from dagster_pandas.constraints import (
     CategoricalColumnConstraint,
+    ColumnConstraint,
     ColumnDTypeFnConstraint,
     ColumnDTypeInSetConstraint,
+    ColumnValues,
     Constraint,
     ConstraintViolationException,
     DataFrameConstraint,
     InRangeColumnConstraint,
     NonNullableColumnConstraint,
+    OffendingRows,
     UniqueColumnConstraint,
 )
 from pandas import DataFrame, Timestamp
@@ -58,17 +61,7 @@ class PandasColumn:
         self.constraints = check.opt_list_param(constraints, 'constraints', of_type=Constraint)
 
     def validate(self, dataframe):
-        if self.name not in dataframe.columns:
-            # Ignore validation if column is missing from dataframe and is optional
-            if not self.is_optional:
-                raise ConstraintViolationException(
-                    "Required column {column_name} not in dataframe with columns {dataframe_columns}".format(
-                        column_name=self.name, dataframe_columns=dataframe.columns
-                    )
-                )
-        else:
-            for constraint in self.constraints:
-                constraint.validate(dataframe, self.name)
+        _ColumnValidator(self).validate(dataframe, dataframe, chunk_size=None)
 
     @staticmethod
     def exists(
@@ -359,19 +352,149 @@ class PandasColumn:
         )
 
 
-def validate_constraints(dataframe, pandas_columns=None, dataframe_constraints=None):
-    dataframe = check.inst_param(dataframe, 'dataframe', DataFrame)
-    pandas_columns = check.opt_list_param(
-        pandas_columns, 'column_constraints', of_type=PandasColumn
-    )
-    dataframe_constraints = check.opt_list_param(
-        dataframe_constraints, 'dataframe_constraints', of_type=DataFrameConstraint
-    )
+class _ColumnValidator(object):
+    def __init__(self, pandas_column):
+        self.name = pandas_column.name
+        self.is_optional = pandas_column.is_optional
+
+        # Constraints that don't check individual values, e.g. dtype constraints, are checked first
+        self.constraints = [
+            constraint
+            for constraint in pandas_column.constraints
+            if not (isinstance(constraint, ColumnConstraint) and constraint.vectorized)
+        ]
+        vectorized = [
+            constraint
+            for constraint in pandas_column.constraints
+            if isinstance(constraint, ColumnConstraint) and constraint.vectorized
+        ]
+        self.row_wise_constraints = [constraint for constraint in vectorized if constraint.row_wise]
+        self.column_wise_constraints = [
+            constraint for constraint in vectorized if not constraint.row_wise
+        ]
+        self.factorize = any(constraint.factorizes for constraint in vectorized)
+
+    def validate(self, dataframe, rows, chunk_size):
+        if self.name not in dataframe.columns:
+            # Ignore validation if column is missing from dataframe and is optional
+            if not self.is_optional:
+                raise ConstraintViolationException(
+                    "Required column {column_name} not in dataframe with columns {dataframe_columns}".format(
+                        column_name=self.name, dataframe_columns=dataframe.columns
+                    )
+                )
+            return
+
+        for constraint in self.constraints:
+            constraint.validate(dataframe, self.name)
+
+        if not (self.row_wise_constraints or self.column_wise_constraints):
+            return
+
+        column = rows[self.name]
+        if chunk_size is None or chunk_size >= len(rows):
+            self._check(
+                self.row_wise_constraints + self.column_wise_constraints,
+                rows,
+                ColumnValues(column, self.factorize),
+            )
+            return
+
+        for start in range(0, len(rows), chunk_size):
+            stop = start + chunk_size
+            self._check(
+                self.row_wise_constraints,
+                rows.iloc[start:stop],
+                ColumnValues(column.iloc[start:stop], self.factorize),
+            )
+
+        self._check(self.column_wise_constraints, rows, ColumnValues(column, self.factorize))
+
+    def _check(self, constraints, rows, values):
+        for constraint in constraints:
+            invalid = constraint.invalid_mask(values)
+            if invalid.any():
+                raise constraint.violation(self.name, OffendingRows(rows, invalid))
+
+
+class DataFrameValidator(object):
+    '''Validates dataframes against a set of column and dataframe constraints.
+
+    The constraints are organized by column once, when the validator is constructed. For each
+    column, constraints that don't check individual values, such as dtype constraints, are checked
+    first. Then the constraints that do are evaluated on the column's values, sharing the column's
+    missing value mask, until one of them is violated. Only then are offending rows selected from
+    the dataframe, and only as many as are reported.
+
+    Args:
+        pandas_columns (Optional[List[PandasColumn]]): The column constraints to validate.
+        dataframe_constraints (Optional[List[DataFrameConstraint]]): The dataframe constraints to
+            validate.
+        sample_size (Optional[int]): If set, the values of dataframes with more rows than this are
+            only checked on a random sample of this many rows. Dtype and dataframe constraints are
+            still checked on the whole dataframe. Uniqueness is only checked within the sample.
+        sample_seed (Optional[int]): The seed of the random sample, so that validating the same
+            dataframe always checks the same rows. Default: 0.
+        chunk_size (Optional[int]): If set, values are checked in chunks of this many rows at a
+            time, which bounds the memory used for temporary masks. Uniqueness is still checked
+            across the whole column.
+    '''
+
+    def __init__(
+        self,
+        pandas_columns=None,
+        dataframe_constraints=None,
+        sample_size=None,
+        chunk_size=None,
+        sample_seed=0,
+    ):
+        pandas_columns = check.opt_list_param(
+            pandas_columns, 'pandas_columns', of_type=PandasColumn
+        )
+        self._columns = [_ColumnValidator(pandas_column) for pandas_column in pandas_columns]
+        self._dataframe_constraints = check.opt_list_param(
+            dataframe_constraints, 'dataframe_constraints', of_type=DataFrameConstraint
+        )
+        self._sample_size = check.opt_int_param(sample_size, 'sample_size')
+        self._chunk_size = check.opt_int_param(chunk_size, 'chunk_size')
+        self._sample_seed = check.int_param(sample_seed, 'sample_seed')
+        check.param_invariant(
+            self._sample_size is None or self._sample_size > 0, 'sample_size', 'must be positive'
+        )
+        check.param_invariant(
+            self._chunk_size is None or self._chunk_size > 0, 'chunk_size', 'must be positive'
+        )
+
+    def validate(self, dataframe):
+        check.inst_param(dataframe, 'dataframe', DataFrame)
+
+        rows = (
+            dataframe.sample(n=self._sample_size, random_state=self._sample_seed)
+            if self._sample_size is not None and len(dataframe) > self._sample_size
+            else dataframe
+        )
 
-    if pandas_columns:
-        for column in pandas_columns:
-            column.validate(dataframe)
+        for column in self._columns:
+            column.validate(dataframe, rows, self._chunk_size)
 
-    if dataframe_constraints:
-        for dataframe_constraint in dataframe_constraints:
+        for dataframe_constraint in self._dataframe_constraints:
             dataframe_constraint.validate(dataframe)
+
+
+def validate_constraints(
+    dataframe,
+    pandas_columns=None,
+    dataframe_constraints=None,
+    sample_size=None,
+    chunk_size=None,
+    sample_seed=0,
+):
+    '''Validates a dataframe against column and dataframe constraints. See
+    :py:class:`DataFrameValidator`.'''
+    DataFrameValidator(
+        pandas_columns=pandas_columns,
+        dataframe_constraints=dataframe_constraints,
+        sample_size=sample_size,
+        chunk_size=chunk_size,
+        sample_seed=sample_seed,
+    ).validate(dataframe)
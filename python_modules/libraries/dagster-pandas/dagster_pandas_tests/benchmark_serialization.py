@@ -0,0 +1,136 @@
+'''Times writing and reading a large intermediate through the filesystem object store with each
+serialization strategy, and measures the peak memory each takes.
+
+Run with ``python -m dagster_pandas_tests.benchmark_serialization [num_rows] [num_reads]``. The
+DataFrame has ``num_rows`` rows of ten float columns, and the array the same shape. Each case runs
+in a fresh process, so that the peak resident memory of the process (``ru_maxrss``) measures that
+case alone: it is reported in excess of the memory taken by the value itself. Reads are repeated
+``num_reads`` times. The Parquet and Arrow cases require pyarrow, and the pickle protocol 5 cases
+Python 3.8 or later.
+'''
+import multiprocessing
+import os
+import pickle
+import resource
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from dagster_pandas import (
+    ArrowSerializationStrategy,
+    NumpySerializationStrategy,
+    ParquetSerializationStrategy,
+)
+
+from dagster import seven
+from dagster.core.storage.object_store import FilesystemObjectStore
+from dagster.core.types.marshal import (
+    PickleProtocol5SerializationStrategy,
+    PickleSerializationStrategy,
+)
+
+NUM_COLUMNS = 10
+
+
+def _has_pyarrow():
+    try:
+        import pyarrow  # pylint: disable=unused-import
+    except ImportError:
+        return False
+    return True
+
+
+def define_cases():
+    cases = [('dataframe', 'pickle', PickleSerializationStrategy)]
+    if pickle.HIGHEST_PROTOCOL >= 5:
+        cases.append(('dataframe', 'pickle5', PickleProtocol5SerializationStrategy))
+    if _has_pyarrow():
+        cases.append(('dataframe', 'parquet', ParquetSerializationStrategy))
+        cases.append(('dataframe', 'arrow', ArrowSerializationStrategy))
+
+    cases.append(('ndarray', 'pickle', PickleSerializationStrategy))
+    if pickle.HIGHEST_PROTOCOL >= 5:
+        cases.append(('ndarray', 'pickle5', PickleProtocol5SerializationStrategy))
+    cases.append(('ndarray', 'npy', NumpySerializationStrategy))
+    return cases
+
+
+def define_value(kind, num_rows):
+    array = np.random.RandomState(0).random_sample((num_rows, NUM_COLUMNS))
+    if kind == 'ndarray':
+        return array
+    return pd.DataFrame(array, columns=['column_{i}'.format(i=i) for i in range(NUM_COLUMNS)])
+
+
+def _max_rss_bytes():
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def run_case(kind, strategy_class, num_rows, num_reads, results):
+    value = define_value(kind, num_rows)
+    object_store = FilesystemObjectStore()
+    strategy = strategy_class()
+
+    with seven.TemporaryDirectory() as temp_dir:
+        key = os.path.join(temp_dir, 'value')
+
+        baseline = _max_rss_bytes()
+        start = time.time()
+        object_store.set_object(key, value, strategy)
+        write_elapsed = time.time() - start
+        write_peak = _max_rss_bytes() - baseline
+        size = os.path.getsize(key)
+
+        # Drop the value, so that the peak of the reads is measured against the same baseline
+        del value
+        start = time.time()
+        for _ in range(num_reads):
+            read_value = object_store.get_object(key, strategy).obj
+            # Touch the data, so that memory-mapped values are paged in as they would be when used
+            float(read_value.sum().sum() if kind == 'dataframe' else read_value.sum())
+            del read_value
+        read_elapsed = (time.time() - start) / num_reads
+        read_peak = _max_rss_bytes() - baseline
+
+    results.put((write_elapsed, write_peak, read_elapsed, read_peak, size))
+
+
+def main(num_rows, num_reads):
+    value_size = num_rows * NUM_COLUMNS * 8
+    print(
+        'Values of {num_rows} rows of {num_columns} float columns, {size:.0f}MB in memory'.format(
+            num_rows=num_rows, num_columns=NUM_COLUMNS, size=value_size / 1e6
+        )
+    )
+
+    for kind, label, strategy_class in define_cases():
+        results = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=run_case, args=(kind, strategy_class, num_rows, num_reads, results)
+        )
+        process.start()
+        write_elapsed, write_peak, read_elapsed, read_peak, size = results.get()
+        process.join()
+
+        print(
+            '{kind:<10} {label:<8} {size:>7.1f}MB on disk, write {write_rate:>7.0f}MB/s peak '
+            '+{write_peak:>6.1f}MB, read {read_rate:>7.0f}MB/s peak +{read_peak:>6.1f}MB'.format(
+                kind=kind,
+                label=label,
+                size=size / 1e6,
+                write_rate=value_size / 1e6 / write_elapsed,
+                write_peak=write_peak / 1e6,
+                read_rate=value_size / 1e6 / read_elapsed,
+                read_peak=read_peak / 1e6,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 3,
+    )
@@ -0,0 +1,87 @@
+'''Times validating a large dataframe against column constraints.
+
+Run with ``python -m dagster_pandas_tests.benchmark_validation [num_rows] [repeats]``. The
+dataframe has an integer, a float, a string and a categorical column, each with its default
+constraints and with range, categorical and uniqueness checks. It is validated by a
+DataFrameValidator as a whole, in chunks of a fifth of its rows, and on a sample of a fiftieth of
+its rows. For comparison, it is also validated one constraint at a time, with each constraint
+computing its own masks, as constraints used to be checked. The best of ``repeats`` runs is
+reported.
+'''
+import sys
+import time
+
+import numpy as np
+from dagster_pandas.validation import DataFrameValidator, PandasColumn
+from pandas import DataFrame
+
+CATEGORIES = ['a', 'b', 'c', 'd']
+
+
+def define_dataframe(num_rows):
+    random_state = np.random.RandomState(0)
+    return DataFrame(
+        {
+            'id': np.arange(num_rows),
+            'value': random_state.random_sample(num_rows),
+            'name': ['name_{i}'.format(i=i % 1000) for i in range(num_rows)],
+            'category': random_state.choice(CATEGORIES, num_rows),
+        }
+    )
+
+
+def define_columns(num_rows):
+    return [
+        PandasColumn.integer_column(
+            'id', min_value=0, max_value=num_rows, non_nullable=True, unique=True
+        ),
+        PandasColumn.float_column('value', min_value=0.0, max_value=1.0, non_nullable=True),
+        PandasColumn.string_column('name', non_nullable=True),
+        PandasColumn.categorical_column('category', categories=set(CATEGORIES)),
+    ]
+
+
+def validate_each_constraint(dataframe, columns):
+    for column in columns:
+        for constraint in column.constraints:
+            constraint.validate(dataframe, column.name)
+
+
+def best_time(fn, dataframe, repeats):
+    elapsed = []
+    for _ in range(repeats):
+        start = time.time()
+        fn(dataframe)
+        elapsed.append(time.time() - start)
+    return min(elapsed)
+
+
+def main(num_rows, repeats):
+    dataframe = define_dataframe(num_rows)
+    columns = define_columns(num_rows)
+
+    for label, fn in [
+        ('each constraint', lambda dataframe: validate_each_constraint(dataframe, columns)),
+        ('validator', DataFrameValidator(pandas_columns=columns).validate),
+        (
+            'fifth chunks',
+            DataFrameValidator(pandas_columns=columns, chunk_size=num_rows // 5).validate,
+        ),
+        (
+            'fiftieth sample',
+            DataFrameValidator(pandas_columns=columns, sample_size=num_rows // 50).validate,
+        ),
+    ]:
+        elapsed = best_time(fn, dataframe, repeats)
+        print(
+            '{label:<16} {num_rows} rows in {elapsed:.3f}s'.format(
+                label=label, num_rows=num_rows, elapsed=elapsed
+            )
+        )
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 5000000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 7,
+    )
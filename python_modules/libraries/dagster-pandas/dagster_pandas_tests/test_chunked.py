@@ -0,0 +1,133 @@
+import pandas as pd
+import pytest
+from dagster_pandas import DataFrame, DataFrameChunks
+
+from dagster import InputDefinition, OutputDefinition, execute_pipeline, pipeline, solid
+from dagster.utils import file_relative_path
+from dagster.utils.test import get_temp_file_name
+
+
+def _numbers(count):
+    return pd.DataFrame({'num': list(range(count)), 'square': [i * i for i in range(count)]})
+
+
+def test_read_csv_in_chunks():
+    with get_temp_file_name() as path:
+        _numbers(25).to_csv(path, index=False)
+
+        chunks = list(DataFrameChunks.read_csv(path, chunksize=10))
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+
+        chunks = DataFrameChunks.read_csv(
+            path, chunksize=10, columns=['square'], filters=[('num', '>=', 15)]
+        )
+        # Chunks without matching rows are kept, so that the columns are known
+        assert [len(chunk) for chunk in chunks] == [0, 5, 5]
+        assert chunks.to_frame().to_dict('list') == {'square': [i * i for i in range(15, 25)]}
+
+
+def test_read_parquet_skips_row_groups():
+    pytest.importorskip('pyarrow')
+
+    with get_temp_file_name() as path:
+        _numbers(100).to_parquet(path, engine='pyarrow', row_group_size=10)
+
+        assert [len(chunk) for chunk in DataFrameChunks.read_parquet(path)] == [10] * 10
+
+        chunks = list(
+            DataFrameChunks.read_parquet(path, columns=['square'], filters=[('num', '>', 85)])
+        )
+        # Only the last two row groups can contain matching rows
+        assert [len(chunk) for chunk in chunks] == [4, 10]
+        assert list(chunks[0].columns) == ['square']
+
+        chunks = list(DataFrameChunks.read_parquet(path, filters=[('num', 'in', [3, 57])]))
+        assert [chunk['num'].tolist() for chunk in chunks] == [[3], [57]]
+
+
+def test_map_and_write():
+    pytest.importorskip('pyarrow')
+
+    chunks = DataFrameChunks.from_frames([_numbers(3), _numbers(2)]).map(
+        lambda chunk: chunk.assign(cube=chunk['num'] * chunk['square'])
+    )
+
+    with get_temp_file_name() as path:
+        chunks.write_csv(path)
+        assert pd.read_csv(path)['cube'].tolist() == [0, 1, 8, 0, 1]
+
+    with get_temp_file_name() as path:
+        chunks.write_parquet(path)
+        assert pd.read_parquet(path)['cube'].tolist() == [0, 1, 8, 0, 1]
+
+
+def test_chunks_from_config():
+    @solid(
+        input_defs=[InputDefinition('chunks', DataFrameChunks)],
+        output_defs=[OutputDefinition(DataFrameChunks)],
+    )
+    def double(_, chunks):
+        return chunks.map(lambda chunk: chunk * 2)
+
+    @pipeline
+    def chunks_pipeline():
+        double()
+
+    with get_temp_file_name() as path:
+        result = execute_pipeline(
+            chunks_pipeline,
+            {
+                'solids': {
+                    'double': {
+                        'inputs': {
+                            'chunks': {
+                                'csv': {
+                                    'path': file_relative_path(__file__, 'num.csv'),
+                                    'chunksize': 1,
+                                }
+                            }
+                        },
+                        'outputs': [{'result': {'csv': {'path': path}}}],
+                    }
+                }
+            },
+        )
+        assert result.success
+        assert pd.read_csv(path).to_dict('list') == {'num1': [2, 6], 'num2': [4, 8]}
+
+
+def test_parquet_row_group_size_materialization():
+    pytest.importorskip('pyarrow')
+
+    @solid(output_defs=[OutputDefinition(DataFrame)])
+    def return_df(_):
+        return _numbers(30)
+
+    @pipeline
+    def return_df_pipeline():
+        return_df()
+
+    with get_temp_file_name() as path:
+        result = execute_pipeline(
+            return_df_pipeline,
+            {
+                'solids': {
+                    'return_df': {
+                        'outputs': [{'result': {'parquet': {'path': path, 'row_group_size': 10}}}]
+                    }
+                }
+            },
+        )
+        assert result.success
+        assert [len(chunk) for chunk in DataFrameChunks.read_parquet(path)] == [10, 10, 10]
+        assert pd.read_parquet(path).equals(_numbers(30))
+
+
+def test_from_frame():
+    pytest.importorskip('pyarrow')
+
+    assert [len(chunk) for chunk in DataFrameChunks.from_frame(_numbers(25), 10)] == [10, 10, 5]
+
+    with get_temp_file_name() as path:
+        DataFrameChunks.from_frame(_numbers(0), 10).write_parquet(path)
+        assert list(pd.read_parquet(path).columns) == ['num', 'square']
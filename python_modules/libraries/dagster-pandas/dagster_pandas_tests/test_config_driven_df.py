@@ -213,6 +213,81 @@ def test_dataframe_parquet_from_inputs():
     assert called['yup']
 
 
+@pytest.mark.parametrize(
+    'file_type,file_name',
+    [('csv', 'num.csv'), ('parquet', 'num.parquet'), ('table', 'num_table.txt')],
+)
+def test_dataframe_projection_and_filters_from_inputs(file_type, file_name):
+    if file_type == 'parquet':
+        check_parquet_support()
+
+    called = {}
+
+    @solid(input_defs=[InputDefinition('df', DataFrame)])
+    def df_as_config(_context, df):
+        assert df.to_dict('list') == {'num2': [4]}
+        called['yup'] = True
+
+    @pipeline
+    def test_pipeline():
+        df_as_config()
+
+    result = execute_pipeline(
+        test_pipeline,
+        {
+            'solids': {
+                'df_as_config': {
+                    'inputs': {
+                        'df': {
+                            file_type: {
+                                'path': file_relative_path(__file__, file_name),
+                                'columns': ['num2'],
+                                'filters': [{'column': 'num1', 'op': '>', 'value': 1}],
+                            }
+                        }
+                    }
+                }
+            }
+        },
+    )
+
+    assert result.success
+    assert called['yup']
+
+
+def test_dataframe_filter_op_from_inputs():
+    @solid(input_defs=[InputDefinition('df', DataFrame)])
+    def df_as_config(_context, df):  # pylint: disable=W0613
+        pass
+
+    @pipeline
+    def test_pipeline():
+        df_as_config()
+
+    with pytest.raises(DagsterInvalidConfigError) as exc_info:
+        execute_pipeline(
+            test_pipeline,
+            {
+                'solids': {
+                    'df_as_config': {
+                        'inputs': {
+                            'df': {
+                                'csv': {
+                                    'path': file_relative_path(__file__, 'num.csv'),
+                                    'filters': [{'column': 'num1', 'op': 'gt', 'value': 1}],
+                                }
+                            }
+                        }
+                    }
+                }
+            },
+        )
+
+    assert 'Value at path root:solids:df_as_config:inputs:df:csv:filters[0]:op not in enum' in str(
+        exc_info.value
+    )
+
+
 def test_dataframe_table_from_inputs():
     called = {}
 
@@ -0,0 +1,118 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+from dagster_pandas import (
+    ArrowSerializationStrategy,
+    NumpySerializationStrategy,
+    ParquetSerializationStrategy,
+    create_dagster_pandas_dataframe_type,
+)
+
+from dagster import InputDefinition, OutputDefinition, execute_pipeline, pipeline, solid
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.intermediate_store import build_fs_intermediate_store
+from dagster.core.types.dagster_type import create_any_type
+from dagster.core.utils import make_new_run_id
+from dagster.utils import safe_tempfile_path
+
+
+def _test_df():
+    return pd.DataFrame({'num': [1, 2, 3], 'name': ['a', 'b', 'c'], 'value': [0.5, 1.5, None]})
+
+
+@pytest.mark.parametrize(
+    'serialization_strategy', [ParquetSerializationStrategy(), ArrowSerializationStrategy()]
+)
+def test_dataframe_serialization_strategies(serialization_strategy):
+    df = _test_df()
+
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(df, tempfile_path)
+        pd.testing.assert_frame_equal(
+            serialization_strategy.deserialize_from_file(tempfile_path), df
+        )
+
+    buffer = io.BytesIO()
+    serialization_strategy.serialize(df, buffer)
+    buffer.seek(0)
+    pd.testing.assert_frame_equal(serialization_strategy.deserialize(buffer), df)
+
+
+def test_numpy_serialization_strategy():
+    array = np.arange(100, dtype='int64').reshape(10, 10)
+    serialization_strategy = NumpySerializationStrategy()
+
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(array, tempfile_path)
+        loaded = serialization_strategy.deserialize_from_file(tempfile_path)
+        assert isinstance(loaded, np.memmap)
+        assert np.array_equal(loaded, array)
+
+        # copy-on-write maps can be modified without touching the stored value
+        loaded[0, 0] = 100
+        assert serialization_strategy.deserialize_from_file(tempfile_path)[0, 0] == 0
+
+        unmapped = NumpySerializationStrategy(mmap_mode=None).deserialize_from_file(tempfile_path)
+        assert not isinstance(unmapped, np.memmap)
+        assert np.array_equal(unmapped, array)
+
+
+def test_read_only_numpy_intermediates_are_shared():
+    NumpyArray = create_any_type(
+        'ReadOnlyNumpyArray', serialization_strategy=NumpySerializationStrategy(mmap_mode='r')
+    )
+    instance = DagsterInstance.ephemeral()
+    run_id = make_new_run_id()
+    intermediate_store = build_fs_intermediate_store(
+        instance.intermediates_directory, run_id=run_id
+    )
+
+    intermediate_store.set_object(np.arange(10), None, NumpyArray, ['array'])
+    first = intermediate_store.get_object(None, NumpyArray, ['array']).obj
+    second = intermediate_store.get_object(None, NumpyArray, ['array']).obj
+    assert first is second
+    assert not first.flags.writeable
+
+
+def test_numpy_serialization_strategy_rejects_object_arrays():
+    with safe_tempfile_path() as tempfile_path:
+        with pytest.raises(ValueError):
+            NumpySerializationStrategy().serialize_to_file(
+                np.array([{}, []], dtype=object), tempfile_path
+            )
+
+
+def test_dataframe_type_with_serialization_strategy():
+    ParquetDataFrame = create_dagster_pandas_dataframe_type(
+        name='ParquetDataFrame', serialization_strategy=ParquetSerializationStrategy()
+    )
+
+    @solid(output_defs=[OutputDefinition(ParquetDataFrame)])
+    def make_df(_):
+        return _test_df()
+
+    @solid(input_defs=[InputDefinition('df', ParquetDataFrame)])
+    def count_rows(_, df):
+        return len(df)
+
+    @pipeline
+    def parquet_pipeline():
+        count_rows(make_df())
+
+    instance = DagsterInstance.ephemeral()
+    result = execute_pipeline(
+        parquet_pipeline, environment_dict={'storage': {'filesystem': {}}}, instance=instance
+    )
+    assert result.success
+    assert result.result_for_solid('count_rows').output_value() == 3
+
+    intermediate_store = build_fs_intermediate_store(
+        instance.intermediates_directory, run_id=result.run_id
+    )
+    stored = intermediate_store.get_object(
+        None, ParquetDataFrame, ['intermediates', 'make_df.compute', 'result']
+    )
+    assert stored.serialization_strategy_name == 'parquet'
+    pd.testing.assert_frame_equal(stored.obj, _test_df())
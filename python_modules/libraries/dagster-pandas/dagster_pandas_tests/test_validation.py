@@ -1,6 +1,7 @@
 import pytest
 from dagster_pandas.constraints import (
     CategoricalColumnConstraint,
+    ColumnConstraintViolationException,
     ColumnDTypeFnConstraint,
     ColumnDTypeInSetConstraint,
     ConstraintViolationException,
@@ -9,7 +10,7 @@ from dagster_pandas.constraints import (
     RowCountConstraint,
     UniqueColumnConstraint,
 )
-from dagster_pandas.validation import PandasColumn, validate_constraints
+from dagster_pandas.validation import DataFrameValidator, PandasColumn, validate_constraints
 from pandas import DataFrame
 
 
@@ -145,3 +146,91 @@ def test_datetime_column_composition(composer, composer_args, expected_constrain
     for constraint in ignore_column.constraints:
         if hasattr(constraint, 'ignore_missing_vals'):
             assert constraint.ignore_missing_vals
+
+
+def test_validator_reports_first_violation_lazily():
+    validator = DataFrameValidator(
+        pandas_columns=[PandasColumn.integer_column('foo', min_value=0, max_value=10, unique=True),]
+    )
+    assert validator.validate(DataFrame({'foo': list(range(10))})) is None
+
+    with pytest.raises(ColumnConstraintViolationException) as exc_info:
+        validator.validate(DataFrame({'foo': list(range(100))}))
+
+    exc = exc_info.value
+    assert exc.constraint_name == 'InRangeColumnConstraint'
+    assert len(exc.offending_rows) == 89
+    assert isinstance(exc.offending_rows, DataFrame)
+    assert exc.offending_rows['foo'].tolist() == list(range(11, 100))
+    # only the first offending rows are shown in the message
+    assert '89 offending rows in total' in str(exc)
+    assert ' 99' not in str(exc)
+
+    with pytest.raises(ColumnConstraintViolationException, match='UniqueColumnConstraint'):
+        validator.validate(DataFrame({'foo': [1, 2, 1]}))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 100])
+def test_chunked_validation(chunk_size):
+    validator = DataFrameValidator(
+        pandas_columns=[
+            PandasColumn.integer_column('foo', min_value=0, unique=True),
+            PandasColumn.categorical_column('bar', categories={'a', 'b'}),
+        ],
+        chunk_size=chunk_size,
+    )
+    assert validator.validate(DataFrame({'foo': [1, 2, 3, 4], 'bar': ['a', 'b', 'a', 'b']})) is None
+
+    with pytest.raises(ColumnConstraintViolationException) as exc_info:
+        validator.validate(DataFrame({'foo': [1, 2, 3, 4], 'bar': ['a', 'b', 'c', 'b']}))
+    assert exc_info.value.offending_rows.index.tolist() == [2]
+
+    # uniqueness is checked across chunks
+    with pytest.raises(ColumnConstraintViolationException, match='UniqueColumnConstraint'):
+        validator.validate(DataFrame({'foo': [1, 2, 3, 1], 'bar': ['a', 'b', 'a', 'b']}))
+
+
+def test_sampled_validation():
+    validator = DataFrameValidator(
+        pandas_columns=[PandasColumn.integer_column('foo', min_value=0)],
+        dataframe_constraints=[RowCountConstraint(1000)],
+        sample_size=10,
+    )
+    assert validator.validate(DataFrame({'foo': list(range(1000))})) is None
+
+    with pytest.raises(ColumnConstraintViolationException):
+        validator.validate(DataFrame({'foo': [-1] * 1000}))
+
+    # dtype and dataframe constraints are checked on the whole dataframe
+    with pytest.raises(ColumnConstraintViolationException, match='ColumnDTypeFnConstraint'):
+        validator.validate(DataFrame({'foo': [0.5] * 1000}))
+    with pytest.raises(ConstraintViolationException, match='RowCountConstraint'):
+        validator.validate(DataFrame({'foo': list(range(999))}))
+
+
+def test_sampled_validation_is_seeded():
+    dataframe = DataFrame({'foo': [-1, 1] * 500})
+
+    def _sampled_offending_rows(sample_seed):
+        validator = DataFrameValidator(
+            pandas_columns=[PandasColumn.integer_column('foo', min_value=0)],
+            sample_size=10,
+            sample_seed=sample_seed,
+        )
+        with pytest.raises(ColumnConstraintViolationException) as exc_info:
+            validator.validate(dataframe)
+        return exc_info.value.offending_rows.index.tolist()
+
+    assert _sampled_offending_rows(0) == _sampled_offending_rows(0)
+    assert _sampled_offending_rows(0) != _sampled_offending_rows(1)
+
+
+def test_non_nullable_offending_rows_are_index_value_pairs():
+    with pytest.raises(ColumnConstraintViolationException) as exc_info:
+        validate_constraints(
+            DataFrame({'foo': [1, None, 3, None]}, index=['a', 'b', 'c', 'd']),
+            pandas_columns=[PandasColumn(name='foo', constraints=[NonNullableColumnConstraint()])],
+        )
+
+    offending_rows = exc_info.value.offending_rows
+    assert [index for index, _ in offending_rows] == ['b', 'd']
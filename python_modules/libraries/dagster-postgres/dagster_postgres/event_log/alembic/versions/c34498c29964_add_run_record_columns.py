@@ -0,0 +1,44 @@
+"""add run record columns
+
+Revision ID: c34498c29964
+Revises: b22f16781a7c
+Create Date: 2020-05-20 10:41:08.331254
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from dagster.core.storage.migration.utils import has_column, has_table
+
+# alembic magic breaks pylint
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = 'c34498c29964'
+down_revision = 'b22f16781a7c'
+branch_labels = None
+depends_on = None
+
+RUN_RECORD_COLUMNS = [
+    ('mode', sa.String),
+    ('root_run_id', sa.String(255)),
+    ('parent_run_id', sa.String(255)),
+    ('step_keys_to_execute', sa.String),
+]
+
+
+def upgrade():
+    if not has_table('runs'):
+        return
+
+    for name, column_type in RUN_RECORD_COLUMNS:
+        if not has_column('runs', name):
+            op.add_column('runs', sa.Column(name, column_type))
+
+
+def downgrade():
+    columns = [name for name, _ in RUN_RECORD_COLUMNS if has_column('runs', name)]
+    if columns:
+        with op.batch_alter_table('runs') as batch_op:
+            for column in columns:
+                batch_op.drop_column(column)
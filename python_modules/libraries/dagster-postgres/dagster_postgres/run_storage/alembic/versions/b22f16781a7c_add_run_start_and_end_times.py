@@ -0,0 +1,39 @@
+"""add run start and end times
+
+Revision ID: b22f16781a7c
+Revises: 0da417ae1b81
+Create Date: 2020-05-19 14:02:17.513920
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from dagster.core.storage.migration.utils import has_column, has_table
+
+# alembic magic breaks pylint
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = 'b22f16781a7c'
+down_revision = '0da417ae1b81'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table('runs'):
+        return
+
+    if not has_column('runs', 'start_time'):
+        op.add_column('runs', sa.Column('start_time', sa.Float))
+
+    if not has_column('runs', 'end_time'):
+        op.add_column('runs', sa.Column('end_time', sa.Float))
+
+
+def downgrade():
+    columns = [column for column in ('start_time', 'end_time') if has_column('runs', column)]
+    if columns:
+        with op.batch_alter_table('runs') as batch_op:
+            for column in columns:
+                batch_op.drop_column(column)
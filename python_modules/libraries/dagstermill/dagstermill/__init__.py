@@ -18,4 +18,6 @@ _reconstitute_pipeline_context = _MANAGER_FOR_NOTEBOOK_INSTANCE.reconstitute_pip
 
 _teardown = _MANAGER_FOR_NOTEBOOK_INSTANCE.teardown_resources
 
+_reset = _MANAGER_FOR_NOTEBOOK_INSTANCE.reset
+
 _load_parameter = _MANAGER_FOR_NOTEBOOK_INSTANCE.load_parameter
@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 import nbformat
 from nbconvert.preprocessors.execute import CellExecutionError
 from papermill.engines import NBConvertEngine
@@ -6,6 +8,19 @@ from papermill.preprocess import PapermillExecutePreprocessor
 
 
 class DagstermillExecutePreprocessor(PapermillExecutePreprocessor):
+    # When a kernel manager is passed in, e.g. from the kernel pool, the ExecutePreprocessor leaves
+    # its kernel running, but also never stops the channels of the client it opened to the kernel.
+    @contextmanager
+    def setup_preprocessor(self, nb, resources, km=None, **kwargs):
+        with super(DagstermillExecutePreprocessor, self).setup_preprocessor(
+            nb, resources, km=km, **kwargs
+        ) as setup:
+            try:
+                yield setup
+            finally:
+                if km is not None:
+                    self.kc.stop_channels()
+
     # We need to finalize dagster resources here (as opposed to, e.g., in the notebook_complete
     # method on the NotebookExecutionManager), because we need to be inside the scope of the
     # nbconvert.preprocessors.ExecutePreprocessor.setup_preprocessor context manager, which tears
@@ -47,6 +62,7 @@ class DagstermillNBConvertEngine(NBConvertEngine):
         stderr_file=None,
         start_timeout=60,
         execution_timeout=None,
+        km=None,
         **kwargs
     ):
         # Nicely handle preprocessor arguments prioritizing values set by engine
@@ -58,4 +74,6 @@ class DagstermillNBConvertEngine(NBConvertEngine):
         )
 
         preprocessor.log_output = log_output  # pylint:disable = attribute-defined-outside-init
-        preprocessor.preprocess(nb_man, kwargs)
+        # If a kernel manager is passed, e.g. from the kernel pool, the preprocessor executes the
+        # notebook in its kernel and leaves the kernel running afterwards
+        preprocessor.preprocess(nb_man, kwargs, km=km)
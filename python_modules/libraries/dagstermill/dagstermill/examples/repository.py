@@ -209,6 +209,39 @@ def define_test_notebook_dag_pipeline():
     )
 
 
+def define_reused_kernel_notebook_dag_pipeline():
+    add_two_numbers = dagstermill.define_dagstermill_solid(
+        'add_two_numbers',
+        nb_test_path('add_two_numbers'),
+        [InputDefinition(name='a', dagster_type=Int), InputDefinition(name='b', dagster_type=Int)],
+        [OutputDefinition(Int)],
+        reuse_kernel=True,
+    )
+    mult_two_numbers = dagstermill.define_dagstermill_solid(
+        'mult_two_numbers',
+        nb_test_path('mult_two_numbers'),
+        [InputDefinition(name='a', dagster_type=Int), InputDefinition(name='b', dagster_type=Int)],
+        [OutputDefinition(Int)],
+        reuse_kernel=True,
+    )
+    return PipelineDefinition(
+        name='test_reused_kernel_notebook_dag',
+        solid_defs=[load_constant, add_two_numbers, mult_two_numbers],
+        dependencies={
+            SolidInvocation('load_constant', alias='load_a'): {},
+            SolidInvocation('load_constant', alias='load_b'): {},
+            SolidInvocation(name='add_two_numbers', alias='add_two'): {
+                'a': DependencyDefinition('load_a'),
+                'b': DependencyDefinition('load_b'),
+            },
+            SolidInvocation(name='mult_two_numbers', alias='mult_two'): {
+                'a': DependencyDefinition('add_two'),
+                'b': DependencyDefinition('load_b'),
+            },
+        },
+    )
+
+
 def define_error_pipeline():
     return PipelineDefinition(
         name='error_pipeline',
@@ -389,6 +422,7 @@ def define_example_repository():
         'resource_with_exception_pipeline': define_resource_with_exception_pipeline,
         'test_add_pipeline': define_add_pipeline,
         'test_notebook_dag': define_test_notebook_dag_pipeline,
+        'test_reused_kernel_notebook_dag': define_reused_kernel_notebook_dag_pipeline,
         'reimport_pipeline': lambda: reimport_pipeline,
     }
     if DAGSTER_PANDAS_PRESENT and SKLEARN_PRESENT and MATPLOTLIB_PRESENT:
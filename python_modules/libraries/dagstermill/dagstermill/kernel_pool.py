@@ -0,0 +1,148 @@
+import atexit
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+from jupyter_client.manager import KernelManager
+
+from dagster import check
+
+RESET_TIMEOUT = 60
+
+# Clear the per-notebook state of the dagstermill manager, change back into the notebook's
+# directory, and then clear the user namespace. Modules stay imported, as does the manager's cache
+# of reconstituted runs.
+RESET_KERNEL_SOURCE = (
+    'import dagstermill as __dm_dagstermill\n'
+    '__dm_dagstermill._reset()\n'
+    '{chdir}'
+    'get_ipython().run_line_magic(\'reset\', \'-f\')\n'
+)
+
+CHDIR_SOURCE = 'import os as __dm_os\n__dm_os.chdir({cwd!r})\n'
+
+
+def _shutdown_kernel(km):
+    try:
+        km.shutdown_kernel(now=True)
+    except Exception:  # pylint: disable=broad-except
+        pass
+
+
+class KernelPool(object):
+    '''Keeps Jupyter kernels running between dagstermill notebook executions in a process.
+
+    Kernels are reset before they are reused: the dagstermill manager state and the user
+    namespace are cleared, but imported modules remain loaded. Kernels that have died, that fail to
+    reset, or that were in use when a notebook raised an error are shut down rather than reused.
+
+    Kernels run in the directory of the notebook they execute, and the reset changes back into it.
+    Idle kernels are only reused for notebooks in the same directory.
+
+    Args:
+        max_idle_kernels (int): The number of idle kernels to keep per kernel name.
+    '''
+
+    def __init__(self, max_idle_kernels=2):
+        self._max_idle_kernels = check.int_param(max_idle_kernels, 'max_idle_kernels')
+        self._idle_kernels = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def acquire(self, kernel_name, cwd=None):
+        check.str_param(kernel_name, 'kernel_name')
+        check.opt_str_param(cwd, 'cwd')
+
+        while True:
+            with self._lock:
+                idle_kernels = self._idle_kernels[(kernel_name, cwd)]
+                km = idle_kernels.pop() if idle_kernels else None
+
+            if km is None:
+                break
+
+            if km.is_alive():
+                return km
+
+            _shutdown_kernel(km)
+
+        km = KernelManager(kernel_name=kernel_name)
+        if cwd is not None:
+            km.start_kernel(cwd=cwd)
+        else:
+            km.start_kernel()
+        return km
+
+    def release(self, km, cwd=None):
+        check.inst_param(km, 'km', KernelManager)
+        check.opt_str_param(cwd, 'cwd')
+
+        if not km.is_alive() or not self._reset_kernel(km, cwd):
+            _shutdown_kernel(km)
+            return
+
+        with self._lock:
+            if self._idle_kernel_count(km.kernel_name) < self._max_idle_kernels:
+                self._idle_kernels[(km.kernel_name, cwd)].append(km)
+                return
+
+        _shutdown_kernel(km)
+
+    def discard(self, km):
+        check.inst_param(km, 'km', KernelManager)
+        _shutdown_kernel(km)
+
+    @contextmanager
+    def kernel(self, kernel_name, cwd=None):
+        km = self.acquire(kernel_name, cwd)
+        try:
+            yield km
+        except:  # pylint: disable=bare-except
+            self.discard(km)
+            raise
+        else:
+            self.release(km, cwd)
+
+    def idle_kernel_count(self, kernel_name=None):
+        check.opt_str_param(kernel_name, 'kernel_name')
+
+        with self._lock:
+            return self._idle_kernel_count(kernel_name)
+
+    def _idle_kernel_count(self, kernel_name):
+        return sum(
+            len(idle_kernels)
+            for (idle_kernel_name, _), idle_kernels in self._idle_kernels.items()
+            if kernel_name is None or idle_kernel_name == kernel_name
+        )
+
+    def shutdown_all(self):
+        with self._lock:
+            kernels = [km for idle_kernels in self._idle_kernels.values() for km in idle_kernels]
+            self._idle_kernels.clear()
+
+        for km in kernels:
+            _shutdown_kernel(km)
+
+    def _reset_kernel(self, km, cwd):
+        kc = km.client()
+        kc.start_channels()
+        try:
+            kc.wait_for_ready(timeout=RESET_TIMEOUT)
+            reply = kc.execute_interactive(
+                RESET_KERNEL_SOURCE.format(
+                    chdir=CHDIR_SOURCE.format(cwd=cwd) if cwd is not None else ''
+                ),
+                store_history=False,
+                timeout=RESET_TIMEOUT,
+                output_hook=lambda _msg: None,
+            )
+            return reply['content']['status'] == 'ok'
+        except Exception:  # pylint: disable=broad-except
+            return False
+        finally:
+            kc.stop_channels()
+
+
+KERNEL_POOL = KernelPool()
+
+atexit.register(KERNEL_POOL.shutdown_all)
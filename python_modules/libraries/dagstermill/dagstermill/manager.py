@@ -1,6 +1,7 @@
 import os
 import pickle
 import uuid
+from collections import OrderedDict, namedtuple
 
 import six
 
@@ -49,6 +50,15 @@ class DagstermillResourceEventGenerationManager(EventGenerationManager):
             pass
 
 
+# The number of runs for which to keep reconstituted pipelines, instances and execution plans in a
+# kernel that is reused between notebook executions
+RECONSTITUTED_RUN_CACHE_SIZE = 4
+
+
+class _ReconstitutedRun(namedtuple('_ReconstitutedRun', 'pipeline instance execution_plan')):
+    pass
+
+
 class Manager(object):
     def __init__(self):
         self.pipeline = None
@@ -57,6 +67,54 @@ class Manager(object):
         self.marshal_dir = None
         self.context = None
         self.resource_manager = None
+        self._reconstituted_runs = OrderedDict()
+
+    def reset(self):
+        '''Clears the state of the notebook that was last executed, so that the kernel can be reused
+        for another notebook. Reconstituted runs are kept.'''
+        self.pipeline = None
+        self.solid_def = None
+        self.in_pipeline = False
+        self.marshal_dir = None
+        self.context = None
+        self.resource_manager = None
+
+    def _reconstitute_run(self, pipeline_run, executable_dict, environment_dict, instance_ref_dict):
+        cache_key = (
+            pipeline_run.run_id,
+            seven.json.dumps(executable_dict, sort_keys=True),
+            seven.json.dumps(environment_dict, sort_keys=True),
+            seven.json.dumps(instance_ref_dict, sort_keys=True),
+        )
+        if cache_key in self._reconstituted_runs:
+            return self._reconstituted_runs[cache_key]
+
+        pipeline = ReconstructablePipeline.from_dict(executable_dict)
+
+        try:
+            instance_ref = unpack_value(instance_ref_dict)
+            instance = DagsterInstance.from_ref(instance_ref)
+        except Exception as err:  # pylint: disable=broad-except
+            six.raise_from(
+                DagstermillError(
+                    'Error when attempting to resolve DagsterInstance from serialized InstanceRef'
+                ),
+                err,
+            )
+
+        execution_plan = create_execution_plan(
+            pipeline,
+            environment_dict,
+            mode=pipeline_run.mode,
+            step_keys_to_execute=pipeline_run.step_keys_to_execute,
+        )
+
+        reconstituted_run = _ReconstitutedRun(pipeline, instance, execution_plan)
+        self._reconstituted_runs[cache_key] = reconstituted_run
+        while len(self._reconstituted_runs) > RECONSTITUTED_RUN_CACHE_SIZE:
+            self._reconstituted_runs.popitem(last=False)
+
+        return reconstituted_run
 
     def _setup_resources(
         self, execution_plan, environment_config, pipeline_run, log_manager, resource_keys_to_init
@@ -103,22 +161,15 @@ class Manager(object):
         check.dict_param(solid_handle_kwargs, 'solid_handle_kwargs')
         check.dict_param(instance_ref_dict, 'instance_ref_dict')
 
-        pipeline = ReconstructablePipeline.from_dict(executable_dict)
-        pipeline_def = pipeline.get_definition()
-
-        try:
-            instance_ref = unpack_value(instance_ref_dict)
-            instance = DagsterInstance.from_ref(instance_ref)
-        except Exception as err:  # pylint: disable=broad-except
-            six.raise_from(
-                DagstermillError(
-                    'Error when attempting to resolve DagsterInstance from serialized InstanceRef'
-                ),
-                err,
-            )
-
         pipeline_run = unpack_value(pipeline_run_dict)
 
+        # In a kernel that is reused between notebooks, the pipeline, instance and execution plan
+        # are only built once per run
+        pipeline, instance, execution_plan = self._reconstitute_run(
+            pipeline_run, executable_dict, environment_dict, instance_ref_dict
+        )
+        pipeline_def = pipeline.get_definition()
+
         solid_handle = SolidHandle.from_dict(solid_handle_kwargs)
         solid_def = pipeline_def.get_solid(solid_handle).definition
 
@@ -127,13 +178,6 @@ class Manager(object):
         self.solid_def = solid_def
         self.pipeline = pipeline
 
-        execution_plan = create_execution_plan(
-            self.pipeline,
-            environment_dict,
-            mode=pipeline_run.mode,
-            step_keys_to_execute=pipeline_run.step_keys_to_execute,
-        )
-
         with scoped_pipeline_context(
             execution_plan,
             environment_dict,
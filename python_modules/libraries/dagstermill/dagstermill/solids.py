@@ -31,6 +31,7 @@ from dagster.utils import mkdir_p, safe_tempfile_path
 
 from .engine import DagstermillNBConvertEngine
 from .errors import DagstermillError, DagstermillExecutionError
+from .kernel_pool import KERNEL_POOL
 from .serialize import read_value, write_value
 from .translator import RESERVED_INPUT_NAMES, DagsterTranslator
 
@@ -138,10 +139,35 @@ def get_papermill_parameters(compute_context, inputs, output_log_path):
     return parameters
 
 
-def _dm_solid_compute(name, notebook_path, output_notebook=None):
+def _execute_notebook(nb, input_path, output_path, reuse_kernel, notebook_dir):
+    papermill_engines.register('dagstermill', DagstermillNBConvertEngine)
+
+    kernel_name = nb.metadata.get('kernelspec', {}).get('name')
+    if not reuse_kernel or kernel_name is None:
+        papermill.execute_notebook(
+            input_path=input_path,
+            output_path=output_path,
+            engine_name='dagstermill',
+            log_output=True,
+        )
+        return
+
+    with KERNEL_POOL.kernel(kernel_name, notebook_dir) as km:
+        papermill.execute_notebook(
+            input_path=input_path,
+            output_path=output_path,
+            engine_name='dagstermill',
+            log_output=True,
+            kernel_name=kernel_name,
+            km=km,
+        )
+
+
+def _dm_solid_compute(name, notebook_path, output_notebook=None, reuse_kernel=False):
     check.str_param(name, 'name')
     check.str_param(notebook_path, 'notebook_path')
     check.opt_str_param(output_notebook, 'output_notebook')
+    check.bool_param(reuse_kernel, 'reuse_kernel')
 
     def _t_fn(compute_context, inputs):
         check.inst_param(compute_context, 'compute_context', SolidExecutionContext)
@@ -183,12 +209,12 @@ def _dm_solid_compute(name, notebook_path, output_notebook=None):
                     ),
                 ):
                     try:
-                        papermill_engines.register('dagstermill', DagstermillNBConvertEngine)
-                        papermill.execute_notebook(
-                            input_path=parameterized_notebook_path,
-                            output_path=executed_notebook_path,
-                            engine_name='dagstermill',
-                            log_output=True,
+                        _execute_notebook(
+                            nb_no_parameters,
+                            parameterized_notebook_path,
+                            executed_notebook_path,
+                            reuse_kernel,
+                            os.path.dirname(os.path.abspath(notebook_path)),
                         )
 
                     except Exception as exc:  # pylint: disable=broad-except
@@ -276,6 +302,7 @@ def define_dagstermill_solid(
     config=None,
     required_resource_keys=None,
     output_notebook=None,
+    reuse_kernel=False,
 ):
     '''Wrap a Jupyter notebook in a solid.
 
@@ -292,6 +319,13 @@ def define_dagstermill_solid(
             respects the :py:class:`~dagster.core.storage.file_manager.FileManager` configured on
             the pipeline system storage, so, e.g., if :py:class:`~dagster_aws.s3.s3_system_storage`
             is configured, the output will be a :py:class:`~dagster_aws.s3.S3FileHandle`.
+        reuse_kernel (Optional[bool]): If True, execute the notebook in a kernel kept running
+            between notebook executions in the same process, rather than starting a new kernel.
+            The kernel runs in the notebook's directory. Its namespace and working directory are
+            reset between notebooks, but modules imported by earlier notebooks stay imported, and
+            the pipeline and execution plan are only reconstituted once per run. This helps most
+            when many notebooks execute in one process, e.g. with the in-process executor.
+            Default: False.
 
     Returns:
         :py:class:`~dagster.SolidDefinition`
@@ -307,7 +341,7 @@ def define_dagstermill_solid(
     return SolidDefinition(
         name=name,
         input_defs=input_defs,
-        compute_fn=_dm_solid_compute(name, notebook_path, output_notebook),
+        compute_fn=_dm_solid_compute(name, notebook_path, output_notebook, reuse_kernel),
         output_defs=output_defs
         + (
             [OutputDefinition(dagster_type=FileHandle, name=output_notebook)]
@@ -0,0 +1,44 @@
+'''Measures the per-notebook overhead of dagstermill solids with and without kernel reuse.
+
+Run with ``python -m dagstermill_tests.benchmark_kernel_pool [iterations]``.
+'''
+import sys
+import time
+
+from dagstermill.kernel_pool import KERNEL_POOL
+
+from dagster import execute_pipeline, seven
+from dagster.core.definitions.reconstructable import ReconstructablePipeline
+from dagster.core.instance import DagsterInstance
+
+NOTEBOOKS_PER_RUN = 2
+
+ENVIRONMENT_DICT = {'solids': {'load_a': {'config': 1}, 'load_b': {'config': 2}}}
+
+
+def time_per_notebook(fn_name, iterations):
+    pipeline = ReconstructablePipeline.for_module('dagstermill.examples.repository', fn_name)
+
+    # Notebooks are passed a reference to the instance, so it can't be an ephemeral one
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+
+        start = time.time()
+        for _ in range(iterations):
+            assert execute_pipeline(pipeline, ENVIRONMENT_DICT, instance=instance).success
+        return (time.time() - start) / (iterations * NOTEBOOKS_PER_RUN)
+
+
+def main(iterations):
+    fresh = time_per_notebook('define_test_notebook_dag_pipeline', iterations)
+    # The first run starts the kernel that later runs reuse
+    time_per_notebook('define_reused_kernel_notebook_dag_pipeline', 1)
+    reused = time_per_notebook('define_reused_kernel_notebook_dag_pipeline', iterations)
+    KERNEL_POOL.shutdown_all()
+
+    print('new kernel per notebook:    {:.3f}s per notebook'.format(fresh))
+    print('reused kernel per notebook: {:.3f}s per notebook'.format(reused))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
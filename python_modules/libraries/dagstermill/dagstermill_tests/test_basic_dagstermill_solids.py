@@ -209,6 +209,26 @@ def test_notebook_dag():
         assert result.result_for_solid('mult_two').output_value() == 6
 
 
+@pytest.mark.notebook_test
+def test_reused_kernel_notebook_dag():
+    from dagstermill.kernel_pool import KERNEL_POOL
+
+    KERNEL_POOL.shutdown_all()
+    try:
+        for _ in range(2):
+            with exec_for_test(
+                'define_reused_kernel_notebook_dag_pipeline',
+                {'solids': {'load_a': {'config': 1}, 'load_b': {'config': 2}}},
+            ) as result:
+                assert result.success
+                assert result.result_for_solid('add_two').output_value() == 3
+                assert result.result_for_solid('mult_two').output_value() == 6
+
+            assert KERNEL_POOL.idle_kernel_count() == 1
+    finally:
+        KERNEL_POOL.shutdown_all()
+
+
 @pytest.mark.notebook_test
 def test_error_notebook():
     with pytest.raises(PapermillExecutionError) as exc:
@@ -0,0 +1,136 @@
+import os
+
+import nbformat
+import papermill
+import pytest
+from dagstermill.engine import DagstermillNBConvertEngine
+from dagstermill.kernel_pool import KernelPool
+from papermill.engines import papermill_engines
+
+from dagster import seven
+
+
+def _execute(km, source):
+    kc = km.client()
+    kc.start_channels()
+    try:
+        kc.wait_for_ready(timeout=60)
+        return kc.execute_interactive(source, timeout=60, output_hook=lambda _msg: None)['content'][
+            'status'
+        ]
+    finally:
+        kc.stop_channels()
+
+
+@pytest.mark.notebook_test
+def test_kernel_pool_reuses_reset_kernels():
+    pool = KernelPool(max_idle_kernels=1)
+    try:
+        km = pool.acquire('python3')
+        assert _execute(km, 'import json\nfoo = 1') == 'ok'
+        pool.release(km)
+        assert pool.idle_kernel_count('python3') == 1
+
+        reused_km = pool.acquire('python3')
+        assert reused_km is km
+        assert pool.idle_kernel_count('python3') == 0
+
+        # the namespace is cleared, but imported modules stay loaded
+        assert _execute(reused_km, 'assert \'foo\' not in dir()') == 'ok'
+        assert _execute(reused_km, 'import sys\nassert \'json\' in sys.modules') == 'ok'
+
+        other_km = pool.acquire('python3')
+        assert other_km is not km
+        pool.release(reused_km)
+        pool.release(other_km)
+        assert pool.idle_kernel_count() == 1
+        assert not other_km.is_alive()
+    finally:
+        pool.shutdown_all()
+
+    assert not km.is_alive()
+
+
+def _assert_cwd_source(cwd):
+    return 'import os\nassert os.path.realpath(os.getcwd()) == {cwd!r}'.format(
+        cwd=os.path.realpath(cwd)
+    )
+
+
+@pytest.mark.notebook_test
+def test_kernel_pool_runs_kernels_in_notebook_directory():
+    pool = KernelPool()
+    try:
+        with seven.TemporaryDirectory() as notebook_dir:
+            with seven.TemporaryDirectory() as other_notebook_dir:
+                km = pool.acquire('python3', notebook_dir)
+                assert _execute(km, _assert_cwd_source(notebook_dir)) == 'ok'
+                os.mkdir(os.path.join(notebook_dir, 'data'))
+                assert _execute(km, 'import os\nos.chdir(\'data\')') == 'ok'
+                pool.release(km, notebook_dir)
+
+                # the reset changes back into the notebook directory
+                assert pool.acquire('python3', notebook_dir) is km
+                assert _execute(km, _assert_cwd_source(notebook_dir)) == 'ok'
+                pool.release(km, notebook_dir)
+
+                # idle kernels are not reused for notebooks in other directories
+                other_km = pool.acquire('python3', other_notebook_dir)
+                assert other_km is not km
+                assert _execute(other_km, _assert_cwd_source(other_notebook_dir)) == 'ok'
+                pool.release(other_km, other_notebook_dir)
+                assert pool.idle_kernel_count('python3') == 2
+    finally:
+        pool.shutdown_all()
+
+
+@pytest.mark.notebook_test
+def test_engine_stops_client_channels_of_pooled_kernel():
+    papermill_engines.register('dagstermill', DagstermillNBConvertEngine)
+    pool = KernelPool()
+    clients = []
+    try:
+        with seven.TemporaryDirectory() as notebook_dir:
+            notebook_path = os.path.join(notebook_dir, 'notebook.ipynb')
+            nb = nbformat.v4.new_notebook(cells=[nbformat.v4.new_code_cell('foo = 1')])
+            nb.metadata['kernelspec'] = {
+                'name': 'python3',
+                'display_name': 'Python 3',
+                'language': 'python',
+            }
+            nbformat.write(nb, notebook_path)
+
+            with pool.kernel('python3', notebook_dir) as km:
+                client = km.client
+
+                def _client(**kwargs):
+                    clients.append(client(**kwargs))
+                    return clients[-1]
+
+                km.client = _client
+                for _ in range(2):
+                    papermill.execute_notebook(
+                        input_path=notebook_path,
+                        output_path=os.path.join(notebook_dir, 'out.ipynb'),
+                        engine_name='dagstermill',
+                        kernel_name='python3',
+                        km=km,
+                    )
+                    assert clients
+                    assert not any(kc.channels_running for kc in clients)
+    finally:
+        pool.shutdown_all()
+
+
+@pytest.mark.notebook_test
+def test_kernel_pool_discards_kernel_on_error():
+    pool = KernelPool()
+    try:
+        with pytest.raises(ValueError):
+            with pool.kernel('python3') as km:
+                raise ValueError()
+
+        assert not km.is_alive()
+        assert pool.idle_kernel_count() == 0
+    finally:
+        pool.shutdown_all()
@@ -1,4 +1,5 @@
 import contextlib
+import copy
 import os
 import pickle
 import shutil
@@ -205,3 +206,50 @@ def test_in_pipeline_manager_with_resources():
     finally:
         if os.path.exists(path):
             os.unlink(path)
+
+
+def test_reset_manager_reuses_reconstituted_run():
+    manager = Manager()
+    instance = DagsterInstance.local_temp()
+    marshal_dir = tempfile.mkdtemp()
+
+    context_dict = {
+        'pipeline_run_dict': pack_value(
+            PipelineRun(
+                pipeline_name='hello_world_pipeline',
+                run_id=make_new_run_id(),
+                mode='default',
+                environment_dict=None,
+                step_keys_to_execute=None,
+                status=PipelineRunStatus.NOT_STARTED,
+            )
+        ),
+        'solid_handle_kwargs': SolidHandle('hello_world', None)._asdict(),
+        'executable_dict': ReconstructablePipeline.for_module(
+            'dagstermill.examples.repository', 'define_hello_world_pipeline'
+        ).to_dict(),
+        'marshal_dir': marshal_dir,
+        'environment_dict': {},
+        'instance_ref_dict': pack_value(instance.get_ref()),
+    }
+
+    try:
+        # Unpacking the serialized run and instance ref consumes them, so each notebook is passed
+        # its own copy, as it is by its injected parameters cell
+        manager.reconstitute_pipeline_context(**copy.deepcopy(context_dict))
+        assert manager.in_pipeline
+        (reconstituted_run,) = manager._reconstituted_runs.values()  # pylint: disable=W0212
+
+        manager.teardown_resources()
+        manager.reset()
+        assert not manager.in_pipeline
+        assert manager.context is None
+
+        manager.reconstitute_pipeline_context(**copy.deepcopy(context_dict))
+        assert manager.in_pipeline
+        (cached_run,) = manager._reconstituted_runs.values()  # pylint: disable=W0212
+        assert cached_run is reconstituted_run
+        assert manager.pipeline is reconstituted_run.pipeline
+    finally:
+        manager.teardown_resources()
+        shutil.rmtree(marshal_dir)
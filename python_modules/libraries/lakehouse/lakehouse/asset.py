@@ -1,3 +1,5 @@
+import hashlib
+import inspect
 from abc import ABCMeta
 from collections import namedtuple
 
@@ -24,6 +26,12 @@ class Asset(six.with_metaclass(ABCMeta)):
     def dagster_type(self):
         return self._dagster_type
 
+    @property
+    def output_in_memory_type(self):
+        '''The python type that the asset is computed as, or None if it isn't computed inside the
+        lakehouse.'''
+        return None
+
 
 class AssetDependency(namedtuple('_AssetDependency', 'asset in_memory_type')):
     '''An asset dependency describes how the contents of another asset are provided to a
@@ -62,14 +70,18 @@ class ComputedAsset(Asset):
             to produce the asset's contents, keyed by their arg names in the compute_fn
             definition.
         output_in_memory_type (Type): The python type that the compute_fn will return.
+        version (Optional[str]): The version of the asset's computation. Fingerprints of the asset
+            include it, so changing it causes the asset to be recomputed by incremental builds. If
+            not given, a hash of the compute_fn's source code is used, if it's available.
     '''
 
-    def __init__(self, storage_key, path, compute_fn, deps, output_in_memory_type):
+    def __init__(self, storage_key, path, compute_fn, deps, output_in_memory_type, version=None):
         self._compute_fn = check.callable_param(compute_fn, 'compute_fn')
         self._deps = check.dict_param(deps, 'deps', key_type=str, value_type=AssetDependency)
         self._output_in_memory_type = check.inst_param(
             output_in_memory_type, 'output_in_memory_type', type
         )
+        self._version = check.opt_str_param(version, 'version') or _source_version(compute_fn)
 
         super(ComputedAsset, self).__init__(
             storage_key=check.str_param(storage_key, 'storage_key'),
@@ -87,3 +99,16 @@ class ComputedAsset(Asset):
     @property
     def output_in_memory_type(self):
         return self._output_in_memory_type
+
+    @property
+    def version(self):
+        return self._version
+
+
+def _source_version(fn):
+    try:
+        source = inspect.getsource(fn)
+    except (IOError, TypeError):
+        return None
+
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()
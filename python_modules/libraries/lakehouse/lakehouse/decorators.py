@@ -6,7 +6,7 @@ from dagster.seven import funcsigs
 from .asset import AssetDependency, ComputedAsset
 
 
-def computed_asset(storage_key, path=None, input_assets=None):
+def computed_asset(storage_key, path=None, input_assets=None, version=None):
     '''Create a ComputedAsset with the decorated function as its compute_fn.
 
     The type annotations on the arguments and return value of the decorated functioon are use to
@@ -21,6 +21,9 @@ def computed_asset(storage_key, path=None, input_assets=None):
             passed, the keys should be the same as the names of the decorated function's arguments.
             If a list is passed, the first asset in the list is mapped to the first argument of the
             decorated function, and so on.
+        version (Optional[str]): The version of the asset's computation, used in incremental builds
+            to decide whether the asset needs to be recomputed. If not given, a hash of the
+            decorated function's source code is used.
 
     Examples:
 
@@ -89,6 +92,7 @@ def computed_asset(storage_key, path=None, input_assets=None):
             compute_fn=fn,
             deps=kwarg_deps,
             output_in_memory_type=_infer_output_type(fn),
+            version=version,
         )
 
     return _computed_asset
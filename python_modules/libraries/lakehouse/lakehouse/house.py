@@ -1,3 +1,4 @@
+import hashlib
 from abc import ABCMeta, abstractmethod
 from functools import wraps
 
@@ -11,6 +12,7 @@ from dagster import (
     PipelineDefinition,
     SolidDefinition,
     check,
+    seven,
 )
 
 from .asset import ComputedAsset
@@ -98,7 +100,23 @@ class Lakehouse:
             for policy in type_storage_policies
         }
 
-    def build_pipeline_definition(self, name, assets_to_update):
+    def build_pipeline_definition(self, name, assets_to_update, incremental=False):
+        '''Build a pipeline that updates the contents of the given assets.
+
+        Each solid records a fingerprint of the asset it computes, which covers the asset's version
+        and the fingerprints of its inputs, using the asset's TypeStoragePolicy. In incremental
+        mode, a solid doesn't recompute its asset if the asset's stored fingerprint is the same as
+        its current one.
+
+        Args:
+            name (str): The name of the pipeline.
+            assets_to_update (List[ComputedAsset]): The assets to update.
+            incremental (bool): Whether to skip recomputing assets whose fingerprints haven't
+                changed. Assets are always recomputed if their TypeStoragePolicy doesn't store
+                fingerprints, or if any of their inputs has no fingerprint. Default: False.
+        '''
+        check.bool_param(incremental, 'incremental')
+
         solid_defs = {}
         for asset in assets_to_update:
             if isinstance(asset, ComputedAsset):
@@ -109,7 +127,9 @@ class Lakehouse:
                     for dep in asset.deps.values():
                         self.check_has_policy(mode, dep.in_memory_type, dep.asset.storage_key)
 
-                solid_defs[asset.path] = self.get_computed_asset_solid_def(asset, assets_to_update)
+                solid_defs[asset.path] = self.get_computed_asset_solid_def(
+                    asset, assets_to_update, incremental
+                )
             else:
                 check.failed('All elements of assets_to_update must be ComputedAssets')
 
@@ -133,7 +153,7 @@ class Lakehouse:
             preset_defs=list(self._presets_by_name.values()),
         )
 
-    def get_computed_asset_solid_def(self, computed_asset, assets_in_pipeline):
+    def get_computed_asset_solid_def(self, computed_asset, assets_in_pipeline, incremental=False):
         output_dagster_type = computed_asset.dagster_type
         output_def = OutputDefinition(output_dagster_type)
         input_defs = []
@@ -160,7 +180,7 @@ class Lakehouse:
             name='__'.join(computed_asset.path),
             input_defs=input_defs,
             compute_fn=self._create_asset_solid_compute_wrapper(
-                computed_asset, input_defs, output_def
+                computed_asset, input_defs, output_def, incremental
             ),
             output_defs=[output_def],
             config=None,
@@ -169,15 +189,34 @@ class Lakehouse:
             metadata=None,
         )
 
-    def _create_asset_solid_compute_wrapper(self, asset, input_defs, output_def):
+    def _create_asset_solid_compute_wrapper(self, asset, input_defs, output_def, incremental):
         check.inst_param(asset, 'asset', ComputedAsset)
         check.list_param(input_defs, 'input_defs', of_type=InputDefinition)
         check.inst_param(output_def, 'output_def', OutputDefinition)
+        check.bool_param(incremental, 'incremental')
 
         @wraps(asset.compute_fn)
         def compute(context, _input_defs):
             kwargs = {}
             mode = self._modes_by_name[context.mode_def.name]
+            output_policy = self.policy_for_type_storage(
+                mode, asset.output_in_memory_type, asset.storage_key
+            )
+            output_storage = getattr(context.resources, asset.storage_key)
+
+            fingerprint = self._asset_fingerprint(mode, context.resources, asset)
+            if (
+                incremental
+                and fingerprint is not None
+                and fingerprint
+                == output_policy.load_fingerprint(output_storage, asset.path, context.resources)
+            ):
+                context.log.info(
+                    'Skipping computation of asset {path}, whose fingerprint {fingerprint} has not '
+                    'changed.'.format(path='.'.join(asset.path), fingerprint=fingerprint)
+                )
+                yield Output(value=asset.path, output_name=output_def.name)
+                return
 
             for arg_name, dep in asset.deps.items():
                 storage_key = dep.asset.storage_key
@@ -186,15 +225,46 @@ class Lakehouse:
                 kwargs[arg_name] = policy.load(storage, dep.asset.path, context.resources)
 
             result = asset.compute_fn(**kwargs)
-            output_policy = self.policy_for_type_storage(
-                mode, asset.output_in_memory_type, asset.storage_key
+            output_policy.save(result, output_storage, asset.path, context.resources)
+            # An unknown fingerprint is saved too, so that a stale one can't match later
+            output_policy.save_fingerprint(
+                fingerprint, output_storage, asset.path, context.resources
             )
-            storage = getattr(context.resources, asset.storage_key)
-            output_policy.save(result, storage, asset.path, context.resources)
             yield Output(value=asset.path, output_name=output_def.name)
 
         return compute
 
+    def _asset_fingerprint(self, mode, resources, asset):
+        '''The fingerprint of an asset is a hash of its version and the fingerprints of its
+        dependencies, which are read from storage. Returns None if any of these are unknown.'''
+        if asset.version is None:
+            return None
+
+        dep_fingerprints = {}
+        for arg_name, dep in asset.deps.items():
+            # Computed assets are stored using the policy for their own output type, if there is
+            # one in this mode
+            in_memory_type = dep.asset.output_in_memory_type
+            if in_memory_type is None or not self.has_policy(
+                mode, in_memory_type, dep.asset.storage_key
+            ):
+                in_memory_type = dep.in_memory_type
+            policy = self.policy_for_type_storage(mode, in_memory_type, dep.asset.storage_key)
+            dep_fingerprint = policy.load_fingerprint(
+                getattr(resources, dep.asset.storage_key), dep.asset.path, resources
+            )
+            if dep_fingerprint is None:
+                return None
+
+            dep_fingerprints[arg_name] = [list(dep.asset.path), dep_fingerprint]
+
+        return hashlib.sha1(
+            seven.json.dumps(
+                {'path': list(asset.path), 'version': asset.version, 'deps': dep_fingerprints},
+                sort_keys=True,
+            ).encode('utf-8')
+        ).hexdigest()
+
     def check_has_policy(self, mode, in_memory_type, storage_key):
         check.invariant(
             storage_key in mode.resource_defs,
@@ -202,15 +272,18 @@ class Lakehouse:
                 name=mode.name, storage_key=storage_key,
             ),
         )
-        storage_def = mode.resource_defs[storage_key]
         check.invariant(
-            (in_memory_type, storage_def) in self._policies_by_type_storage,
+            self.has_policy(mode, in_memory_type, storage_key),
             'Mode {name} is missing TypeStoragePolicy for storage_key {storage_key} '
             'and in-memory type {in_memory_type}'.format(
                 name=mode.name, storage_key=storage_key, in_memory_type=in_memory_type,
             ),
         )
 
+    def has_policy(self, mode, in_memory_type, storage_key):
+        storage_def = mode.resource_defs.get(storage_key)
+        return (in_memory_type, storage_def) in self._policies_by_type_storage
+
     def policy_for_type_storage(self, mode, in_memory_type, storage_key):
         storage_def = mode.resource_defs[storage_key]
         return self._policies_by_type_storage[in_memory_type, storage_def]
@@ -240,3 +313,20 @@ class TypeStoragePolicy(six.with_metaclass(ABCMeta)):
     @abstractmethod
     def load(cls, storage, path, resources):
         pass
+
+    @classmethod
+    def save_fingerprint(cls, fingerprint, storage, path, resources):
+        '''Record the fingerprint of the asset stored at the given path, alongside it. The
+        fingerprint is None if it's unknown, in which case any stored fingerprint should be
+        cleared. Policies that don't store fingerprints don't need to implement this, but assets
+        stored with them are always recomputed by incremental builds.'''
+
+    @classmethod
+    def load_fingerprint(cls, storage, path, resources):
+        '''Return the fingerprint of the asset stored at the given path, or None if it's unknown.
+
+        For computed assets, this is the fingerprint last saved with :py:meth:`save_fingerprint`.
+        For source assets, this can be any string that changes when the asset's contents change,
+        e.g. a modification time or content hash.
+        '''
+        return None
@@ -9,6 +9,7 @@ def basic_lakehouse_and_storages():
     class DictStorage:
         def __init__(self):
             self.the_dict = {}
+            self.fingerprints = {}
 
     storage1 = DictStorage()
     storage2 = DictStorage()
@@ -43,6 +44,14 @@ def basic_lakehouse_and_storages():
         def load(cls, storage, path, _resources):
             return storage.the_dict[path]
 
+        @classmethod
+        def save_fingerprint(cls, fingerprint, storage, path, _resources):
+            storage.fingerprints[path] = fingerprint
+
+        @classmethod
+        def load_fingerprint(cls, storage, path, _resources):
+            return storage.fingerprints.get(path)
+
     class IntSomeOtherStoragePolicy(TypeStoragePolicy):
         @classmethod
         def in_memory_type(cls):
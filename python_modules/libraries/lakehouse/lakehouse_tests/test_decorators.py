@@ -33,6 +33,7 @@ def test_computed_asset_one_dep():
     assert list(casset.deps.keys()) == ['a_']
     assert casset.deps['a_'].in_memory_type == int
     assert casset.deps['a_'].asset == source_asset
+    assert source_asset.output_in_memory_type is None
 
 
 def test_computed_asset_multiple_deps_dict():
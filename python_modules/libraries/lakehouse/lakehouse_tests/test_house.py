@@ -143,3 +143,75 @@ def test_build_and_execute_pipeline(basic_lakehouse_and_storages):
     assert ('return_two_asset',) not in storage1.the_dict
     assert storage2.the_dict[('add_asset',)] == 3
     assert ('add_asset',) not in storage1.the_dict
+
+
+def test_incremental_build(basic_lakehouse_and_storages):
+    basic_lakehouse, storage1, storage2 = basic_lakehouse_and_storages
+    computed = []
+
+    source_asset = SourceAsset(storage_key='storage1', path=('source',))
+    storage1.the_dict[('source',)] = 1
+    storage1.fingerprints[('source',)] = 'v1'
+
+    def build_pipeline(plus_one_version='1'):
+        @computed_asset(
+            storage_key='storage1', input_assets=[source_asset], version=plus_one_version
+        )
+        def plus_one_asset(source: int) -> int:
+            computed.append('plus_one_asset')
+            return source + 1
+
+        @computed_asset(storage_key='storage1', input_assets=[plus_one_asset], version='1')
+        def times_two_asset(plus_one: int) -> int:
+            computed.append('times_two_asset')
+            return plus_one * 2
+
+        # storage2's policy doesn't store fingerprints, so this is always recomputed
+        @computed_asset(storage_key='storage2', input_assets=[plus_one_asset], version='1')
+        def minus_one_asset(plus_one: int) -> int:
+            computed.append('minus_one_asset')
+            return plus_one - 1
+
+        return basic_lakehouse.build_pipeline_definition(
+            'some_pipeline', [plus_one_asset, times_two_asset, minus_one_asset], incremental=True,
+        )
+
+    def execute(pipeline):
+        del computed[:]
+        assert execute_pipeline(pipeline, mode='dev').success
+        return sorted(computed)
+
+    all_assets = ['minus_one_asset', 'plus_one_asset', 'times_two_asset']
+    assert execute(build_pipeline()) == all_assets
+    assert storage1.the_dict[('times_two_asset',)] == 4
+    assert storage2.the_dict[('minus_one_asset',)] == 1
+
+    assert execute(build_pipeline()) == ['minus_one_asset']
+
+    storage1.the_dict[('source',)] = 2
+    storage1.fingerprints[('source',)] = 'v2'
+    assert execute(build_pipeline()) == all_assets
+    assert storage1.the_dict[('times_two_asset',)] == 6
+
+    assert execute(build_pipeline(plus_one_version='2')) == all_assets
+    assert execute(build_pipeline(plus_one_version='2')) == ['minus_one_asset']
+
+    # without a fingerprint for the source, nothing downstream of it can be skipped
+    del storage1.fingerprints[('source',)]
+    assert execute(build_pipeline(plus_one_version='2')) == all_assets
+
+
+def test_non_incremental_build_records_fingerprints(basic_lakehouse_and_storages):
+    basic_lakehouse, storage1, _ = basic_lakehouse_and_storages
+
+    @computed_asset(storage_key='storage1')
+    def return_one_asset() -> int:
+        return 1
+
+    pipeline = basic_lakehouse.build_pipeline_definition('some_pipeline', [return_one_asset])
+    assert execute_pipeline(pipeline, mode='dev').success
+    fingerprint = storage1.fingerprints[('return_one_asset',)]
+    assert fingerprint
+
+    assert execute_pipeline(pipeline, mode='dev').success
+    assert storage1.fingerprints[('return_one_asset',)] == fingerprint